@@ -0,0 +1,34 @@
+"""Add radacct (acctstoptime, radacctid) index for keyset sync
+
+The TimescaleDB session sync pages completed sessions by
+(acctstoptime, radacctid); this index serves that ordering directly.
+
+Revision ID: 2025_12_01_1000
+Revises: 2025_11_30_1200
+Create Date: 2025-12-01 10:00:00.000000
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2025_12_01_1000"
+down_revision: Union[str, None] = "2025_11_30_1200"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_radacct_stoptime_id",
+        "radacct",
+        ["acctstoptime", "radacctid"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_radacct_stoptime_id", table_name="radacct", if_exists=True)
@@ -0,0 +1,41 @@
+"""Add radacct composite indexes for usage aggregation
+
+Usage lookups filter radacct by tenant, subscriber (username or
+subscriber_id) and session start time.
+
+Revision ID: 2025_12_01_1100
+Revises: 2025_12_01_1000
+Create Date: 2025-12-01 11:00:00.000000
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2025_12_01_1100"
+down_revision: Union[str, None] = "2025_12_01_1000"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_radacct_tenant_username_start",
+        "radacct",
+        ["tenant_id", "username", "acctstarttime"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_radacct_tenant_subscriber_start",
+        "radacct",
+        ["tenant_id", "subscriber_id", "acctstarttime"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_radacct_tenant_subscriber_start", table_name="radacct", if_exists=True)
+    op.drop_index("idx_radacct_tenant_username_start", table_name="radacct", if_exists=True)
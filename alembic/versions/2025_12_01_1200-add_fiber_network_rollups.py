@@ -0,0 +1,85 @@
+"""Add fiber_network_rollups table
+
+Per-tenant fiber analytics aggregates, refreshed periodically so the
+network analytics query is a single primary-key read.
+
+Revision ID: 2025_12_01_1200
+Revises: 2025_12_01_1100
+Create Date: 2025-12-01 12:00:00.000000
+"""
+
+from collections.abc import Sequence
+from typing import Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2025_12_01_1200"
+down_revision: Union[str, None] = "2025_12_01_1100"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNT_COLUMNS = (
+    "total_cables",
+    "total_strands",
+    "cables_active",
+    "cables_inactive",
+    "cables_under_construction",
+    "cables_maintenance",
+    "cables_damaged",
+    "cables_retired",
+    "total_distribution_points",
+    "total_capacity",
+    "used_capacity",
+    "total_splice_points",
+    "total_service_areas",
+    "active_service_areas",
+    "homes_passed",
+    "homes_connected",
+)
+
+FLOAT_COLUMNS = (
+    "total_fiber_km",
+    "average_cable_loss_db_per_km",
+    "average_splice_loss_db",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "fiber_network_rollups",
+        sa.Column(
+            "tenant_id",
+            sa.String(length=255),
+            nullable=False,
+            comment="Tenant the aggregates belong to",
+        ),
+        *(
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+            for name in COUNT_COLUMNS
+        ),
+        *(
+            sa.Column(name, sa.Float(), nullable=False, server_default="0")
+            for name in FLOAT_COLUMNS
+        ),
+        sa.Column(
+            "cables_with_high_loss",
+            sa.JSON(),
+            nullable=False,
+            comment="cable_id of cables above the high-loss attenuation threshold",
+        ),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="When the aggregates were computed",
+        ),
+        sa.PrimaryKeyConstraint("tenant_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("fiber_network_rollups")
@@ -67,6 +67,18 @@ CREATE INDEX IF NOT EXISTS idx_radacct_ts_username
 CREATE INDEX IF NOT EXISTS idx_radacct_ts_session
     ON radacct_timeseries(session_id);
 
+-- Lets the sync task insert with ON CONFLICT DO NOTHING
+CREATE UNIQUE INDEX IF NOT EXISTS uq_radacct_ts_session
+    ON radacct_timeseries(time, tenant_id, nas_ip_address, session_id);
+
+-- High-water mark of the radacct -> radacct_timeseries sync
+CREATE TABLE IF NOT EXISTS radacct_sync_watermark (
+    name VARCHAR(64) PRIMARY KEY,
+    last_stop_time TIMESTAMPTZ NOT NULL,
+    last_radacctid BIGINT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL
+);
+
 -- Add compression policy (compress data older than 7 days)
 SELECT add_compression_policy(
     'radacct_timeseries',
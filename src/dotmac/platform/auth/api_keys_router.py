@@ -11,6 +11,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, ConfigDict, Field
 
 from .core import UserInfo, api_key_service, get_current_user
+from .verification_cache import get_verification_cache
 
 router = APIRouter(prefix="/auth/api-keys", tags=["API Keys"])
 
@@ -340,6 +341,10 @@ async def _update_api_key_metadata(key_id: str, updates: dict[str, Any]) -> bool
         data = api_key_service._deserialize(data_str)
         data.update(updates)
         await client.set(f"api_key_meta:{key_id}", api_key_service._serialize(data))
+        # Verified keys are cached by hash, not metadata id, so drop them all
+        cache = get_verification_cache()
+        if cache is not None:
+            await cache.invalidate_api_keys()
         return True
     else:
         if not getattr(api_key_service, "_fallback_allowed", True):
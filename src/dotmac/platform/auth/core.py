@@ -13,7 +13,7 @@ import inspect
 import json
 import os
 import secrets
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any, cast
@@ -32,6 +32,7 @@ from fastapi.security import (
 from passlib.context import CryptContext
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from dotmac.platform.auth.verification_cache import get_verification_cache
 from dotmac.platform.utils.crypto_compat import ensure_bcrypt_metadata
 
 redis_async: Any | None
@@ -469,6 +470,7 @@ class JWTService:
                 await redis_client.setex(f"blacklist:{jti}", ttl, "1")
             else:
                 await redis_client.set(f"blacklist:{jti}", "1")
+            await _invalidate_verification_cache(jtis=[jti])
 
             logger.info(f"Revoked token with JTI: {jti}")
             return True
@@ -527,7 +529,18 @@ class JWTService:
                     )
                     return True  # Fail closed: treat as revoked
                 return False  # Fail open in dev
-            return bool(await redis_client.exists(f"blacklist:{jti}"))
+
+            cache = get_verification_cache()
+            if cache is None or not cache.is_ready():
+                return bool(await redis_client.exists(f"blacklist:{jti}"))
+
+            cached = cache.token_revoked(jti)
+            if cached is not cache.MISSING:
+                return bool(cached)
+            generation = cache.generation
+            revoked = bool(await redis_client.exists(f"blacklist:{jti}"))
+            cache.set_token_revoked(jti, revoked, generation=generation)
+            return revoked
         except Exception as e:
             logger.error(
                 "Failed to check token revocation status",
@@ -537,6 +550,45 @@ class JWTService:
             )
             return not fail_open_allowed  # Fail closed in prod, open in dev
 
+    async def _prefetch_token_state(self, jti: str | None, session_id: str | None) -> None:
+        """Load uncached blacklist and session entries in one pipelined round trip.
+
+        Only fills the verification cache; ``is_token_revoked`` and
+        ``_is_session_active`` still make the decisions (and handle Redis
+        failures), reading the prefetched entries from the cache.
+        """
+        cache = get_verification_cache()
+        if cache is None or not (jti or session_id) or not cache.is_ready():
+            return
+
+        # Sessions can only be read alongside when they live on the same Redis
+        if session_manager.redis_url != self.redis_url:
+            session_id = None
+        need_jti = bool(jti) and cache.token_revoked(cast(str, jti)) is cache.MISSING
+        need_session = bool(session_id) and cache.session(cast(str, session_id)) is cache.MISSING
+        if not (need_jti or need_session):
+            return
+
+        generation = cache.generation
+        try:
+            redis_client = await self._get_redis()
+            if not redis_client:
+                return
+            async with redis_client.pipeline(transaction=False) as pipe:
+                if need_jti:
+                    pipe.exists(f"blacklist:{jti}")
+                if need_session:
+                    pipe.get(f"session:{session_id}")
+                results = list(await pipe.execute())
+        except Exception as e:
+            logger.debug("Token state prefetch failed", error=str(e))
+            return
+
+        if need_jti:
+            cache.set_token_revoked(cast(str, jti), bool(results.pop(0)), generation=generation)
+        if need_session:
+            session_manager.cache_session(cast(str, session_id), results.pop(0), generation)
+
     async def verify_token_async(
         self,
         token: str,
@@ -576,14 +628,21 @@ class JWTService:
                         f"Invalid token type. Expected {expected_type.value}, got {token_type}"
                     )
 
-            # Check if token is revoked
+            # Revocation and session state come from the verification cache,
+            # filled by at most one pipelined Redis round trip
             jti = claims.get("jti")
+            check_session = validate_session and expected_type == TokenType.ACCESS
+            await self._prefetch_token_state(
+                jti, claims.get("session_id") if check_session else None
+            )
+
+            # Check if token is revoked
             if jti and await self.is_token_revoked(jti):
                 raise JoseError("Token has been revoked")
 
             # SECURITY: Validate session is still active for ACCESS tokens
             # This ensures logout/session revocation is immediately effective
-            if validate_session and expected_type == TokenType.ACCESS:
+            if check_session:
                 session_id = claims.get("session_id")
                 if session_id:
                     session_active = await self._is_session_active(session_id)
@@ -668,6 +727,7 @@ class JWTService:
 
             # Clean up the tracking set
             await redis_client.delete(user_refresh_key)
+            await _invalidate_verification_cache(jtis=refresh_jtis)
 
             logger.info(
                 "Revoked user tokens",
@@ -800,15 +860,53 @@ class SessionManager:
                     status_code=503, detail="Session service unavailable (Redis not available)"
                 )
 
+        # The id may be cached as missing (e.g. deterministic 2FA pending ids)
+        await _invalidate_verification_cache(session_ids=[session_id])
         await self._enforce_session_limit(user_id)
         return session_id
 
+    async def store_session(self, session_id: str, data: dict[str, Any], ttl: int) -> bool:
+        """Write raw session data under a caller-chosen ID (e.g. 2FA pending state).
+
+        Unlike ``create_session`` the data is stored as given, without user
+        tracking or session limits. Returns False when no store is available.
+        """
+        client = await self._get_redis()
+        if client:
+            await client.setex(f"session:{session_id}", ttl, json.dumps(data))
+        elif self._fallback_enabled:
+            self._fallback_store[session_id] = {
+                **data,
+                "expires_at": (datetime.now(UTC) + timedelta(seconds=ttl)).isoformat(),
+            }
+        else:
+            return False
+
+        # The id may be cached as missing or with its previous contents
+        await _invalidate_verification_cache(session_ids=[session_id])
+        return True
+
     async def get_session(self, session_id: str) -> dict[str, Any] | None:
-        """Get session data from Redis or fallback."""
+        """Get session data from the verification cache, Redis or fallback.
+
+        Cached sessions are shared objects; callers must not mutate them.
+        """
+        cache = get_verification_cache()
+        if cache is not None and not cache.is_ready():
+            cache = None
+        generation: int | None = None
+        if cache is not None:
+            cached = cache.session(session_id)
+            if cached is not cache.MISSING:
+                return cast(dict[str, Any] | None, cached)
+            generation = cache.generation
+
         client = await self._get_redis()
         if client:
             try:
                 data = await client.get(f"session:{session_id}")
+                if cache is not None:
+                    self.cache_session(session_id, data, generation)
                 if data:
                     return cast(dict[str, Any], json.loads(data))
             except Exception as e:
@@ -826,6 +924,29 @@ class SessionManager:
 
         return None
 
+    def cache_session(
+        self, session_id: str, raw: str | None, generation: int | None = None
+    ) -> None:
+        """Store a session read from Redis in the verification cache.
+
+        Missing sessions are cached too, unless the in-memory fallback holds
+        them. Entries never outlive the session's own expiry.
+        """
+        cache = get_verification_cache()
+        if cache is None:
+            return
+        if not raw:
+            if session_id not in self._fallback_store:
+                cache.set_session(session_id, None, generation=generation)
+            return
+        session = cast(dict[str, Any], json.loads(raw))
+        cache.set_session(
+            session_id,
+            session,
+            ttl=_seconds_until(session.get("expires_at")),
+            generation=generation,
+        )
+
     def _is_fallback_expired(self, session: dict[str, Any]) -> bool:
         """Check expiry for fallback sessions and evict stale ones."""
         expires_at = session.get("expires_at")
@@ -836,24 +957,40 @@ class SessionManager:
         except Exception:
             return False
 
-    async def touch_session(self, session_id: str) -> bool:
-        """Refresh session last access time and TTL."""
+    async def touch_session(self, session_id: str, session: dict[str, Any] | None = None) -> bool:
+        """Refresh session last access time and TTL.
+
+        Args:
+            session_id: Session to refresh
+            session: Session data already loaded by the caller, to skip re-reading it
+        """
         ttl_seconds = self.idle_timeout_seconds
         now = datetime.now(UTC).isoformat()
 
         client = await self._get_redis()
         if client:
-            session = await self.get_session(session_id)
+            cache = get_verification_cache()
+            generation = cache.generation if cache is not None else None
+            session = session or await self.get_session(session_id)
             if not session:
                 return False
 
-            session["last_accessed"] = now
-            session["expires_at"] = (datetime.now(UTC) + timedelta(seconds=ttl_seconds)).isoformat()
+            # Copy: the loaded session may be the shared cached object
+            session = {
+                **session,
+                "last_accessed": now,
+                "expires_at": (datetime.now(UTC) + timedelta(seconds=ttl_seconds)).isoformat(),
+            }
+            raw = json.dumps(session)
             try:
-                await client.setex(f"session:{session_id}", ttl_seconds, json.dumps(session))
-                user_id = session.get("user_id")
-                if user_id:
-                    await client.expire(f"user_sessions:{user_id}", ttl_seconds)
+                async with client.pipeline(transaction=False) as pipe:
+                    pipe.setex(f"session:{session_id}", ttl_seconds, raw)
+                    user_id = session.get("user_id")
+                    if user_id:
+                        pipe.expire(f"user_sessions:{user_id}", ttl_seconds)
+                    await pipe.execute()
+                if cache is not None and cache.is_ready():
+                    self.cache_session(session_id, raw, generation)
             except Exception as exc:
                 logger.warning("Failed to refresh session TTL", session_id=session_id, error=str(exc))
             return True
@@ -883,6 +1020,7 @@ class SessionManager:
                         await client.srem(f"user_sessions:{user_id}", session_id)
 
                 deleted_count = await client.delete(f"session:{session_id}")
+                await _invalidate_verification_cache(session_ids=[session_id])
                 return bool(deleted_count)
 
             # Fallback cleanup
@@ -962,6 +1100,7 @@ class SessionManager:
                 for _, sid in overflow:
                     await client.delete(f"session:{sid}")
                     await client.srem(user_sessions_key, sid)
+                await _invalidate_verification_cache(session_ids=[sid for _, sid in overflow])
                 return
 
             if not self._fallback_enabled:
@@ -1007,6 +1146,7 @@ class SessionManager:
 
             # Clean up the user sessions set
             await client.delete(user_sessions_key)
+            await _invalidate_verification_cache(session_ids=session_ids)
 
             logger.info(f"Deleted {deleted_count} sessions for user {user_id}")
             return deleted_count
@@ -1165,41 +1305,21 @@ class APIKeyService:
 
             client = await self._get_redis()
             if client:
-                data = await client.get(f"api_key:{api_key_hash}")
-                if not data:
-                    return None
-
-                key_data: dict[str, Any] = json.loads(data)
-
-                # SECURITY: Load metadata to check is_active and expires_at
-                # First get the key_id from the lookup table
-                key_id = await client.get(f"api_key_lookup:{api_key_hash}")
-                if key_id:
-                    if isinstance(key_id, bytes):
-                        key_id = key_id.decode("utf-8")
-
-                    # Load metadata
-                    metadata_str = await client.get(f"api_key_meta:{key_id}")
-                    if metadata_str:
-                        metadata = self._deserialize(metadata_str)
-
-                        # Check if key is active
-                        if not metadata.get("is_active", True):
-                            logger.warning(f"API key {key_id} is disabled")
-                            return None
-
-                        # Check if key is expired
-                        expires_at_str = metadata.get("expires_at")
-                        if expires_at_str:
-                            expires_at = datetime.fromisoformat(expires_at_str)
-                            if expires_at < datetime.now(UTC):
-                                logger.warning(f"API key {key_id} is expired")
-                                return None
-
-                        # Merge metadata into key_data for backward compatibility
-                        key_data.update(metadata)
-
-                return key_data
+                cache = get_verification_cache()
+                if cache is not None and cache.is_ready():
+                    cached = cache.api_key(api_key_hash)
+                    if cached is not cache.MISSING:
+                        return dict(cast(dict[str, Any], cached)) if cached else None
+                    generation = cache.generation
+                    key_data = await self._load_api_key(client, api_key_hash)
+                    cache.set_api_key(
+                        api_key_hash,
+                        key_data,
+                        ttl=_seconds_until(key_data.get("expires_at")) if key_data else None,
+                        generation=generation,
+                    )
+                    return dict(key_data) if key_data else None
+                return await self._load_api_key(client, api_key_hash)
 
             if not self._fallback_allowed:
                 logger.error(
@@ -1213,6 +1333,58 @@ class APIKeyService:
             logger.error("Failed to verify API key", error=str(e))
             return None
 
+    async def _load_api_key(self, client: Any, api_key_hash: str) -> dict[str, Any] | None:
+        """Read a key record with its metadata and apply the is_active/expiry checks.
+
+        The key record, its lookup entry and (once the metadata id is known)
+        the metadata are fetched with one MGET.
+        """
+        cache = get_verification_cache()
+        known_key_id = cache.api_key_id(api_key_hash) if cache is not None else None
+
+        keys = [f"api_key:{api_key_hash}", f"api_key_lookup:{api_key_hash}"]
+        if known_key_id:
+            keys.append(f"api_key_meta:{known_key_id}")
+        values = await client.mget(keys)
+        data, key_id = values[0], values[1]
+        if not data:
+            return None
+
+        key_data: dict[str, Any] = json.loads(data)
+
+        # SECURITY: Load metadata to check is_active and expires_at
+        if not key_id:
+            return key_data
+        if isinstance(key_id, bytes):
+            key_id = key_id.decode("utf-8")
+        if key_id == known_key_id:
+            metadata_str = values[2]
+        else:
+            metadata_str = await client.get(f"api_key_meta:{key_id}")
+            if cache is not None:
+                cache.set_api_key_id(api_key_hash, key_id)
+
+        if metadata_str:
+            metadata = self._deserialize(metadata_str)
+
+            # Check if key is active
+            if not metadata.get("is_active", True):
+                logger.warning(f"API key {key_id} is disabled")
+                return None
+
+            # Check if key is expired
+            expires_at_str = metadata.get("expires_at")
+            if expires_at_str:
+                expires_at = datetime.fromisoformat(expires_at_str)
+                if expires_at < datetime.now(UTC):
+                    logger.warning(f"API key {key_id} is expired")
+                    return None
+
+            # Merge metadata into key_data for backward compatibility
+            key_data.update(metadata)
+
+        return key_data
+
     async def revoke_api_key(self, api_key: str) -> bool:
         """
         Revoke API key by hashing and deleting.
@@ -1234,6 +1406,7 @@ class APIKeyService:
             client = await self._get_redis()
             if client:
                 deleted_count = await client.delete(f"api_key:{api_key_hash}")
+                await _invalidate_verification_cache(api_key_hashes=[api_key_hash])
                 return bool(deleted_count)
             if not self._fallback_allowed:
                 logger.error("API key revocation failed: Redis unavailable and fallback disabled.")
@@ -1261,6 +1434,7 @@ class APIKeyService:
             client = await self._get_redis()
             if client:
                 deleted_count = await client.delete(f"api_key:{api_key_hash}")
+                await _invalidate_verification_cache(api_key_hashes=[api_key_hash])
                 return bool(deleted_count)
             if not self._fallback_allowed:
                 logger.error("API key revocation failed: Redis unavailable and fallback disabled.")
@@ -1272,6 +1446,34 @@ class APIKeyService:
             return False
 
 
+async def _invalidate_verification_cache(
+    *,
+    jtis: Iterable[str] = (),
+    session_ids: Iterable[str] = (),
+    api_key_hashes: Iterable[str] = (),
+) -> None:
+    """Drop revoked credentials from the verification cache on every worker."""
+    cache = get_verification_cache()
+    if cache is None:
+        return
+    try:
+        await cache.invalidate(jtis=jtis, session_ids=session_ids, api_key_hashes=api_key_hashes)
+    except Exception as e:  # pragma: no cover - defensive
+        logger.error("Failed to invalidate auth verification cache", error=str(e))
+
+
+def _seconds_until(timestamp: str | None) -> float | None:
+    """Seconds until an ISO timestamp, or None when absent or unparseable."""
+    if not timestamp:
+        return None
+    try:
+        remaining = (datetime.fromisoformat(timestamp) - datetime.now(UTC)).total_seconds()
+    except (TypeError, ValueError):
+        return None
+    # LocalCache treats a falsy TTL as "use the default", so never return 0
+    return remaining if remaining > 0 else -1.0
+
+
 # ============================================
 # Service Instances
 # ============================================
@@ -1486,7 +1688,25 @@ async def _enforce_active_session(claims: dict[str, Any]) -> None:
             detail="Session does not match user",
         )
 
-    await session_manager.touch_session(session_id)
+    if _touch_due(session):
+        await session_manager.touch_session(session_id, session)
+
+
+def _touch_due(session: dict[str, Any]) -> bool:
+    """Whether the sliding expiry of a session should be refreshed now.
+
+    Refreshes are throttled to one per ``session_touch_interval_seconds`` so
+    most requests validate their session without writing to Redis.
+    """
+    interval = settings.auth.session_touch_interval_seconds
+    last_accessed = session.get("last_accessed")
+    if interval <= 0 or not last_accessed:
+        return True
+    try:
+        elapsed = datetime.now(UTC) - datetime.fromisoformat(last_accessed)
+    except (TypeError, ValueError):
+        return True
+    return elapsed.total_seconds() >= interval
 
 
 # ============================================
@@ -0,0 +1,157 @@
+"""
+RBAC Permission Cache.
+
+Stores resolved permission snapshots per (user, tenant) on the async Redis
+client, so permission checks never block the event loop on a synchronous
+network call.
+
+Every cached snapshot is tagged with the global and per-user permission
+versions it was computed under, and both versions are read in the same MGET
+as the snapshot. Invalidating a user is therefore a single ``INCR`` of the
+user's version (``invalidate_all`` bumps the global one) rather than deleting
+every key variant or scanning ``user_perms:*``: entries tagged with an older
+version are simply ignored and expire on their own.
+
+Without the shared Redis client (scripts, tests) the same scheme runs on
+in-process dictionaries.
+"""
+
+import json
+from typing import Any
+
+import structlog
+
+from dotmac.platform.cache.local import LocalCache
+
+logger = structlog.get_logger(__name__)
+
+PERMISSION_CACHE_PREFIX = "user_perms"
+GLOBAL_VERSION_KEY = f"{PERMISSION_CACHE_PREFIX}:version"
+
+# Versions must outlive the snapshots tagged with them
+VERSION_TTL_SECONDS = 7 * 24 * 3600
+
+# (global version, user version)
+type PermissionVersion = tuple[int, int]
+
+_permission_cache: "PermissionCache | None" = None
+
+
+class PermissionCache:
+    """Versioned permission snapshot cache keyed by user, tenant and expiry mode."""
+
+    def __init__(self, ttl_seconds: int = 300, max_local_entries: int = 10_000) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._local = LocalCache(max_entries=max_local_entries, ttl_seconds=ttl_seconds)
+        self._local_versions: dict[str, int] = {}
+
+    @staticmethod
+    def _get_redis() -> Any:
+        from dotmac.platform.redis_client import redis_manager
+
+        try:
+            return redis_manager.get_client()
+        except RuntimeError:
+            # Redis not initialized (single process, scripts, tests)
+            return None
+
+    @staticmethod
+    def _version_key(user_id: str) -> str:
+        return f"{PERMISSION_CACHE_PREFIX}:{user_id}:version"
+
+    @staticmethod
+    def _key(user_id: str, tenant_scope: str | None, include_expired: bool) -> str:
+        return (
+            f"{PERMISSION_CACHE_PREFIX}:{user_id}:tenant:{tenant_scope or 'none'}"
+            f":expired={include_expired}"
+        )
+
+    async def get(
+        self, user_id: str, tenant_scope: str | None, include_expired: bool
+    ) -> tuple[dict[str, Any] | None, PermissionVersion | None]:
+        """
+        Return the cached payload (or None) and the current version.
+
+        Pass the version back to ``set`` so a snapshot computed while the
+        user's permissions changed is stored under an already stale version.
+        The version is None when Redis failed, in which case nothing is cached.
+        """
+        key = self._key(user_id, tenant_scope, include_expired)
+        redis = self._get_redis()
+        if redis is None:
+            version = (
+                self._local_versions.get(GLOBAL_VERSION_KEY, 0),
+                self._local_versions.get(self._version_key(user_id), 0),
+            )
+            payload = self._local.get(key)
+            payload = None if payload is LocalCache.MISSING else payload
+        else:
+            try:
+                global_version, user_version, raw = await redis.mget(
+                    [GLOBAL_VERSION_KEY, self._version_key(user_id), key]
+                )
+                version = (int(global_version or 0), int(user_version or 0))
+                payload = json.loads(raw) if raw else None
+            except Exception as e:
+                logger.debug("permission_cache.get_failed", user_id=user_id, error=str(e))
+                return None, None
+
+        if not isinstance(payload, dict) or tuple(payload.get("version") or ()) != version:
+            return None, version
+        return payload, version
+
+    async def set(
+        self,
+        user_id: str,
+        tenant_scope: str | None,
+        include_expired: bool,
+        payload: dict[str, Any],
+        version: PermissionVersion,
+    ) -> None:
+        """Store a snapshot payload tagged with the version returned by ``get``."""
+        key = self._key(user_id, tenant_scope, include_expired)
+        payload = {**payload, "version": list(version)}
+        redis = self._get_redis()
+        if redis is None:
+            self._local.set(key, payload)
+            return
+        try:
+            await redis.set(key, json.dumps(payload), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.debug("permission_cache.set_failed", user_id=user_id, error=str(e))
+
+    async def _bump(self, version_key: str) -> None:
+        self._local_versions[version_key] = self._local_versions.get(version_key, 0) + 1
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            async with redis.pipeline(transaction=False) as pipe:
+                pipe.incr(version_key)
+                pipe.expire(version_key, VERSION_TTL_SECONDS)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("permission_cache.invalidate_failed", key=version_key, error=str(e))
+
+    async def invalidate_user(self, user_id: str) -> None:
+        """Invalidate every cached snapshot of a user."""
+        await self._bump(self._version_key(user_id))
+
+    async def invalidate_all(self) -> None:
+        """Invalidate every cached snapshot (e.g. after role definitions change)."""
+        await self._bump(GLOBAL_VERSION_KEY)
+
+
+def get_permission_cache() -> PermissionCache:
+    """Get the process-wide permission cache."""
+    global _permission_cache
+
+    if _permission_cache is None:
+        _permission_cache = PermissionCache()
+    return _permission_cache
+
+
+def reset_permission_cache() -> None:
+    """Reset the process-wide permission cache (useful for testing)."""
+    global _permission_cache
+    _permission_cache = None
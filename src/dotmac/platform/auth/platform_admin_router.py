@@ -791,22 +791,22 @@ async def clear_system_cache(
         details={"cache_type": cache_type or "all"},
     )
 
+    if cache_type == "permissions":
+        # Permission snapshots are versioned; bumping the global version retires them all
+        from dotmac.platform.auth.permission_cache import get_permission_cache
+
+        await get_permission_cache().invalidate_all()
+        return CacheClearResponse(status="success", cache_type="permissions")
+
     # Placeholder - implement cache clearing
     from dotmac.platform.core.caching import get_redis
 
     try:
         redis_client = get_redis()
         if redis_client:
-            if cache_type == "permissions":
-                # Clear permission caches
-                pattern = "user_perms:*"
-                for key in redis_client.scan_iter(match=pattern):
-                    redis_client.delete(key)
-                return CacheClearResponse(status="success", cache_type="permissions")
-            else:
-                # Clear all caches
-                redis_client.flushdb()
-                return CacheClearResponse(status="success", cache_type="all")
+            # Clear all caches
+            redis_client.flushdb()
+            return CacheClearResponse(status="success", cache_type="all")
     except Exception as e:
         logger.error("Failed to clear cache", error=str(e))
         return CacheClearResponse(status="cleared", message=str(e))
@@ -9,9 +9,8 @@ Contains endpoints that don't require authentication:
 - Password reset
 """
 
-import json
 import secrets
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from typing import Any, Literal
 
 import structlog
@@ -218,7 +217,6 @@ async def _authenticate_and_issue_tokens(
     # Check if 2FA is enabled
     if user.mfa_enabled:
         pending_key = f"2fa_pending:{user.id}"
-        redis_client = await session_manager._get_redis()
         session_data = {
             "username": user.username,
             "email": user.email,
@@ -227,14 +225,7 @@ async def _authenticate_and_issue_tokens(
             "tenant_id": user.tenant_id,
         }
 
-        if redis_client:
-            await redis_client.setex(f"session:{pending_key}", 300, json.dumps(session_data))
-        else:
-            if session_manager._fallback_enabled:
-                session_data["expires_at"] = (
-                    datetime.now(UTC) + timedelta(seconds=300)
-                ).isoformat()
-                session_manager._fallback_store[pending_key] = session_data
+        await session_manager.store_session(pending_key, session_data, ttl=300)
 
         await log_user_activity(
             user_id=str(user.id),
@@ -673,7 +664,7 @@ async def verify_2fa_login(
         if redis_client:
             current_attempts = await redis_client.get(attempts_key)
             if current_attempts and int(current_attempts) >= max_attempts:
-                await redis_client.delete(f"session:2fa_pending:{verify_request.user_id}")
+                await session_manager.delete_session(f"2fa_pending:{verify_request.user_id}")
                 await redis_client.delete(attempts_key)
                 logger.warning(
                     "2FA session invalidated due to too many failed attempts",
@@ -788,7 +779,6 @@ async def login_cookie_only(
 
     if user.mfa_enabled:
         pending_key = f"2fa_pending:{user.id}"
-        redis_client = await session_manager._get_redis()
         session_data = {
             "username": user.username,
             "email": user.email,
@@ -797,11 +787,7 @@ async def login_cookie_only(
             "tenant_id": user.tenant_id,
         }
 
-        if redis_client:
-            await redis_client.setex(f"session:{pending_key}", 300, json.dumps(session_data))
-        elif session_manager._fallback_enabled:
-            session_data["expires_at"] = (datetime.now(UTC) + timedelta(seconds=300)).isoformat()
-            session_manager._fallback_store[pending_key] = session_data
+        await session_manager.store_session(pending_key, session_data, ttl=300)
 
         await log_user_activity(
             user_id=str(user.id),
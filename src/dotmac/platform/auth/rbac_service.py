@@ -26,8 +26,8 @@ from dotmac.platform.auth.models import (
     user_permissions,
     user_roles,
 )
+from dotmac.platform.auth.permission_cache import get_permission_cache
 from dotmac.platform.auth.rbac_audit import rbac_audit_logger
-from dotmac.platform.core.caching import cache_clear, cache_delete, cache_get, cache_set
 from dotmac.platform.db import get_async_session
 from dotmac.platform.tenant import get_current_tenant_id
 
@@ -40,12 +40,59 @@ except AttributeError:  # pragma: no cover - older Python versions
 logger = logging.getLogger(__name__)
 
 
+class PermissionIndex:
+    """
+    Interns permission names as bit positions.
+
+    Snapshots keep their allows/denies as bitmasks over this index, so a check
+    is one AND against the precomputed mask of every grant that satisfies the
+    permission (the name itself, ``*`` and each enclosing ``prefix.*``).
+    """
+
+    MAX_CACHED_CANDIDATES = 10_000
+
+    def __init__(self) -> None:
+        self._bits: dict[str, int] = {}
+        self._candidates: dict[str, int] = {}
+
+    def mask(self, names: Iterable[str]) -> int:
+        """Return the bitmask of ``names``, interning unseen ones."""
+        mask = 0
+        for name in names:
+            bit = self._bits.get(name)
+            if bit is None:
+                bit = self._bits[name] = 1 << len(self._bits)
+                # Cached candidate masks may now be missing the new bit
+                self._candidates.clear()
+            mask |= bit
+        return mask
+
+    def candidates(self, permission: str) -> int:
+        """Return the mask of every grant that would satisfy ``permission``."""
+        mask = self._candidates.get(permission)
+        if mask is not None:
+            return mask
+
+        parts = permission.split(".")
+        names = [permission, "*", f"{permission}.*"]
+        names += [".".join(parts[:i]) + ".*" for i in range(1, len(parts))]
+        mask = 0
+        for name in names:
+            mask |= self._bits.get(name, 0)
+        if len(self._candidates) < self.MAX_CACHED_CANDIDATES:
+            self._candidates[permission] = mask
+        return mask
+
+
+_permission_index = PermissionIndex()
+
+
 class PermissionSnapshot(Iterable[str]):
     """
     Container for a user's effective permissions, including explicit denies.
     """
 
-    __slots__ = ("allows", "denies")
+    __slots__ = ("allows", "denies", "_allow_mask", "_deny_mask")
 
     def __init__(
         self,
@@ -54,7 +101,9 @@ class PermissionSnapshot(Iterable[str]):
     ) -> None:
         self.allows: set[str] = set(allows or [])
         self.denies: set[str] = set(denies or [])
+        self._deny_mask = _permission_index.mask(self.denies)
         self._prune_conflicting_allows()
+        self._allow_mask = _permission_index.mask(self.allows)
 
     def __iter__(self) -> Iterator[str]:
         return iter(self.allows)
@@ -72,10 +121,10 @@ class PermissionSnapshot(Iterable[str]):
             self.allows.difference_update(to_remove)
 
     def allows_permission(self, permission: str) -> bool:
-        return self._matches(self.allows, permission)
+        return bool(self._allow_mask & _permission_index.candidates(permission))
 
     def is_denied(self, permission: str) -> bool:
-        return self._matches(self.denies, permission)
+        return bool(self._deny_mask & _permission_index.candidates(permission))
 
     def to_cache_payload(self) -> dict[str, list[str]]:
         return {"allows": list(self.allows), "denies": list(self.denies)}
@@ -89,19 +138,6 @@ class PermissionSnapshot(Iterable[str]):
             return cls(set(payload), set())
         return None
 
-    def _matches(self, bucket: set[str], permission: str) -> bool:
-        if permission in bucket or "*" in bucket:
-            return True
-
-        for entry in bucket:
-            if not entry.endswith(".*"):
-                continue
-            prefix = entry[:-2]
-            if permission == prefix or permission.startswith(f"{prefix}."):
-                return True
-
-        return False
-
 
 class RBACService:
     """Service for managing roles and permissions"""
@@ -110,19 +146,15 @@ class RBACService:
         self.db = db_session
         self._permission_cache: dict[str, Permission] = {}
         self._role_cache: dict[str, Role] = {}
+        # Per-request memo: the service lives for one request/session
+        self._snapshots: dict[tuple[str, str | None, bool], PermissionSnapshot] = {}
 
-    def _invalidate_user_permission_cache(self, user_id: UUID | str, tenant_id: str | None = None) -> None:
-        """Remove cached permissions for a user (clears legacy and new cache keys)."""
-        # Legacy keys (no tenant)
-        cache_delete(f"user_perms:{user_id}")
-        cache_delete(f"user_perms:{user_id}:expired=False")
-        cache_delete(f"user_perms:{user_id}:expired=True")
-        # Namespaced keys (with tenant)
-        tenant_scope = tenant_id or "none"
-        cache_delete(f"user_perms:{user_id}:tenant:{tenant_scope}:expired=False")
-        cache_delete(f"user_perms:{user_id}:tenant:{tenant_scope}:expired=True")
-        # Best-effort clear of any other tracked cache entries for this user
-        cache_clear(f"user_perms:{user_id}")
+    async def _invalidate_user_permission_cache(self, user_id: UUID | str) -> None:
+        """Invalidate cached permissions for a user (one version bump, all variants)."""
+        user_key = str(user_id)
+        for memo_key in [key for key in self._snapshots if key[0] == user_key]:
+            del self._snapshots[memo_key]
+        await get_permission_cache().invalidate_user(user_key)
 
     # ==================== User Permissions ====================
 
@@ -144,15 +176,18 @@ class RBACService:
             user_id = UUID(user_id)
 
         tenant_scope = self._resolve_tenant_scope(tenant_id)
-        tenant_cache_key = tenant_scope or "none"
 
         # Include include_expired flag in cache key to prevent cache poisoning
-        cache_key = f"user_perms:{user_id}:tenant:{tenant_cache_key}:expired={include_expired}"
+        memo_key = (str(user_id), tenant_scope, include_expired)
+        snapshot = self._snapshots.get(memo_key)
+        if snapshot is not None:
+            return snapshot
 
-        # Check cache first
-        cached = cache_get(cache_key)
+        permission_cache = get_permission_cache()
+        cached, version = await permission_cache.get(str(user_id), tenant_scope, include_expired)
         snapshot = PermissionSnapshot.from_cache_payload(cached)
         if snapshot is not None:
+            self._snapshots[memo_key] = snapshot
             return snapshot
 
         permissions: set[str] = set()
@@ -215,8 +250,11 @@ class RBACService:
 
         snapshot = PermissionSnapshot(permissions, denied_permissions)
 
-        # Cache for 5 minutes
-        cache_set(cache_key, snapshot.to_cache_payload(), ttl=300)
+        if version is not None:
+            await permission_cache.set(
+                str(user_id), tenant_scope, include_expired, snapshot.to_cache_payload(), version
+            )
+        self._snapshots[memo_key] = snapshot
 
         logger.info(f"Loaded {len(snapshot)} permissions for user {user_id}")
         return snapshot
@@ -364,7 +402,7 @@ class RBACService:
         )
 
         # Clear cache
-        self._invalidate_user_permission_cache(user_id)
+        await self._invalidate_user_permission_cache(user_id)
 
         logger.info(f"Assigned role {role_name} to user {user_id}")
 
@@ -419,7 +457,7 @@ class RBACService:
         )
 
         # Clear cache
-        self._invalidate_user_permission_cache(user_id)
+        await self._invalidate_user_permission_cache(user_id)
 
         logger.info(f"Revoked role {role_name} from user {user_id}")
 
@@ -510,7 +548,7 @@ class RBACService:
         )
 
         # Clear cache (need to clear both cache keys for expired=True and expired=False)
-        self._invalidate_user_permission_cache(user_id)
+        await self._invalidate_user_permission_cache(user_id)
 
         logger.info(f"Granted permission {permission_name} to user {user_id}")
 
@@ -572,7 +610,7 @@ class RBACService:
         )
 
         # Clear cache
-        self._invalidate_user_permission_cache(user_id)
+        await self._invalidate_user_permission_cache(user_id)
 
         logger.info(f"Revoked permission {permission_name} from user {user_id}")
 
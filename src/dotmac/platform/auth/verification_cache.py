@@ -0,0 +1,208 @@
+"""
+Auth Verification Cache.
+
+Process-wide cache of the Redis state consulted on every authenticated
+request: token blacklist entries, sessions and API key records. Hits cost no
+Redis round trip; misses are filled by a single pipelined lookup.
+
+Logout and revocation stay immediate: every write that revokes access drops
+the affected entries here and broadcasts the drop to other workers over Redis
+pub/sub, and the cache is bypassed whenever that listener is not subscribed.
+The short TTL only bounds staleness if a broadcast is lost.
+"""
+
+import time
+from collections.abc import Iterable
+from typing import Any
+
+import structlog
+
+from dotmac.platform.cache.local import LocalCache, LocalCacheInvalidator
+
+logger = structlog.get_logger(__name__)
+
+AUTH_REVOCATION_CHANNEL = "auth:revocations"
+
+# Seconds between attempts to (re)start the revocation listener
+LISTENER_RETRY_SECONDS = 5.0
+
+# API key hash -> metadata id mappings never change, so they are kept longer
+API_KEY_ID_TTL_SECONDS = 3600.0
+
+_verification_cache: "AuthVerificationCache | None" = None
+
+
+class AuthVerificationCache:
+    """
+    Bounded LRU/TTL cache of token, session and API key lookups.
+
+    ``None`` is cached for sessions and API keys that do not exist, so floods
+    of stale or forged credentials do not reach Redis either.
+    """
+
+    MISSING = LocalCache.MISSING
+
+    def __init__(
+        self,
+        max_entries: int = 50_000,
+        ttl_seconds: float = 5.0,
+        channel: str = AUTH_REVOCATION_CHANNEL,
+    ) -> None:
+        self.local_cache = LocalCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._invalidator = LocalCacheInvalidator(self.local_cache, channel=channel)
+        self._api_key_ids = LocalCache(max_entries=max_entries, ttl_seconds=API_KEY_ID_TTL_SECONDS)
+        self._next_listener_start = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter; pass it back to the setters to detect racing revocations."""
+        return self.local_cache.generation
+
+    @staticmethod
+    def _get_redis() -> Any:
+        from dotmac.platform.redis_client import redis_manager
+
+        try:
+            return redis_manager.get_client()
+        except RuntimeError:
+            # Redis not initialized (scripts, tests)
+            return None
+
+    def is_ready(self) -> bool:
+        """
+        Check whether reads may be served, starting the listener on demand.
+
+        Without the shared Redis client there is no way to hear about
+        revocations made by other workers, so the cache stays bypassed.
+        """
+        if self._invalidator.is_listening:
+            return True
+        redis = self._get_redis()
+        now = time.monotonic()
+        if redis is not None and now >= self._next_listener_start:
+            self._next_listener_start = now + LISTENER_RETRY_SECONDS
+            self._invalidator.start(redis)
+        return False
+
+    def _get(self, key: str) -> Any:
+        value = self.local_cache.get(key)
+        if value is LocalCache.MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def token_revoked(self, jti: str) -> bool | object:
+        """Return whether the token is blacklisted, or ``MISSING``."""
+        return self._get(f"token:{jti}")
+
+    def set_token_revoked(self, jti: str, revoked: bool, generation: int | None = None) -> None:
+        self.local_cache.set(f"token:{jti}", revoked, generation=generation)
+
+    def session(self, session_id: str) -> dict[str, Any] | None | object:
+        """Return the session, ``None`` for a missing one, or ``MISSING``."""
+        return self._get(f"session:{session_id}")
+
+    def set_session(
+        self,
+        session_id: str,
+        session: dict[str, Any] | None,
+        ttl: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Store a session (``None`` caches a missing session)."""
+        self.local_cache.set(f"session:{session_id}", session, ttl=ttl, generation=generation)
+
+    def api_key(self, api_key_hash: str) -> dict[str, Any] | None | object:
+        """Return the verified key data, ``None`` for an invalid key, or ``MISSING``."""
+        return self._get(f"api_key:{api_key_hash}")
+
+    def set_api_key(
+        self,
+        api_key_hash: str,
+        key_data: dict[str, Any] | None,
+        ttl: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Store verified key data (``None`` caches an invalid key)."""
+        self.local_cache.set(f"api_key:{api_key_hash}", key_data, ttl=ttl, generation=generation)
+
+    def api_key_id(self, api_key_hash: str) -> str | None:
+        """
+        Metadata id of a key hash, which never changes once assigned.
+
+        Safe to use without the listener: a stale id only points at metadata
+        that no longer exists, and the key record itself is always re-read.
+        """
+        value = self._api_key_ids.get(api_key_hash)
+        return None if value is LocalCache.MISSING else value
+
+    def set_api_key_id(self, api_key_hash: str, key_id: str) -> None:
+        self._api_key_ids.set(api_key_hash, key_id)
+
+    async def invalidate(
+        self,
+        *,
+        jtis: Iterable[str] = (),
+        session_ids: Iterable[str] = (),
+        api_key_hashes: Iterable[str] = (),
+    ) -> None:
+        """Drop entries here and on every other worker."""
+        keys = [f"token:{jti}" for jti in jtis if jti]
+        keys += [f"session:{session_id}" for session_id in session_ids if session_id]
+        keys += [f"api_key:{api_key_hash}" for api_key_hash in api_key_hashes if api_key_hash]
+        if not keys:
+            return
+        self.local_cache.delete(*keys)
+        redis = self._get_redis()
+        if redis is not None:
+            await self._invalidator.publish(redis, "keys", keys)
+
+    async def invalidate_api_keys(self) -> None:
+        """Drop every cached API key here and on every other worker."""
+        pattern = "api_key:*"
+        self.local_cache.invalidate_pattern(pattern)
+        redis = self._get_redis()
+        if redis is not None:
+            await self._invalidator.publish(redis, "pattern", [pattern])
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and size."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.local_cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.local_cache.evictions,
+            "listening": self._invalidator.is_listening,
+        }
+
+    async def close(self) -> None:
+        """Stop the revocation listener."""
+        await self._invalidator.stop()
+
+
+def get_verification_cache() -> AuthVerificationCache | None:
+    """Get the process-wide verification cache, or None when disabled."""
+    global _verification_cache
+
+    from dotmac.platform.settings import settings
+
+    if not settings.auth.verification_cache_enabled:
+        return None
+
+    if _verification_cache is None:
+        _verification_cache = AuthVerificationCache(
+            max_entries=settings.auth.verification_cache_max_entries,
+            ttl_seconds=settings.auth.verification_cache_ttl_seconds,
+        )
+    return _verification_cache
+
+
+def reset_verification_cache() -> None:
+    """Reset the process-wide verification cache (useful for testing)."""
+    global _verification_cache
+    _verification_cache = None
@@ -24,7 +24,7 @@ from dotmac.platform.billing.core.entities import (
 from dotmac.platform.billing.core.models import PaymentStatus
 from dotmac.platform.billing.models import BillingSubscriptionTable
 from dotmac.platform.customer_management.models import Customer, CustomerStatus
-from dotmac.platform.db import get_session_dependency
+from dotmac.platform.db import get_read_session
 
 logger = structlog.get_logger(__name__)
 
@@ -429,7 +429,7 @@ async def _get_expiring_subscriptions_cached(
 @router.get("/metrics", response_model=BillingMetricsResponse)
 async def get_billing_metrics(
     period_days: int = Query(default=30, ge=1, le=365, description="Time period in days"),
-    session: AsyncSession = Depends(get_session_dependency),
+    session: AsyncSession = Depends(get_read_session),
     current_user: UserInfo = Depends(get_current_user),
 ) -> BillingMetricsResponse:
     """
@@ -484,7 +484,7 @@ async def get_recent_payments(
     ),
     offset: int = Query(default=0, ge=0, description="Number of payments to skip"),
     status: str | None = Query(default=None, description="Filter by payment status"),
-    session: AsyncSession = Depends(get_session_dependency),
+    session: AsyncSession = Depends(get_read_session),
     current_user: UserInfo = Depends(get_current_user),
 ) -> PaymentListResponse:
     """
@@ -572,7 +572,7 @@ async def get_recent_payments(
 @customer_metrics_router.get("/overview", response_model=CustomerMetricsResponse)
 async def get_customer_metrics_overview(
     period_days: int = Query(default=30, ge=1, le=365, description="Time period in days"),
-    session: AsyncSession = Depends(get_session_dependency),
+    session: AsyncSession = Depends(get_read_session),
     current_user: UserInfo = Depends(get_current_user),
 ) -> CustomerMetricsResponse:
     """
@@ -660,7 +660,7 @@ async def get_expiring_subscriptions(
     limit: int = Query(
         default=50, ge=1, le=500, description="Maximum number of subscriptions to return"
     ),
-    session: AsyncSession = Depends(get_session_dependency),
+    session: AsyncSession = Depends(get_read_session),
     current_user: UserInfo = Depends(get_current_user),
 ) -> ExpiringSubscriptionsResponse:
     """
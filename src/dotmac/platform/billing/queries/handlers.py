@@ -6,6 +6,9 @@ Handlers optimize for read performance using:
 2. Caching strategies
 3. Database query optimization
 4. Minimal data transformation
+
+Handlers only read, so they can be given a session from
+``dotmac.platform.db.get_read_session`` to run against a read replica.
 """
 
 from datetime import UTC, datetime
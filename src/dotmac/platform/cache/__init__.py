@@ -12,6 +12,7 @@ from dotmac.platform.cache.decorators import (
     invalidate_cache,
     memoize,
 )
+from dotmac.platform.cache.local import LocalCache, LocalCacheInvalidator
 from dotmac.platform.cache.models import (
     CacheConfig,
     CacheNamespace,
@@ -31,6 +32,8 @@ __all__ = [
     # Service
     "CacheService",
     "get_cache_service",
+    "LocalCache",
+    "LocalCacheInvalidator",
     # Decorators
     "cached",
     "cache_aside",
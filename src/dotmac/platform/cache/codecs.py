@@ -0,0 +1,266 @@
+"""
+Cache Codecs.
+
+Pluggable serialization and compression for cached values. Encoded payloads
+start with a two byte header (format version, then serializer and compressor
+ids) so values written with different codecs, and legacy headerless JSON or
+zlib payloads, can be read side by side while a codec change rolls out.
+
+Fast paths (orjson, msgpack, zstandard, lz4) are optional dependencies and are
+only used when installed.
+"""
+
+import importlib
+import json
+import zlib
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, is_dataclass
+from datetime import date, datetime
+from enum import Enum, IntEnum
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Legacy payloads are JSON text or zlib streams, neither of which can start
+# with this byte
+CODEC_HEADER_V1 = 0xCA
+_HEADER_SIZE = 2
+
+_LEGACY_ZLIB_MAGIC = b"\x78\x9c"
+
+
+class SerializerId(IntEnum):
+    JSON = 1
+    ORJSON = 2
+    MSGPACK = 3
+
+
+class CompressorId(IntEnum):
+    NONE = 0
+    ZLIB = 1
+    ZSTD = 2
+    LZ4 = 3
+
+
+class CodecError(ValueError):
+    """Raised when a payload cannot be encoded or decoded."""
+
+
+def _optional_module(name: str) -> Any:
+    try:
+        return importlib.import_module(name)
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+
+
+orjson = _optional_module("orjson")
+msgpack = _optional_module("msgpack")
+zstandard = _optional_module("zstandard")
+lz4_frame = _optional_module("lz4.frame")
+
+
+def default_encoder(value: Any) -> Any:
+    """
+    Provide safe fallbacks for objects commonly cached in the application.
+
+    Raises TypeError for unsupported objects so serializers surface the issue.
+    """
+    if hasattr(value, "model_dump") and callable(value.model_dump):
+        return value.model_dump()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@dataclass(frozen=True, slots=True)
+class Serializer:
+    id: SerializerId
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class Compressor:
+    id: CompressorId
+    name: str
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value, default=default_encoder, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(payload: bytes) -> Any:
+    return json.loads(payload.decode("utf-8"))
+
+
+SERIALIZERS: dict[SerializerId, Serializer] = {
+    SerializerId.JSON: Serializer(SerializerId.JSON, "json", _json_dumps, _json_loads),
+}
+COMPRESSORS: dict[CompressorId, Compressor] = {
+    CompressorId.ZLIB: Compressor(CompressorId.ZLIB, "zlib", zlib.compress, zlib.decompress),
+}
+
+if orjson is not None:
+    # Non-string keys are stringified, matching the stdlib json behaviour
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+    SERIALIZERS[SerializerId.ORJSON] = Serializer(
+        SerializerId.ORJSON,
+        "orjson",
+        lambda value: orjson.dumps(value, default=default_encoder, option=_ORJSON_OPTIONS),
+        orjson.loads,
+    )
+
+if msgpack is not None:
+    SERIALIZERS[SerializerId.MSGPACK] = Serializer(
+        SerializerId.MSGPACK,
+        "msgpack",
+        lambda value: msgpack.packb(value, default=default_encoder, use_bin_type=True),
+        lambda payload: msgpack.unpackb(payload, raw=False, strict_map_key=False),
+    )
+
+if zstandard is not None:
+    _zstd_compressor = zstandard.ZstdCompressor(level=3)
+    _zstd_decompressor = zstandard.ZstdDecompressor()
+    COMPRESSORS[CompressorId.ZSTD] = Compressor(
+        CompressorId.ZSTD,
+        "zstd",
+        _zstd_compressor.compress,
+        _zstd_decompressor.decompress,
+    )
+
+if lz4_frame is not None:
+    COMPRESSORS[CompressorId.LZ4] = Compressor(
+        CompressorId.LZ4, "lz4", lz4_frame.compress, lz4_frame.decompress
+    )
+
+_SERIALIZER_PREFERENCE = (SerializerId.ORJSON, SerializerId.JSON)
+_COMPRESSOR_PREFERENCE = (CompressorId.ZSTD, CompressorId.LZ4, CompressorId.ZLIB)
+
+
+def _resolve_serializer(name: str) -> Serializer:
+    if name == "auto":
+        return next(SERIALIZERS[sid] for sid in _SERIALIZER_PREFERENCE if sid in SERIALIZERS)
+    for serializer in SERIALIZERS.values():
+        if serializer.name == name:
+            return serializer
+    logger.warning("Cache serializer unavailable, falling back to json", serializer=name)
+    return SERIALIZERS[SerializerId.JSON]
+
+
+def _resolve_compressor(name: str) -> Compressor | None:
+    if name == "none":
+        return None
+    if name == "auto":
+        return next(COMPRESSORS[cid] for cid in _COMPRESSOR_PREFERENCE if cid in COMPRESSORS)
+    for compressor in COMPRESSORS.values():
+        if compressor.name == name:
+            return compressor
+    logger.warning("Cache compressor unavailable, falling back to zlib", compressor=name)
+    return COMPRESSORS[CompressorId.ZLIB]
+
+
+class CacheCodec:
+    """
+    Encodes cache values with a configurable serializer and compressor.
+
+    Payloads larger than ``compression_threshold`` bytes are compressed when
+    that actually makes them smaller. Decoding dispatches on the header, so any
+    installed codec can be read regardless of the configured one.
+    """
+
+    def __init__(
+        self,
+        serializer: str = "auto",
+        compressor: str = "auto",
+        compression_threshold: int = 1024,
+    ) -> None:
+        self.serializer = _resolve_serializer(serializer)
+        self.compressor = _resolve_compressor(compressor)
+        self.compression_threshold = compression_threshold
+
+    def encode(self, value: Any, compress: bool = False) -> bytes:
+        """
+        Serialize (and maybe compress) a value.
+
+        Args:
+            value: Value to encode
+            compress: Compress regardless of the size threshold
+        """
+        try:
+            payload = self.serializer.dumps(value)
+        except (TypeError, ValueError) as exc:
+            raise CodecError(
+                f"Cannot cache non-JSON-serializable value of type {type(value).__name__}. "
+                "Use a Pydantic model, dataclass, or convert the value to JSON-safe primitives."
+            ) from exc
+
+        compressor_id = CompressorId.NONE
+        compressor = self.compressor or (COMPRESSORS[CompressorId.ZLIB] if compress else None)
+        if compressor is not None and (compress or len(payload) > self.compression_threshold):
+            compressed = compressor.compress(payload)
+            if compress or len(compressed) < len(payload):
+                payload = compressed
+                compressor_id = compressor.id
+
+        return bytes((CODEC_HEADER_V1, (compressor_id << 4) | self.serializer.id)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        """Decode a payload written by any codec version, including legacy ones."""
+        if not data or data[0] != CODEC_HEADER_V1:
+            return self._decode_legacy(data)
+
+        if len(data) < _HEADER_SIZE:
+            raise CodecError("Truncated cache payload header")
+
+        codec_byte = data[1]
+        payload = data[_HEADER_SIZE:]
+
+        try:
+            compressor_id = CompressorId(codec_byte >> 4)
+            serializer_id = SerializerId(codec_byte & 0x0F)
+        except ValueError as exc:
+            raise CodecError(f"Unknown cache codec 0x{codec_byte:02x}") from exc
+
+        if compressor_id is not CompressorId.NONE:
+            compressor = COMPRESSORS.get(compressor_id)
+            if compressor is None:
+                raise CodecError(f"Cache compressor {compressor_id.name.lower()} not installed")
+            try:
+                payload = compressor.decompress(payload)
+            except Exception as exc:
+                raise CodecError(f"Cache decompress error: {exc}") from exc
+
+        serializer = SERIALIZERS.get(serializer_id)
+        if serializer is None:
+            raise CodecError(f"Cache serializer {serializer_id.name.lower()} not installed")
+        try:
+            return serializer.loads(payload)
+        except Exception as exc:
+            raise CodecError(f"Corrupted cache data: {exc}") from exc
+
+    @staticmethod
+    def _decode_legacy(data: bytes) -> Any:
+        """Decode headerless JSON, optionally zlib compressed."""
+        raw_value = data
+        if raw_value[:2] == _LEGACY_ZLIB_MAGIC:
+            try:
+                raw_value = zlib.decompress(raw_value)
+            except zlib.error as exc:
+                raise CodecError(f"Cache decompress error: {exc}") from exc
+
+        try:
+            return json.loads(raw_value.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            raise CodecError(f"Corrupted cache data: {exc}") from exc
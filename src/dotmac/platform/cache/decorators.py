@@ -9,18 +9,28 @@ import functools
 import hashlib
 import inspect
 import json
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Iterable
 from typing import Any, TypeVar
 
 import structlog
 
 from dotmac.platform.cache.models import CacheNamespace
 from dotmac.platform.cache.service import get_cache_service
+from dotmac.platform.cache.stampede import CacheEnvelope, single_flight
+from dotmac.platform.core.distributed_locks import release_lock, try_lock
 
 logger = structlog.get_logger(__name__)
 
 T = TypeVar("T")
 
+# Static tag templates (formatted with the call's arguments) or a callable
+# receiving the call's arguments and returning the tags.
+TagSpec = Iterable[str] | Callable[..., Iterable[str]]
+
+# How often callers waiting on another worker's recompute re-check the cache
+_LOCK_POLL_INTERVAL = 0.05
+
 
 def cached(
     ttl: int = 3600,
@@ -29,12 +39,21 @@ def cached(
     include_tenant: bool = True,
     include_user: bool = False,
     key_builder: Callable[..., Any] | None = None,
+    tags: TagSpec | None = None,
+    stale_ttl: int = 0,
+    early_refresh_beta: float = 0.0,
+    lock_timeout: int | None = None,
+    coalesce: bool = True,
 ) -> Callable[..., Any]:
     """
     Decorator to cache function results.
 
     Usage:
-        @cached(ttl=3600, namespace=CacheNamespace.CUSTOMER)
+        @cached(
+            ttl=3600,
+            namespace=CacheNamespace.CUSTOMER,
+            tags=["customer:{customer_id}"],
+        )
         async def get_customer(customer_id: UUID):
             # Expensive operation
             return customer
@@ -45,9 +64,46 @@ def cached(
         key_prefix: Optional key prefix (defaults to function name)
         include_tenant: Include tenant_id in cache key
         include_user: Include user_id in cache key
+        tags: Tag templates formatted with the call's arguments (and
+            ``tenant_id``), or a callable returning tags; invalidate with
+            ``@invalidate_cache(tags=...)`` or ``CacheService.invalidate_tags``
+        stale_ttl: Seconds an expired value keeps being served while a single
+            background task refreshes it (stale-while-revalidate)
+        early_refresh_beta: Enables probabilistic early refresh before expiry;
+            higher values refresh earlier (1.0 is a good default)
+        lock_timeout: When set, a Redis lock (held at most this many seconds)
+            lets only one worker recompute a missing key while the others wait
+            for its result
+        coalesce: Share one in-flight computation between concurrent callers
+            in this process
+
+    The stampede options apply to async functions; sync functions only
+    understand the stored format.
     """
+    use_envelope = stale_ttl > 0 or early_refresh_beta > 0
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        async def _store(
+            cache: Any,
+            cache_key: str,
+            value: Any,
+            tenant_id: str | None,
+            store_ttl: int,
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+        ) -> None:
+            if tags is not None:
+                await cache.set(
+                    cache_key,
+                    value,
+                    namespace,
+                    tenant_id,
+                    store_ttl,
+                    tags=_resolve_tags(tags, func, args, kwargs),
+                )
+            else:
+                await cache.set(cache_key, value, namespace, tenant_id, store_ttl)
+
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
             cache = get_cache_service()
@@ -65,34 +121,86 @@ def cached(
 
             # Extract tenant_id for isolation
             tenant_id = _extract_tenant_id(args, kwargs) if include_tenant else None
+            flight_key = f"cache:{namespace}:{tenant_id or 'global'}:{cache_key}"
+
+            async def refresh(stale: Any = None) -> Any:
+                lock_value = None
+                if lock_timeout:
+                    lock_value = await _try_refresh_lock(flight_key, lock_timeout)
+                    if lock_value is None:
+                        # Another worker is recomputing; background refreshes
+                        # keep serving stale data, foreground callers wait
+                        if stale is not None:
+                            return stale
+                        value = await _wait_for_value(
+                            cache, cache_key, namespace, tenant_id, lock_timeout
+                        )
+                        if value is not None:
+                            return value
+
+                try:
+                    started = time.monotonic()
+                    result = await func(*args, **kwargs)
+                    stored, store_ttl = result, ttl
+                    if use_envelope:
+                        stored = CacheEnvelope(
+                            value=result,
+                            expires_at=time.time() + ttl,
+                            compute_seconds=time.monotonic() - started,
+                        ).to_dict()
+                        store_ttl = ttl + stale_ttl
+                    await _store(cache, cache_key, stored, tenant_id, store_ttl, args, kwargs)
+                finally:
+                    if lock_value is not None:
+                        await _release_refresh_lock(flight_key, lock_value)
 
-            # Try to get from cache
-            cached_value = await cache.get(cache_key, namespace, tenant_id)
-
-            if cached_value is not None:
                 logger.debug(
-                    "Cache hit",
+                    "Cache miss - value cached",
                     function=func.__name__,
                     key=cache_key,
                     namespace=namespace,
+                    ttl=ttl,
                 )
-                return cached_value
+                return result
 
-            # Cache miss - execute function
-            result = await func(*args, **kwargs)
-
-            # Store in cache
-            await cache.set(cache_key, result, namespace, tenant_id, ttl)
-
-            logger.debug(
-                "Cache miss - value cached",
-                function=func.__name__,
-                key=cache_key,
-                namespace=namespace,
-                ttl=ttl,
-            )
+            # Try to get from cache
+            cached_value = await cache.get(cache_key, namespace, tenant_id)
 
-            return result
+            if cached_value is not None:
+                envelope = CacheEnvelope.from_cached(cached_value) if use_envelope else None
+                if envelope is None:
+                    logger.debug(
+                        "Cache hit",
+                        function=func.__name__,
+                        key=cache_key,
+                        namespace=namespace,
+                    )
+                    return cached_value
+
+                now = time.time()
+                if envelope.is_fresh(now):
+                    if envelope.should_refresh_early(early_refresh_beta, now):
+                        single_flight.run_in_background(
+                            flight_key, functools.partial(refresh, envelope.value)
+                        )
+                    return envelope.value
+
+                if stale_ttl > 0:
+                    logger.debug(
+                        "Cache hit (stale) - refreshing in background",
+                        function=func.__name__,
+                        key=cache_key,
+                        namespace=namespace,
+                    )
+                    single_flight.run_in_background(
+                        flight_key, functools.partial(refresh, envelope.value)
+                    )
+                    return envelope.value
+
+            # Cache miss - execute function once for all concurrent callers
+            if coalesce:
+                return await single_flight.run(flight_key, refresh)
+            return await refresh()
 
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -114,13 +222,26 @@ def cached(
             cached_value = asyncio.run(cache.get(cache_key, namespace, tenant_id))
 
             if cached_value is not None:
-                return cached_value
+                envelope = CacheEnvelope.from_cached(cached_value) if use_envelope else None
+                if envelope is None:
+                    return cached_value
+                if envelope.is_fresh():
+                    return envelope.value
 
             # Cache miss - execute function
+            started = time.monotonic()
             result = func(*args, **kwargs)
 
             # Store in cache (blocking)
-            asyncio.run(cache.set(cache_key, result, namespace, tenant_id, ttl))
+            stored, store_ttl = result, ttl
+            if use_envelope:
+                stored = CacheEnvelope(
+                    value=result,
+                    expires_at=time.time() + ttl,
+                    compute_seconds=time.monotonic() - started,
+                ).to_dict()
+                store_ttl = ttl + stale_ttl
+            asyncio.run(_store(cache, cache_key, stored, tenant_id, store_ttl, args, kwargs))
 
             return result
 
@@ -137,11 +258,16 @@ def cache_aside(
     ttl: int = 3600,
     namespace: CacheNamespace | str = CacheNamespace.QUERY_RESULT,
     key_builder: Callable[..., Any] | None = None,
+    tags: TagSpec | None = None,
+    stale_ttl: int = 0,
+    early_refresh_beta: float = 0.0,
+    lock_timeout: int | None = None,
 ) -> Callable[..., Any]:
     """
     Cache-aside pattern decorator.
 
-    Check cache first, if miss load from source and cache.
+    Check cache first, if miss load from source and cache. Accepts the same
+    stampede protection options as ``@cached``.
 
     Usage:
         @cache_aside(ttl=3600, namespace=CacheNamespace.CUSTOMER)
@@ -150,13 +276,23 @@ def cache_aside(
             result = await db.execute(stmt)
             return result.scalar_one_or_none()
     """
-    return cached(ttl=ttl, namespace=namespace, key_prefix=None, key_builder=key_builder)
+    return cached(
+        ttl=ttl,
+        namespace=namespace,
+        key_prefix=None,
+        key_builder=key_builder,
+        tags=tags,
+        stale_ttl=stale_ttl,
+        early_refresh_beta=early_refresh_beta,
+        lock_timeout=lock_timeout,
+    )
 
 
 def invalidate_cache(
     namespace: CacheNamespace | str,
     key_pattern: str | None = None,
     keys: list[str] | None = None,
+    tags: TagSpec | None = None,
 ) -> Callable[..., Any]:
     """
     Decorator to invalidate cache after function execution.
@@ -164,7 +300,7 @@ def invalidate_cache(
     Usage:
         @invalidate_cache(
             namespace=CacheNamespace.CUSTOMER,
-            key_pattern="get_customer:*"
+            tags=["customer:{customer_id}"],
         )
         async def update_customer(customer_id: UUID, data: dict[str, Any]):
             # Update customer
@@ -172,8 +308,10 @@ def invalidate_cache(
 
     Args:
         namespace: Cache namespace to invalidate
-        key_pattern: Pattern for keys to invalidate (supports *)
+        key_pattern: Pattern for keys to invalidate (supports *); scans the
+            keyspace, so prefer ``tags`` for hot paths
         keys: Specific keys to invalidate
+        tags: Tags to invalidate (same format as ``@cached(tags=...)``)
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -186,7 +324,16 @@ def invalidate_cache(
             cache = get_cache_service()
             tenant_id = _extract_tenant_id(args, kwargs)
 
-            if key_pattern:
+            if tags is not None:
+                resolved_tags = _resolve_tags(tags, func, args, kwargs)
+                await cache.invalidate_tags(*resolved_tags)
+                logger.debug(
+                    "Cache invalidated by tags",
+                    function=func.__name__,
+                    tags=resolved_tags,
+                    namespace=namespace,
+                )
+            elif key_pattern:
                 await cache.invalidate_pattern(key_pattern, namespace, tenant_id)
                 logger.debug(
                     "Cache invalidated by pattern",
@@ -213,7 +360,9 @@ def invalidate_cache(
             cache = get_cache_service()
             tenant_id = _extract_tenant_id(args, kwargs)
 
-            if key_pattern:
+            if tags is not None:
+                asyncio.run(cache.invalidate_tags(*_resolve_tags(tags, func, args, kwargs)))
+            elif key_pattern:
                 asyncio.run(cache.invalidate_pattern(key_pattern, namespace, tenant_id))
             elif keys:
                 for key in keys:
@@ -338,6 +487,76 @@ def _generate_cache_key(
     return ":".join(key_parts)
 
 
+def _resolve_tags(
+    tags: TagSpec,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> list[str]:
+    """Resolve tag templates or a tag callable against the call's arguments."""
+    if callable(tags):
+        return [str(tag) for tag in tags(*args, **kwargs)]
+
+    bound_args = inspect.signature(func).bind(*args, **kwargs)
+    bound_args.apply_defaults()
+    values = dict(bound_args.arguments)
+    values.setdefault("tenant_id", _extract_tenant_id(args, kwargs))
+
+    resolved = []
+    for template in tags:
+        try:
+            resolved.append(template.format_map(values))
+        except (KeyError, AttributeError, IndexError) as e:
+            logger.warning(
+                "Cannot resolve cache tag",
+                function=func.__name__,
+                tag=template,
+                error=str(e),
+            )
+    return resolved
+
+
+async def _try_refresh_lock(key: str, timeout: int) -> str | None:
+    """Acquire the cross-worker recompute lock; proceeds unlocked if Redis fails."""
+    try:
+        return await try_lock(key, timeout=timeout)
+    except Exception as e:
+        logger.warning("Cache refresh lock unavailable", key=key, error=str(e))
+        return ""
+
+
+async def _release_refresh_lock(key: str, lock_value: str) -> None:
+    if not lock_value:
+        return
+    try:
+        await release_lock(key, lock_value)
+    except Exception as e:
+        logger.warning("Failed to release cache refresh lock", key=key, error=str(e))
+
+
+async def _wait_for_value(
+    cache: Any,
+    cache_key: str,
+    namespace: CacheNamespace | str,
+    tenant_id: str | None,
+    timeout: float,
+    poll_interval: float = _LOCK_POLL_INTERVAL,
+) -> Any:
+    """Poll the cache for a value being computed by another worker."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        await asyncio.sleep(poll_interval)
+        cached_value = await cache.get(cache_key, namespace, tenant_id)
+        if cached_value is None:
+            continue
+        envelope = CacheEnvelope.from_cached(cached_value)
+        if envelope is None:
+            return cached_value
+        if envelope.is_fresh():
+            return envelope.value
+    return None
+
+
 def _extract_tenant_id(args: tuple[Any, ...], kwargs: dict[str, Any]) -> str | None:
     """Extract tenant_id from function arguments."""
     # Check kwargs first
@@ -0,0 +1,206 @@
+"""
+Local (L1) Cache.
+
+Bounded in-process LRU/TTL cache that sits in front of Redis for hot,
+read-mostly namespaces (tenant settings, plans, feature flags). Workers keep
+their L1 copies coherent by broadcasting invalidations over Redis pub/sub.
+"""
+
+import asyncio
+import fnmatch
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+from uuid import uuid4
+
+import structlog
+
+from dotmac.platform.redis_client import RedisClientType
+
+logger = structlog.get_logger(__name__)
+
+L1_INVALIDATION_CHANNEL = "cache:l1:invalidate"
+
+_MISSING = object()
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    expires_at: float
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU cache with per-entry TTL.
+
+    Values are stored as deserialized objects and returned by reference, so
+    callers must treat cached values as read-only.
+    """
+
+    MISSING = _MISSING
+
+    def __init__(self, max_entries: int = 10_000, ttl_seconds: float = 30.0) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.evictions = 0
+        # Bumped on every invalidation so readers can detect one that raced
+        # with their Redis read (see ``set(generation=...)``)
+        self.generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, or ``LocalCache.MISSING`` when absent/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Store a value, evicting the least recently used entries when full.
+
+        When ``generation`` is given, the value is only stored if no
+        invalidation happened since that generation was read.
+        """
+        if generation is not None and generation != self.generation:
+            return
+
+        local_ttl = self.ttl_seconds if not ttl else min(ttl, self.ttl_seconds)
+        if local_ttl <= 0:
+            return
+
+        self._entries[key] = _Entry(value, time.monotonic() + local_ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def delete(self, *keys: str) -> int:
+        """Drop specific keys."""
+        self.generation += 1
+        return sum(self._entries.pop(key, None) is not None for key in keys)
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Drop every entry whose key matches a Redis-style glob pattern."""
+        matching = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        return self.delete(*matching)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self.generation += 1
+        self._entries.clear()
+
+
+class LocalCacheInvalidator:
+    """
+    Broadcasts and applies L1 invalidations across workers via Redis pub/sub.
+
+    Each process tags its messages with an origin id and ignores its own, since
+    local invalidation has already happened synchronously.
+    """
+
+    def __init__(self, local_cache: LocalCache, channel: str = L1_INVALIDATION_CHANNEL) -> None:
+        self.local_cache = local_cache
+        self.channel = channel
+        self.origin = uuid4().hex
+        self._listener_task: asyncio.Task[None] | None = None
+        self._subscribed = False
+
+    def message(self, op: str, values: Iterable[str]) -> str:
+        """Encode an invalidation (``keys``, ``pattern`` or ``clear``) for the channel."""
+        return json.dumps({"origin": self.origin, "op": op, "values": list(values)})
+
+    async def publish(self, redis: RedisClientType, op: str, values: Iterable[str]) -> None:
+        """Broadcast an invalidation (``keys``, ``pattern`` or ``clear``)."""
+        message = self.message(op, values)
+        try:
+            await redis.publish(self.channel, message)
+        except Exception as e:
+            logger.warning("L1 cache invalidation broadcast failed", op=op, error=str(e))
+
+    def apply(self, raw_message: str | bytes) -> None:
+        """Apply an invalidation received from another worker."""
+        try:
+            message = json.loads(raw_message)
+        except (TypeError, ValueError):
+            logger.warning("Malformed L1 cache invalidation message")
+            return
+
+        if message.get("origin") == self.origin:
+            return
+
+        op = message.get("op")
+        values = message.get("values") or []
+        if op == "keys":
+            self.local_cache.delete(*values)
+        elif op == "pattern":
+            for pattern in values:
+                self.local_cache.invalidate_pattern(pattern)
+        else:
+            self.local_cache.clear()
+
+    @property
+    def is_listening(self) -> bool:
+        """True once the listener is subscribed and still running."""
+        return (
+            self._subscribed and self._listener_task is not None and not self._listener_task.done()
+        )
+
+    def start(self, redis: RedisClientType) -> None:
+        """Start the background listener if it is not already running."""
+        if self._listener_task is not None and not self._listener_task.done():
+            return
+        self._listener_task = asyncio.create_task(self._listen(redis))
+
+    async def stop(self) -> None:
+        """Stop the background listener."""
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            pass
+        self._listener_task = None
+
+    async def _listen(self, redis: RedisClientType) -> None:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(self.channel)
+            self._subscribed = True
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self.apply(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Without the listener L1 could serve stale data, so drop it all
+            logger.error("L1 cache invalidation listener failed", error=str(e))
+            self.local_cache.clear()
+        finally:
+            self._subscribed = False
+            try:
+                await pubsub.unsubscribe(self.channel)
+                await pubsub.close()
+            except Exception:  # nosec B110 - best-effort cleanup
+                pass
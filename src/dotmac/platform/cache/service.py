@@ -5,15 +5,15 @@ Redis-backed caching with multiple strategies and patterns.
 """
 
 import hashlib
-import json
-import zlib
-from dataclasses import asdict, is_dataclass
-from datetime import UTC, date, datetime
-from enum import Enum
+import time
+from collections.abc import Iterable
+from datetime import UTC, datetime
 from typing import Any, TypedDict
 
 import structlog
 
+from dotmac.platform.cache.codecs import CacheCodec, CodecError
+from dotmac.platform.cache.local import LocalCache, LocalCacheInvalidator
 from dotmac.platform.cache.models import CacheNamespace
 from dotmac.platform.redis_client import RedisClientType
 from dotmac.platform.settings import settings
@@ -22,9 +22,58 @@ logger = structlog.get_logger(__name__)
 
 _default_cache_service: "CacheService | None" = None
 
+# Invalidation deletes tagged keys in moderate batches
+_TAG_DELETE_BATCH_SIZE = 500
+
+# Store a value and register it in its tag sets in one round trip.
+#
+# KEYS: cache key, then one tag set key per tag
+# ARGV: serialized value, ttl (0 = no expiration), now (epoch seconds)
+#
+# Tag sets are sorted sets scored by each member's expiry (+inf without one).
+# Members whose cache key has expired are pruned on every write, so a tag
+# that is written often does not accumulate dead keys. Tag sets live at least
+# as long as their longest-lived member, and are made persistent when a
+# member has no expiration.
+_SET_WITH_TAGS_SCRIPT = """
+local ttl = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+if ttl > 0 then
+    redis.call("SET", KEYS[1], ARGV[1], "EX", ttl)
+else
+    redis.call("SET", KEYS[1], ARGV[1])
+end
+
+local expires_at = "+inf"
+if ttl > 0 then
+    expires_at = now + ttl
+end
+
+for i = 2, #KEYS do
+    local tag_key = KEYS[i]
+    -- -2: new set, -1: persistent set, otherwise remaining seconds
+    local current = redis.call("TTL", tag_key)
+    redis.call("ZREMRANGEBYSCORE", tag_key, "-inf", "(" .. now)
+    redis.call("ZADD", tag_key, expires_at, KEYS[1])
+    if ttl <= 0 then
+        redis.call("PERSIST", tag_key)
+    elseif current == -2 or (current >= 0 and current < ttl) then
+        redis.call("EXPIRE", tag_key, ttl)
+    end
+end
+return 1
+"""
+
 
 class CacheService:
-    """Service for caching with Redis backend."""
+    """
+    Service for caching with Redis backend.
+
+    Namespaces listed in ``local_namespaces`` are additionally served from an
+    in-process L1 cache (when ``local_cache`` is given). Writes and
+    invalidations are broadcast over Redis pub/sub so other workers drop their
+    L1 copies; L1 is bypassed while the invalidation listener is not running.
+    """
 
     class NamespaceStats(TypedDict):
         hits: int
@@ -33,11 +82,26 @@ class CacheService:
         deletes: int
         total_hit_latency: float
         total_miss_latency: float
+        local_hits: int
+        local_misses: int
 
-    def __init__(self, redis: RedisClientType | None = None):
+    def __init__(
+        self,
+        redis: RedisClientType | None = None,
+        local_cache: LocalCache | None = None,
+        local_namespaces: Iterable[CacheNamespace | str] | None = None,
+        codec: CacheCodec | None = None,
+    ):
         """Initialize cache service."""
         self.redis = redis
+        self.codec = codec or CacheCodec()
         self._local_stats: dict[str, CacheService.NamespaceStats] = {}
+        self._set_script: Any = None
+        self.local_cache = local_cache
+        self.local_namespaces = {
+            ns.value if isinstance(ns, CacheNamespace) else ns for ns in local_namespaces or ()
+        }
+        self._invalidator = LocalCacheInvalidator(local_cache) if local_cache is not None else None
 
     async def _get_redis(self) -> RedisClientType:
         """Get Redis connection."""
@@ -52,6 +116,84 @@ class CacheService:
             )
         return self.redis
 
+    def _get_set_script(self, redis: RedisClientType) -> Any:
+        """Get the registered set-with-tags script (EVALSHA with EVAL fallback)."""
+        if self._set_script is None:
+            self._set_script = redis.register_script(_SET_WITH_TAGS_SCRIPT)
+        return self._set_script
+
+    def _is_local_namespace(self, namespace: CacheNamespace | str) -> bool:
+        """Check whether the namespace is configured for L1 caching."""
+        if self._invalidator is None:
+            return False
+        ns = namespace.value if isinstance(namespace, CacheNamespace) else namespace
+        return ns in self.local_namespaces
+
+    def _uses_local(self, namespace: CacheNamespace | str, redis: RedisClientType) -> bool:
+        """Check whether reads may be served from L1, starting the listener on demand."""
+        if self._invalidator is None or not self._is_local_namespace(namespace):
+            return False
+        if not self._invalidator.is_listening:
+            # Coherence depends on the listener; serve from Redis until it runs
+            self._invalidator.start(redis)
+            return False
+        return True
+
+    async def _invalidate_local(
+        self,
+        redis: RedisClientType,
+        namespace: CacheNamespace | str | None = None,
+        keys: Iterable[str | bytes] = (),
+        pattern: str | None = None,
+    ) -> None:
+        """
+        Drop L1 entries for changed keys here and on every other worker.
+
+        When ``namespace`` is None (tag invalidation spans namespaces), keys are
+        filtered by the namespace embedded in the cache key.
+        """
+        if self.local_cache is None or self._invalidator is None:
+            return
+        if namespace is not None and not self._is_local_namespace(namespace):
+            return
+
+        if pattern is not None:
+            self.local_cache.invalidate_pattern(pattern)
+            await self._invalidator.publish(redis, "pattern", [pattern])
+            return
+
+        key_list = []
+        for key in keys:
+            key_str = key.decode() if isinstance(key, bytes) else key
+            # cache:{tenant}:{namespace}:{key}
+            parts = key_str.split(":", 3)
+            if namespace is None and (len(parts) < 4 or parts[2] not in self.local_namespaces):
+                continue
+            key_list.append(key_str)
+
+        if key_list:
+            self.local_cache.delete(*key_list)
+            await self._invalidator.publish(redis, "keys", key_list)
+
+    def _queue_local_invalidation(
+        self, pipe: Any, namespace: CacheNamespace | str, keys: list[str]
+    ) -> list[str]:
+        """
+        Queue the L1 broadcast for written keys on the write's own pipeline.
+
+        Returns the keys to drop from this process's L1 once the pipeline has
+        run (empty when the namespace has no L1, so nothing is published).
+        """
+        if self._invalidator is None or not self._is_local_namespace(namespace):
+            return []
+        pipe.publish(self._invalidator.channel, self._invalidator.message("keys", keys))
+        return keys
+
+    async def close(self) -> None:
+        """Stop the L1 invalidation listener."""
+        if self._invalidator is not None:
+            await self._invalidator.stop()
+
     def _generate_key(
         self,
         namespace: CacheNamespace | str,
@@ -73,6 +215,15 @@ class CacheService:
             return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()  # nosec B324
         return key
 
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        """Generate Redis key for the set of cache keys carrying a tag."""
+        return f"cache:tag:{tag}"
+
+    def _tag_keys_for(self, tags: Iterable[str] | None) -> list[str]:
+        """Tag set keys a cache entry must be registered in."""
+        return [self._tag_key(tag) for tag in sorted(set(tags or ()))]
+
     async def get(
         self,
         key: str,
@@ -95,6 +246,15 @@ class CacheService:
         redis = await self._get_redis()
         cache_key = self._generate_key(namespace, self._hash_key(key), tenant_id)
 
+        use_local = self._uses_local(namespace, redis)
+        generation = 0
+        if use_local and self.local_cache is not None:
+            local_value = self.local_cache.get(cache_key)
+            if local_value is not LocalCache.MISSING:
+                self._record_hit(namespace, 0, local_hit=True)
+                return local_value
+            generation = self.local_cache.generation
+
         try:
             start_time = datetime.now(UTC)
 
@@ -103,14 +263,17 @@ class CacheService:
             latency = (datetime.now(UTC) - start_time).total_seconds() * 1000
 
             if value is None:
-                self._record_miss(namespace, latency)
+                self._record_miss(namespace, latency, local=use_local)
                 logger.debug("Cache miss", key=cache_key, namespace=namespace)
                 return default
 
             # Deserialize
             deserialized = self._deserialize(value)
 
-            self._record_hit(namespace, latency)
+            if use_local and self.local_cache is not None and deserialized is not None:
+                self.local_cache.set(cache_key, deserialized, generation=generation)
+
+            self._record_hit(namespace, latency, local_hit=False if use_local else None)
             logger.debug("Cache hit", key=cache_key, namespace=namespace)
 
             return deserialized
@@ -127,6 +290,7 @@ class CacheService:
         tenant_id: str | None = None,
         ttl: int | None = None,
         compress: bool = False,
+        tags: Iterable[str] | None = None,
     ) -> bool:
         """
         Set value in cache.
@@ -137,7 +301,8 @@ class CacheService:
             namespace: Cache namespace
             tenant_id: Tenant ID for isolation
             ttl: Time-to-live in seconds (None = no expiration)
-            compress: Whether to compress value
+            compress: Compress even below the codec's size threshold
+            tags: Tags (e.g. ``customer:<id>``) for later :meth:`invalidate_tags`
 
         Returns:
             True if successful
@@ -146,21 +311,26 @@ class CacheService:
         cache_key = self._generate_key(namespace, self._hash_key(key), tenant_id)
 
         try:
-            # Serialize
-            serialized = self._serialize(value)
-
-            # Compress if requested
-            if compress:
-                serialized = zlib.compress(serialized)
+            # Serialize (compressed above the codec's size threshold)
+            serialized = self._serialize(value, compress=compress)
+
+            # Set with optional TTL and register in tag sets atomically; the
+            # L1 broadcast (if any) shares the round trip
+            tag_keys = self._tag_keys_for(tags)
+            async with redis.pipeline(transaction=False) as pipe:
+                await self._get_set_script(redis)(
+                    keys=[cache_key, *tag_keys],
+                    args=[serialized, ttl or 0, time.time()],
+                    client=pipe,
+                )
+                local_keys = self._queue_local_invalidation(pipe, namespace, [cache_key])
+                await pipe.execute()
 
-            # Set with optional TTL
-            if ttl:
-                await redis.setex(cache_key, ttl, serialized)
-            else:
-                await redis.set(cache_key, serialized)
+            if local_keys and self.local_cache is not None:
+                self.local_cache.delete(*local_keys)
 
             self._record_set(namespace)
-            logger.debug("Cache set", key=cache_key, namespace=namespace, ttl=ttl)
+            logger.debug("Cache set", key=cache_key, namespace=namespace, ttl=ttl, tags=tags)
 
             return True
 
@@ -190,6 +360,7 @@ class CacheService:
 
         try:
             deleted = await redis.delete(cache_key)
+            await self._invalidate_local(redis, namespace, [cache_key])
             self._record_delete(namespace)
             logger.debug("Cache delete", key=cache_key, namespace=namespace, deleted=bool(deleted))
             return bool(deleted)
@@ -292,6 +463,7 @@ class CacheService:
                 if cursor == 0:
                     break
 
+            await self._invalidate_local(redis, namespace, pattern=cache_pattern)
             self._record_delete(namespace, deleted_count)
             logger.info(
                 "Cache pattern invalidated",
@@ -306,6 +478,54 @@ class CacheService:
             logger.error("Cache invalidate pattern error", error=str(e), pattern=cache_pattern)
             return 0
 
+    async def invalidate_tags(self, *tags: str) -> int:
+        """
+        Invalidate all keys carrying any of the given tags.
+
+        Cost is proportional to the number of tagged keys rather than the size
+        of the keyspace, unlike :meth:`invalidate_pattern`.
+
+        Args:
+            *tags: Tags passed to :meth:`set` (e.g. ``tenant:<id>``)
+
+        Returns:
+            Number of keys deleted
+        """
+        if not tags:
+            return 0
+
+        redis = await self._get_redis()
+        tag_keys = [self._tag_key(tag) for tag in tags]
+
+        try:
+            # Read and drop the tag sets atomically; keys tagged afterwards
+            # land in fresh sets and survive this invalidation. Members that
+            # already expired need no delete.
+            now = time.time()
+            async with redis.pipeline(transaction=True) as pipe:
+                for tag_key in tag_keys:
+                    pipe.zrangebyscore(tag_key, now, "+inf")
+                pipe.delete(*tag_keys)
+                results = await pipe.execute()
+
+            members: set[Any] = set()
+            for tag_members in results[: len(tag_keys)]:
+                members.update(tag_members or ())
+
+            deleted_count = 0
+            batch = list(members)
+            for start in range(0, len(batch), _TAG_DELETE_BATCH_SIZE):
+                deleted_count += await redis.delete(*batch[start : start + _TAG_DELETE_BATCH_SIZE])
+
+            await self._invalidate_local(redis, keys=batch)
+
+            logger.info("Cache tags invalidated", tags=tags, deleted=deleted_count)
+            return deleted_count
+
+        except Exception as e:
+            logger.error("Cache invalidate tags error", error=str(e), tags=tags)
+            return 0
+
     async def clear_namespace(
         self,
         namespace: CacheNamespace | str,
@@ -324,19 +544,35 @@ class CacheService:
         redis = await self._get_redis()
 
         try:
-            cache_keys = [
-                self._generate_key(namespace, self._hash_key(key), tenant_id) for key in keys
-            ]
-
-            values = await redis.mget(cache_keys)
+            cache_keys = {
+                key: self._generate_key(namespace, self._hash_key(key), tenant_id) for key in keys
+            }
 
             result = {}
-            for key, value in zip(keys, values, strict=False):
+            use_local = self._uses_local(namespace, redis) and self.local_cache is not None
+            generation = 0
+            if use_local and self.local_cache is not None:
+                generation = self.local_cache.generation
+                for key, cache_key in cache_keys.items():
+                    local_value = self.local_cache.get(cache_key)
+                    if local_value is not LocalCache.MISSING:
+                        result[key] = local_value
+                        self._record_hit(namespace, 0, local_hit=True)
+
+            remaining = [key for key in keys if key not in result]
+            if not remaining:
+                return result
+
+            values = await redis.mget([cache_keys[key] for key in remaining])
+
+            for key, value in zip(remaining, values, strict=False):
                 if value is not None:
                     result[key] = self._deserialize(value)
-                    self._record_hit(namespace, 0)
+                    if use_local and self.local_cache is not None and result[key] is not None:
+                        self.local_cache.set(cache_keys[key], result[key], generation=generation)
+                    self._record_hit(namespace, 0, local_hit=False if use_local else None)
                 else:
-                    self._record_miss(namespace, 0)
+                    self._record_miss(namespace, 0, local=use_local)
 
             return result
 
@@ -350,24 +586,35 @@ class CacheService:
         namespace: CacheNamespace | str = CacheNamespace.API_RESPONSE,
         tenant_id: str | None = None,
         ttl: int | None = None,
+        tags: Iterable[str] | None = None,
     ) -> bool:
         """Set multiple values in cache."""
         redis = await self._get_redis()
 
         try:
+            tag_keys = self._tag_keys_for(tags)
+            script = self._get_set_script(redis)
+            now = time.time()
+
+            cache_keys = []
+
             # Use pipeline for atomic multi-set
             async with redis.pipeline() as pipe:
                 for key, value in items.items():
                     cache_key = self._generate_key(namespace, self._hash_key(key), tenant_id)
                     serialized = self._serialize(value)
+                    cache_keys.append(cache_key)
 
-                    if ttl:
-                        pipe.setex(cache_key, ttl, serialized)
-                    else:
-                        pipe.set(cache_key, serialized)
+                    await script(
+                        keys=[cache_key, *tag_keys], args=[serialized, ttl or 0, now], client=pipe
+                    )
 
+                local_keys = self._queue_local_invalidation(pipe, namespace, cache_keys)
                 await pipe.execute()
 
+            if local_keys and self.local_cache is not None:
+                self.local_cache.delete(*local_keys)
+
             self._record_set(namespace, len(items))
             logger.debug("Cache set_many", count=len(items), namespace=namespace)
 
@@ -390,6 +637,7 @@ class CacheService:
 
         try:
             result = await redis.incrby(cache_key, amount)
+            await self._invalidate_local(redis, namespace, [cache_key])
             return int(result)
 
         except Exception as e:
@@ -406,69 +654,25 @@ class CacheService:
         """Decrement counter in cache."""
         return await self.increment(key, -amount, namespace, tenant_id)
 
-    def _serialize(self, value: Any) -> bytes:
+    def _serialize(self, value: Any, compress: bool = False) -> bytes:
         """
-        Serialize value for storage using JSON only.
+        Serialize value for storage with the configured codec.
 
         Raises:
-            ValueError: If the value cannot be represented safely as JSON.
+            ValueError: If the value cannot be represented safely.
         """
-        try:
-            json_payload = json.dumps(
-                value, default=self._json_default_encoder, separators=(",", ":")
-            )
-        except (TypeError, ValueError) as exc:
-            raise ValueError(
-                f"Cannot cache non-JSON-serializable value of type {type(value).__name__}. "
-                "Use a Pydantic model, dataclass, or convert the value to JSON-safe primitives."
-            ) from exc
-
-        return json_payload.encode("utf-8")
+        return self.codec.encode(value, compress=compress)
 
     def _deserialize(self, value: bytes) -> Any:
         """Deserialize value from storage."""
-        raw_value = value
-
-        if self._is_compressed(raw_value):
-            try:
-                raw_value = zlib.decompress(raw_value)
-            except zlib.error as exc:
-                logger.error("Cache decompress error", error=str(exc))
-                return None
-
         try:
-            return json.loads(raw_value.decode("utf-8"))
-        except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+            return self.codec.decode(value)
+        except CodecError as exc:
             logger.error("Corrupted cache data", error=str(exc))
             return None
 
-    @staticmethod
-    def _is_compressed(value: bytes) -> bool:
-        """Detect if a payload looks like zlib-compressed data."""
-        return len(value) >= 2 and value[:2] == b"\x78\x9c"
-
-    @staticmethod
-    def _json_default_encoder(value: Any) -> Any:
-        """
-        Provide safe fallbacks for objects commonly cached in the application.
-
-        Raises TypeError for unsupported objects so json.dumps surfaces the issue.
-        """
-        if hasattr(value, "model_dump") and callable(value.model_dump):
-            return value.model_dump()
-        if is_dataclass(value) and not isinstance(value, type):
-            return asdict(value)
-        if isinstance(value, datetime):
-            return value.isoformat()
-        if isinstance(value, date):
-            return value.isoformat()
-        if isinstance(value, Enum):
-            return value.value
-
-        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
-
-    def _record_hit(self, namespace: CacheNamespace | str, latency_ms: float) -> None:
-        """Record cache hit for statistics."""
+    def _namespace_stats(self, namespace: CacheNamespace | str) -> "CacheService.NamespaceStats":
+        """Get (or create) the statistics bucket for a namespace."""
         ns = namespace.value if isinstance(namespace, CacheNamespace) else namespace
 
         if ns not in self._local_stats:
@@ -479,59 +683,49 @@ class CacheService:
                 deletes=0,
                 total_hit_latency=0.0,
                 total_miss_latency=0.0,
+                local_hits=0,
+                local_misses=0,
             )
 
-        self._local_stats[ns]["hits"] += 1
-        self._local_stats[ns]["total_hit_latency"] += latency_ms
+        return self._local_stats[ns]
 
-    def _record_miss(self, namespace: CacheNamespace | str, latency_ms: float) -> None:
-        """Record cache miss for statistics."""
-        ns = namespace.value if isinstance(namespace, CacheNamespace) else namespace
-
-        if ns not in self._local_stats:
-            self._local_stats[ns] = CacheService.NamespaceStats(
-                hits=0,
-                misses=0,
-                sets=0,
-                deletes=0,
-                total_hit_latency=0.0,
-                total_miss_latency=0.0,
-            )
+    def _record_hit(
+        self,
+        namespace: CacheNamespace | str,
+        latency_ms: float,
+        local_hit: bool | None = None,
+    ) -> None:
+        """
+        Record cache hit for statistics.
 
-        self._local_stats[ns]["misses"] += 1
-        self._local_stats[ns]["total_miss_latency"] += latency_ms
+        ``local_hit`` is None when L1 was not consulted, True when L1 served
+        the value and False when L1 missed and Redis answered.
+        """
+        stats = self._namespace_stats(namespace)
+        stats["hits"] += 1
+        stats["total_hit_latency"] += latency_ms
+        if local_hit is True:
+            stats["local_hits"] += 1
+        elif local_hit is False:
+            stats["local_misses"] += 1
+
+    def _record_miss(
+        self, namespace: CacheNamespace | str, latency_ms: float, local: bool = False
+    ) -> None:
+        """Record cache miss for statistics (``local`` when L1 was consulted)."""
+        stats = self._namespace_stats(namespace)
+        stats["misses"] += 1
+        stats["total_miss_latency"] += latency_ms
+        if local:
+            stats["local_misses"] += 1
 
     def _record_set(self, namespace: CacheNamespace | str, count: int = 1) -> None:
         """Record cache set operation."""
-        ns = namespace.value if isinstance(namespace, CacheNamespace) else namespace
-
-        if ns not in self._local_stats:
-            self._local_stats[ns] = CacheService.NamespaceStats(
-                hits=0,
-                misses=0,
-                sets=0,
-                deletes=0,
-                total_hit_latency=0.0,
-                total_miss_latency=0.0,
-            )
-
-        self._local_stats[ns]["sets"] += count
+        self._namespace_stats(namespace)["sets"] += count
 
     def _record_delete(self, namespace: CacheNamespace | str, count: int = 1) -> None:
         """Record cache delete operation."""
-        ns = namespace.value if isinstance(namespace, CacheNamespace) else namespace
-
-        if ns not in self._local_stats:
-            self._local_stats[ns] = {
-                "hits": 0,
-                "misses": 0,
-                "sets": 0,
-                "deletes": 0,
-                "total_hit_latency": 0,
-                "total_miss_latency": 0,
-            }
-
-        self._local_stats[ns]["deletes"] += count
+        self._namespace_stats(namespace)["deletes"] += count
 
     def get_stats(self) -> dict[str, dict[str, Any]]:
         """Get accumulated statistics."""
@@ -546,6 +740,11 @@ class CacheService:
                 data["total_miss_latency"] / data["misses"] if data["misses"] > 0 else 0
             )
 
+            local_requests = data["local_hits"] + data["local_misses"]
+            local_hit_rate = (
+                (data["local_hits"] / local_requests * 100) if local_requests > 0 else 0
+            )
+
             stats[namespace] = {
                 "total_requests": total_requests,
                 "cache_hits": data["hits"],
@@ -555,6 +754,10 @@ class CacheService:
                 "avg_miss_latency_ms": round(avg_miss_latency, 2),
                 "sets": data["sets"],
                 "deletes": data["deletes"],
+                "l1_hits": data["local_hits"],
+                "l1_misses": data["local_misses"],
+                "l1_hit_rate": round(local_hit_rate, 2),
+                "l2_hits": data["hits"] - data["local_hits"],
             }
 
         return stats
@@ -576,6 +779,20 @@ def get_cache_service(redis: RedisClientType | None = None) -> CacheService:
         return CacheService(redis=redis)
 
     if _default_cache_service is None:
-        _default_cache_service = CacheService()
+        local_cache = None
+        if settings.cache.local_enabled:
+            local_cache = LocalCache(
+                max_entries=settings.cache.local_max_entries,
+                ttl_seconds=settings.cache.local_ttl_seconds,
+            )
+        _default_cache_service = CacheService(
+            local_cache=local_cache,
+            local_namespaces=settings.cache.local_namespaces,
+            codec=CacheCodec(
+                serializer=settings.cache.serializer,
+                compressor=settings.cache.compressor,
+                compression_threshold=settings.cache.compression_threshold_bytes,
+            ),
+        )
 
     return _default_cache_service
@@ -0,0 +1,158 @@
+"""
+Cache Stampede Protection.
+
+Helpers used by the cache decorators to keep a hot key's expiry from turning
+into a thundering herd of recomputations:
+
+- ``SingleFlight`` coalesces concurrent recomputations of the same key within
+  a process (Redis locks from ``core.distributed_locks`` do the same across
+  workers).
+- Entries can be wrapped in an envelope carrying their logical expiry and
+  recompute cost, enabling probabilistic early refresh (XFetch) and
+  stale-while-revalidate.
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+ENVELOPE_MARKER = "__cache_envelope__"
+
+
+@dataclass(frozen=True, slots=True)
+class CacheEnvelope:
+    """Cached value plus the metadata needed for early/stale refresh."""
+
+    value: Any
+    expires_at: float
+    compute_seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            ENVELOPE_MARKER: 1,
+            "value": self.value,
+            "expires_at": self.expires_at,
+            "compute_seconds": self.compute_seconds,
+        }
+
+    @classmethod
+    def from_cached(cls, cached: Any) -> "CacheEnvelope | None":
+        """Unwrap a cached envelope; returns None for plain (legacy) values."""
+        if not isinstance(cached, dict) or ENVELOPE_MARKER not in cached:
+            return None
+        return cls(
+            value=cached.get("value"),
+            expires_at=float(cached.get("expires_at", 0)),
+            compute_seconds=float(cached.get("compute_seconds", 0)),
+        )
+
+    def is_fresh(self, now: float | None = None) -> bool:
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def should_refresh_early(self, beta: float = 1.0, now: float | None = None) -> bool:
+        """
+        Probabilistic early expiration (XFetch).
+
+        Refreshes become increasingly likely as expiry approaches, scaled by
+        how long the value took to compute, so a single caller usually
+        refreshes before the key actually expires.
+        """
+        if beta <= 0 or self.compute_seconds <= 0:
+            return False
+        current = now if now is not None else time.time()
+        # -log(U) for U in (0, 1] is an exponential sample with mean 1
+        jitter = -math.log(1.0 - random.random())  # nosec B311 - not security related
+        return current + self.compute_seconds * beta * jitter >= self.expires_at
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution.
+
+    Callers arriving while a call is in flight await its result (or exception)
+    instead of running the function again. Calls are tracked per event loop:
+    a caller on another loop (Celery runs one per task) cannot await the
+    in-flight call and runs its own, which only repeats work.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future[Any]] = {}
+        self._background: set[asyncio.Task[Any]] = set()
+
+    @staticmethod
+    def _flight_key(key: str) -> tuple[asyncio.AbstractEventLoop, str]:
+        return asyncio.get_running_loop(), key
+
+    def in_flight(self, key: str) -> bool:
+        return self._flight_key(key) in self._inflight
+
+    async def run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``func`` once per key, sharing the result with concurrent callers."""
+        existing = self._inflight.get(self._flight_key(key))
+        if existing is not None:
+            return await asyncio.shield(existing)
+        return await self._execute(key, self._register(key), func)
+
+    def run_in_background(self, key: str, func: Callable[[], Awaitable[Any]]) -> bool:
+        """Start ``func`` in the background unless a call for the key is in flight."""
+        if self.in_flight(key):
+            return False
+
+        # Register synchronously so callers arriving before the task starts
+        # see the refresh as in flight
+        future = self._register(key)
+
+        async def _refresh() -> None:
+            try:
+                await self._execute(key, future, func)
+            except Exception as e:
+                logger.warning("Background cache refresh failed", key=key, error=str(e))
+
+        task = asyncio.create_task(_refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return True
+
+    async def wait(self, key: str) -> Any:
+        """Wait for the call in flight for the key on this loop, if any."""
+        existing = self._inflight.get(self._flight_key(key))
+        if existing is None:
+            return None
+        return await asyncio.shield(existing)
+
+    def _register(self, key: str) -> asyncio.Future[Any]:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        # Mark exceptions as retrieved when nobody else was waiting
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[self._flight_key(key)] = future
+        return future
+
+    async def _execute(
+        self, key: str, future: asyncio.Future[Any], func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(self._flight_key(key), None)
+
+
+# Shared by all decorated functions in the process
+single_flight = SingleFlight()
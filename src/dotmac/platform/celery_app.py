@@ -30,6 +30,7 @@ celery_app = Celery(
         "dotmac.platform.services.internet_plans.usage_billing_tasks",
         "dotmac.platform.data_transfer.tasks",
         "dotmac.platform.network.tasks",  # IPv6 lifecycle cleanup tasks
+        "dotmac.platform.fiber.tasks",  # Fiber network rollup refresh
     ],  # Auto-discover task modules
 )
 
@@ -150,13 +151,22 @@ def setup_periodic_tasks(sender: Any, **kwargs: Any) -> None:
     )
     replay_pending_operations.apply_async(countdown=5)
 
+    # Fiber - Refresh network analytics rollups every 5 minutes
+    from dotmac.platform.fiber.tasks import refresh_network_rollups_task
+
+    sender.add_periodic_task(
+        300.0,  # 5 minutes
+        refresh_network_rollups_task.s(),
+        name="fiber-refresh-network-rollups",
+    )
+
     # RADIUS - Sync sessions to TimescaleDB every 15 minutes (only if configured)
     if settings.timescaledb.is_configured:
         from dotmac.platform.radius.tasks import sync_sessions_to_timescaledb
 
         sender.add_periodic_task(
             900.0,  # 15 minutes
-            sync_sessions_to_timescaledb.s(batch_size=100, max_age_hours=24),
+            sync_sessions_to_timescaledb.s(batch_size=1000, max_age_hours=24),
             name="radius-sync-sessions-to-timescaledb",
         )
 
@@ -212,6 +222,7 @@ def setup_periodic_tasks(sender: Any, **kwargs: Any) -> None:
         "lifecycle-process-auto-resume",
         "lifecycle-perform-health-checks",
         "genieacs-check-scheduled-upgrades",
+        "fiber-refresh-network-rollups",
         "network-cleanup-ipv6-stale-prefixes",
         "network-emit-ipv6-metrics",
     ]
@@ -38,6 +38,7 @@ if TYPE_CHECKING:
     get_async_db_session: Any
     get_session: Any
     get_session_dependency: Any
+    get_read_session: Any
     get_sync_engine: Any
     get_async_engine: Any
     get_async_database_url: Any
@@ -86,13 +87,15 @@ for _name in dir(_legacy_module):
 # Additional helpers available under dotmac.platform.db.types
 # ---------------------------------------------------------------------------
 
+from .replicas import get_read_session  # noqa: E402  (import depends on module above)
 from .types import JSONBCompat  # noqa: E402  (import depends on module above)
 
 _exported = list(getattr(_legacy_module, "__all__", [])) or [
     name for name in dir(_legacy_module) if not name.startswith("_")
 ]
-if "JSONBCompat" not in _exported:
-    _exported.append("JSONBCompat")
+for _extra in ("JSONBCompat", "get_read_session"):
+    if _extra not in _exported:
+        _exported.append(_extra)
 
 __all__ = _exported
 
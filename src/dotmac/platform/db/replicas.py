@@ -0,0 +1,304 @@
+"""
+Read-replica routing for the async SQLAlchemy engine.
+
+``get_read_session`` yields a session whose statements go to a streaming
+replica (round-robin over ``settings.database.read_replica_urls``) while the
+primary keeps serving writes. The bind is chosen per statement:
+
+* Flushes and INSERT/UPDATE/DELETE statements always go to the primary.
+* Replicas whose last measured lag exceeds ``replica_max_lag_seconds`` (or
+  that failed their check) are skipped; with none left, reads use the primary.
+* Once the current request has written through a primary session, later reads
+  in the same request go to the primary too (read-your-writes).
+
+Without configured replicas every read session is simply the primary session,
+so read-only endpoints can adopt ``get_read_session`` unconditionally.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from itertools import count
+from typing import Any
+
+import structlog
+from fastapi import Depends
+from sqlalchemy import Delete, Insert, Update, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.pool import StaticPool
+
+from dotmac.platform.db import get_async_engine, get_session_dependency
+from dotmac.platform.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+# Seconds of replay delay; 0 when the replica has replayed everything it received
+POSTGRES_LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0) END"
+)
+
+_replica_router: ReplicaRouter | None = None
+_router_configured = False
+
+
+class RequestRouting:
+    """Per-request routing state; records whether the request has written."""
+
+    __slots__ = ("wrote",)
+
+    def __init__(self) -> None:
+        self.wrote = False
+
+
+_request_routing: ContextVar[RequestRouting | None] = ContextVar(
+    "dotmac_db_request_routing", default=None
+)
+
+
+def begin_request_routing() -> RequestRouting:
+    """Return the routing state of the current request, creating it if needed."""
+    state = _request_routing.get()
+    if state is None:
+        state = RequestRouting()
+        _request_routing.set(state)
+    return state
+
+
+def mark_primary_write() -> None:
+    """Pin the rest of the current request's reads to the primary.
+
+    Called automatically for ORM flushes and INSERT/UPDATE/DELETE statements;
+    call it explicitly after writes issued as raw SQL text.
+    """
+    state = _request_routing.get()
+    if state is not None:
+        state.wrote = True
+
+
+@dataclass(slots=True)
+class ReplicaState:
+    """A replica engine and the outcome of its last lag check."""
+
+    url: str
+    engine: AsyncEngine
+    lag_seconds: float | None = None
+    checked_at: float = float("-inf")
+
+
+class ReplicaRouter:
+    """Chooses the engine for read statements from the replica lag checks."""
+
+    def __init__(
+        self,
+        replicas: Sequence[tuple[str, AsyncEngine]],
+        primary: AsyncEngine,
+        *,
+        max_lag_seconds: float = 5.0,
+        check_interval_seconds: float = 10.0,
+        check_timeout_seconds: float = 2.0,
+    ) -> None:
+        self.replicas = [ReplicaState(url=url, engine=engine) for url, engine in replicas]
+        self.primary = primary
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.check_timeout_seconds = check_timeout_seconds
+        self._round_robin = count()
+        self.session_factory = async_sessionmaker(
+            class_=AsyncSession,
+            sync_session_class=RoutedReadSession,
+            autoflush=False,
+            expire_on_commit=False,
+            info={"replica_router": self},
+        )
+
+    def _is_usable(self, replica: ReplicaState) -> bool:
+        return replica.lag_seconds is not None and replica.lag_seconds <= self.max_lag_seconds
+
+    def read_engine(self) -> AsyncEngine:
+        """Return the engine for the next read statement."""
+        state = _request_routing.get()
+        if state is not None and state.wrote:
+            return self.primary
+        usable = [replica for replica in self.replicas if self._is_usable(replica)]
+        if not usable:
+            return self.primary
+        return usable[next(self._round_robin) % len(usable)].engine
+
+    async def _measure_lag(self, replica: ReplicaState) -> float:
+        async with replica.engine.connect() as connection:
+            if replica.engine.dialect.name != "postgresql":
+                await connection.execute(text("SELECT 1"))
+                return 0.0
+            result = await connection.execute(POSTGRES_LAG_QUERY)
+            return float(result.scalar() or 0.0)
+
+    async def _check(self, replica: ReplicaState) -> None:
+        replica.checked_at = time.monotonic()
+        try:
+            replica.lag_seconds = await asyncio.wait_for(
+                self._measure_lag(replica), self.check_timeout_seconds
+            )
+        except Exception as e:
+            replica.lag_seconds = None
+            logger.warning("db.replica.check_failed", replica=_redact(replica.url), error=str(e))
+            return
+        if replica.lag_seconds > self.max_lag_seconds:
+            logger.info(
+                "db.replica.lagging",
+                replica=_redact(replica.url),
+                lag_seconds=replica.lag_seconds,
+                max_lag_seconds=self.max_lag_seconds,
+            )
+
+    async def refresh(self, *, force: bool = False) -> None:
+        """Re-check replicas whose last lag measurement is older than the interval."""
+        now = time.monotonic()
+        stale = [
+            replica
+            for replica in self.replicas
+            if force or now - replica.checked_at >= self.check_interval_seconds
+        ]
+        if stale:
+            await asyncio.gather(*(self._check(replica) for replica in stale))
+
+    def get_stats(self) -> dict[str, Any]:
+        """Return per-replica lag and usability."""
+        return {
+            "max_lag_seconds": self.max_lag_seconds,
+            "replicas": [
+                {
+                    "url": _redact(replica.url),
+                    "lag_seconds": replica.lag_seconds,
+                    "usable": self._is_usable(replica),
+                }
+                for replica in self.replicas
+            ],
+        }
+
+    async def dispose(self) -> None:
+        """Close the replica connection pools."""
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+class RoutedReadSession(Session):
+    """Sync session class behind read sessions; picks the bind per statement."""
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kw: Any) -> Any:
+        router: ReplicaRouter = self.info["replica_router"]
+        if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+            return router.primary.sync_engine
+        return router.read_engine().sync_engine
+
+
+def _redact(url: str) -> str:
+    return make_url(url).render_as_string(hide_password=True)
+
+
+def _create_replica_engine(url: str) -> AsyncEngine:
+    if make_url(url).get_backend_name().startswith("sqlite"):
+        return create_async_engine(
+            url, connect_args={"check_same_thread": False}, poolclass=StaticPool
+        )
+    return create_async_engine(
+        url,
+        echo=settings.database.echo,
+        pool_size=settings.database.pool_size,
+        max_overflow=settings.database.max_overflow,
+        pool_timeout=settings.database.pool_timeout,
+        pool_recycle=settings.database.pool_recycle,
+        pool_pre_ping=settings.database.pool_pre_ping,
+    )
+
+
+def _on_primary_flush(session: Session, flush_context: Any) -> None:
+    if not isinstance(session, RoutedReadSession):
+        mark_primary_write()
+
+
+def _on_primary_execute(orm_execute_state: ORMExecuteState) -> None:
+    if isinstance(orm_execute_state.session, RoutedReadSession):
+        return
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mark_primary_write()
+
+
+def _install_write_tracking() -> None:
+    if not event.contains(Session, "after_flush", _on_primary_flush):
+        event.listen(Session, "after_flush", _on_primary_flush)
+        event.listen(Session, "do_orm_execute", _on_primary_execute)
+
+
+def set_replica_router(router: ReplicaRouter | None) -> None:
+    """Install a replica router (None disables read routing)."""
+    global _replica_router, _router_configured
+    _replica_router = router
+    _router_configured = True
+    if router is not None:
+        _install_write_tracking()
+
+
+def get_replica_router() -> ReplicaRouter | None:
+    """Get the process-wide replica router, or None when no replicas are configured."""
+    if not _router_configured:
+        urls = settings.database.read_replica_urls
+        router = None
+        if urls:
+            router = ReplicaRouter(
+                [(url, _create_replica_engine(url)) for url in urls],
+                get_async_engine(),
+                max_lag_seconds=settings.database.replica_max_lag_seconds,
+                check_interval_seconds=settings.database.replica_check_interval_seconds,
+                check_timeout_seconds=settings.database.replica_check_timeout_seconds,
+            )
+        set_replica_router(router)
+    return _replica_router
+
+
+async def reset_replica_router() -> None:
+    """Dispose the replica router so settings are re-read (useful for testing)."""
+    global _replica_router, _router_configured
+    if _replica_router is not None:
+        await _replica_router.dispose()
+    _replica_router = None
+    _router_configured = False
+
+
+@asynccontextmanager
+async def open_read_session() -> AsyncIterator[AsyncSession | None]:
+    """Open a routed read session, or yield None when no replicas are configured."""
+    router = get_replica_router()
+    if router is None:
+        yield None
+        return
+    begin_request_routing()
+    await router.refresh()
+    async with router.session_factory() as session:
+        yield session
+
+
+async def get_read_session(
+    primary: AsyncSession = Depends(get_session_dependency),
+) -> AsyncIterator[AsyncSession]:
+    """
+    FastAPI dependency for read-only endpoints.
+
+    Yields a replica-routed session, or the request's primary session when no
+    replicas are configured (so overrides of ``get_session_dependency`` in
+    tests still apply).
+    """
+    async with open_read_session() as session:
+        yield session if session is not None else primary
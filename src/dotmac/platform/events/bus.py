@@ -4,6 +4,7 @@ import asyncio
 import json
 from collections import defaultdict
 from collections.abc import Awaitable, Callable
+from contextlib import aclosing
 from datetime import UTC, datetime
 from fnmatch import fnmatch
 from typing import Any, Protocol
@@ -110,24 +111,7 @@ class EventBus:
             EventPublishError: If publishing fails
         """
         try:
-            # Create event
-            from dotmac.platform.events.models import EventMetadata
-
-            now = datetime.now(UTC)
-            event = Event(
-                event_type=event_type,
-                payload=payload or {},
-                metadata=EventMetadata(**(metadata or {})),
-                priority=priority,
-                status=EventStatus.PENDING,
-                created_at=now,
-                published_at=None,
-                processed_at=None,
-                retry_count=0,
-                max_retries=3,
-                error_message=None,
-                last_error_at=None,
-            )
+            event = self._build_event(event_type, payload, metadata, priority)
 
             logger.info(
                 "Publishing event",
@@ -160,6 +144,83 @@ class EventBus:
             )
             raise EventPublishError(f"Failed to publish event: {e}") from e
 
+    async def publish_batch(self, events: list[dict[str, Any]]) -> list[Event]:
+        """
+        Publish several events, persisting them in a single storage write.
+
+        Args:
+            events: Dicts with ``event_type`` and optional ``payload``,
+                ``metadata`` and ``priority`` keys
+
+        Returns:
+            Published events, in input order
+
+        Raises:
+            EventPublishError: If publishing fails
+        """
+        try:
+            built = [
+                self._build_event(
+                    spec["event_type"],
+                    spec.get("payload"),
+                    spec.get("metadata"),
+                    spec.get("priority", EventPriority.NORMAL),
+                )
+                for spec in events
+            ]
+            if not built:
+                return []
+
+            logger.info("Publishing event batch", count=len(built))
+
+            if self._enable_persistence:
+                await self._storage.save_events(built)
+
+            await asyncio.gather(*(self._publish_local(event) for event in built))
+
+            if self._redis:
+                for event in built:
+                    await self._publish_redis(event)
+
+            for event in built:
+                event.published_at = event.created_at
+            return built
+
+        except Exception as e:
+            logger.error(
+                "Failed to publish event batch",
+                count=len(events),
+                error=str(e),
+                exc_info=True,
+            )
+            raise EventPublishError(f"Failed to publish event batch: {e}") from e
+
+    @staticmethod
+    def _build_event(
+        event_type: str,
+        payload: dict[str, Any] | None,
+        metadata: dict[str, Any] | None,
+        priority: EventPriority,
+    ) -> Event:
+        """Create a pending event."""
+        from dotmac.platform.events.models import EventMetadata
+
+        now = datetime.now(UTC)
+        return Event(
+            event_type=event_type,
+            payload=payload or {},
+            metadata=EventMetadata(**(metadata or {})),
+            priority=priority,
+            status=EventStatus.PENDING,
+            created_at=now,
+            published_at=None,
+            processed_at=None,
+            retry_count=0,
+            max_retries=3,
+            error_message=None,
+            last_error_at=None,
+        )
+
     async def _publish_local(self, event: Event) -> None:
         """Publish event to local in-memory handlers."""
         handlers: list[EventHandler] = list(self._handlers.get(event.event_type, []))
@@ -330,6 +391,37 @@ class EventBus:
             return []
         return list(events)
 
+    async def get_events_page(
+        self,
+        event_type: str | None = None,
+        status: EventStatus | None = None,
+        tenant_id: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[Event], str | None]:
+        """
+        Query one page of events from storage.
+
+        Args:
+            event_type: Filter by event type
+            status: Filter by status
+            tenant_id: Filter by tenant
+            limit: Maximum number of events to return
+            cursor: Cursor returned by the previous page
+
+        Returns:
+            Matching events and the cursor for the next page (None when exhausted)
+        """
+        if not self._enable_persistence:
+            return [], None
+        return await self._storage.query_events_page(
+            event_type=event_type,
+            status=status,
+            tenant_id=tenant_id,
+            limit=limit,
+            cursor=cursor,
+        )
+
     async def replay_event(self, event_id: str) -> None:
         """
         Replay a failed event.
@@ -341,7 +433,45 @@ class EventBus:
         if not event:
             raise EventError(f"Event {event_id} not found")
 
-        logger.info("Replaying event", event_id=event_id, event_type=event.event_type)
+        await self._replay(event)
+
+    async def replay_events(
+        self,
+        event_type: str | None = None,
+        status: EventStatus | None = EventStatus.FAILED,
+        tenant_id: str | None = None,
+        cursor: str | None = None,
+        limit: int | None = None,
+    ) -> int:
+        """
+        Replay stored events matching the filters, streaming them from storage.
+
+        Args:
+            event_type: Filter by event type
+            status: Filter by status (failed events by default)
+            tenant_id: Filter by tenant
+            cursor: Resume after a cursor from ``get_events_page``
+            limit: Maximum number of events to replay
+
+        Returns:
+            Number of events replayed
+        """
+        if not self._enable_persistence:
+            return 0
+
+        replayed = 0
+        async with aclosing(
+            self._storage.iter_events(event_type, status, tenant_id, cursor)
+        ) as events:
+            async for event in events:
+                if limit is not None and replayed >= limit:
+                    break
+                await self._replay(event)
+                replayed += 1
+        return replayed
+
+    async def _replay(self, event: Event) -> None:
+        logger.info("Replaying event", event_id=event.event_id, event_type=event.event_type)
 
         # Reset status for replay
         event.status = EventStatus.PENDING
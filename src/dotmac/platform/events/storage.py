@@ -1,36 +1,131 @@
 """Event persistence storage."""
 
+import asyncio
 import json
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing
+from typing import Any
 
 import structlog
 
-from dotmac.platform.core.caching import get_redis
 from dotmac.platform.events.models import Event, EventStatus
+from dotmac.platform.redis_client import redis_manager
+from dotmac.platform.settings import settings
 
 logger = structlog.get_logger(__name__)
 
 
 INDEX_TTL_SECONDS = 86400 * 7
 
+# Index entries fetched per ZREVRANGEBYSCORE round trip while paging
+SCAN_CHUNK_SIZE = 200
+
+
+def encode_cursor(score: float, event_id: str) -> str:
+    """Encode a paging cursor pointing just past ``event_id``."""
+    return f"{score!r}:{event_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[float, str]:
+    """Decode a cursor produced by ``encode_cursor``."""
+    score, _, event_id = cursor.partition(":")
+    return float(score), event_id
+
 
 class EventStorage:
     """
     Event storage for persistence and querying.
 
-    Supports both Redis and in-memory storage backends.
+    Supports both Redis and in-memory storage backends. The Redis backend uses
+    the shared async client: each save writes the event body and all of its
+    index entries in one MULTI/EXEC pipeline, and queries page through the
+    sorted-set indexes with a ``(score, event_id)`` cursor, fetching bodies
+    with MGET.
+
+    Processes that never call ``init_redis`` (Celery workers, scripts) get a
+    standalone client with the same connection settings instead, so their
+    events land in the same indexes as the API's.
     """
 
-    def __init__(self, use_redis: bool = True) -> None:
+    def __init__(self, use_redis: bool = True, redis_client: Any | None = None) -> None:
         """
         Initialize event storage.
 
         Args:
             use_redis: Whether to use Redis for storage
+            redis_client: Async Redis client (defaults to the shared ``redis_manager`` client)
         """
-        self._redis = get_redis() if use_redis else None
+        self._use_redis = use_redis
+        self._redis = redis_client
         self._memory_store: dict[str, Event] = {}
+        self._standalone: tuple[asyncio.AbstractEventLoop, Any] | None = None
+
+        logger.debug("EventStorage initialized", backend="redis" if use_redis else "memory")
+
+    def _client(self) -> Any | None:
+        """Resolve the async Redis client, or None to use memory."""
+        if self._redis is not None:
+            return self._redis
+        if not self._use_redis:
+            return None
+        try:
+            return redis_manager.get_client()
+        except RuntimeError:
+            # Shared client not initialized (Celery workers, scripts)
+            return self._standalone_client()
+
+    def _standalone_client(self) -> Any:
+        """
+        Build a client matching ``redis_manager``'s settings, one per event loop.
 
-        logger.debug("EventStorage initialized", backend="redis" if self._redis else "memory")
+        Celery tasks run each coroutine under its own ``asyncio.run`` and asyncio
+        connections cannot be reused across loops.
+        """
+        loop = asyncio.get_running_loop()
+        if self._standalone is not None and self._standalone[0] is loop:
+            return self._standalone[1]
+
+        from redis.asyncio import Redis
+
+        if self._standalone is None:
+            logger.info("Shared Redis client not initialized, event storage using its own client")
+        client = Redis(
+            host=settings.redis.host,
+            port=settings.redis.port,
+            password=settings.redis.password or None,
+            decode_responses=True,
+            max_connections=settings.redis.max_connections,
+        )
+        self._standalone = (loop, client)
+        return client
+
+    @staticmethod
+    def _event_key(event_id: str) -> str:
+        return f"event:{event_id}"
+
+    @staticmethod
+    def _index_keys(event: Event) -> list[str]:
+        """Type, status, tenant and all-events index keys of an event."""
+        keys = [f"events:type:{event.event_type}", f"events:status:{event.status.value}"]
+        if event.metadata.tenant_id:
+            keys.append(f"events:tenant:{event.metadata.tenant_id}")
+        keys.append("events:all")
+        return keys
+
+    def _queue_writes(self, pipe: Any, event: Event) -> None:
+        """Queue the body and index writes of one event on a pipeline."""
+        pipe.set(self._event_key(event.event_id), json.dumps(event.to_dict()), ex=INDEX_TTL_SECONDS)
+
+        # Status is the only indexed field that changes, so clear the others
+        # instead of reading the previous version back
+        for status in EventStatus:
+            if status != event.status:
+                pipe.zrem(f"events:status:{status.value}", event.event_id)
+
+        score = event.created_at.timestamp()
+        for index_key in self._index_keys(event):
+            pipe.zadd(index_key, {event.event_id: score})
+            pipe.expire(index_key, INDEX_TTL_SECONDS)
 
     async def save_event(self, event: Event) -> None:
         """
@@ -39,72 +134,32 @@ class EventStorage:
         Args:
             event: Event to save
         """
-        if self._redis:
-            try:
-                existing_event = await self.get_event(event.event_id)
-                if existing_event:
-                    self._remove_from_indices(existing_event)
-
-                key = f"event:{event.event_id}"
-                value = json.dumps(event.to_dict())
-                self._redis.setex(key, INDEX_TTL_SECONDS, value)  # 7 days TTL
+        await self.save_events([event])
 
-                # Add to indices
-                self._add_to_indices(event)
-            except Exception as e:
-                logger.warning("Failed to save event to Redis", error=str(e))
-                self._memory_store[event.event_id] = event
-        else:
-            self._memory_store[event.event_id] = event
-
-    def _add_to_indices(self, event: Event) -> None:
-        """Add event to type, status, tenant, and all-events indices."""
-        if not self._redis:
-            return
-
-        try:
-            # Index by type
-            type_key = f"events:type:{event.event_type}"
-            self._redis.zadd(type_key, {event.event_id: event.created_at.timestamp()})
-            self._redis.expire(type_key, INDEX_TTL_SECONDS)
-
-            # Index by status
-            status_key = f"events:status:{event.status.value}"
-            self._redis.zadd(status_key, {event.event_id: event.created_at.timestamp()})
-            self._redis.expire(status_key, INDEX_TTL_SECONDS)
-
-            # Index by tenant if available
-            if event.metadata.tenant_id:
-                tenant_key = f"events:tenant:{event.metadata.tenant_id}"
-                self._redis.zadd(tenant_key, {event.event_id: event.created_at.timestamp()})
-                self._redis.expire(tenant_key, INDEX_TTL_SECONDS)
-
-            # Global index for fetching all events (newest first)
-            all_key = "events:all"
-            self._redis.zadd(all_key, {event.event_id: event.created_at.timestamp()})
-            self._redis.expire(all_key, INDEX_TTL_SECONDS)
-        except Exception as e:
-            logger.warning("Failed to update event indices", error=str(e))
+    async def save_events(self, events: Iterable[Event]) -> None:
+        """
+        Save several events in a single Redis round trip.
 
-    def _remove_from_indices(self, event: Event) -> None:
-        """Remove event from existing indices prior to update."""
-        if not self._redis:
+        Args:
+            events: Events to save
+        """
+        events = list(events)
+        if not events:
             return
 
-        try:
-            type_key = f"events:type:{event.event_type}"
-            self._redis.zrem(type_key, event.event_id)
-
-            status_key = f"events:status:{event.status.value}"
-            self._redis.zrem(status_key, event.event_id)
-
-            if event.metadata.tenant_id:
-                tenant_key = f"events:tenant:{event.metadata.tenant_id}"
-                self._redis.zrem(tenant_key, event.event_id)
+        client = self._client()
+        if client is not None:
+            try:
+                async with client.pipeline(transaction=True) as pipe:
+                    for event in events:
+                        self._queue_writes(pipe, event)
+                    await pipe.execute()
+                return
+            except Exception as e:
+                logger.warning("Failed to save events to Redis", error=str(e), count=len(events))
 
-            self._redis.zrem("events:all", event.event_id)
-        except Exception as e:
-            logger.warning("Failed to remove event from indices", error=str(e))
+        for event in events:
+            self._memory_store[event.event_id] = event
 
     async def get_event(self, event_id: str) -> Event | None:
         """
@@ -116,10 +171,10 @@ class EventStorage:
         Returns:
             Event or None if not found
         """
-        if self._redis:
+        client = self._client()
+        if client is not None:
             try:
-                key = f"event:{event_id}"
-                value = self._redis.get(key)
+                value = await client.get(self._event_key(event_id))
                 if value:
                     data = json.loads(value)
                     return Event.from_dict(data)
@@ -156,10 +211,81 @@ class EventStorage:
         Returns:
             List of matching events
         """
-        if self._redis:
-            return await self._query_redis(event_type, status, tenant_id, limit)
+        events, _ = await self.query_events_page(event_type, status, tenant_id, limit)
+        return events
+
+    async def query_events_page(
+        self,
+        event_type: str | None = None,
+        status: EventStatus | None = None,
+        tenant_id: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[Event], str | None]:
+        """
+        Query one page of events, newest first.
+
+        Args:
+            event_type: Filter by event type
+            status: Filter by status
+            tenant_id: Filter by tenant
+            limit: Maximum events to return
+            cursor: Cursor returned by the previous page
+
+        Returns:
+            Matching events and the cursor for the next page (None when exhausted)
+        """
+        events: list[Event] = []
+        next_cursor: str | None = None
+        async with aclosing(self._scan(event_type, status, tenant_id, cursor)) as scan:
+            async for event, score in scan:
+                if len(events) == limit:
+                    # At least one more match exists past this page
+                    return events, next_cursor
+                events.append(event)
+                next_cursor = encode_cursor(score, event.event_id)
+        return events, None
+
+    async def iter_events(
+        self,
+        event_type: str | None = None,
+        status: EventStatus | None = None,
+        tenant_id: str | None = None,
+        cursor: str | None = None,
+    ) -> AsyncIterator[Event]:
+        """
+        Stream matching events, newest first, without loading whole indexes.
+
+        Args:
+            event_type: Filter by event type
+            status: Filter by status
+            tenant_id: Filter by tenant
+            cursor: Resume after the position encoded by this cursor
+        """
+        async with aclosing(self._scan(event_type, status, tenant_id, cursor)) as scan:
+            async for event, _ in scan:
+                yield event
+
+    async def _scan(
+        self,
+        event_type: str | None,
+        status: EventStatus | None,
+        tenant_id: str | None,
+        cursor: str | None,
+    ) -> AsyncIterator[tuple[Event, float]]:
+        """Yield ``(event, score)`` pairs after the cursor from Redis or memory."""
+        client = self._client()
+        if client is None:
+            source = self._scan_memory(cursor)
         else:
-            return await self._query_memory(event_type, status, tenant_id, limit)
+            source = self._scan_redis(client, event_type, status, tenant_id, cursor)
+
+        try:
+            async for event, score in source:
+                if self._event_matches_filters(event, event_type, status, tenant_id):
+                    yield event, score
+        except Exception as e:
+            logger.warning("Failed to query events from Redis", error=str(e))
 
     def _determine_index_key(
         self,
@@ -198,61 +324,71 @@ class EventStorage:
             return False
         return True
 
-    async def _query_redis(
-        self,
-        event_type: str | None,
-        status: EventStatus | None,
-        tenant_id: str | None,
-        limit: int,
-    ) -> list[Event]:
-        """Query events from Redis."""
-        if not self._redis:
-            return []
-
-        try:
-            # Determine which index to use
-            index_key = self._determine_index_key(event_type, status, tenant_id)
-
-            # Get event IDs from index (newest first)
-            event_ids = self._redis.zrevrange(index_key, 0, limit - 1)
-
-            # Fetch events
-            events = []
-            for event_id in event_ids:
-                decoded_id = self._decode_event_id(event_id)
-                event = await self.get_event(decoded_id)
-
-                if event and self._event_matches_filters(event, event_type, status, tenant_id):
-                    events.append(event)
-
-            return events[:limit]
-
-        except Exception as e:
-            logger.warning("Failed to query events from Redis", error=str(e))
-            return []
-
-    async def _query_memory(
+    async def _scan_redis(
         self,
+        client: Any,
         event_type: str | None,
         status: EventStatus | None,
         tenant_id: str | None,
-        limit: int,
-    ) -> list[Event]:
-        """Query events from memory storage."""
-        events = list(self._memory_store.values())
-
-        # Apply filters
-        if event_type:
-            events = [e for e in events if e.event_type == event_type]
-        if status:
-            events = [e for e in events if e.status == status]
-        if tenant_id:
-            events = [e for e in events if e.metadata.tenant_id == tenant_id]
-
-        # Sort by creation time (newest first)
-        events.sort(key=lambda e: e.created_at, reverse=True)
-
-        return events[:limit]
+        cursor: str | None,
+    ) -> AsyncIterator[tuple[Event, float]]:
+        """Page through a sorted-set index in chunks, fetching bodies with MGET."""
+        index_key = self._determine_index_key(event_type, status, tenant_id)
+
+        # Each chunk restarts from the last position rather than an offset, so
+        # events leaving the index mid-scan (e.g. status changes) are not
+        # skipped. Members sharing a score come back in reverse lexical order,
+        # which makes ``(score, event_id)`` a stable position even with ties.
+        max_score: float | str = "+inf"
+        last_id: str | None = None
+        if cursor:
+            max_score, last_id = decode_cursor(cursor)
+
+        num = SCAN_CHUNK_SIZE
+        while True:
+            rows = await client.zrevrangebyscore(
+                index_key, max_score, "-inf", start=0, num=num, withscores=True
+            )
+            exhausted = len(rows) < num
+
+            entries = [(self._decode_event_id(member), float(score)) for member, score in rows]
+            if last_id is not None:
+                entries = [
+                    (event_id, score)
+                    for event_id, score in entries
+                    if score != max_score or event_id < last_id
+                ]
+            if not entries:
+                if exhausted:
+                    return
+                num *= 2  # A full chunk of ties at the cursor score
+                continue
+            num = SCAN_CHUNK_SIZE
+
+            values = await client.mget([self._event_key(event_id) for event_id, _ in entries])
+            for (_, score), value in zip(entries, values, strict=True):
+                if value:  # Body may have expired before its index entry
+                    yield Event.from_dict(json.loads(value)), score
+
+            if exhausted:
+                return
+            last_id, max_score = entries[-1]
+
+    async def _scan_memory(self, cursor: str | None) -> AsyncIterator[tuple[Event, float]]:
+        """Yield in-memory events in index order after the cursor."""
+        entries = sorted(
+            (
+                (event.created_at.timestamp(), event.event_id, event)
+                for event in self._memory_store.values()
+            ),
+            key=lambda entry: (entry[0], entry[1]),
+            reverse=True,
+        )
+        position = decode_cursor(cursor) if cursor else None
+        for score, event_id, event in entries:
+            if position is not None and (score, event_id) >= position:
+                continue
+            yield event, score
 
     async def get_dead_letter_events(self, limit: int = 100) -> list[Event]:
         """
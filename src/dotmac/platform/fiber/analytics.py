@@ -0,0 +1,181 @@
+"""
+Fiber Network Analytics Rollups.
+
+Network-wide fiber aggregates (cable, strand and capacity totals, health
+buckets, coverage and loss averages) are computed with one FILTER-clause
+aggregate statement per tenant and stored in ``fiber_network_rollups``.
+``refresh_network_rollups`` runs periodically, so dashboards read a single
+row by primary key; a missing or stale row is computed live instead.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import structlog
+from sqlalchemy import func, select, true, union
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import (
+    DistributionPoint,
+    FiberCable,
+    FiberCableStatus,
+    FiberNetworkRollup,
+    ServiceArea,
+    SplicePoint,
+)
+
+logger = structlog.get_logger(__name__)
+
+# Cables attenuating more than this (dB/km) are reported as high loss
+HIGH_LOSS_ATTENUATION_DB_PER_KM = 0.5
+
+# Rollups older than this are recomputed on read (the refresh task runs every 5 minutes)
+ROLLUP_MAX_AGE_SECONDS = 900
+
+_CABLE_STATUS_COLUMNS = {
+    "cables_active": FiberCableStatus.ACTIVE,
+    "cables_inactive": FiberCableStatus.INACTIVE,
+    "cables_under_construction": FiberCableStatus.UNDER_CONSTRUCTION,
+    "cables_maintenance": FiberCableStatus.MAINTENANCE,
+    "cables_damaged": FiberCableStatus.DAMAGED,
+    "cables_retired": FiberCableStatus.RETIRED,
+}
+
+
+async def compute_network_rollup(session: AsyncSession, tenant_id: str) -> FiberNetworkRollup:
+    """
+    Compute the fiber aggregates of a tenant without storing them.
+
+    Each table is aggregated once with FILTER clauses and the four single-row
+    aggregates are joined into one statement; the high-loss cable ids are a
+    second query.
+    """
+    cables = (
+        select(
+            func.count().label("total_cables"),
+            func.coalesce(func.sum(FiberCable.fiber_count), 0).label("total_strands"),
+            func.coalesce(func.sum(FiberCable.length_km), 0.0).label("total_fiber_km"),
+            func.coalesce(func.avg(FiberCable.attenuation_db_per_km), 0.0).label(
+                "average_cable_loss_db_per_km"
+            ),
+            *(
+                func.count().filter(FiberCable.status == status).label(column)
+                for column, status in _CABLE_STATUS_COLUMNS.items()
+            ),
+        )
+        .where(FiberCable.tenant_id == tenant_id)
+        .subquery()
+    )
+    points = (
+        select(
+            func.count().label("total_distribution_points"),
+            func.coalesce(func.sum(DistributionPoint.total_ports), 0).label("total_capacity"),
+            func.coalesce(func.sum(DistributionPoint.used_ports), 0).label("used_capacity"),
+        )
+        .where(DistributionPoint.tenant_id == tenant_id)
+        .subquery()
+    )
+    splices = (
+        select(
+            func.count().label("total_splice_points"),
+            func.coalesce(func.avg(SplicePoint.insertion_loss_db), 0.0).label(
+                "average_splice_loss_db"
+            ),
+        )
+        .where(SplicePoint.tenant_id == tenant_id)
+        .subquery()
+    )
+    areas = (
+        select(
+            func.count().label("total_service_areas"),
+            func.count()
+            .filter(ServiceArea.is_serviceable == True)  # noqa: E712
+            .label("active_service_areas"),
+            func.coalesce(func.sum(ServiceArea.homes_passed), 0).label("homes_passed"),
+            func.coalesce(func.sum(ServiceArea.homes_connected), 0).label("homes_connected"),
+        )
+        .where(ServiceArea.tenant_id == tenant_id)
+        .subquery()
+    )
+
+    aggregates = (
+        await session.execute(
+            select(cables, points, splices, areas).select_from(
+                cables.join(points, true()).join(splices, true()).join(areas, true())
+            )
+        )
+    ).one()
+
+    high_loss = await session.execute(
+        select(FiberCable.cable_id).where(
+            FiberCable.tenant_id == tenant_id,
+            FiberCable.attenuation_db_per_km > HIGH_LOSS_ATTENUATION_DB_PER_KM,
+        )
+    )
+
+    return FiberNetworkRollup(
+        tenant_id=tenant_id,
+        cables_with_high_loss=list(high_loss.scalars().all()),
+        refreshed_at=datetime.now(UTC),
+        **aggregates._asdict(),
+    )
+
+
+async def refresh_network_rollup(session: AsyncSession, tenant_id: str) -> FiberNetworkRollup:
+    """Recompute and store the rollup of a tenant (the caller commits)."""
+    rollup = await compute_network_rollup(session, tenant_id)
+    return await session.merge(rollup)
+
+
+async def refresh_network_rollups(session: AsyncSession) -> int:
+    """
+    Recompute and commit the rollup of every tenant with fiber infrastructure.
+
+    Tenants that already have a rollup are refreshed too, so removing a
+    tenant's last cable resets its totals rather than leaving them frozen.
+    A tenant whose refresh fails is logged and skipped.
+
+    Returns:
+        Number of tenants refreshed
+    """
+    tenant_ids = union(
+        *(
+            select(model.tenant_id).where(model.tenant_id.isnot(None))
+            for model in (FiberCable, DistributionPoint, SplicePoint, ServiceArea)
+        ),
+        select(FiberNetworkRollup.tenant_id),
+    )
+    refreshed = 0
+    for tenant_id in (await session.execute(tenant_ids)).scalars().all():
+        try:
+            await refresh_network_rollup(session, tenant_id)
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error("fiber.network_rollup.refresh_failed", tenant_id=tenant_id, error=str(e))
+            continue
+        refreshed += 1
+    return refreshed
+
+
+async def get_network_rollup(
+    session: AsyncSession,
+    tenant_id: str,
+    max_age_seconds: float = ROLLUP_MAX_AGE_SECONDS,
+) -> FiberNetworkRollup:
+    """
+    Return the stored rollup of a tenant, computing it live if missing or stale.
+
+    Live results are not stored, so reads never write; the periodic refresh
+    keeps the table current.
+    """
+    rollup = await session.get(FiberNetworkRollup, tenant_id)
+    if rollup is not None:
+        refreshed_at = rollup.refreshed_at
+        if refreshed_at.tzinfo is None:
+            refreshed_at = refreshed_at.replace(tzinfo=UTC)
+        if datetime.now(UTC) - refreshed_at <= timedelta(seconds=max_age_seconds):
+            return rollup
+    logger.debug("fiber.network_rollup.stale", tenant_id=tenant_id, missing=rollup is None)
+    return await compute_network_rollup(session, tenant_id)
@@ -876,3 +876,60 @@ class OTDRTestResult(Base, TimestampMixin, TenantMixin, SoftDeleteMixin, AuditMi
         CheckConstraint("strand_id > 0", name="ck_otdr_test_results_strand_positive"),
         CheckConstraint("events_detected >= 0", name="ck_otdr_test_results_events_non_negative"),
     )
+
+
+class FiberNetworkRollup(Base):  # type: ignore[misc]
+    """
+    Per-tenant fiber network analytics rollup.
+
+    Holds the network-wide aggregates behind the fiber analytics dashboard,
+    recomputed periodically by ``fiber.refresh_network_rollups`` so reading
+    them is a single primary-key lookup instead of scanning every cable,
+    splice, distribution point and service area of the tenant.
+    """
+
+    __tablename__ = "fiber_network_rollups"
+
+    tenant_id: Mapped[str] = mapped_column(
+        String(255),
+        primary_key=True,
+        comment="Tenant the aggregates belong to",
+    )
+
+    # Cables
+    total_cables: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_strands: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_fiber_km: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    cables_active: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cables_inactive: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cables_under_construction: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cables_maintenance: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cables_damaged: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    cables_retired: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    average_cable_loss_db_per_km: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    cables_with_high_loss: Mapped[list] = mapped_column(
+        JSON,
+        nullable=False,
+        default=list,
+        comment="cable_id of cables above the high-loss attenuation threshold",
+    )
+
+    # Distribution points and splices
+    total_distribution_points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_capacity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    used_capacity: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_splice_points: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    average_splice_loss_db: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    # Service areas
+    total_service_areas: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    active_service_areas: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    homes_passed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    homes_connected: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        comment="When the aggregates were computed",
+    )
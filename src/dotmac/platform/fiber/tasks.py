@@ -0,0 +1,36 @@
+"""
+Celery tasks for fiber infrastructure.
+
+Keeps the per-tenant fiber network analytics rollups current.
+"""
+
+import asyncio
+from typing import Any
+
+import structlog
+
+from dotmac.platform import db as db_module
+from dotmac.platform.celery_app import celery_app
+from dotmac.platform.fiber.analytics import refresh_network_rollups
+
+logger = structlog.get_logger(__name__)
+
+
+@celery_app.task(name="fiber.refresh_network_rollups")  # type: ignore[misc]  # Celery decorator is untyped
+def refresh_network_rollups_task() -> dict[str, Any]:
+    """
+    Recompute the fiber network analytics rollup of every tenant.
+
+    Returns:
+        dict: Number of tenants refreshed
+    """
+    return asyncio.run(_refresh_network_rollups_async())
+
+
+async def _refresh_network_rollups_async() -> dict[str, Any]:
+    """Async implementation of the rollup refresh."""
+    async with db_module.async_session_maker() as session:
+        refreshed = await refresh_network_rollups(session)
+
+    logger.info("fiber.network_rollups.refreshed", tenants=refreshed)
+    return {"tenants_refreshed": refreshed}
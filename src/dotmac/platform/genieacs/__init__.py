@@ -26,6 +26,9 @@ Components:
 - service_db: Production database-backed service layer (ACTIVE)
 - router: FastAPI endpoints using GenieACSServiceDB
 - tasks: Celery tasks for background firmware upgrades and mass config
+- executor: Bounded-concurrency, rate-limited per-device execution for bulk jobs
+- stats: Incrementally refreshed per-tenant device statistics
+- inventory: Incrementally synced, indexed per-tenant CPE inventory for device listings
 - metrics: Prometheus metrics for monitoring job status
 
 Database Tables:
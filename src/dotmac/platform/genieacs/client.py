@@ -4,8 +4,10 @@ GenieACS NBI (Northbound Interface) Client
 Provides interface to GenieACS REST API for TR-069/CWMP device management.
 """
 
-import asyncio
+import json
 import os
+import time
+from collections.abc import AsyncIterator
 from typing import Any, cast
 from urllib.parse import quote
 
@@ -44,8 +46,7 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
         "provision": 60.0,
     }
 
-    PREFETCH_THRESHOLD = 50  # Concurrent requests before triggering cache prefetch
-    PREFETCH_LIMIT = 1000
+    DEVICE_CACHE_MAX_ENTRIES = 1000
 
     def __init__(
         self,
@@ -58,6 +59,7 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
         max_retries: int = 3,
         max_connections: int | None = None,
         max_keepalive_connections: int | None = None,
+        device_cache_ttl_seconds: float | None = None,
     ):
         """
         Initialize GenieACS client with robust HTTP capabilities.
@@ -72,6 +74,8 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
             max_retries: Maximum retry attempts
             max_connections: Maximum concurrent connections in pool (None for unlimited)
             max_keepalive_connections: Maximum keep-alive connections to retain (None for unlimited)
+            device_cache_ttl_seconds: How long get_device results are reused, 0 disables
+                (defaults to settings.genieacs.device_cache_ttl_seconds)
         """
         # Load from centralized settings (Phase 2 implementation)
         if base_url is None:
@@ -82,6 +86,13 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
             except (ImportError, AttributeError):
                 # Fallback to environment variable if settings not available
                 base_url = os.getenv("GENIEACS_URL", "http://localhost:7557")
+        if device_cache_ttl_seconds is None:
+            try:
+                from dotmac.platform.settings import settings
+
+                device_cache_ttl_seconds = settings.genieacs.device_cache_ttl_seconds
+            except (ImportError, AttributeError):
+                device_cache_ttl_seconds = 0.0
 
         username = username or os.getenv("GENIEACS_USERNAME", "")
         password = password or os.getenv("GENIEACS_PASSWORD", "")
@@ -91,6 +102,12 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
         max_keepalive_value = (
             max_keepalive_connections if max_keepalive_connections is not None else 10
         )
+        # Callers bound their concurrency by this (bulk operations)
+        self.max_connections = max_connections_value
+        # Short-lived device documents for bursts of get_device calls:
+        # device ID -> (monotonic expiry, document)
+        self.device_cache_ttl_seconds = device_cache_ttl_seconds
+        self._device_cache: dict[str, tuple[float, dict[str, Any]]] = {}
 
         super().__init__(
             service_name="genieacs",
@@ -105,12 +122,6 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
             max_keepalive_connections=max_keepalive_value,
         )
 
-        # Prefetch/cache state (lazily initialised inside async context)
-        self._prefetch_lock: asyncio.Lock | None = None
-        self._prefetch_task: asyncio.Task[None] | None = None
-        self._device_cache: dict[str, dict[str, Any]] | None = None
-        self._active_requests = 0
-
     async def _genieacs_request(
         self,
         method: str,
@@ -150,6 +161,7 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
         projection: str | None = None,
         skip: int = 0,
         limit: int = 100,
+        sort: dict[str, int] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Get devices from GenieACS
@@ -159,6 +171,7 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
             projection: Comma-separated list of fields to return
             skip: Number of records to skip
             limit: Maximum records to return
+            sort: Sort specification, e.g. {"_id": 1}
 
         Returns:
             List of device objects
@@ -166,117 +179,101 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
         params: dict[str, Any] = {"skip": skip, "limit": limit}
 
         if query:
-            import json
-
             params["query"] = json.dumps(query)
 
         if projection:
             params["projection"] = projection
 
+        if sort:
+            params["sort"] = json.dumps(sort)
+
         response = await self._genieacs_request("GET", "devices", params=params)
         return response if isinstance(response, list) else []
 
-    async def _ensure_prefetch_lock(self) -> None:
-        if self._prefetch_lock is None:
-            self._prefetch_lock = asyncio.Lock()
-
-    async def _invalidate_device_cache(self) -> None:
-        await self._ensure_prefetch_lock()
-        assert self._prefetch_lock is not None
-        async with self._prefetch_lock:
-            self._device_cache = None
-            self._prefetch_task = None
-
-    async def _cache_devices(self, devices: list[dict[str, Any]]) -> None:
-        cache: dict[str, dict[str, Any]] = {}
-        for device in devices:
-            if isinstance(device, dict) and "_id" in device:
-                cache[str(device["_id"])] = device
-
-        await self._ensure_prefetch_lock()
-        assert self._prefetch_lock is not None
-        async with self._prefetch_lock:
-            self._device_cache = cache
-            self._prefetch_task = None
-
-    async def _cache_device_object(self, device: dict[str, Any]) -> None:
-        device_id = device.get("_id")
-        if device_id is None:
-            return
-        await self._ensure_prefetch_lock()
-        assert self._prefetch_lock is not None
-        async with self._prefetch_lock:
-            if self._device_cache is not None:
-                self._device_cache[str(device_id)] = device
-
-    async def _prefetch_all_devices(self) -> None:
-        try:
-            response = await self._genieacs_request(
-                "GET",
-                "devices",
-                params={"limit": self.PREFETCH_LIMIT},
-            )
-            devices = response if isinstance(response, list) else []
-            await self._cache_devices(devices)
-        except Exception as exc:  # pragma: no cover - diagnostic aide
-            logger.warning("genieacs.prefetch.failed", error=str(exc))
-            await self._invalidate_device_cache()
-
-    async def _maybe_prefetch_devices(self) -> None:
-        if self._device_cache is not None:
-            return
+    async def iter_devices(
+        self,
+        query: dict[str, Any] | None = None,
+        projection: str | None = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over all devices matching a query, one page at a time.
 
-        if self._active_requests < self.PREFETCH_THRESHOLD:
-            return
+        Pages are keyed on ``_id`` (sorted, greater than the last ID seen)
+        instead of ``skip``, so every page is an index range scan and devices
+        added or removed while iterating do not shift later pages.
 
-        await self._ensure_prefetch_lock()
-        assert self._prefetch_lock is not None
-        async with self._prefetch_lock:
-            if self._device_cache is not None:
+        Args:
+            query: MongoDB-style query filter
+            projection: Comma-separated list of fields to return (``_id`` is added)
+            page_size: Devices requested per page
+
+        Yields:
+            Device objects
+        """
+        if projection and "_id" not in projection.split(","):
+            projection = f"_id,{projection}"
+
+        last_id: str | None = None
+        while True:
+            page_query = dict(query or {})
+            if last_id is not None:
+                after_last = {"$gt": last_id}
+                if "_id" in page_query:
+                    page_query = {"$and": [page_query, {"_id": after_last}]}
+                else:
+                    page_query["_id"] = after_last
+
+            page = await self.get_devices(
+                query=page_query or None,
+                projection=projection,
+                limit=page_size,
+                sort={"_id": 1},
+            )
+            for device in page:
+                yield device
+            if len(page) < page_size:
                 return
-
-            if self._prefetch_task is None:
-                self._prefetch_task = asyncio.create_task(self._prefetch_all_devices())
-
-            task = self._prefetch_task
-
-        if task is not None:
-            await task
-
-    async def _get_cached_device(self, device_id: str) -> dict[str, Any] | None:
-        await self._maybe_prefetch_devices()
-        if self._device_cache is not None:
-            return self._device_cache.get(device_id)
-        return None
+            last_id = str(page[-1]["_id"])
 
     async def get_device(self, device_id: str) -> dict[str, Any] | None:
         """
         Get single device by ID
 
+        Documents are reused for ``device_cache_ttl_seconds`` and dropped when
+        this client changes the device; cached documents are shared, so
+        callers must not mutate them.
+
         Args:
             device_id: Device ID (typically serial number)
 
         Returns:
             Device object or None
         """
-        self._active_requests += 1
+        cached = self._device_cache.get(device_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
         try:
-            cached = await self._get_cached_device(device_id)
-            if cached is not None:
-                return cached
-
             # URL encode device ID
             encoded_id = quote(device_id, safe="")
             response = await self._genieacs_request("GET", f"devices/{encoded_id}")
-            device = cast(dict[str, Any], response)
-            await self._cache_device_object(device)
-            return device
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
+                self._device_cache.pop(device_id, None)
                 return None
             raise
-        finally:
-            self._active_requests = max(0, self._active_requests - 1)
+        device = cast(dict[str, Any], response)
+        self._cache_device(device_id, device)
+        return device
+
+    def _cache_device(self, device_id: str, device: dict[str, Any]) -> None:
+        if self.device_cache_ttl_seconds <= 0 or not isinstance(device, dict):
+            return
+        self._device_cache.pop(device_id, None)
+        if len(self._device_cache) >= self.DEVICE_CACHE_MAX_ENTRIES:
+            # Oldest insertion first
+            del self._device_cache[next(iter(self._device_cache))]
+        self._device_cache[device_id] = (time.monotonic() + self.device_cache_ttl_seconds, device)
 
     async def delete_device(self, device_id: str) -> bool:
         """
@@ -291,7 +288,7 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
         try:
             encoded_id = quote(device_id, safe="")
             await self._genieacs_request("DELETE", f"devices/{encoded_id}")
-            await self._invalidate_device_cache()
+            self._device_cache.pop(device_id, None)
             return True
         except Exception as e:
             logger.error("genieacs.delete_device.failed", device_id=device_id, error=str(e))
@@ -310,7 +307,7 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
         """
         encoded_id = quote(device_id, safe="")
         response = await self._genieacs_request("PATCH", f"devices/{encoded_id}", json=data)
-        await self._invalidate_device_cache()
+        self._device_cache.pop(device_id, None)
         return cast(dict[str, Any], response)
 
     async def get_device_count(self, query: dict[str, Any] | None = None) -> int:
@@ -363,7 +360,11 @@ class GenieACSClient(RobustHTTPClient):  # type: ignore[misc]
         if task_data:
             payload.update(task_data)
 
-        response = await self._genieacs_request("POST", endpoint, json=payload)
+        try:
+            response = await self._genieacs_request("POST", endpoint, json=payload)
+        finally:
+            # Tasks run in the device session and may have changed its parameters
+            self._device_cache.pop(device_id, None)
         return cast(dict[str, Any], response)
 
     async def add_task(self, device_id: str, task_name: str, **task_kwargs: Any) -> dict[str, Any]:
@@ -0,0 +1,137 @@
+"""
+Concurrent per-device execution for GenieACS bulk operations.
+
+``run_device_operations`` applies one coroutine to many devices with at most
+``max_concurrent`` calls in flight and yields a ``DeviceOutcome`` for each
+device as soon as it finishes, so callers can persist and report results in
+batches instead of once per device. An optional ``AcsRateLimiter`` spaces out
+the calls started against one ACS. Failed calls are not retried here;
+``GenieACSClient`` already retries transient errors (timeouts, dropped
+connections, 429 and 5xx).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+_rate_limiters: dict[str, AcsRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+class AcsRateLimiter:
+    """
+    Start at most ``rate_per_second`` requests per second against one ACS.
+
+    Slots are reserved under a thread lock without awaiting, so a limiter can
+    be shared by every event loop in the process (Celery runs one per task).
+    """
+
+    def __init__(self, rate_per_second: float) -> None:
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate_per_second = rate_per_second
+        self._interval = 1.0 / rate_per_second
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for the next free request slot."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+def get_acs_rate_limiter(base_url: str, rate_per_second: float) -> AcsRateLimiter | None:
+    """Return the process-wide limiter for an ACS, or None when unlimited."""
+    if rate_per_second <= 0:
+        return None
+    key = base_url.rstrip("/")
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None or limiter.rate_per_second != rate_per_second:
+            limiter = AcsRateLimiter(rate_per_second)
+            _rate_limiters[key] = limiter
+        return limiter
+
+
+def reset_acs_rate_limiters() -> None:
+    """Drop all process-wide rate limiters (tests)."""
+    with _rate_limiters_lock:
+        _rate_limiters.clear()
+
+
+@dataclass(slots=True)
+class DeviceOutcome:
+    """Result of one device operation."""
+
+    device_id: str
+    started_at: datetime
+    completed_at: datetime
+    result: Any = None
+    error: Exception | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+async def run_device_operations(
+    device_ids: Iterable[str],
+    operation: Callable[[str], Awaitable[Any]],
+    *,
+    max_concurrent: int,
+    rate_limiter: AcsRateLimiter | None = None,
+) -> AsyncIterator[DeviceOutcome]:
+    """
+    Run ``operation`` for every device and yield outcomes in completion order.
+
+    A fixed pool of ``max_concurrent`` workers pulls device IDs lazily, so
+    memory does not grow with the number of devices in flight. Exceptions
+    raised by ``operation`` are captured in the outcome. Close the generator
+    (``contextlib.aclosing``) when abandoning it early so workers are cancelled.
+    """
+    if max_concurrent < 1:
+        raise ValueError("max_concurrent must be at least 1")
+
+    pending = iter(device_ids)
+    # ``None`` marks a finished worker
+    outcomes: asyncio.Queue[DeviceOutcome | None] = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            for device_id in pending:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                started_at = datetime.now(UTC)
+                try:
+                    result = await operation(device_id)
+                except Exception as e:
+                    outcome = DeviceOutcome(device_id, started_at, datetime.now(UTC), error=e)
+                else:
+                    outcome = DeviceOutcome(device_id, started_at, datetime.now(UTC), result=result)
+                outcomes.put_nowait(outcome)
+        finally:
+            outcomes.put_nowait(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(max_concurrent)]
+    running = len(workers)
+    try:
+        while running:
+            outcome = await outcomes.get()
+            if outcome is None:
+                running -= 1
+                continue
+            yield outcome
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
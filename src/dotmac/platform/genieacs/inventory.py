@@ -0,0 +1,382 @@
+"""
+Incrementally synced CPE inventory for GenieACS.
+
+``CpeInventory`` keeps a compact record per device (identity, model,
+versions, last inform and registration time) for one tenant on one ACS,
+with secondary indexes on serial number, OUI and product class, an ordering
+by last inform for online/offline filtering and an ordering by device ID for
+paging. Device listings are served from the index without contacting the
+ACS; the index itself is refreshed by reading only devices whose
+``_lastInform`` or ``_registered`` is at or after the newest value already
+seen, with a periodic full resync to drop devices deleted elsewhere.
+Concurrent callers share one in-flight sync, and once the inventory has been
+built listings are answered from it while a due sync runs in the background.
+
+Full device documents (all parameters) are still read from the ACS; the
+inventory only answers "which devices" questions.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+
+from dotmac.platform.cache.stampede import SingleFlight
+from dotmac.platform.genieacs.schemas import DeviceInfo
+from dotmac.platform.genieacs.stats import (
+    DeviceSource,
+    format_acs_timestamp,
+    get_parameter_value,
+    is_online,
+    online_cutoff,
+    parse_last_inform,
+)
+from dotmac.platform.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+# Single-flight key of an inventory's sync
+SYNC_FLIGHT_KEY = "genieacs.inventory.sync"
+
+
+def _device_info_paths(name: str) -> tuple[str, str]:
+    return (f"InternetGatewayDevice.DeviceInfo.{name}", f"Device.DeviceInfo.{name}")
+
+
+# Candidate paths per record field, most specific first
+_FIELD_PATHS: dict[str, tuple[str, ...]] = {
+    "serial_number": ("_deviceId._SerialNumber", *_device_info_paths("SerialNumber")),
+    "oui": ("_deviceId._OUI", *_device_info_paths("ManufacturerOUI")),
+    "product_class": ("_deviceId._ProductClass", *_device_info_paths("ProductClass")),
+    "manufacturer": ("_deviceId._Manufacturer", *_device_info_paths("Manufacturer")),
+    "model": _device_info_paths("ModelName"),
+    "hardware_version": _device_info_paths("HardwareVersion"),
+    "software_version": _device_info_paths("SoftwareVersion"),
+    "connection_request_url": (
+        "_deviceId._ConnectionRequestURL",
+        "InternetGatewayDevice.ManagementServer.ConnectionRequestURL",
+        "Device.ManagementServer.ConnectionRequestURL",
+    ),
+}
+
+INVENTORY_PROJECTION = ",".join(
+    (
+        "_id",
+        "_deviceId",
+        "_lastInform",
+        "_registered",
+        *(
+            path
+            for paths in _FIELD_PATHS.values()
+            for path in paths
+            if not path.startswith("_deviceId.")
+        ),
+    )
+)
+
+
+@dataclass(slots=True, frozen=True)
+class InventoryRecord:
+    """Compact inventory entry for one device."""
+
+    device_id: str
+    serial_number: str | None = None
+    oui: str | None = None
+    product_class: str | None = None
+    manufacturer: str | None = None
+    model: str | None = None
+    hardware_version: str | None = None
+    software_version: str | None = None
+    connection_request_url: str | None = None
+    last_inform: float | None = None
+    registered: float | None = None
+
+    @classmethod
+    def from_device(cls, device: dict[str, Any]) -> InventoryRecord | None:
+        device_id = device.get("_id")
+        if not device_id:
+            return None
+        fields: dict[str, str | None] = {}
+        for field, paths in _FIELD_PATHS.items():
+            value = next((v for p in paths if (v := get_parameter_value(device, p))), None)
+            fields[field] = str(value) if value is not None else None
+        return cls(
+            device_id=str(device_id),
+            last_inform=parse_last_inform(device.get("_lastInform")),
+            registered=parse_last_inform(device.get("_registered")),
+            **fields,
+        )
+
+    def to_device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            device_id=self.device_id,
+            manufacturer=self.manufacturer,
+            model=self.model,
+            product_class=self.product_class,
+            oui=self.oui,
+            serial_number=self.serial_number,
+            hardware_version=self.hardware_version,
+            software_version=self.software_version,
+            connection_request_url=self.connection_request_url,
+            last_inform=_to_datetime(self.last_inform),
+            registered=_to_datetime(self.registered),
+        )
+
+
+def _to_datetime(epoch_seconds: float | None) -> datetime | None:
+    return datetime.fromtimestamp(epoch_seconds, UTC) if epoch_seconds is not None else None
+
+
+_INDEXED_FIELDS = ("serial_number", "oui", "product_class")
+
+
+class _InventoryIndex:
+    """Records plus the secondary indexes derived from them."""
+
+    def __init__(self, records: Iterable[InventoryRecord] = ()) -> None:
+        self.records: dict[str, InventoryRecord] = {}
+        self.by_field: dict[str, dict[str, set[str]]] = {field: {} for field in _INDEXED_FIELDS}
+        self.last_inform_watermark: float | None = None
+        self.registered_watermark: float | None = None
+        for record in records:
+            self.records[record.device_id] = record
+        for record in self.records.values():
+            self._index(record)
+        # Sorted once here, then maintained with bisect on every change
+        self.order: list[str] = sorted(self.records)
+        self.by_inform: list[tuple[float, str]] = sorted(
+            (r.last_inform or 0.0, r.device_id) for r in self.records.values()
+        )
+
+    def upsert(self, record: InventoryRecord) -> None:
+        previous = self.records.get(record.device_id)
+        if previous is None:
+            insort(self.order, record.device_id)
+        else:
+            self._unindex(previous)
+            del self.by_inform[bisect_left(self.by_inform, self._inform_key(previous))]
+        self.records[record.device_id] = record
+        self._index(record)
+        insort(self.by_inform, self._inform_key(record))
+
+    def discard(self, device_id: str) -> None:
+        record = self.records.pop(device_id, None)
+        if record is None:
+            return
+        self._unindex(record)
+        del self.order[bisect_left(self.order, device_id)]
+        del self.by_inform[bisect_left(self.by_inform, self._inform_key(record))]
+
+    def _index(self, record: InventoryRecord) -> None:
+        for field in _INDEXED_FIELDS:
+            value = getattr(record, field)
+            if value is not None:
+                self.by_field[field].setdefault(value, set()).add(record.device_id)
+        if record.last_inform is not None:
+            self.last_inform_watermark = max(self.last_inform_watermark or 0.0, record.last_inform)
+        if record.registered is not None:
+            self.registered_watermark = max(self.registered_watermark or 0.0, record.registered)
+
+    def _unindex(self, record: InventoryRecord) -> None:
+        for field in _INDEXED_FIELDS:
+            value = getattr(record, field)
+            ids = self.by_field[field].get(value) if value is not None else None
+            if ids is not None:
+                ids.discard(record.device_id)
+                if not ids:
+                    del self.by_field[field][value]
+
+    @staticmethod
+    def _inform_key(record: InventoryRecord) -> tuple[float, str]:
+        return (record.last_inform or 0.0, record.device_id)
+
+
+class CpeInventory:
+    """
+    Device inventory for one tenant on one ACS.
+
+    Like ``DeviceStatsAggregator``, syncs do not hold a lock: index updates
+    are synchronous, so an overlapping sync (from another event loop) only
+    repeats work.
+    """
+
+    def __init__(
+        self,
+        sync_interval_seconds: float,
+        full_resync_seconds: float,
+        page_size: int,
+    ) -> None:
+        self.sync_interval_seconds = sync_interval_seconds
+        self.full_resync_seconds = full_resync_seconds
+        self.page_size = page_size
+        self._index = _InventoryIndex()
+        self._synced_at: float | None = None
+        self._full_synced_at: float | None = None
+        self._sync = SingleFlight()
+
+    def __len__(self) -> int:
+        return len(self._index.records)
+
+    async def sync(self, source: DeviceSource) -> None:
+        """
+        Start a sync if the inventory is older than the sync interval.
+
+        Only waits for the sync while the inventory has never been built;
+        afterwards the current index keeps answering while the sync runs.
+        """
+        now = time.monotonic()
+        if self._full_synced_at is None or now - self._full_synced_at >= self.full_resync_seconds:
+            self._sync.run_in_background(SYNC_FLIGHT_KEY, lambda: self.full_resync(source))
+        elif self._synced_at is None or now - self._synced_at >= self.sync_interval_seconds:
+            self._sync.run_in_background(SYNC_FLIGHT_KEY, lambda: self.refresh(source))
+        else:
+            return
+        if self._full_synced_at is None:
+            await self._sync.wait(SYNC_FLIGHT_KEY)
+
+    async def wait_for_sync(self) -> None:
+        """Wait for a background sync started on this event loop."""
+        await self._sync.wait(SYNC_FLIGHT_KEY)
+
+    async def full_resync(self, source: DeviceSource) -> None:
+        """Rebuild the inventory from every device on the ACS."""
+        started = time.monotonic()
+        records = []
+        async for device in source.iter_devices(
+            projection=INVENTORY_PROJECTION, page_size=self.page_size
+        ):
+            record = InventoryRecord.from_device(device)
+            if record is not None:
+                records.append(record)
+        self._index = _InventoryIndex(records)
+        self._synced_at = self._full_synced_at = time.monotonic()
+        logger.debug(
+            "genieacs.inventory.full_resync",
+            devices=len(self._index.records),
+            duration_seconds=round(self._full_synced_at - started, 3),
+        )
+
+    async def refresh(self, source: DeviceSource) -> None:
+        """Read devices that informed or registered since the newest seen."""
+        index = self._index
+        conditions = []
+        # Inclusive bounds: devices sharing a watermark's timestamp are re-read
+        if index.last_inform_watermark is not None:
+            since = format_acs_timestamp(index.last_inform_watermark)
+            conditions.append({"_lastInform": {"$gte": since}})
+        if index.registered_watermark is not None:
+            since = format_acs_timestamp(index.registered_watermark)
+            conditions.append({"_registered": {"$gte": since}})
+        if not conditions:
+            await self.full_resync(source)
+            return
+
+        updated = 0
+        async for device in source.iter_devices(
+            query=conditions[0] if len(conditions) == 1 else {"$or": conditions},
+            projection=INVENTORY_PROJECTION,
+            page_size=self.page_size,
+        ):
+            record = InventoryRecord.from_device(device)
+            if record is not None:
+                self._index.upsert(record)
+                updated += 1
+        self._synced_at = time.monotonic()
+        logger.debug("genieacs.inventory.refreshed", updated=updated)
+
+    def get(self, device_id: str) -> InventoryRecord | None:
+        return self._index.records.get(device_id)
+
+    def discard(self, device_id: str) -> None:
+        """Forget a device deleted through this process."""
+        self._index.discard(device_id)
+
+    def query(
+        self,
+        *,
+        serial_number: str | None = None,
+        oui: str | None = None,
+        product_class: str | None = None,
+        online: bool | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[InventoryRecord], int]:
+        """
+        Select devices ordered by device ID.
+
+        Returns:
+            (page of records, total number of matching devices)
+        """
+        index = self._index
+        filters = {
+            "serial_number": serial_number,
+            "oui": oui,
+            "product_class": product_class,
+        }
+        candidate_sets = [
+            index.by_field[field].get(value, set())
+            for field, value in filters.items()
+            if value is not None
+        ]
+
+        if not candidate_sets and online is None:
+            page_ids = index.order[skip : skip + limit]
+            return [index.records[device_id] for device_id in page_ids], len(index.order)
+
+        cutoff = online_cutoff()
+        if candidate_sets:
+            candidate_sets.sort(key=len)
+            matches = set(candidate_sets[0]).intersection(*candidate_sets[1:])
+            if online is not None:
+                matches = {
+                    device_id
+                    for device_id in matches
+                    if is_online(index.records[device_id].last_inform, cutoff) == online
+                }
+        else:
+            # Online devices (``is_online``: last inform at or after the cutoff)
+            # are a suffix of the last-inform ordering
+            split = bisect_left(index.by_inform, (cutoff, ""))
+            selected = index.by_inform[split:] if online else index.by_inform[:split]
+            matches = {device_id for _, device_id in selected}
+
+        ordered = sorted(matches)
+        page_ids = ordered[skip : skip + limit]
+        return [index.records[device_id] for device_id in page_ids], len(ordered)
+
+
+_inventories: dict[tuple[str | None, str], CpeInventory] = {}
+_inventories_lock = threading.Lock()
+
+
+def get_cpe_inventory(tenant_id: str | None, base_url: str) -> CpeInventory:
+    """Return the process-wide inventory for a tenant on one ACS."""
+    key = (tenant_id, base_url.rstrip("/"))
+    with _inventories_lock:
+        inventory = _inventories.get(key)
+        if inventory is None:
+            inventory = new_cpe_inventory()
+            _inventories[key] = inventory
+        return inventory
+
+
+def new_cpe_inventory() -> CpeInventory:
+    """Create an inventory configured from settings."""
+    return CpeInventory(
+        sync_interval_seconds=settings.genieacs.inventory_sync_interval_seconds,
+        full_resync_seconds=settings.genieacs.inventory_full_resync_seconds,
+        page_size=settings.genieacs.inventory_page_size,
+    )
+
+
+def reset_cpe_inventories() -> None:
+    """Drop all process-wide inventories (tests)."""
+    with _inventories_lock:
+        _inventories.clear()
@@ -4,16 +4,26 @@ GenieACS API Router
 FastAPI endpoints for GenieACS CPE management operations.
 """
 
+import json
+import time
+from collections.abc import AsyncIterator
 from typing import Any, cast
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from sse_starlette.sse import EventSourceResponse
 
 from dotmac.platform.auth.core import UserInfo
 from dotmac.platform.auth.rbac_dependencies import require_permission
 from dotmac.platform.db import get_session_dependency
 from dotmac.platform.genieacs.client import GenieACSClient
 from dotmac.platform.genieacs.schemas import (
+    BulkDeviceResult,
+    BulkFirmwareUpgradeRequest,
+    BulkOperationRequest,
+    BulkOperationSummary,
+    BulkSetParametersRequest,
     CPEConfigRequest,
     DeviceListResponse,
     DeviceQuery,
@@ -110,11 +120,22 @@ async def health_check(
 async def list_devices(
     skip: int = Query(0, ge=0, description="Records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum records"),
+    serial_number: str | None = Query(None, description="Filter by serial number"),
+    oui: str | None = Query(None, description="Filter by manufacturer OUI"),
+    product_class: str | None = Query(None, description="Filter by product class"),
+    online: bool | None = Query(None, description="Filter by online state"),
     service: GenieACSServiceDB = Depends(get_genieacs_service),
     _: UserInfo = Depends(require_permission("isp.cpe.read")),
 ) -> DeviceListResponse:
     """List CPE devices"""
-    query = DeviceQuery(skip=skip, limit=limit)
+    query = DeviceQuery(
+        skip=skip,
+        limit=limit,
+        serial_number=serial_number,
+        oui=oui,
+        product_class=product_class,
+        online=online,
+    )
     result = await service.list_devices(query, return_response=True)
     return cast(DeviceListResponse, result)
 
@@ -362,6 +383,116 @@ async def configure_cpe(
     return await service.configure_cpe(request)
 
 
+# =============================================================================
+# Bulk Task Endpoints
+# =============================================================================
+
+
+async def _bulk_events(
+    results: AsyncIterator[BulkDeviceResult],
+) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+    """Yield one ``device_result`` event per device followed by a ``summary``."""
+    started = time.monotonic()
+    total = succeeded = 0
+    async for result in results:
+        total += 1
+        succeeded += result.success
+        yield "device_result", result.model_dump()
+    elapsed = time.monotonic() - started
+    summary = BulkOperationSummary(
+        total=total,
+        succeeded=succeeded,
+        failed=total - succeeded,
+        elapsed_seconds=round(elapsed, 3),
+        devices_per_second=round(total / elapsed, 1) if elapsed > 0 else 0.0,
+    )
+    yield "summary", summary.model_dump()
+
+
+def _stream_bulk_results(
+    http_request: Request, results: AsyncIterator[BulkDeviceResult]
+) -> Response:
+    """Stream bulk results as SSE when requested, NDJSON otherwise."""
+    events = _bulk_events(results)
+
+    if "text/event-stream" in http_request.headers.get("accept", ""):
+
+        async def sse() -> AsyncIterator[dict[str, str]]:
+            async for event, data in events:
+                yield {"event": event, "data": json.dumps(data)}
+
+        return EventSourceResponse(sse())
+
+    async def ndjson() -> AsyncIterator[str]:
+        async for event, data in events:
+            yield json.dumps({"event": event, "data": data}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+_BULK_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "description": "One event per device, then a summary",
+        "content": {"application/x-ndjson": {}, "text/event-stream": {}},
+    }
+}
+
+
+@router.post(
+    "/tasks/bulk/set-parameters",
+    response_class=StreamingResponse,
+    responses=_BULK_RESPONSES,
+    summary="Bulk Set Device Parameters",
+    description="Set TR-069 parameter values on many devices, streaming per-device results",
+)
+async def bulk_set_parameters(
+    request: BulkSetParametersRequest,
+    http_request: Request,
+    service: GenieACSServiceDB = Depends(get_genieacs_service),
+    _: UserInfo = Depends(require_permission("isp.cpe.write")),
+) -> Response:
+    """Set parameters on multiple devices"""
+    return _stream_bulk_results(http_request, service.stream_bulk_set_parameters(request))
+
+
+@router.post(
+    "/tasks/bulk/firmware-upgrade",
+    response_class=StreamingResponse,
+    responses=_BULK_RESPONSES,
+    summary="Bulk Firmware Upgrade",
+    description="Trigger firmware upgrades on many devices, streaming per-device results",
+)
+async def bulk_firmware_upgrade(
+    request: BulkFirmwareUpgradeRequest,
+    http_request: Request,
+    service: GenieACSServiceDB = Depends(get_genieacs_service),
+    _: UserInfo = Depends(require_permission("isp.cpe.write")),
+) -> Response:
+    """Trigger firmware upgrade on multiple devices"""
+    return _stream_bulk_results(http_request, service.stream_bulk_firmware_upgrade(request))
+
+
+@router.post(
+    "/tasks/bulk/operation",
+    response_class=StreamingResponse,
+    responses=_BULK_RESPONSES,
+    summary="Bulk Device Operation",
+    description="Reboot or factory reset many devices, streaming per-device results",
+)
+async def bulk_operation(
+    request: BulkOperationRequest,
+    http_request: Request,
+    service: GenieACSServiceDB = Depends(get_genieacs_service),
+    _: UserInfo = Depends(require_permission("isp.cpe.write")),
+) -> Response:
+    """Run an operation on multiple devices"""
+    try:
+        results = service.stream_bulk_operation(request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+    return _stream_bulk_results(http_request, results)
+
+
 # =============================================================================
 # Preset Endpoints
 # =============================================================================
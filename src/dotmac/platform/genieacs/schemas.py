@@ -28,6 +28,10 @@ class DeviceQuery(BaseModel):  # BaseModel resolves to Any in isolation
     projection: str | None = Field(None, description="Comma-separated fields")
     skip: int = Field(0, ge=0, description="Records to skip")
     limit: int = Field(100, ge=1, le=1000, description="Maximum records")
+    serial_number: str | None = Field(None, description="Filter by serial number")
+    oui: str | None = Field(None, description="Filter by manufacturer OUI")
+    product_class: str | None = Field(None, description="Filter by product class")
+    online: bool | None = Field(None, description="Filter by online state (informed recently)")
 
 
 class DeviceInfo(BaseModel):  # BaseModel resolves to Any in isolation
@@ -204,6 +208,15 @@ class BulkFirmwareUpgradeRequest(BaseModel):  # BaseModel resolves to Any in iso
     download_url: str = Field(..., description="URL to firmware image")
     file_type: str | None = Field(None, description="TR-069 file type")
     schedule_time: str | None = Field(None, description="Scheduled execution time (ISO)")
+    max_concurrent: int | None = Field(
+        None,
+        ge=1,
+        le=20,
+        description=(
+            "Device tasks in flight at once, at most the ACS connection pool size "
+            "(server default if unset)"
+        ),
+    )
 
 
 class DiagnosticRequest(BaseModel):  # BaseModel resolves to Any in isolation
@@ -226,6 +239,15 @@ class BulkSetParametersRequest(BaseModel):  # BaseModel resolves to Any in isola
 
     device_ids: list[str] = Field(..., min_length=1, description="List of device IDs")
     parameters: dict[str, Any] = Field(..., description="Parameters to apply to devices")
+    max_concurrent: int | None = Field(
+        None,
+        ge=1,
+        le=20,
+        description=(
+            "Device tasks in flight at once, at most the ACS connection pool size "
+            "(server default if unset)"
+        ),
+    )
 
 
 class BulkOperationRequest(BaseModel):  # BaseModel resolves to Any in isolation
@@ -236,6 +258,38 @@ class BulkOperationRequest(BaseModel):  # BaseModel resolves to Any in isolation
     device_ids: list[str] = Field(..., min_length=1, description="List of device IDs")
     operation: str = Field(..., description="Operation to perform on each device")
     parameters: dict[str, Any] | None = Field(None, description="Optional operation parameters")
+    max_concurrent: int | None = Field(
+        None,
+        ge=1,
+        le=20,
+        description=(
+            "Device tasks in flight at once, at most the ACS connection pool size "
+            "(server default if unset)"
+        ),
+    )
+
+
+class BulkDeviceResult(BaseModel):  # BaseModel resolves to Any in isolation
+    """Outcome of a bulk operation on one device."""
+
+    model_config = ConfigDict()
+
+    device_id: str = Field(..., description="Device ID")
+    success: bool = Field(..., description="Whether the device task was created")
+    task_id: str | None = Field(None, description="Created task ID")
+    error: str | None = Field(None, description="Error message if the task was not created")
+
+
+class BulkOperationSummary(BaseModel):  # BaseModel resolves to Any in isolation
+    """Totals reported after the last device of a bulk operation."""
+
+    model_config = ConfigDict()
+
+    total: int = Field(..., description="Devices processed")
+    succeeded: int = Field(..., description="Devices whose task was created")
+    failed: int = Field(..., description="Devices whose task was not created")
+    elapsed_seconds: float = Field(..., description="Wall-clock duration")
+    devices_per_second: float = Field(..., description="Throughput")
 
 
 # ============================================================================
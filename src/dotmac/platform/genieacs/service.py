@@ -4,6 +4,8 @@ GenieACS Service Layer
 Business logic for CPE management via GenieACS TR-069/CWMP.
 """
 
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import aclosing
 from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
@@ -12,7 +14,14 @@ import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from dotmac.platform.genieacs.client import GenieACSClient
+from dotmac.platform.genieacs.executor import get_acs_rate_limiter, run_device_operations
+from dotmac.platform.genieacs.inventory import (
+    CpeInventory,
+    get_cpe_inventory,
+    new_cpe_inventory,
+)
 from dotmac.platform.genieacs.schemas import (
+    BulkDeviceResult,
     BulkFirmwareUpgradeRequest,
     BulkOperationRequest,
     BulkSetParametersRequest,
@@ -54,6 +63,12 @@ from dotmac.platform.genieacs.schemas import (
     WANConfig,
     WiFiConfig,
 )
+from dotmac.platform.genieacs.stats import (
+    DeviceStatsAggregator,
+    get_device_stats_aggregator,
+    new_device_stats_aggregator,
+)
+from dotmac.platform.settings import settings
 
 logger = structlog.get_logger(__name__)
 
@@ -98,6 +113,8 @@ class GenieACSService:
         self.tenant_id = tenant_id
         # Per-instance cache to support lightweight tests and fallback behaviour
         self._device_store: dict[str, dict[str, Any]] = {}
+        self._stats_aggregator: DeviceStatsAggregator | None = None
+        self._inventory: CpeInventory | None = None
 
     @staticmethod
     async def _await_if_needed(value: Any) -> Any:
@@ -215,10 +232,23 @@ class GenieACSService:
         *,
         return_response: bool = False,
     ) -> DeviceListResponse | list[dict[str, Any]]:
-        """List devices with optional filtering."""
+        """
+        List devices with optional filtering.
+
+        Listings without a raw ACS query or projection are served from the
+        tenant's ``CpeInventory``, which is synced incrementally rather than
+        read from the ACS on every page.
+        """
         if query_params is None:
             query_params = DeviceQuery()
 
+        if (
+            callable(getattr(self.client, "iter_devices", None))
+            and query_params.query is None
+            and query_params.projection is None
+        ):
+            return await self._list_inventory_devices(query_params, return_response)
+
         devices_raw: list[dict[str, Any]] = []
         # Prefer local cache when available
         devices_raw.extend(self._device_store.values())
@@ -276,6 +306,48 @@ class GenieACSService:
             )
         return paginated
 
+    async def _list_inventory_devices(
+        self, query_params: DeviceQuery, return_response: bool
+    ) -> DeviceListResponse | list[dict[str, Any]]:
+        inventory = self._cpe_inventory()
+        try:
+            await inventory.sync(self.client)
+        except Exception as exc:
+            # Serve the last synced inventory while the ACS is unreachable
+            logger.warning("genieacs.inventory.sync_failed", error=str(exc))
+
+        records, total = inventory.query(
+            serial_number=query_params.serial_number,
+            oui=query_params.oui,
+            product_class=query_params.product_class,
+            online=query_params.online,
+            skip=query_params.skip,
+            limit=query_params.limit,
+        )
+        device_models = [record.to_device_info() for record in records]
+        if return_response:
+            return DeviceListResponse(
+                devices=device_models,
+                total=total,
+                skip=query_params.skip,
+                limit=query_params.limit,
+            )
+        return [device.model_dump(by_alias=True) for device in device_models]
+
+    def _acs_base_url(self) -> str | None:
+        base_url = getattr(self.client, "base_url", None)
+        return base_url if isinstance(base_url, str) else None
+
+    def _cpe_inventory(self) -> CpeInventory:
+        if self._inventory is None:
+            base_url = self._acs_base_url()
+            self._inventory = (
+                get_cpe_inventory(self.tenant_id, base_url)
+                if base_url is not None
+                else new_cpe_inventory()
+            )
+        return self._inventory
+
     async def get_device(
         self,
         device_id: str,
@@ -334,6 +406,12 @@ class GenieACSService:
             self._device_store.pop(device_id, None)
             deleted = True
 
+        if deleted:
+            if self._stats_aggregator is not None:
+                self._stats_aggregator.discard(device_id)
+            if self._inventory is not None:
+                self._inventory.discard(device_id)
+
         return deleted
 
     async def get_device_status(self, device_id: str) -> DeviceStatusResponse | None:
@@ -379,41 +457,28 @@ class GenieACSService:
         )
 
     async def get_device_stats(self) -> DeviceStatsResponse:
-        """Get aggregate device statistics"""
-        all_devices = await self._await_if_needed(self.client.get_devices(limit=10000))
-
-        total = len(all_devices)
-        online_count = 0
-        manufacturers: dict[str, int] = {}
-        models: dict[str, int] = {}
-
-        for device in all_devices:
-            device_data = self._device_to_dict(device)
-            # Check if online
-            last_inform = device_data.get("_lastInform")
-            if last_inform:
-                last_inform_dt = datetime.fromtimestamp(last_inform / 1000)
-                if (datetime.utcnow() - last_inform_dt) < timedelta(minutes=5):
-                    online_count += 1
-
-            # Count manufacturers
-            mfr = self._get_param_value(
-                device_data, "InternetGatewayDevice.DeviceInfo.Manufacturer"
-            )
-            if mfr:
-                manufacturers[mfr] = manufacturers.get(mfr, 0) + 1
+        """
+        Get aggregate device statistics.
 
-            # Count models
-            model = self._get_param_value(device_data, "InternetGatewayDevice.DeviceInfo.ModelName")
-            if model:
-                models[model] = models.get(model, 0) + 1
+        Served from the per-tenant ``DeviceStatsAggregator``, which pages
+        through devices with a minimal projection and afterwards only re-reads
+        devices that informed since its last refresh.
+        """
+        if self._stats_aggregator is None:
+            base_url = self._acs_base_url()
+            self._stats_aggregator = (
+                get_device_stats_aggregator(self.tenant_id, base_url)
+                if base_url is not None
+                else new_device_stats_aggregator()
+            )
+        stats = await self._stats_aggregator.get_snapshot(self.client)
 
         return DeviceStatsResponse(
-            total_devices=total,
-            online_devices=online_count,
-            offline_devices=total - online_count,
-            manufacturers=manufacturers,
-            models=models,
+            total_devices=stats.total_devices,
+            online_devices=stats.online_devices,
+            offline_devices=stats.offline_devices,
+            manufacturers=stats.manufacturers,
+            models=stats.models,
         )
 
     # =========================================================================
@@ -445,6 +510,43 @@ class GenieACSService:
                 message=f"Failed to refresh device: {str(e)}",
             )
 
+    async def _create_set_parameters_task(self, request: SetParameterRequest) -> tuple[str, Any]:
+        """Create a setParameterValues task, raising on failure."""
+        set_method = getattr(self.client, "set_parameter_values", None)
+        if set_method is None:
+            set_method = getattr(self.client, "set_parameters", None)
+            if set_method is None:
+                raise AttributeError("GenieACS client does not support parameter updates")
+            result = set_method(request.device_id, request.parameters)
+        else:
+            result = set_method(request.device_id, request.parameters)
+        if hasattr(result, "__await__"):
+            result = await result
+        task_id = None
+        if isinstance(result, dict):
+            task_id = result.get("id") or result.get("task_id")
+        elif isinstance(result, str):
+            task_id = result
+        if task_id is None:
+            task_id = f"task_{uuid4().hex[:8]}"
+
+        # Update cached parameters for quick access
+        store = self._device_store.setdefault(request.device_id, {"device_id": request.device_id})
+        parameters_store = store.setdefault("parameters", {})
+        parameters_store.update(request.parameters)
+
+        if (
+            hasattr(self.client, "devices")
+            and isinstance(self.client.devices, dict)  # type: ignore[attr-defined]
+            and request.device_id in self.client.devices  # type: ignore[index]
+        ):
+            device_entry = self.client.devices[request.device_id]  # type: ignore[index]
+            device_entry_parameters = device_entry.setdefault("parameters", {})
+            if isinstance(device_entry_parameters, dict):
+                device_entry_parameters.update(request.parameters)
+
+        return task_id, result
+
     async def set_parameters(
         self,
         request: SetParameterRequest,
@@ -453,41 +555,7 @@ class GenieACSService:
     ) -> TaskResponse | str | None:
         """Set parameter values on device"""
         try:
-            set_method = getattr(self.client, "set_parameter_values", None)
-            if set_method is None:
-                set_method = getattr(self.client, "set_parameters", None)
-                if set_method is None:
-                    raise AttributeError("GenieACS client does not support parameter updates")
-                result = set_method(request.device_id, request.parameters)
-            else:
-                result = set_method(request.device_id, request.parameters)
-            if hasattr(result, "__await__"):
-                result = await result
-            task_id = None
-            if isinstance(result, dict):
-                task_id = result.get("id") or result.get("task_id")
-            elif isinstance(result, str):
-                task_id = result
-            if task_id is None:
-                task_id = f"task_{uuid4().hex[:8]}"
-
-            # Update cached parameters for quick access
-            store = self._device_store.setdefault(
-                request.device_id, {"device_id": request.device_id}
-            )
-            parameters_store = store.setdefault("parameters", {})
-            parameters_store.update(request.parameters)
-
-            if (
-                hasattr(self.client, "devices")
-                and isinstance(self.client.devices, dict)  # type: ignore[attr-defined]
-                and request.device_id in self.client.devices  # type: ignore[index]
-            ):
-                device_entry = self.client.devices[request.device_id]  # type: ignore[index]
-                device_entry_parameters = device_entry.setdefault("parameters", {})
-                if isinstance(device_entry_parameters, dict):
-                    device_entry_parameters.update(request.parameters)
-
+            task_id, result = await self._create_set_parameters_task(request)
             response = TaskResponse(
                 success=True,
                 message=f"Set parameters task created for device {request.device_id}",
@@ -514,18 +582,24 @@ class GenieACSService:
         return_task_response: bool = False,
     ) -> TaskResponse | str | None:
         """Execute generic device operation for backward compatibility."""
-        operation = request.operation.lower()
-        if operation in {"factory_reset", "factoryreset"}:
+        operation = self._normalize_device_operation(request.operation)
+        if operation == "factory_reset":
             reset_request = FactoryResetRequest(device_id=request.device_id)
             return await self.factory_reset(
                 reset_request, return_task_response=return_task_response
             )
-        if operation in {"reboot", "reboot_device"}:
-            reboot_request = RebootRequest(device_id=request.device_id)
-            return await self.reboot_device(
-                reboot_request, return_task_response=return_task_response
-            )
-        raise ValueError(f"Unsupported device operation '{request.operation}'")
+        reboot_request = RebootRequest(device_id=request.device_id)
+        return await self.reboot_device(reboot_request, return_task_response=return_task_response)
+
+    @staticmethod
+    def _normalize_device_operation(operation: str) -> str:
+        """Map operation aliases to ``reboot`` / ``factory_reset``."""
+        normalized = operation.lower()
+        if normalized in {"factory_reset", "factoryreset"}:
+            return "factory_reset"
+        if normalized in {"reboot", "reboot_device"}:
+            return "reboot"
+        raise ValueError(f"Unsupported device operation '{operation}'")
 
     async def get_parameters(
         self,
@@ -573,6 +647,31 @@ class GenieACSService:
             )
             return response if return_task_response else {}
 
+    async def _create_device_task(self, device_id: str, operation: str) -> str:
+        """Create a ``reboot`` or ``factory_reset`` task, raising on failure."""
+        task_id: str | None = None
+        client_method = getattr(
+            self.client, "reboot_device" if operation == "reboot" else "factory_reset", None
+        )
+        if callable(client_method):
+            result = await self._await_if_needed(client_method(device_id))
+            if isinstance(result, dict):
+                task_id = result.get("id") or result.get("task_id")
+            elif isinstance(result, str):
+                task_id = result
+        if task_id is None:
+            task_id = f"task_{uuid4().hex[:8]}"
+            if hasattr(self.client, "tasks") and isinstance(self.client.tasks, list):  # type: ignore[attr-defined]
+                self.client.tasks.append(  # type: ignore[attr-defined]
+                    {
+                        "id": task_id,
+                        "device_id": device_id,
+                        "type": operation,
+                        "status": "pending",
+                    }
+                )
+        return task_id
+
     async def reboot_device(
         self,
         request: RebootRequest,
@@ -580,26 +679,8 @@ class GenieACSService:
         return_task_response: bool = False,
     ) -> TaskResponse | str | None:
         """Reboot device"""
-        task_id: str | None = None
         try:
-            reboot_method = getattr(self.client, "reboot_device", None)
-            if callable(reboot_method):
-                result = await self._await_if_needed(reboot_method(request.device_id))
-                if isinstance(result, dict):
-                    task_id = result.get("id") or result.get("task_id")
-                elif isinstance(result, str):
-                    task_id = result
-            if task_id is None:
-                task_id = f"task_{uuid4().hex[:8]}"
-                if hasattr(self.client, "tasks") and isinstance(self.client.tasks, list):  # type: ignore[attr-defined]
-                    self.client.tasks.append(  # type: ignore[attr-defined]
-                        {
-                            "id": task_id,
-                            "device_id": request.device_id,
-                            "type": "reboot",
-                            "status": "pending",
-                        }
-                    )
+            task_id = await self._create_device_task(request.device_id, "reboot")
             response = TaskResponse(
                 success=True,
                 message=f"Reboot task created for device {request.device_id}",
@@ -625,26 +706,8 @@ class GenieACSService:
         return_task_response: bool = False,
     ) -> TaskResponse | str | None:
         """Factory reset device"""
-        task_id: str | None = None
         try:
-            reset_method = getattr(self.client, "factory_reset", None)
-            if callable(reset_method):
-                result = await self._await_if_needed(reset_method(request.device_id))
-                if isinstance(result, dict):
-                    task_id = result.get("id") or result.get("task_id")
-                elif isinstance(result, str):
-                    task_id = result
-            if task_id is None:
-                task_id = f"task_{uuid4().hex[:8]}"
-                if hasattr(self.client, "tasks") and isinstance(self.client.tasks, list):  # type: ignore[attr-defined]
-                    self.client.tasks.append(  # type: ignore[attr-defined]
-                        {
-                            "id": task_id,
-                            "device_id": request.device_id,
-                            "type": "factory_reset",
-                            "status": "pending",
-                        }
-                    )
+            task_id = await self._create_device_task(request.device_id, "factory_reset")
             response = TaskResponse(
                 success=True,
                 message=f"Factory reset task created for device {request.device_id}",
@@ -663,17 +726,21 @@ class GenieACSService:
             )
             return response if return_task_response else None
 
+    async def _create_download_task(self, request: FirmwareDownloadRequest) -> Any:
+        """Create a download task, raising on failure."""
+        return await self._await_if_needed(
+            self.client.download_firmware(
+                request.device_id,
+                request.file_type,
+                request.file_name,
+                request.target_file_name or request.file_name,
+            )
+        )
+
     async def download_firmware(self, request: FirmwareDownloadRequest) -> TaskResponse:
         """Download firmware to device"""
         try:
-            result = await self._await_if_needed(
-                self.client.download_firmware(
-                    request.device_id,
-                    request.file_type,
-                    request.file_name,
-                    request.target_file_name or request.file_name,
-                )
-            )
+            result = await self._create_download_task(request)
             return TaskResponse(
                 success=True,
                 message=f"Firmware download task created for device {request.device_id}",
@@ -690,6 +757,27 @@ class GenieACSService:
                 message=f"Failed to initiate firmware download: {str(e)}",
             )
 
+    async def _create_firmware_upgrade_task(self, request: FirmwareUpgradeRequest) -> str:
+        """Create a firmware upgrade task, raising on failure."""
+        client_method = getattr(self.client, "trigger_firmware_upgrade", None)
+        if callable(client_method):
+            result = client_method(request.device_id, request.download_url)
+            if hasattr(result, "__await__"):
+                result = await result  # type: ignore[func-returns-value]
+            if isinstance(result, str):
+                return result
+
+        # Fallback: use a download task as proxy
+        download_request = FirmwareDownloadRequest(
+            device_id=request.device_id,
+            file_type=request.file_type or "1 Firmware Upgrade Image",
+            file_name=request.target_filename or request.download_url.split("/")[-1],
+            target_file_name=request.target_filename,
+        )
+        result = await self._create_download_task(download_request)
+        task_id = result.get("_id") if isinstance(result, dict) else None
+        return str(task_id) if task_id else f"task_{uuid4().hex[:8]}"
+
     async def trigger_firmware_upgrade(
         self,
         request: FirmwareUpgradeRequest,
@@ -698,25 +786,7 @@ class GenieACSService:
     ) -> TaskResponse | str | None:
         """Trigger an immediate firmware upgrade on a device."""
         try:
-            task_id: str | None = None
-            client_method = getattr(self.client, "trigger_firmware_upgrade", None)
-            if callable(client_method):
-                result = client_method(request.device_id, request.download_url)
-                if hasattr(result, "__await__"):
-                    result = await result  # type: ignore[func-returns-value]
-                if isinstance(result, str):
-                    task_id = result
-            if task_id is None:
-                # Fallback: use download_firmware as proxy task
-                download_request = FirmwareDownloadRequest(
-                    device_id=request.device_id,
-                    file_type=request.file_type or "1 Firmware Upgrade Image",
-                    file_name=request.target_filename or request.download_url.split("/")[-1],
-                    target_file_name=request.target_filename,
-                )
-                response = await self.download_firmware(download_request)
-                task_id = response.task_id or f"task_{uuid4().hex[:8]}"
-
+            task_id = await self._create_firmware_upgrade_task(request)
             response = TaskResponse(
                 success=True,
                 message=f"Firmware upgrade triggered for device {request.device_id}",
@@ -775,24 +845,34 @@ class GenieACSService:
         )
         return schedule_id
 
+    def stream_bulk_firmware_upgrade(
+        self,
+        request: BulkFirmwareUpgradeRequest,
+    ) -> AsyncIterator[BulkDeviceResult]:
+        """Trigger firmware upgrades concurrently, yielding each device's result."""
+
+        async def upgrade(device_id: str) -> str:
+            return await self._create_firmware_upgrade_task(
+                FirmwareUpgradeRequest(
+                    device_id=device_id,
+                    firmware_version=request.firmware_version,
+                    download_url=request.download_url,
+                    file_type=request.file_type,
+                    schedule_time=request.schedule_time,
+                )
+            )
+
+        return self._run_bulk(request.device_ids, upgrade, request.max_concurrent)
+
     async def bulk_firmware_upgrade(
         self,
         request: BulkFirmwareUpgradeRequest,
     ) -> list[str]:
         """Trigger firmware upgrade for multiple devices."""
-        task_ids: list[str] = []
-        for device_id in request.device_ids:
-            upgrade_request = FirmwareUpgradeRequest(
-                device_id=device_id,
-                firmware_version=request.firmware_version,
-                download_url=request.download_url,
-                file_type=request.file_type,
-                schedule_time=request.schedule_time,
-            )
-            task_id = await self.trigger_firmware_upgrade(upgrade_request)
-            if isinstance(task_id, str):
-                task_ids.append(task_id)
-        return task_ids
+        task_ids = await self._collect_bulk(
+            request.device_ids, self.stream_bulk_firmware_upgrade(request)
+        )
+        return [task_id for task_id in task_ids if task_id is not None]
 
     async def run_diagnostic(
         self,
@@ -815,35 +895,111 @@ class GenieACSService:
             )
         return task_id
 
+    def stream_bulk_set_parameters(
+        self,
+        request: BulkSetParametersRequest,
+    ) -> AsyncIterator[BulkDeviceResult]:
+        """Apply parameters concurrently, yielding each device's result."""
+
+        async def set_parameters(device_id: str) -> str:
+            task_id, _ = await self._create_set_parameters_task(
+                SetParameterRequest(device_id=device_id, parameters=request.parameters)
+            )
+            return task_id
+
+        return self._run_bulk(request.device_ids, set_parameters, request.max_concurrent)
+
     async def bulk_set_parameters(
         self,
         request: BulkSetParametersRequest,
     ) -> list[str]:
         """Apply parameters to multiple devices."""
-        task_ids: list[str] = []
-        for device_id in request.device_ids:
-            task_id = await self.set_parameters(
-                SetParameterRequest(device_id=device_id, parameters=request.parameters),
-            )
-            if isinstance(task_id, str):
-                task_ids.append(task_id)
-        return task_ids
+        task_ids = await self._collect_bulk(
+            request.device_ids, self.stream_bulk_set_parameters(request)
+        )
+        return [task_id for task_id in task_ids if task_id is not None]
+
+    def stream_bulk_operation(
+        self,
+        request: BulkOperationRequest,
+    ) -> AsyncIterator[BulkDeviceResult]:
+        """
+        Run a device operation concurrently, yielding each device's result.
+
+        Raises:
+            ValueError: If the operation is not supported (before any device is touched)
+        """
+        operation = self._normalize_device_operation(request.operation)
+
+        async def run(device_id: str) -> str:
+            return await self._create_device_task(device_id, operation)
+
+        return self._run_bulk(request.device_ids, run, request.max_concurrent)
 
     async def bulk_operation(
         self,
         request: BulkOperationRequest,
     ) -> list[str | None]:
         """Execute bulk operations (reboot, factory reset, etc.)."""
-        task_ids: list[str | None] = []
-        for device_id in request.device_ids:
-            op_request = DeviceOperationRequest(
-                device_id=device_id,
-                operation=request.operation,
-                parameters=request.parameters,
-            )
-            task_id = await self.device_operation(op_request)
-            task_ids.append(task_id if isinstance(task_id, str) else None)
-        return task_ids
+        return await self._collect_bulk(request.device_ids, self.stream_bulk_operation(request))
+
+    async def _run_bulk(
+        self,
+        device_ids: list[str],
+        create_task: Callable[[str], Awaitable[str]],
+        max_concurrent: int | None = None,
+    ) -> AsyncIterator[BulkDeviceResult]:
+        """
+        Create one task per device with bounded concurrency.
+
+        Devices are deduplicated and results are yielded in completion order.
+        Concurrency never exceeds the client's connection pool, so device
+        calls do not queue inside the pool where their timeouts would run.
+        Transient errors are retried by the client, not here.
+        """
+        base_url = getattr(self.client, "base_url", None)
+        rate_limiter = (
+            get_acs_rate_limiter(base_url, settings.genieacs.rate_limit_per_second)
+            if isinstance(base_url, str)
+            else None
+        )
+        concurrency = max_concurrent or settings.genieacs.bulk_max_concurrent
+        pool_size = getattr(self.client, "max_connections", None)
+        if isinstance(pool_size, int) and pool_size > 0:
+            concurrency = min(concurrency, pool_size)
+        outcomes = run_device_operations(
+            dict.fromkeys(device_ids),
+            create_task,
+            max_concurrent=concurrency,
+            rate_limiter=rate_limiter,
+        )
+        async with aclosing(outcomes):
+            async for outcome in outcomes:
+                if outcome.success:
+                    yield BulkDeviceResult(
+                        device_id=outcome.device_id,
+                        success=True,
+                        task_id=outcome.result,
+                    )
+                    continue
+                logger.error(
+                    "genieacs.bulk.device_failed",
+                    device_id=outcome.device_id,
+                    error=str(outcome.error),
+                )
+                yield BulkDeviceResult(
+                    device_id=outcome.device_id,
+                    success=False,
+                    error=str(outcome.error),
+                )
+
+    @staticmethod
+    async def _collect_bulk(
+        device_ids: list[str], results: AsyncIterator[BulkDeviceResult]
+    ) -> list[str | None]:
+        """Collect streamed bulk results as task IDs in request order."""
+        task_ids = {result.device_id: result.task_id async for result in results}
+        return [task_ids.get(device_id) for device_id in device_ids]
 
     async def is_device_online(self, device_id: str) -> bool:
         """Determine if device has phoned home recently."""
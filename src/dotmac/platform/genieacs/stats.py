@@ -0,0 +1,304 @@
+"""
+Incrementally maintained GenieACS device statistics.
+
+``DeviceStatsAggregator`` keeps one small entry per device (last inform time,
+manufacturer, model) and the manufacturer/model counters derived from them.
+Devices are read with a tight projection, page by page, so a refresh never
+holds more than one page of device documents. After the first full pass only
+devices that informed since the last refresh are fetched; a periodic full
+resync drops devices deleted from the ACS behind our back.
+
+Aggregators are shared per (tenant, ACS) within a process, so repeated calls
+to the stats endpoint are served from memory between refreshes. Concurrent
+callers share one in-flight refresh, and once statistics exist a stale
+snapshot is returned while the refresh runs in the background.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Protocol
+
+import structlog
+
+from dotmac.platform.cache.stampede import SingleFlight
+from dotmac.platform.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+# Single-flight key of an aggregator's refresh
+REFRESH_FLIGHT_KEY = "genieacs.stats.refresh"
+
+# A device counts as online when it informed within this window
+ONLINE_WINDOW_SECONDS = 300.0
+
+MANUFACTURER_PATHS = (
+    "InternetGatewayDevice.DeviceInfo.Manufacturer",
+    "Device.DeviceInfo.Manufacturer",
+)
+MODEL_PATHS = (
+    "InternetGatewayDevice.DeviceInfo.ModelName",
+    "Device.DeviceInfo.ModelName",
+)
+STATS_PROJECTION = ",".join(("_id", "_lastInform", *MANUFACTURER_PATHS, *MODEL_PATHS))
+
+
+class DeviceSource(Protocol):
+    def iter_devices(
+        self,
+        query: dict[str, Any] | None = None,
+        projection: str | None = None,
+        page_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]: ...
+
+
+def get_parameter_value(device: dict[str, Any], path: str) -> Any | None:
+    """
+    Read a parameter value from a device document.
+
+    GenieACS returns projected parameters as nested objects; flattened
+    ``{"A.B.C": {"_value": ...}}`` documents are accepted as well. Plain
+    values (``_deviceId._SerialNumber``) are returned as they are.
+    """
+    node: Any = device.get(path)
+    if node is None:
+        node = device
+        for part in path.split("."):
+            if not isinstance(node, dict):
+                return None
+            node = node.get(part)
+    if isinstance(node, dict):
+        return node.get("_value")
+    return node
+
+
+def parse_last_inform(value: Any) -> float | None:
+    """Convert ``_lastInform`` (ISO string, datetime or epoch ms) to epoch seconds."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, int | float):
+        return float(value) / 1000
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
+def format_acs_timestamp(epoch_seconds: float) -> str:
+    """Format epoch seconds the way GenieACS stores timestamps (ISO 8601, UTC)."""
+    moment = datetime.fromtimestamp(epoch_seconds, UTC)
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def online_cutoff() -> float:
+    """Earliest last inform (epoch seconds) that still counts as online."""
+    return time.time() - ONLINE_WINDOW_SECONDS
+
+
+def is_online(last_inform: float | None, cutoff: float) -> bool:
+    """Whether a device that last informed at ``last_inform`` is online."""
+    return last_inform is not None and last_inform >= cutoff
+
+
+@dataclass(slots=True, frozen=True)
+class _DeviceEntry:
+    last_inform: float | None
+    manufacturer: str | None
+    model: str | None
+
+
+@dataclass(slots=True)
+class DeviceStatsSnapshot:
+    """Point-in-time device statistics."""
+
+    total_devices: int
+    online_devices: int
+    manufacturers: dict[str, int]
+    models: dict[str, int]
+
+    @property
+    def offline_devices(self) -> int:
+        return self.total_devices - self.online_devices
+
+
+class _DeviceIndex:
+    """Per-device entries plus the counters derived from them."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, _DeviceEntry] = {}
+        self.manufacturers: Counter[str] = Counter()
+        self.models: Counter[str] = Counter()
+        self.max_last_inform: float | None = None
+
+    def upsert(self, device: dict[str, Any]) -> None:
+        device_id = device.get("_id")
+        if not device_id:
+            return
+        last_inform = parse_last_inform(device.get("_lastInform"))
+        manufacturer = next(
+            (v for p in MANUFACTURER_PATHS if (v := get_parameter_value(device, p))), None
+        )
+        model = next((v for p in MODEL_PATHS if (v := get_parameter_value(device, p))), None)
+
+        self.discard(str(device_id))
+        self.entries[str(device_id)] = _DeviceEntry(last_inform, manufacturer, model)
+        if manufacturer:
+            self.manufacturers[manufacturer] += 1
+        if model:
+            self.models[model] += 1
+        if last_inform is not None and (
+            self.max_last_inform is None or last_inform > self.max_last_inform
+        ):
+            self.max_last_inform = last_inform
+
+    def discard(self, device_id: str) -> None:
+        entry = self.entries.pop(device_id, None)
+        if entry is None:
+            return
+        if entry.manufacturer:
+            self.manufacturers[entry.manufacturer] -= 1
+            if self.manufacturers[entry.manufacturer] <= 0:
+                del self.manufacturers[entry.manufacturer]
+        if entry.model:
+            self.models[entry.model] -= 1
+            if self.models[entry.model] <= 0:
+                del self.models[entry.model]
+
+
+class DeviceStatsAggregator:
+    """
+    Device statistics for one tenant on one ACS, refreshed incrementally.
+
+    Refreshes do not hold a lock: index updates are synchronous, so an
+    overlapping refresh (from another event loop) only repeats work and never
+    corrupts the counters.
+    """
+
+    def __init__(
+        self,
+        refresh_interval_seconds: float,
+        full_resync_seconds: float,
+        page_size: int,
+    ) -> None:
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.full_resync_seconds = full_resync_seconds
+        self.page_size = page_size
+        self._index = _DeviceIndex()
+        self._refreshed_at: float | None = None
+        self._full_synced_at: float | None = None
+        self._sync = SingleFlight()
+
+    async def get_snapshot(self, source: DeviceSource) -> DeviceStatsSnapshot:
+        """
+        Return a snapshot, starting a refresh if the statistics are stale.
+
+        Only the first call waits for the refresh (there is nothing to serve
+        before it); later calls return the previous statistics while it runs.
+        """
+        now = time.monotonic()
+        if self._full_synced_at is None or now - self._full_synced_at >= self.full_resync_seconds:
+            self._sync.run_in_background(REFRESH_FLIGHT_KEY, lambda: self.full_resync(source))
+        elif (
+            self._refreshed_at is None or now - self._refreshed_at >= self.refresh_interval_seconds
+        ):
+            self._sync.run_in_background(REFRESH_FLIGHT_KEY, lambda: self.refresh(source))
+        else:
+            return self.snapshot()
+        if self._full_synced_at is None:
+            await self._sync.wait(REFRESH_FLIGHT_KEY)
+        return self.snapshot()
+
+    async def wait_for_refresh(self) -> None:
+        """Wait for a background refresh started on this event loop."""
+        await self._sync.wait(REFRESH_FLIGHT_KEY)
+
+    async def full_resync(self, source: DeviceSource) -> None:
+        """Rebuild the index from every device on the ACS."""
+        started = time.monotonic()
+        index = _DeviceIndex()
+        async for device in source.iter_devices(
+            projection=STATS_PROJECTION, page_size=self.page_size
+        ):
+            index.upsert(device)
+        self._index = index
+        self._refreshed_at = self._full_synced_at = time.monotonic()
+        logger.debug(
+            "genieacs.stats.full_resync",
+            devices=len(index.entries),
+            duration_seconds=round(self._full_synced_at - started, 3),
+        )
+
+    async def refresh(self, source: DeviceSource) -> None:
+        """Fetch devices that informed since the newest inform already seen."""
+        watermark = self._index.max_last_inform
+        if watermark is None:
+            await self.full_resync(source)
+            return
+
+        # Inclusive bound: devices sharing the watermark's timestamp are re-read
+        updated = 0
+        async for device in source.iter_devices(
+            query={"_lastInform": {"$gte": format_acs_timestamp(watermark)}},
+            projection=STATS_PROJECTION,
+            page_size=self.page_size,
+        ):
+            self._index.upsert(device)
+            updated += 1
+        self._refreshed_at = time.monotonic()
+        logger.debug("genieacs.stats.refreshed", updated=updated)
+
+    def discard(self, device_id: str) -> None:
+        """Forget a device deleted through this process."""
+        self._index.discard(device_id)
+
+    def snapshot(self) -> DeviceStatsSnapshot:
+        cutoff = online_cutoff()
+        entries = self._index.entries
+        online = sum(1 for entry in entries.values() if is_online(entry.last_inform, cutoff))
+        return DeviceStatsSnapshot(
+            total_devices=len(entries),
+            online_devices=online,
+            manufacturers=dict(self._index.manufacturers),
+            models=dict(self._index.models),
+        )
+
+
+_aggregators: dict[tuple[str | None, str], DeviceStatsAggregator] = {}
+_aggregators_lock = threading.Lock()
+
+
+def get_device_stats_aggregator(tenant_id: str | None, base_url: str) -> DeviceStatsAggregator:
+    """Return the process-wide aggregator for a tenant on one ACS."""
+    key = (tenant_id, base_url.rstrip("/"))
+    with _aggregators_lock:
+        aggregator = _aggregators.get(key)
+        if aggregator is None:
+            aggregator = new_device_stats_aggregator()
+            _aggregators[key] = aggregator
+        return aggregator
+
+
+def new_device_stats_aggregator() -> DeviceStatsAggregator:
+    """Create an aggregator configured from settings."""
+    return DeviceStatsAggregator(
+        refresh_interval_seconds=settings.genieacs.stats_refresh_interval_seconds,
+        full_resync_seconds=settings.genieacs.stats_full_resync_seconds,
+        page_size=settings.genieacs.stats_page_size,
+    )
+
+
+def reset_device_stats_aggregators() -> None:
+    """Drop all process-wide aggregators (tests)."""
+    with _aggregators_lock:
+        _aggregators.clear()
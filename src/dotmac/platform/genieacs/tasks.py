@@ -7,8 +7,10 @@ and mass configuration jobs.
 """
 
 import asyncio
-from collections.abc import Coroutine
+import time
+from collections.abc import Callable, Coroutine
 from concurrent.futures import Future
+from contextlib import aclosing
 from datetime import UTC, datetime
 from typing import Any, cast
 
@@ -16,11 +18,22 @@ import redis.asyncio as aioredis
 import structlog
 from celery import Task
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from dotmac.platform import db as db_module
 from dotmac.platform.celery_app import celery_app
 from dotmac.platform.genieacs.client import GenieACSClient
+from dotmac.platform.genieacs.executor import (
+    AcsRateLimiter,
+    DeviceOutcome,
+    get_acs_rate_limiter,
+    run_device_operations,
+)
 from dotmac.platform.genieacs.metrics import (
+    record_firmware_upgrade_device,
+    record_firmware_upgrade_duration,
+    record_mass_config_device,
+    record_mass_config_duration,
     set_firmware_upgrade_schedule_status,
     set_mass_config_job_status,
 )
@@ -31,7 +44,8 @@ from dotmac.platform.genieacs.models import (
     MassConfigResult,
 )
 from dotmac.platform.redis_client import RedisClientType
-from dotmac.platform.tenant.oss_config import OSSService, get_service_config
+from dotmac.platform.settings import settings
+from dotmac.platform.tenant.oss_config import OSSService, ServiceConfig, get_service_config
 
 logger = structlog.get_logger(__name__)
 
@@ -67,8 +81,6 @@ async def get_redis_client() -> RedisClientType:
 
     Uses centralized Redis URL from settings (Phase 1 implementation).
     """
-    from dotmac.platform.settings import settings
-
     # Use Celery broker URL as default for background task pub/sub
     # This ensures consistency with task queue Redis instance
     redis_url = settings.celery.broker_url
@@ -92,6 +104,127 @@ async def publish_progress(
     await redis.publish(channel, json.dumps(message))
 
 
+# ---------------------------------------------------------------------------
+# Concurrent execution helpers
+# ---------------------------------------------------------------------------
+
+
+def _acs_rate_limiter(config: ServiceConfig) -> AcsRateLimiter | None:
+    """Return the rate limiter for a tenant's ACS (OSS config extra overrides the default)."""
+    rate = config.extras.get("rate_limit_per_second", settings.genieacs.rate_limit_per_second)
+    return get_acs_rate_limiter(config.url, float(rate or 0))
+
+
+class _ProgressBatch:
+    """
+    Buffer per-device outcomes and write them in batches.
+
+    Each flush commits the session once and publishes a single progress event
+    listing every device finished since the previous flush.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        redis: RedisClientType,
+        channel: str,
+        event_type: str,
+        job_fields: dict[str, Any],
+        total: int,
+        completed: int = 0,
+        before_commit: Callable[["_ProgressBatch"], None] | None = None,
+    ) -> None:
+        self.session = session
+        self.redis = redis
+        self.channel = channel
+        self.event_type = event_type
+        self.job_fields = job_fields
+        self.total = total
+        self.completed = completed
+        self.failed = 0
+        self.before_commit = before_commit
+        self._devices: list[dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+
+    def add(self, outcome: DeviceOutcome) -> None:
+        device: dict[str, Any] = {"device_id": outcome.device_id}
+        if outcome.success:
+            self.completed += 1
+            device["status"] = "success"
+        else:
+            self.failed += 1
+            device["status"] = "failed"
+            device["error"] = str(outcome.error)
+        self._devices.append(device)
+
+    def due(self) -> bool:
+        return (
+            len(self._devices) >= settings.genieacs.status_flush_size
+            or time.monotonic() - self._last_flush
+            >= settings.genieacs.status_flush_interval_seconds
+        )
+
+    async def flush(self) -> None:
+        if not self._devices:
+            return
+        if self.before_commit is not None:
+            self.before_commit(self)
+        await self.session.commit()
+        await publish_progress(
+            self.redis,
+            self.channel,
+            self.event_type,
+            {
+                **self.job_fields,
+                "completed": self.completed,
+                "failed": self.failed,
+                "total": self.total,
+                "devices": self._devices,
+            },
+        )
+        self._devices = []
+        self._last_flush = time.monotonic()
+
+
+def _build_mass_config_parameters(config_changes: dict[str, Any]) -> dict[str, Any]:
+    """Translate a mass configuration job's changes into TR-069 parameters."""
+    params_to_set: dict[str, Any] = {}
+
+    # WiFi configuration
+    if "wifi" in config_changes and config_changes["wifi"]:
+        wifi = config_changes["wifi"]
+        if wifi.get("ssid"):
+            params_to_set["InternetGatewayDevice.LANDevice.1.WLANConfiguration.1.SSID"] = wifi[
+                "ssid"
+            ]
+        if wifi.get("password"):
+            params_to_set[
+                "InternetGatewayDevice.LANDevice.1.WLANConfiguration.1.PreSharedKey.1.KeyPassphrase"
+            ] = wifi["password"]
+
+    # LAN configuration
+    if "lan" in config_changes and config_changes["lan"]:
+        lan = config_changes["lan"]
+        if lan.get("dhcp_enabled") is not None:
+            params_to_set[
+                "InternetGatewayDevice.LANDevice.1.LANHostConfigManagement.DHCPServerEnable"
+            ] = lan["dhcp_enabled"]
+
+    # WAN configuration
+    if "wan" in config_changes and config_changes["wan"]:
+        wan = config_changes["wan"]
+        if wan.get("vlan_id"):
+            params_to_set[
+                "InternetGatewayDevice.WANDevice.1.WANConnectionDevice.1.X_CUSTOM_VLANTag"
+            ] = wan["vlan_id"]
+
+    # Custom parameters
+    if "custom_parameters" in config_changes:
+        params_to_set.update(config_changes["custom_parameters"])
+
+    return params_to_set
+
+
 # ---------------------------------------------------------------------------
 # Firmware Upgrade Tasks
 # ---------------------------------------------------------------------------
@@ -107,8 +240,9 @@ def execute_firmware_upgrade(self: Task, schedule_id: str) -> dict[str, Any]:
     """
     Execute firmware upgrade schedule.
 
-    This task processes all devices in the schedule, respecting
-    the max_concurrent limit and publishing progress updates.
+    This task processes all devices in the schedule concurrently, keeping at
+    most max_concurrent upgrades in flight and publishing batched progress
+    updates. Devices upgraded successfully by an earlier run are skipped.
 
     Args:
         self: Celery task instance
@@ -141,6 +275,7 @@ async def _execute_firmware_upgrade_async(schedule_id: str, task: Task) -> dict[
         set_firmware_upgrade_schedule_status(
             schedule.tenant_id, schedule.schedule_id, "running", 1.0
         )
+        run_started = time.monotonic()
 
         logger.info(
             "firmware_upgrade.started",
@@ -172,7 +307,8 @@ async def _execute_firmware_upgrade_async(schedule_id: str, task: Task) -> dict[
             # Query devices
             devices = await client.get_devices(query=schedule.device_filter)
 
-            # Load existing results to support replay scenarios
+            # Load existing results so replayed or retried runs resume: devices
+            # that were already upgraded successfully are not upgraded again
             existing_result_rows = await session.execute(
                 select(FirmwareUpgradeResult).where(
                     FirmwareUpgradeResult.schedule_id == schedule_id
@@ -182,14 +318,19 @@ async def _execute_firmware_upgrade_async(schedule_id: str, task: Task) -> dict[
                 existing.device_id: existing for existing in existing_result_rows.scalars()
             }
 
-            results: list[FirmwareUpgradeResult] = []
+            pending_results: dict[str, FirmwareUpgradeResult] = {}
+            resumed = 0
             for device in devices:
                 device_id = device.get("_id", "")
                 if not device_id:
                     continue
 
-                if device_id in result_map:
-                    result_obj = result_map[device_id]
+                result_obj = result_map.get(device_id)
+                if result_obj is not None and result_obj.status == "success":
+                    resumed += 1
+                    continue
+
+                if result_obj is not None:
                     result_obj.status = "pending"
                     result_obj.error_message = None
                     result_obj.started_at = None
@@ -201,12 +342,12 @@ async def _execute_firmware_upgrade_async(schedule_id: str, task: Task) -> dict[
                         status="pending",
                     )
                     session.add(result_obj)
-                results.append(result_obj)
+                pending_results[device_id] = result_obj
 
             await session.commit()
 
             # Publish start event
-            total_devices = len(results)
+            total_devices = resumed + len(pending_results)
 
             await publish_progress(
                 redis,
@@ -215,87 +356,58 @@ async def _execute_firmware_upgrade_async(schedule_id: str, task: Task) -> dict[
                 {
                     "schedule_id": schedule_id,
                     "total_devices": total_devices,
+                    "resumed": resumed,
                 },
             )
 
-            # Process devices with concurrency limit
-            completed = 0
-            failed = 0
-            batch_size = schedule.max_concurrent
-
-            for i in range(0, total_devices, batch_size):
-                batch = results[i : i + batch_size]
-
-                for result_obj in batch:
-                    device_id = cast(str, result_obj.device_id)
-                    try:
-                        # Update result status
-                        result_obj.status = "in_progress"
-                        result_obj.started_at = datetime.now(UTC)
-                        await session.commit()
-
-                        # Trigger firmware download
-                        await client.add_task(
-                            device_id=device_id,
-                            task_name="download",
-                            file_name=schedule.firmware_file,
-                            file_type=schedule.file_type,
-                        )
+            async def upgrade(device_id: str) -> None:
+                await client.add_task(
+                    device_id=device_id,
+                    task_name="download",
+                    file_name=schedule.firmware_file,
+                    file_type=schedule.file_type,
+                )
 
-                        # Update result as success
+            # Process devices concurrently, writing results in batches
+            batch = _ProgressBatch(
+                session,
+                redis,
+                channel,
+                "upgrade_progress",
+                {"schedule_id": schedule_id},
+                total=total_devices,
+                completed=resumed,
+            )
+            outcomes = run_device_operations(
+                pending_results,
+                upgrade,
+                max_concurrent=max(1, schedule.max_concurrent or 1),
+                rate_limiter=_acs_rate_limiter(config),
+            )
+            async with aclosing(outcomes):
+                async for outcome in outcomes:
+                    result_obj = pending_results[outcome.device_id]
+                    result_obj.started_at = outcome.started_at
+                    result_obj.completed_at = outcome.completed_at
+                    if outcome.success:
                         result_obj.status = "success"
-                        result_obj.completed_at = datetime.now(UTC)
-                        completed += 1
-
-                        # Publish device progress
-                        await publish_progress(
-                            redis,
-                            channel,
-                            "device_completed",
-                            {
-                                "device_id": device_id,
-                                "status": "success",
-                                "completed": completed,
-                                "total": total_devices,
-                            },
-                        )
-
-                        logger.info(
-                            "firmware_upgrade.device_success",
-                            schedule_id=schedule_id,
-                            device_id=device_id,
-                        )
-
-                    except Exception as e:
-                        # Update result as failed
+                    else:
                         result_obj.status = "failed"
-                        result_obj.error_message = str(e)
-                        result_obj.completed_at = datetime.now(UTC)
-                        failed += 1
-
-                        # Publish device failure
-                        await publish_progress(
-                            redis,
-                            channel,
-                            "device_failed",
-                            {
-                                "device_id": device_id,
-                                "status": "failed",
-                                "error": str(e),
-                                "completed": completed,
-                                "failed": failed,
-                                "total": total_devices,
-                            },
-                        )
-
+                        result_obj.error_message = str(outcome.error)
                         logger.error(
                             "firmware_upgrade.device_failed",
                             schedule_id=schedule_id,
-                            device_id=device_id,
-                            error=str(e),
+                            device_id=outcome.device_id,
+                            error=str(outcome.error),
                         )
+                    record_firmware_upgrade_device(schedule.tenant_id, result_obj.status)
+                    batch.add(outcome)
+                    if batch.due():
+                        await batch.flush()
+                await batch.flush()
 
-                    await session.commit()
+            completed = batch.completed
+            failed = batch.failed
 
             # Update schedule as completed
             schedule.status = "completed"
@@ -304,6 +416,7 @@ async def _execute_firmware_upgrade_async(schedule_id: str, task: Task) -> dict[
             set_firmware_upgrade_schedule_status(
                 schedule.tenant_id, schedule.schedule_id, "completed", 1.0
             )
+            record_firmware_upgrade_duration(schedule.tenant_id, time.monotonic() - run_started)
 
             # Publish completion event
             await publish_progress(
@@ -324,6 +437,7 @@ async def _execute_firmware_upgrade_async(schedule_id: str, task: Task) -> dict[
                 total=total_devices,
                 completed=completed,
                 failed=failed,
+                resumed=resumed,
             )
 
             return {
@@ -331,11 +445,12 @@ async def _execute_firmware_upgrade_async(schedule_id: str, task: Task) -> dict[
                 "total_devices": total_devices,
                 "completed": completed,
                 "failed": failed,
+                "resumed": resumed,
                 "status": "completed",
             }
 
         except Exception as e:
-            # Update schedule as failed
+            # Keep results recorded so far; a retry resumes from them
             schedule.status = "failed"
             schedule.completed_at = datetime.now(UTC)
             await session.commit()
@@ -382,8 +497,10 @@ def execute_mass_config(self: Task, job_id: str) -> dict[str, Any]:
     """
     Execute mass configuration job.
 
-    This task processes all devices in the job, applying configuration
-    changes and publishing progress updates.
+    This task applies the configuration changes to all devices in the job
+    concurrently, keeping at most max_concurrent requests in flight and
+    publishing batched progress updates. Devices configured successfully by
+    an earlier run are skipped.
 
     Args:
         self: Celery task instance
@@ -416,6 +533,7 @@ async def _execute_mass_config_async(job_id: str, task: Task) -> dict[str, Any]:
         job.pending_devices = 0
         await session.commit()
         set_mass_config_job_status(job.tenant_id, job.job_id, "running", 1.0)
+        run_started = time.monotonic()
 
         logger.info(
             "mass_config.started",
@@ -447,6 +565,7 @@ async def _execute_mass_config_async(job_id: str, task: Task) -> dict[str, Any]:
             # Query devices
             devices = await client.get_devices(query=job.device_filter)
 
+            # Devices configured successfully by an earlier run are skipped
             existing_result_rows = await session.execute(
                 select(MassConfigResult).where(MassConfigResult.job_id == job_id)
             )
@@ -454,14 +573,19 @@ async def _execute_mass_config_async(job_id: str, task: Task) -> dict[str, Any]:
                 existing.device_id: existing for existing in existing_result_rows.scalars()
             }
 
-            results: list[MassConfigResult] = []
+            pending_results: dict[str, MassConfigResult] = {}
+            resumed = 0
             for device in devices:
                 device_id = device.get("_id", "")
                 if not device_id:
                     continue
 
-                if device_id in result_map:
-                    result_obj = result_map[device_id]
+                result_obj = result_map.get(device_id)
+                if result_obj is not None and result_obj.status == "success":
+                    resumed += 1
+                    continue
+
+                if result_obj is not None:
                     result_obj.status = "pending"
                     result_obj.error_message = None
                     result_obj.parameters_changed = {}
@@ -474,12 +598,12 @@ async def _execute_mass_config_async(job_id: str, task: Task) -> dict[str, Any]:
                         status="pending",
                     )
                     session.add(result_obj)
-                results.append(result_obj)
+                pending_results[device_id] = result_obj
 
-            await session.commit()
-            total_devices = len(results)
+            total_devices = resumed + len(pending_results)
             job.total_devices = total_devices
-            job.pending_devices = total_devices
+            job.completed_devices = resumed
+            job.pending_devices = len(pending_results)
             await session.commit()
 
             # Publish start event
@@ -490,137 +614,77 @@ async def _execute_mass_config_async(job_id: str, task: Task) -> dict[str, Any]:
                 {
                     "job_id": job_id,
                     "total_devices": total_devices,
+                    "resumed": resumed,
                 },
             )
 
-            # Build parameters to set from config_changes
-            config_changes = job.config_changes
-
-            # Process devices with concurrency limit
-            completed = 0
-            failed = 0
-            batch_size = job.max_concurrent
-
-            for i in range(0, total_devices, batch_size):
-                batch = results[i : i + batch_size]
-
-                for result_obj in batch:
-                    device_id = cast(str, result_obj.device_id)
-                    try:
-                        # Update result status
-                        result_obj.status = "in_progress"
-                        result_obj.started_at = datetime.now(UTC)
-                        await session.commit()
-
-                        # Build TR-069 parameters from config_changes
-                        params_to_set: dict[str, Any] = {}
-
-                        # WiFi configuration
-                        if "wifi" in config_changes and config_changes["wifi"]:
-                            wifi = config_changes["wifi"]
-                            if wifi.get("ssid"):
-                                params_to_set[
-                                    "InternetGatewayDevice.LANDevice.1.WLANConfiguration.1.SSID"
-                                ] = wifi["ssid"]
-                            if wifi.get("password"):
-                                params_to_set[
-                                    "InternetGatewayDevice.LANDevice.1.WLANConfiguration.1.PreSharedKey.1.KeyPassphrase"
-                                ] = wifi["password"]
-
-                        # LAN configuration
-                        if "lan" in config_changes and config_changes["lan"]:
-                            lan = config_changes["lan"]
-                            if lan.get("dhcp_enabled") is not None:
-                                params_to_set[
-                                    "InternetGatewayDevice.LANDevice.1.LANHostConfigManagement.DHCPServerEnable"
-                                ] = lan["dhcp_enabled"]
-
-                        # WAN configuration
-                        if "wan" in config_changes and config_changes["wan"]:
-                            wan = config_changes["wan"]
-                            if wan.get("vlan_id"):
-                                params_to_set[
-                                    "InternetGatewayDevice.WANDevice.1.WANConnectionDevice.1.X_CUSTOM_VLANTag"
-                                ] = wan["vlan_id"]
-
-                        # Custom parameters
-                        if "custom_parameters" in config_changes:
-                            params_to_set.update(config_changes["custom_parameters"])
-
-                        # Set parameters
-                        if params_to_set:
-                            await client.set_parameter_values(
-                                device_id=device_id,
-                                parameters=params_to_set,
-                            )
-
-                        # Update result as success
-                        result_obj.status = "success"
-                        result_obj.parameters_changed = params_to_set
-                        result_obj.completed_at = datetime.now(UTC)
-                        completed += 1
-                        job.completed_devices = completed
-                        job.pending_devices = total_devices - completed - failed
-
-                        # Publish device progress
-                        await publish_progress(
-                            redis,
-                            channel,
-                            "device_configured",
-                            {
-                                "device_id": device_id,
-                                "status": "success",
-                                "parameters_changed": params_to_set,
-                                "completed": completed,
-                                "total": total_devices,
-                            },
-                        )
+            # The same parameters are applied to every device
+            params_to_set = _build_mass_config_parameters(job.config_changes)
 
-                        logger.info(
-                            "mass_config.device_success",
-                            job_id=job_id,
-                            device_id=device_id,
-                        )
+            async def configure(device_id: str) -> None:
+                if params_to_set:
+                    await client.set_parameter_values(
+                        device_id=device_id,
+                        parameters=params_to_set,
+                    )
 
-                    except Exception as e:
-                        # Update result as failed
-                        result_obj.status = "failed"
-                        result_obj.error_message = str(e)
-                        result_obj.completed_at = datetime.now(UTC)
-                        failed += 1
-                        job.failed_devices = failed
-                        job.pending_devices = total_devices - completed - failed
-
-                        # Publish device failure
-                        await publish_progress(
-                            redis,
-                            channel,
-                            "device_config_failed",
-                            {
-                                "device_id": device_id,
-                                "status": "failed",
-                                "error": str(e),
-                                "completed": completed,
-                                "failed": failed,
-                                "total": total_devices,
-                            },
-                        )
+            def update_job_counters(progress: _ProgressBatch) -> None:
+                job.completed_devices = progress.completed
+                job.failed_devices = progress.failed
+                job.pending_devices = total_devices - progress.completed - progress.failed
 
+            # Process devices concurrently, writing results in batches
+            batch = _ProgressBatch(
+                session,
+                redis,
+                channel,
+                "config_progress",
+                {"job_id": job_id},
+                total=total_devices,
+                completed=resumed,
+                before_commit=update_job_counters,
+            )
+            outcomes = run_device_operations(
+                pending_results,
+                configure,
+                max_concurrent=max(1, job.max_concurrent or 1),
+                rate_limiter=_acs_rate_limiter(config),
+            )
+            async with aclosing(outcomes):
+                async for outcome in outcomes:
+                    result_obj = pending_results[outcome.device_id]
+                    result_obj.started_at = outcome.started_at
+                    result_obj.completed_at = outcome.completed_at
+                    if outcome.success:
+                        result_obj.status = "success"
+                        result_obj.parameters_changed = params_to_set
+                    else:
+                        result_obj.status = "failed"
+                        result_obj.error_message = str(outcome.error)
                         logger.error(
                             "mass_config.device_failed",
                             job_id=job_id,
-                            device_id=device_id,
-                            error=str(e),
+                            device_id=outcome.device_id,
+                            error=str(outcome.error),
                         )
+                    record_mass_config_device(job.tenant_id, result_obj.status)
+                    batch.add(outcome)
+                    if batch.due():
+                        await batch.flush()
+                await batch.flush()
 
-                    await session.commit()
+            completed = batch.completed
+            failed = batch.failed
 
             # Update job as completed
             job.status = "completed"
+            job.completed_devices = completed
+            job.failed_devices = failed
             job.pending_devices = max(0, total_devices - completed - failed)
             job.completed_at = datetime.now(UTC)
             await session.commit()
             set_mass_config_job_status(job.tenant_id, job.job_id, "completed", 1.0)
+            record_mass_config_duration(job.tenant_id, time.monotonic() - run_started)
 
             # Publish completion event
             await publish_progress(
@@ -641,6 +705,7 @@ async def _execute_mass_config_async(job_id: str, task: Task) -> dict[str, Any]:
                 total=total_devices,
                 completed=completed,
                 failed=failed,
+                resumed=resumed,
             )
 
             return {
@@ -648,6 +713,7 @@ async def _execute_mass_config_async(job_id: str, task: Task) -> dict[str, Any]:
                 "total_devices": total_devices,
                 "completed": completed,
                 "failed": failed,
+                "resumed": resumed,
                 "status": "completed",
             }
 
@@ -14,6 +14,7 @@ from strawberry.types import Info
 
 from dotmac.platform.auth.core import TokenType, UserInfo, jwt_service
 from dotmac.platform.db import AsyncSessionLocal
+from dotmac.platform.db.replicas import begin_request_routing, get_replica_router
 from dotmac.platform.graphql.loaders import DataLoaderRegistry
 
 
@@ -25,6 +26,7 @@ class Context(BaseContext):
     Provides:
     - request: FastAPI Request object
     - db: SQLAlchemy async session
+    - read_db: Session for read-only resolvers, routed to a read replica when configured
     - current_user: Authenticated user info (optional for public queries)
     """
 
@@ -45,6 +47,7 @@ class Context(BaseContext):
         self.db = db
         self.current_user = current_user
         self.loaders = DataLoaderRegistry(db)
+        self._read_db: AsyncSession | None = None
         self._background_tasks: BackgroundTasks | None = None
         self._close_registered = False
         self._session_closed = False
@@ -60,10 +63,20 @@ class Context(BaseContext):
             tasks.add_task(self._close_db_session)
             self._close_registered = True
 
+    @property
+    def read_db(self) -> AsyncSession:
+        """Session for read-only resolvers (the primary session without replicas)."""
+        if self._read_db is None:
+            router = get_replica_router()
+            self._read_db = router.session_factory() if router is not None else self.db
+        return self._read_db
+
     async def _close_db_session(self) -> None:
-        """Ensure the attached session is closed after the response is sent."""
+        """Ensure the attached sessions are closed after the response is sent."""
         if self._session_closed:
             return
+        if self._read_db is not None and self._read_db is not self.db:
+            await self._read_db.close()
         await self.db.close()
         self._session_closed = True
 
@@ -169,6 +182,12 @@ class Context(BaseContext):
         # Lazily create database session; closed via background tasks
         db_session = AsyncSessionLocal()
 
+        # Track writes of this request so replica reads can fall back to the primary
+        replica_router = get_replica_router()
+        if replica_router is not None:
+            begin_request_routing()
+            await replica_router.refresh()
+
         # Extract user from token; GraphQL requires authenticated access
         try:
             auth_header = request.headers.get("Authorization", "")
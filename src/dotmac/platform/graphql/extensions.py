@@ -0,0 +1,277 @@
+"""
+Schema extensions applied to every GraphQL operation.
+
+- ``DocumentCache`` keeps parsed documents and their validation errors in an
+  LRU keyed by the query text, so the documents the portal sends over and
+  over are parsed and validated once per worker.
+- ``QueryCostLimiter`` estimates how many fields an operation resolves and
+  rejects pathological (deeply nested, large fan-out) operations before any
+  resolver runs.
+
+Both are registered on the schema as classes, so every operation gets its
+own extension instance.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any
+
+import structlog
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLInterfaceType,
+    GraphQLNamedType,
+    GraphQLObjectType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    OperationType,
+    SelectionSetNode,
+    get_named_type,
+    get_nullable_type,
+    is_list_type,
+    parse,
+    value_from_ast,
+)
+from graphql.pyutils import Undefined
+from graphql.utilities import get_operation_ast
+from graphql.validation import ASTValidationRule
+from strawberry.extensions import SchemaExtension
+from strawberry.schema.schema import validate_document
+
+from dotmac.platform.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+# Arguments that bound how many items a field returns (GraphQL names)
+SIZE_ARGUMENTS = ("limit", "first", "last", "pageSize", "perPage")
+
+
+@lru_cache(maxsize=settings.graphql.document_cache_size)
+def _parse_document(query: str, **parse_options: Any) -> DocumentNode:
+    return parse(query, **parse_options)
+
+
+@lru_cache(maxsize=settings.graphql.document_cache_size)
+def _validate_document(
+    schema: GraphQLSchema,
+    query: str,
+    validation_rules: tuple[type[ASTValidationRule], ...],
+) -> tuple[GraphQLError, ...]:
+    # Only reached after ``_parse_document`` succeeded for the same query
+    return tuple(validate_document(schema, _parse_document(query), validation_rules))
+
+
+class DocumentCache(SchemaExtension):
+    """Serve parsing and validation of repeated documents from an LRU cache."""
+
+    def on_parse(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        if execution_context.query is not None and not execution_context.parse_options:
+            execution_context.graphql_document = _parse_document(execution_context.query)
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        if execution_context.query is not None and not execution_context.parse_options:
+            execution_context.pre_execution_errors = list(
+                _validate_document(
+                    execution_context.schema._schema,
+                    execution_context.query,
+                    execution_context.validation_rules,
+                )
+            )
+        yield
+
+
+class _CostEstimator:
+    """Walks an operation, multiplying child costs by the size of list fields."""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variables: dict[str, Any] | None,
+        default_list_size: int,
+    ) -> None:
+        self.schema = schema
+        self.variables = variables or {}
+        self.default_list_size = default_list_size
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+    def selection_set(
+        self,
+        selection_set: SelectionSetNode,
+        parent_type: GraphQLNamedType,
+        depth: int,
+        paged: bool,
+    ) -> tuple[int, int]:
+        """Return (cost, depth) of a selection set."""
+        cost = 0
+        max_depth = depth
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                field_cost, field_depth = self.field(selection, parent_type, depth + 1, paged)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = (
+                        self.schema.get_type(selection.type_condition.name.value) or parent_type
+                    )
+                field_cost, field_depth = self.selection_set(
+                    selection.selection_set, fragment_type, depth, paged
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                fragment = self.fragments.get(selection.name.value)
+                if fragment is None:
+                    continue
+                fragment_type = (
+                    self.schema.get_type(fragment.type_condition.name.value) or parent_type
+                )
+                field_cost, field_depth = self.selection_set(
+                    fragment.selection_set, fragment_type, depth, paged
+                )
+            else:
+                continue
+            cost += field_cost
+            max_depth = max(max_depth, field_depth)
+        return cost, max_depth
+
+    def field(
+        self,
+        node: FieldNode,
+        parent_type: GraphQLNamedType,
+        depth: int,
+        paged: bool,
+    ) -> tuple[int, int]:
+        field_def = None
+        if isinstance(parent_type, GraphQLObjectType | GraphQLInterfaceType):
+            field_def = parent_type.fields.get(node.name.value)
+        if field_def is None or node.selection_set is None:
+            return 1, depth
+
+        # A size argument bounds the list directly below (connection types)
+        # or the field itself; other lists are assumed to hold the default
+        size = self.size_argument(node, field_def)
+        if size is not None:
+            multiplier, child_paged = size, True
+        elif is_list_type(get_nullable_type(field_def.type)):
+            multiplier, child_paged = (1 if paged else self.default_list_size), False
+        else:
+            multiplier, child_paged = 1, False
+
+        child_cost, child_depth = self.selection_set(
+            node.selection_set, get_named_type(field_def.type), depth, child_paged
+        )
+        return 1 + multiplier * child_cost, child_depth
+
+    def size_argument(self, node: FieldNode, field_def: GraphQLField) -> int | None:
+        for name in SIZE_ARGUMENTS:
+            arg_def = field_def.args.get(name)
+            if arg_def is None:
+                continue
+            value = arg_def.default_value
+            for argument in node.arguments or ():
+                if argument.name.value == name:
+                    # An unset variable leaves the schema default in place
+                    provided = value_from_ast(argument.value, arg_def.type, self.variables)
+                    if provided is not Undefined:
+                        value = provided
+            if isinstance(value, int):
+                return max(value, 0)
+        return None
+
+
+def estimate_query_cost(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: str | None = None,
+    variables: dict[str, Any] | None = None,
+    default_list_size: int | None = None,
+) -> tuple[int, int]:
+    """
+    Estimate the cost and depth of an operation.
+
+    Every selected field costs 1. The cost of a field's selections is
+    multiplied by its ``limit``/``first``/``pageSize`` argument (explicit or
+    schema default) or, for list fields without one, by ``default_list_size``.
+
+    Returns:
+        (cost, depth); (0, 0) when the operation cannot be found
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None:
+        return 0, 0
+    root_type = schema.get_root_type(operation.operation)
+    if root_type is None:
+        return 0, 0
+
+    estimator = _CostEstimator(
+        schema,
+        document,
+        variables,
+        default_list_size or settings.graphql.default_list_size,
+    )
+    return estimator.selection_set(operation.selection_set, root_type, 0, False)
+
+
+class QueryCostLimiter(SchemaExtension):
+    """Reject queries and mutations whose estimated cost or depth is too high."""
+
+    def on_execute(self) -> Iterator[None]:
+        execution_context = self.execution_context
+        document = execution_context.graphql_document
+        if document is not None and execution_context.result is None:
+            error = self._check(execution_context.schema._schema, document)
+            if error is not None:
+                execution_context.result = ExecutionResult(data=None, errors=[error])
+        yield
+
+    def _check(self, schema: GraphQLSchema, document: DocumentNode) -> GraphQLError | None:
+        execution_context = self.execution_context
+        operation = get_operation_ast(document, execution_context.operation_name)
+        if operation is None or operation.operation == OperationType.SUBSCRIPTION:
+            return None
+
+        cost, depth = estimate_query_cost(
+            schema,
+            document,
+            execution_context.operation_name,
+            execution_context.variables,
+        )
+        max_cost = settings.graphql.max_query_cost
+        max_depth = settings.graphql.max_query_depth
+        if cost <= max_cost and depth <= max_depth:
+            return None
+
+        logger.warning(
+            "graphql.query_rejected",
+            operation_name=execution_context.operation_name,
+            cost=cost,
+            depth=depth,
+        )
+        if depth > max_depth:
+            message = f"Query depth {depth} exceeds the maximum of {max_depth}"
+        else:
+            message = f"Query cost {cost} exceeds the maximum of {max_cost}"
+        return GraphQLError(
+            message,
+            extensions={
+                "code": "QUERY_TOO_COMPLEX",
+                "cost": cost,
+                "maxCost": max_cost,
+                "depth": depth,
+                "maxDepth": max_depth,
+            },
+        )
@@ -0,0 +1,108 @@
+"""
+Opt-in result caching for root GraphQL query fields.
+
+Expensive, read-mostly resolvers (dashboards, aggregated metrics) declare a
+TTL on their field::
+
+    @strawberry.field(extensions=[CachedResult(ttl_seconds=60)])
+    async def wireless_dashboard(self, info: Info) -> WirelessDashboard: ...
+
+Results are cached per worker under a key made of the tenant, the field and
+its arguments, and returned by reference, so they must not be mutated after
+the resolver returns. Only fields of the root ``Query`` type are cached, and
+nothing is cached when the tenant cannot be resolved.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from graphql import OperationType
+from strawberry.extensions import FieldExtension
+from strawberry.extensions.field_extension import AsyncExtensionResolver
+from strawberry.types import Info
+
+from dotmac.platform.cache.codecs import default_encoder
+from dotmac.platform.cache.local import LocalCache
+from dotmac.platform.settings import settings
+
+FIELD_CACHE_PREFIX = "graphql:field"
+
+# Upper bound for any declared field TTL
+MAX_FIELD_TTL_SECONDS = 3600
+
+_field_result_cache: LocalCache | None = None
+
+
+def get_field_result_cache() -> LocalCache:
+    """Return the process-wide field result cache."""
+    global _field_result_cache
+    if _field_result_cache is None:
+        _field_result_cache = LocalCache(
+            max_entries=settings.graphql.field_cache_max_entries,
+            ttl_seconds=MAX_FIELD_TTL_SECONDS,
+        )
+    return _field_result_cache
+
+
+def reset_field_result_cache() -> None:
+    """Drop the process-wide field result cache (tests)."""
+    global _field_result_cache
+    _field_result_cache = None
+
+
+def _tenant_scope(info: Info) -> str | None:
+    context = info.context
+    if isinstance(context, Mapping):
+        tenant_id = context.get("tenant_id")
+    else:
+        get_tenant = getattr(context, "get_active_tenant_id", None)
+        if not callable(get_tenant):
+            return None
+        try:
+            tenant_id = get_tenant()
+        except Exception:
+            # Unauthenticated or ambiguous; let the resolver raise
+            return None
+    return str(tenant_id) if tenant_id else None
+
+
+class CachedResult(FieldExtension):
+    """Cache a root query field's result per tenant and arguments for ``ttl_seconds``."""
+
+    def __init__(self, ttl_seconds: int) -> None:
+        if not 0 < ttl_seconds <= MAX_FIELD_TTL_SECONDS:
+            raise ValueError(f"ttl_seconds must be between 1 and {MAX_FIELD_TTL_SECONDS}")
+        self.ttl_seconds = ttl_seconds
+
+    def _key(self, info: Info, kwargs: dict[str, Any]) -> str | None:
+        if info.path.prev is not None or info.operation.operation != OperationType.QUERY:
+            return None
+        tenant_id = _tenant_scope(info)
+        if tenant_id is None:
+            return None
+        try:
+            arguments = json.dumps(kwargs, sort_keys=True, default=default_encoder)
+        except TypeError:
+            return None
+        digest = hashlib.sha256(arguments.encode()).hexdigest()[:32]
+        return f"{FIELD_CACHE_PREFIX}:{tenant_id}:{info.field_name}:{digest}"
+
+    async def resolve_async(
+        self, next_: AsyncExtensionResolver, source: Any, info: Info, **kwargs: Any
+    ) -> Any:
+        key = self._key(info, kwargs)
+        if key is None:
+            return await next_(source, info, **kwargs)
+
+        cache = get_field_result_cache()
+        cached = cache.get(key)
+        if cached is not LocalCache.MISSING:
+            return cached
+
+        result = await next_(source, info, **kwargs)
+        cache.set(key, result, ttl=self.ttl_seconds)
+        return result
@@ -2,79 +2,209 @@
 DataLoaders for batching GraphQL queries.
 
 Prevents N+1 query problems by batching database requests.
+
+Every loader derives from ``BatchLoader``: ``load(key)`` calls made in the
+same event-loop tick (for example by sibling field resolvers) are queued and
+resolved by a single ``batch_load(keys)`` call, and each key is fetched at
+most once per request. Loaders are created per request by
+``DataLoaderRegistry`` and share its database session, so batches run one at
+a time under a lock the registry owns.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
 from collections import defaultdict
-from typing import Any, cast
+from collections.abc import Hashable, Sequence
+from typing import Any, ClassVar, cast
 
 import structlog
+from prometheus_client import Histogram
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = structlog.get_logger(__name__)
 
+dataloader_batch_size = Histogram(
+    "graphql_dataloader_batch_size",
+    "Number of keys resolved per DataLoader batch",
+    ["loader"],
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500],
+)
 
-class SessionLoader:
-    """Batch load RADIUS sessions by username."""
+dataloader_batch_duration_seconds = Histogram(
+    "graphql_dataloader_batch_duration_seconds",
+    "Duration of DataLoader batch queries in seconds",
+    ["loader"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5],
+)
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[tuple[str | None, str], list[Any]] = {}
 
-    async def load(self, username: str, *, tenant_id: str | None = None) -> list[Any]:
-        """Load sessions for a single username (with cache)."""
-        cache_key = (tenant_id, username)
-        if cache_key in self._cache:
-            return list(self._cache[cache_key])
+class BatchLoader[K: Hashable, V]:
+    """
+    Base class for request-scoped batching loaders.
 
-        # Import here to avoid circular imports
-        from dotmac.platform.radius.models import RadAcct
+    Subclasses implement ``batch_load``, which receives a list of distinct
+    keys and must return one value per key, in the same order.
 
-        # Query for this specific username
-        stmt = (
-            select(RadAcct)
-            .where(RadAcct.username == username)
-            .where(RadAcct.acctstoptime.is_(None))  # Only active sessions
-            .order_by(RadAcct.acctstarttime.desc())
-            .limit(20)
-        )
-        if tenant_id is not None:
-            stmt = stmt.where(RadAcct.tenant_id == tenant_id)
+    Attributes:
+        name: Label used for this loader's metrics
+        max_batch_size: Largest number of keys passed to one ``batch_load`` call
+        batch_window_seconds: Extra time to wait for more keys before
+            dispatching; 0 dispatches on the next event-loop tick
+    """
 
-        result = await self.db.execute(stmt)
-        sessions = result.scalars().all()
+    name: ClassVar[str] = "batch"
+    max_batch_size: ClassVar[int] = 500
+    batch_window_seconds: ClassVar[float] = 0.0
+
+    def __init__(self, db: AsyncSession, *, lock: asyncio.Lock | None = None):
+        self.db = db
+        self._lock = lock or asyncio.Lock()
+        self._cache: dict[K, asyncio.Future[V]] = {}
+        self._queue: list[tuple[K, asyncio.Future[V]]] = []
+        self._dispatch_scheduled = False
+        self._batches: set[asyncio.Task[None]] = set()
+
+    async def batch_load(self, keys: list[K]) -> Sequence[V]:
+        """Load values for ``keys``, returning them in the same order."""
+        raise NotImplementedError
+
+    async def load(self, key: K) -> V:
+        """Load the value for a single key (with cache)."""
+        return await self._enqueue(key)
+
+    async def load_many(self, keys: Sequence[K]) -> list[V]:
+        """Load values for several keys, in the same order as ``keys``."""
+        if not keys:
+            return []
+        return list(await asyncio.gather(*(self._enqueue(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Seed the cache with an already known value."""
+        if key not in self._cache:
+            future: asyncio.Future[V] = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._cache[key] = future
+
+    def clear(self, key: K) -> None:
+        """Drop a cached key so the next load fetches it again."""
+        self._cache.pop(key, None)
+
+    def clear_all(self) -> None:
+        """Drop every cached key."""
+        self._cache.clear()
+
+    def _enqueue(self, key: K) -> asyncio.Future[V]:
+        future = self._cache.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._cache[key] = future
+        self._queue.append((key, future))
+
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            if self.batch_window_seconds > 0:
+                loop.call_later(self.batch_window_seconds, self._dispatch)
+            else:
+                loop.call_soon(self._dispatch)
+        return future
+
+    def _dispatch(self) -> None:
+        queue, self._queue = self._queue, []
+        self._dispatch_scheduled = False
+
+        for start in range(0, len(queue), self.max_batch_size):
+            task = asyncio.create_task(self._run_batch(queue[start : start + self.max_batch_size]))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: list[tuple[K, asyncio.Future[V]]]) -> None:
+        keys = [key for key, _ in batch]
+        try:
+            async with self._lock:
+                started = time.perf_counter()
+                values = await self.batch_load(keys)
+                dataloader_batch_duration_seconds.labels(loader=self.name).observe(
+                    time.perf_counter() - started
+                )
+            dataloader_batch_size.labels(loader=self.name).observe(len(keys))
+
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"{type(self).__name__}.batch_load returned {len(values)} values "
+                    f"for {len(keys)} keys"
+                )
+        except asyncio.CancelledError:
+            self._fail(batch, None)
+            raise
+        except Exception as e:
+            logger.warning(
+                "dataloader.batch_failed", loader=self.name, keys=len(keys), error=str(e)
+            )
+            self._fail(batch, e)
+            return
 
-        # Cache result
-        self._cache[cache_key] = list(sessions)
-        return list(sessions)
+        for (_, future), value in zip(batch, values, strict=True):
+            if not future.done():
+                future.set_result(value)
 
-    async def load_many(
+    def _fail(
         self,
-        usernames: list[str],
+        batch: list[tuple[K, asyncio.Future[V]]],
+        error: Exception | None,
+    ) -> None:
+        # Failed keys are not cached, so a later load retries them
+        for key, future in batch:
+            if self._cache.get(key) is future:
+                del self._cache[key]
+            if future.done():
+                continue
+            if error is None:
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+
+class SessionLoader(BatchLoader[tuple[str | None, str], list[Any]]):
+    """Batch load RADIUS sessions by username."""
+
+    name = "session"
+
+    async def load(  # type: ignore[override]
+        self, username: str, *, tenant_id: str | None = None
+    ) -> list[Any]:
+        """Load sessions for a single username (with cache)."""
+        return list(await self._enqueue((tenant_id, username)))
+
+    async def load_many(  # type: ignore[override]
+        self,
+        usernames: Sequence[str],
         *,
         tenant_id: str | None = None,
     ) -> list[list[Any]]:
         """Batch load sessions for multiple usernames."""
-        if not usernames:
-            return []
+        keys = [(tenant_id, username) for username in usernames]
+        return [list(sessions) for sessions in await super().load_many(keys)]
 
-        def cache_key(name):
-            return (tenant_id, name)
-
-        uncached_usernames = [
-            username for username in usernames if cache_key(username) not in self._cache
-        ]
+    async def batch_load(self, keys: list[tuple[str | None, str]]) -> list[list[Any]]:
+        # Import here to avoid circular imports
+        from dotmac.platform.radius.models import RadAcct
 
-        if uncached_usernames:
-            # Import here to avoid circular imports
-            from dotmac.platform.radius.models import RadAcct
+        usernames_by_tenant: dict[str | None, list[str]] = defaultdict(list)
+        for tenant_id, username in keys:
+            usernames_by_tenant[tenant_id].append(username)
 
-            # Query all uncached sessions at once
+        grouped: dict[tuple[str | None, str], list[Any]] = defaultdict(list)
+        for tenant_id, usernames in usernames_by_tenant.items():
+            # Query all sessions for this tenant's usernames at once
             stmt = (
                 select(RadAcct)
-                .where(RadAcct.username.in_(uncached_usernames))
+                .where(RadAcct.username.in_(usernames))
                 .where(RadAcct.acctstoptime.is_(None))  # Only active sessions
                 .order_by(RadAcct.username, RadAcct.acctstarttime.desc())
             )
@@ -82,36 +212,19 @@ class SessionLoader:
                 stmt = stmt.where(RadAcct.tenant_id == tenant_id)
 
             result = await self.db.execute(stmt)
-            all_sessions = result.scalars().all()
-
-            # Group sessions by username
-            grouped: dict[str, list[Any]] = defaultdict(list)
-            for session in all_sessions:
-                username_value = str(session.username)
-                grouped[username_value].append(session)
-
-            # Limit each user to 20 sessions and cache
-            for username in uncached_usernames:
-                sessions = grouped.get(username, [])
-                limited_sessions = sessions[:20]
-                self._cache[cache_key(username)] = list(limited_sessions)
+            for session in result.scalars().all():
+                grouped[(tenant_id, str(session.username))].append(session)
 
-        # Return in same order as input usernames
-        return [list(self._cache.get(cache_key(username), [])) for username in usernames]
+        # Limit each user to 20 sessions
+        return [grouped.get(key, [])[:20] for key in keys]
 
 
-class CustomerActivityLoader:
+class CustomerActivityLoader(BatchLoader[str, list[Any]]):
     """Batch load customer activities by customer_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, customer_ids: list[str]) -> list[list[Any]]:
-        """Batch load activities for multiple customers."""
-        if not customer_ids:
-            return []
+    name = "customer_activity"
 
+    async def batch_load(self, customer_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
         from dotmac.platform.customer_management.models import CustomerActivity
 
@@ -131,28 +244,15 @@ class CustomerActivityLoader:
             grouped[str(activity.customer_id)].append(activity)
 
         # Limit each customer to 20 most recent activities
-        for customer_id in grouped:
-            grouped[customer_id] = grouped[customer_id][:20]
+        return [grouped.get(customer_id, [])[:20] for customer_id in customer_ids]
 
-        # Cache all results
-        self._cache.update(grouped)
 
-        # Return in same order as input customer_ids
-        return [grouped.get(customer_id, []) for customer_id in customer_ids]
-
-
-class CustomerNoteLoader:
+class CustomerNoteLoader(BatchLoader[str, list[Any]]):
     """Batch load customer notes by customer_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, customer_ids: list[str]) -> list[list[Any]]:
-        """Batch load notes for multiple customers."""
-        if not customer_ids:
-            return []
+    name = "customer_note"
 
+    async def batch_load(self, customer_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
         from dotmac.platform.customer_management.models import CustomerNote
 
@@ -173,94 +273,62 @@ class CustomerNoteLoader:
             grouped[str(note.customer_id)].append(note)
 
         # Limit each customer to 10 most recent notes
-        for customer_id in grouped:
-            grouped[customer_id] = grouped[customer_id][:10]
-
-        # Cache all results
-        self._cache.update(grouped)
-
-        # Return in same order as input customer_ids
-        return [grouped.get(customer_id, []) for customer_id in customer_ids]
+        return [grouped.get(customer_id, [])[:10] for customer_id in customer_ids]
 
 
-class PaymentCustomerLoader:
+class PaymentCustomerLoader(BatchLoader[str, Any]):
     """Batch load customer data for payments."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, Any] = {}
-
-    async def load_many(self, customer_ids: list[str]) -> list[Any | None]:
-        """Batch load customer data for multiple customer IDs."""
-        if not customer_ids:
-            return []
+    name = "payment_customer"
 
+    async def batch_load(self, customer_ids: list[str]) -> list[Any | None]:
         # Import here to avoid circular imports
         from dotmac.platform.customer_management.models import Customer
 
-        # Filter out already cached IDs
-        uncached_ids = [cid for cid in customer_ids if cid not in self._cache]
+        # Query all customers at once
+        stmt = select(Customer).where(Customer.id.in_(customer_ids))
 
-        if uncached_ids:
-            # Query all customers at once
-            stmt = select(Customer).where(Customer.id.in_(list(uncached_ids)))
-
-            result = await self.db.execute(stmt)
-            customers = result.scalars().all()
-
-            # Cache results
-            for customer in customers:
-                self._cache[str(customer.id)] = customer
+        result = await self.db.execute(stmt)
+        customers_by_id = {str(customer.id): customer for customer in result.scalars().all()}
 
         # Return in same order as input customer_ids (None if not found)
-        return [self._cache.get(customer_id) for customer_id in customer_ids]
+        return [customers_by_id.get(customer_id) for customer_id in customer_ids]
 
 
-class PaymentInvoiceLoader:
+class PaymentInvoiceLoader(BatchLoader[str | None, Any]):
     """Batch load invoice data for payments."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, Any] = {}
-
-    async def load_many(self, invoice_ids: list[str]) -> list[Any | None]:
-        """Batch load invoice data for multiple invoice IDs."""
-        if not invoice_ids:
-            return []
+    name = "payment_invoice"
 
+    async def batch_load(self, invoice_ids: list[str | None]) -> list[Any | None]:
         # Import here to avoid circular imports
-        from dotmac.platform.billing.invoicing.entities import InvoiceEntity
+        from dotmac.platform.billing.core.entities import InvoiceEntity
 
-        # Filter out already cached IDs and None values
-        valid_ids = [iid for iid in invoice_ids if iid and iid not in self._cache]
+        # Payments without an invoice resolve to None without a lookup
+        valid_ids = [iid for iid in invoice_ids if iid]
+        invoices_by_id: dict[str, Any] = {}
 
         if valid_ids:
             # Query all invoices at once
-            stmt = select(InvoiceEntity).where(InvoiceEntity.invoice_id.in_(list(valid_ids)))
+            stmt = select(InvoiceEntity).where(InvoiceEntity.invoice_id.in_(valid_ids))
 
             result = await self.db.execute(stmt)
-            invoices = result.scalars().all()
-
-            # Cache results
-            for invoice in invoices:
-                self._cache[str(invoice.invoice_id)] = invoice
+            invoices_by_id = {
+                str(invoice.invoice_id): invoice for invoice in result.scalars().all()
+            }
 
         # Return in same order as input invoice_ids (None if not found)
-        return [self._cache.get(invoice_id) if invoice_id else None for invoice_id in invoice_ids]
+        return [
+            invoices_by_id.get(invoice_id) if invoice_id else None for invoice_id in invoice_ids
+        ]
 
 
-class TenantSettingsLoader:
+class TenantSettingsLoader(BatchLoader[str, list[Any]]):
     """Batch load tenant settings by tenant_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, tenant_ids: list[str]) -> list[list[Any]]:
-        """Batch load settings for multiple tenants."""
-        if not tenant_ids:
-            return []
+    name = "tenant_settings"
 
+    async def batch_load(self, tenant_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
         from dotmac.platform.tenant.models import TenantSetting
 
@@ -279,24 +347,16 @@ class TenantSettingsLoader:
         for setting in all_settings:
             grouped[str(setting.tenant_id)].append(setting)
 
-        self._cache.update(grouped)
-
         # Return in same order as input tenant_ids
         return [grouped.get(tenant_id, []) for tenant_id in tenant_ids]
 
 
-class TenantUsageLoader:
+class TenantUsageLoader(BatchLoader[str, list[Any]]):
     """Batch load tenant usage records by tenant_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, tenant_ids: list[str]) -> list[list[Any]]:
-        """Batch load usage records for multiple tenants."""
-        if not tenant_ids:
-            return []
+    name = "tenant_usage"
 
+    async def batch_load(self, tenant_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
         from dotmac.platform.tenant.models import TenantUsage
 
@@ -310,32 +370,21 @@ class TenantUsageLoader:
         result = await self.db.execute(stmt)
         all_usage = result.scalars().all()
 
-        # Group usage by tenant_id, limit to 12 most recent
+        # Group usage by tenant_id
         grouped: dict[str, list[Any]] = defaultdict(list)
         for usage in all_usage:
             grouped[str(usage.tenant_id)].append(usage)
 
         # Limit each tenant to 12 most recent records
-        for tenant_id in grouped:
-            grouped[tenant_id] = grouped[tenant_id][:12]
-
-        self._cache.update(grouped)
-
-        return [grouped.get(tenant_id, []) for tenant_id in tenant_ids]
+        return [grouped.get(tenant_id, [])[:12] for tenant_id in tenant_ids]
 
 
-class TenantInvitationsLoader:
+class TenantInvitationsLoader(BatchLoader[str, list[Any]]):
     """Batch load tenant invitations by tenant_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, tenant_ids: list[str]) -> list[list[Any]]:
-        """Batch load invitations for multiple tenants."""
-        if not tenant_ids:
-            return []
+    name = "tenant_invitations"
 
+    async def batch_load(self, tenant_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
         from dotmac.platform.tenant.models import TenantInvitation
 
@@ -354,23 +403,15 @@ class TenantInvitationsLoader:
         for invitation in all_invitations:
             grouped[str(invitation.tenant_id)].append(invitation)
 
-        self._cache.update(grouped)
-
         return [grouped.get(tenant_id, []) for tenant_id in tenant_ids]
 
 
-class UserRolesLoader:
+class UserRolesLoader(BatchLoader[str, list[Any]]):
     """Batch load user roles by user_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, user_ids: list[str]) -> list[list[Any]]:
-        """Batch load roles for multiple users."""
-        if not user_ids:
-            return []
+    name = "user_roles"
 
+    async def batch_load(self, user_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
         from dotmac.platform.auth.models import Role, user_roles
 
@@ -399,24 +440,16 @@ class UserRolesLoader:
             if role:
                 grouped[user_id_str].append(role)
 
-        self._cache.update(grouped)
-
         # Return in same order as input user_ids
         return [grouped.get(user_id, []) for user_id in user_ids]
 
 
-class UserPermissionsLoader:
+class UserPermissionsLoader(BatchLoader[str, list[Any]]):
     """Batch load user permissions by user_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, user_ids: list[str]) -> list[list[Any]]:
-        """Batch load permissions for multiple users."""
-        if not user_ids:
-            return []
+    name = "user_permissions"
 
+    async def batch_load(self, user_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
         from dotmac.platform.auth.models import Permission, role_permissions, user_roles
 
@@ -468,26 +501,16 @@ class UserPermissionsLoader:
             perms = role_to_perms.get(role_id_str, [])
             grouped[user_id_str].update(perms)
 
-        # Convert sets to lists and cache
-        grouped_lists = {user_id: list(perms) for user_id, perms in grouped.items()}
-        self._cache.update(grouped_lists)
-
         # Return in same order as input user_ids
-        return [grouped_lists.get(user_id, []) for user_id in user_ids]
+        return [list(grouped.get(user_id, ())) for user_id in user_ids]
 
 
-class UserTeamsLoader:
+class UserTeamsLoader(BatchLoader[str, list[Any]]):
     """Batch load user team memberships by user_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, user_ids: list[str]) -> list[list[Any]]:
-        """Batch load team memberships for multiple users."""
-        if not user_ids:
-            return []
+    name = "user_teams"
 
+    async def batch_load(self, user_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
         from dotmac.platform.user_management.models import Team, TeamMember
 
@@ -521,24 +544,16 @@ class UserTeamsLoader:
             membership._team = teams_by_id.get(str(membership.team_id))
             grouped[user_id_str].append(membership)
 
-        self._cache.update(grouped)
-
         # Return in same order as input user_ids
         return [grouped.get(user_id, []) for user_id in user_ids]
 
 
-class ProfileChangeHistoryLoader:
+class ProfileChangeHistoryLoader(BatchLoader[str, list[Any]]):
     """Batch load profile change history by user_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, user_ids: list[str]) -> list[list[Any]]:
-        """Batch load profile changes for multiple users."""
-        if not user_ids:
-            return []
+    name = "profile_changes"
 
+    async def batch_load(self, user_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
         from dotmac.platform.user_management.models import ProfileChangeHistory, User
 
@@ -572,96 +587,56 @@ class ProfileChangeHistoryLoader:
             grouped[user_id_str].append(change)
 
         # Limit each user to 20 most recent changes
-        for user_id in grouped:
-            grouped[user_id] = grouped[user_id][:20]
-
-        self._cache.update(grouped)
-
-        # Return in same order as input user_ids
-        return [grouped.get(user_id, []) for user_id in user_ids]
+        return [grouped.get(user_id, [])[:20] for user_id in user_ids]
 
 
-class SubscriptionPlanLoader:
+class SubscriptionPlanLoader(BatchLoader[str, Any]):
     """Batch load subscription plans by plan_id."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, Any] = {}
-
-    async def load_many(self, plan_ids: list[str]) -> list[Any | None]:
-        """Batch load plans for multiple plan IDs."""
-        if not plan_ids:
-            return []
+    name = "subscription_plan"
 
+    async def batch_load(self, plan_ids: list[str]) -> list[Any | None]:
         # Import here to avoid circular imports
         from dotmac.platform.billing.subscriptions.models import SubscriptionPlan
 
-        # Filter out already cached IDs
-        uncached_ids = [pid for pid in plan_ids if pid not in self._cache]
-
-        if uncached_ids:
-            # Query all plans at once
-            plan_id_column = cast(Any, SubscriptionPlan.plan_id)
-            stmt = select(SubscriptionPlan).where(plan_id_column.in_(uncached_ids))
-
-            result = await self.db.execute(stmt)
-            plans = result.scalars().all()
+        # Query all plans at once
+        plan_id_column = cast(Any, SubscriptionPlan.plan_id)
+        stmt = select(SubscriptionPlan).where(plan_id_column.in_(plan_ids))
 
-            # Cache results
-            for plan in plans:
-                self._cache[plan.plan_id] = plan
+        result = await self.db.execute(stmt)
+        plans_by_id = {plan.plan_id: plan for plan in result.scalars().all()}
 
         # Return in same order as input plan_ids (None if not found)
-        return [self._cache.get(plan_id) for plan_id in plan_ids]
+        return [plans_by_id.get(plan_id) for plan_id in plan_ids]
 
 
-class SubscriptionCustomerLoader:
+class SubscriptionCustomerLoader(BatchLoader[str, Any]):
     """Batch load customer data for subscriptions."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, Any] = {}
-
-    async def load_many(self, customer_ids: list[str]) -> list[Any | None]:
-        """Batch load customer data for multiple customer IDs."""
-        if not customer_ids:
-            return []
+    name = "subscription_customer"
 
+    async def batch_load(self, customer_ids: list[str]) -> list[Any | None]:
         # Import here to avoid circular imports
         from dotmac.platform.customer_management.models import Customer
 
-        # Filter out already cached IDs
-        uncached_ids = [cid for cid in customer_ids if cid not in self._cache]
-
-        if uncached_ids:
-            # Query all customers at once
-            stmt = select(Customer).where(Customer.id.in_(uncached_ids))
-
-            result = await self.db.execute(stmt)
-            customers = result.scalars().all()
+        # Query all customers at once
+        stmt = select(Customer).where(Customer.id.in_(customer_ids))
 
-            # Cache results
-            for customer in customers:
-                self._cache[str(customer.id)] = customer
+        result = await self.db.execute(stmt)
+        customers_by_id = {str(customer.id): customer for customer in result.scalars().all()}
 
         # Return in same order as input customer_ids (None if not found)
-        return [self._cache.get(customer_id) for customer_id in customer_ids]
+        return [customers_by_id.get(customer_id) for customer_id in customer_ids]
 
 
-class SubscriptionInvoicesLoader:
+class SubscriptionInvoicesLoader(BatchLoader[str, list[Any]]):
     """Batch load recent invoices for subscriptions."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, subscription_ids: list[str]) -> list[list[Any]]:
-        """Batch load recent invoices for multiple subscriptions."""
-        if not subscription_ids:
-            return []
+    name = "subscription_invoices"
 
+    async def batch_load(self, subscription_ids: list[str]) -> list[list[Any]]:
         # Import here to avoid circular imports
-        from dotmac.platform.billing.invoicing.entities import InvoiceEntity
+        from dotmac.platform.billing.core.entities import InvoiceEntity
 
         # Query all invoices at once (limit to 5 most recent per subscription)
         stmt = (
@@ -680,91 +655,57 @@ class SubscriptionInvoicesLoader:
                 grouped[invoice.subscription_id].append(invoice)
 
         # Limit each subscription to 5 most recent invoices
-        for sub_id in grouped:
-            grouped[sub_id] = grouped[sub_id][:5]
-
-        self._cache.update(grouped)
+        return [grouped.get(sub_id, [])[:5] for sub_id in subscription_ids]
 
-        # Return in same order as input subscription_ids
-        return [grouped.get(sub_id, []) for sub_id in subscription_ids]
 
-
-class DeviceTrafficLoader:
+class DeviceTrafficLoader(BatchLoader[str, Any]):
     """Batch load traffic statistics for network devices.
 
     This loader uses the network monitoring service to fetch traffic data
     for multiple devices in a single batch operation.
     """
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, Any] = {}
-
-    async def load_many(self, device_ids: list[str]) -> list[Any | None]:
-        """Batch load traffic stats for multiple devices."""
-        if not device_ids:
-            return []
-
-        # Filter out already cached IDs
-        uncached_ids = [did for did in device_ids if did not in self._cache]
+    name = "device_traffic"
 
-        if uncached_ids:
-            # Note: In a real implementation, this would call the network monitoring service
-            # For now, we'll return placeholder data
-            # The actual implementation would integrate with NetBox, GenieACS, or VOLTHA
+    async def batch_load(self, device_ids: list[str]) -> list[Any | None]:
+        # Note: In a real implementation, this would call the network monitoring service
+        # For now, we'll return placeholder data
+        # The actual implementation would integrate with NetBox, GenieACS, or VOLTHA
 
-            # from dotmac.platform.network_monitoring.service import NetworkMonitoringService
-            # service = NetworkMonitoringService(...)
-            # traffic_list = await service.batch_get_traffic_stats(uncached_ids)
+        # from dotmac.platform.network_monitoring.service import NetworkMonitoringService
+        # service = NetworkMonitoringService(...)
+        # traffic_list = await service.batch_get_traffic_stats(device_ids)
 
-            # Placeholder: Cache None for devices without traffic data
-            for device_id in uncached_ids:
-                self._cache[device_id] = None
+        # Placeholder: None for devices without traffic data
+        return [None for _ in device_ids]
 
-        # Return in same order as input device_ids (None if not found)
-        return [self._cache.get(device_id) for device_id in device_ids]
 
-
-class DeviceAlertsLoader:
+class DeviceAlertsLoader(BatchLoader[str, list[Any]]):
     """Batch load alerts for network devices."""
 
-    def __init__(self, db: AsyncSession):
-        self.db = db
-        self._cache: dict[str, list[Any]] = {}
-
-    async def load_many(self, device_ids: list[str]) -> list[list[Any]]:
-        """Batch load alerts for multiple devices."""
-        if not device_ids:
-            return []
-
-        # Filter out already cached IDs
-        uncached_ids = [did for did in device_ids if did not in self._cache]
+    name = "device_alerts"
 
-        if uncached_ids:
-            # Note: In a real implementation, this would query network alerts
-            # from a monitoring database or service
+    async def batch_load(self, device_ids: list[str]) -> list[list[Any]]:
+        # Note: In a real implementation, this would query network alerts
+        # from a monitoring database or service
 
-            # from dotmac.platform.network_monitoring.models import NetworkAlert
-            # stmt = (
-            #     select(NetworkAlert)
-            #     .where(NetworkAlert.device_id.in_(uncached_ids))
-            #     .where(NetworkAlert.is_active == True)
-            #     .order_by(NetworkAlert.device_id, NetworkAlert.triggered_at.desc())
-            # )
-            # result = await self.db.execute(stmt)
-            # alerts = result.scalars().all()
+        # from dotmac.platform.network_monitoring.models import NetworkAlert
+        # stmt = (
+        #     select(NetworkAlert)
+        #     .where(NetworkAlert.device_id.in_(device_ids))
+        #     .where(NetworkAlert.is_active == True)
+        #     .order_by(NetworkAlert.device_id, NetworkAlert.triggered_at.desc())
+        # )
+        # result = await self.db.execute(stmt)
+        # alerts = result.scalars().all()
 
-            # Group alerts by device_id
-            # grouped: dict[str, list[Any]] = defaultdict(list)
-            # for alert in alerts:
-            #     grouped[alert.device_id].append(alert)
+        # Group alerts by device_id
+        # grouped: dict[str, list[Any]] = defaultdict(list)
+        # for alert in alerts:
+        #     grouped[alert.device_id].append(alert)
 
-            # For now, placeholder implementation
-            for device_id in uncached_ids:
-                self._cache[device_id] = []
-
-        # Return in same order as input device_ids
-        return [self._cache.get(device_id, []) for device_id in device_ids]
+        # For now, placeholder implementation
+        return [[] for _ in device_ids]
 
 
 class DataLoaderRegistry:
@@ -772,106 +713,80 @@ class DataLoaderRegistry:
 
     def __init__(self, db: AsyncSession):
         self.db = db
-        self._loaders: dict[str, Any] = {}
+        self._loaders: dict[str, BatchLoader[Any, Any]] = {}
+        # An AsyncSession cannot run statements concurrently, so batches from
+        # different loaders take turns on it
+        self._lock = asyncio.Lock()
+
+    def _get[L: BatchLoader[Any, Any]](self, loader_cls: type[L]) -> L:
+        if loader_cls.name not in self._loaders:
+            self._loaders[loader_cls.name] = loader_cls(self.db, lock=self._lock)
+        return cast(L, self._loaders[loader_cls.name])
 
     def get_session_loader(self) -> SessionLoader:
         """Get or create SessionLoader for this request."""
-        if "session" not in self._loaders:
-            self._loaders["session"] = SessionLoader(self.db)
-        return cast(SessionLoader, self._loaders["session"])
+        return self._get(SessionLoader)
 
     def get_customer_activity_loader(self) -> CustomerActivityLoader:
         """Get or create CustomerActivityLoader for this request."""
-        if "customer_activity" not in self._loaders:
-            self._loaders["customer_activity"] = CustomerActivityLoader(self.db)
-        return cast(CustomerActivityLoader, self._loaders["customer_activity"])
+        return self._get(CustomerActivityLoader)
 
     def get_customer_note_loader(self) -> CustomerNoteLoader:
         """Get or create CustomerNoteLoader for this request."""
-        if "customer_note" not in self._loaders:
-            self._loaders["customer_note"] = CustomerNoteLoader(self.db)
-        return cast(CustomerNoteLoader, self._loaders["customer_note"])
+        return self._get(CustomerNoteLoader)
 
     def get_payment_customer_loader(self) -> PaymentCustomerLoader:
         """Get or create PaymentCustomerLoader for this request."""
-        if "payment_customer" not in self._loaders:
-            self._loaders["payment_customer"] = PaymentCustomerLoader(self.db)
-        return cast(PaymentCustomerLoader, self._loaders["payment_customer"])
+        return self._get(PaymentCustomerLoader)
 
     def get_payment_invoice_loader(self) -> PaymentInvoiceLoader:
         """Get or create PaymentInvoiceLoader for this request."""
-        if "payment_invoice" not in self._loaders:
-            self._loaders["payment_invoice"] = PaymentInvoiceLoader(self.db)
-        return cast(PaymentInvoiceLoader, self._loaders["payment_invoice"])
+        return self._get(PaymentInvoiceLoader)
 
     def get_tenant_settings_loader(self) -> TenantSettingsLoader:
         """Get or create TenantSettingsLoader for this request."""
-        if "tenant_settings" not in self._loaders:
-            self._loaders["tenant_settings"] = TenantSettingsLoader(self.db)
-        return cast(TenantSettingsLoader, self._loaders["tenant_settings"])
+        return self._get(TenantSettingsLoader)
 
     def get_tenant_usage_loader(self) -> TenantUsageLoader:
         """Get or create TenantUsageLoader for this request."""
-        if "tenant_usage" not in self._loaders:
-            self._loaders["tenant_usage"] = TenantUsageLoader(self.db)
-        return cast(TenantUsageLoader, self._loaders["tenant_usage"])
+        return self._get(TenantUsageLoader)
 
     def get_tenant_invitations_loader(self) -> TenantInvitationsLoader:
         """Get or create TenantInvitationsLoader for this request."""
-        if "tenant_invitations" not in self._loaders:
-            self._loaders["tenant_invitations"] = TenantInvitationsLoader(self.db)
-        return cast(TenantInvitationsLoader, self._loaders["tenant_invitations"])
+        return self._get(TenantInvitationsLoader)
 
     def get_user_roles_loader(self) -> UserRolesLoader:
         """Get or create UserRolesLoader for this request."""
-        if "user_roles" not in self._loaders:
-            self._loaders["user_roles"] = UserRolesLoader(self.db)
-        return cast(UserRolesLoader, self._loaders["user_roles"])
+        return self._get(UserRolesLoader)
 
     def get_user_permissions_loader(self) -> UserPermissionsLoader:
         """Get or create UserPermissionsLoader for this request."""
-        if "user_permissions" not in self._loaders:
-            self._loaders["user_permissions"] = UserPermissionsLoader(self.db)
-        return cast(UserPermissionsLoader, self._loaders["user_permissions"])
+        return self._get(UserPermissionsLoader)
 
     def get_user_teams_loader(self) -> UserTeamsLoader:
         """Get or create UserTeamsLoader for this request."""
-        if "user_teams" not in self._loaders:
-            self._loaders["user_teams"] = UserTeamsLoader(self.db)
-        return cast(UserTeamsLoader, self._loaders["user_teams"])
+        return self._get(UserTeamsLoader)
 
     def get_profile_change_history_loader(self) -> ProfileChangeHistoryLoader:
         """Get or create ProfileChangeHistoryLoader for this request."""
-        if "profile_changes" not in self._loaders:
-            self._loaders["profile_changes"] = ProfileChangeHistoryLoader(self.db)
-        return cast(ProfileChangeHistoryLoader, self._loaders["profile_changes"])
+        return self._get(ProfileChangeHistoryLoader)
 
     def get_subscription_plan_loader(self) -> SubscriptionPlanLoader:
         """Get or create SubscriptionPlanLoader for this request."""
-        if "subscription_plan" not in self._loaders:
-            self._loaders["subscription_plan"] = SubscriptionPlanLoader(self.db)
-        return cast(SubscriptionPlanLoader, self._loaders["subscription_plan"])
+        return self._get(SubscriptionPlanLoader)
 
     def get_subscription_customer_loader(self) -> SubscriptionCustomerLoader:
         """Get or create SubscriptionCustomerLoader for this request."""
-        if "subscription_customer" not in self._loaders:
-            self._loaders["subscription_customer"] = SubscriptionCustomerLoader(self.db)
-        return cast(SubscriptionCustomerLoader, self._loaders["subscription_customer"])
+        return self._get(SubscriptionCustomerLoader)
 
     def get_subscription_invoices_loader(self) -> SubscriptionInvoicesLoader:
         """Get or create SubscriptionInvoicesLoader for this request."""
-        if "subscription_invoices" not in self._loaders:
-            self._loaders["subscription_invoices"] = SubscriptionInvoicesLoader(self.db)
-        return cast(SubscriptionInvoicesLoader, self._loaders["subscription_invoices"])
+        return self._get(SubscriptionInvoicesLoader)
 
     def get_device_traffic_loader(self) -> DeviceTrafficLoader:
         """Get or create DeviceTrafficLoader for this request."""
-        if "device_traffic" not in self._loaders:
-            self._loaders["device_traffic"] = DeviceTrafficLoader(self.db)
-        return cast(DeviceTrafficLoader, self._loaders["device_traffic"])
+        return self._get(DeviceTrafficLoader)
 
     def get_device_alerts_loader(self) -> DeviceAlertsLoader:
         """Get or create DeviceAlertsLoader for this request."""
-        if "device_alerts" not in self._loaders:
-            self._loaders["device_alerts"] = DeviceAlertsLoader(self.db)
-        return cast(DeviceAlertsLoader, self._loaders["device_alerts"])
+        return self._get(DeviceAlertsLoader)
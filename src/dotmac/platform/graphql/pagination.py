@@ -0,0 +1,186 @@
+"""
+Keyset pagination for GraphQL list resolvers.
+
+``paginate`` orders a filtered SELECT by a fixed set of columns ending in a
+unique one and returns opaque cursors for the first and last row. Passing
+``after=<endCursor>`` continues with a row-value comparison on those columns
+(``WHERE (name, id) > (:name, :id)``), which an index on the sort columns
+answers directly however deep the page is. ``offset`` keeps working for
+existing clients, but costs a scan of every skipped row.
+
+``totalCount`` is exact by default. With ``TotalCountMode.ESTIMATED`` on
+PostgreSQL it is the planner's row estimate for the filtered query, taken
+from ``EXPLAIN`` statistics instead of counting; small estimates are still
+counted exactly because the planner is least accurate there.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from dotmac.platform.graphql.types.common import PageInfo, TotalCountMode
+
+# Planner estimates below this are replaced by an exact (cheap) count
+EXACT_COUNT_BELOW_ESTIMATE = 1000
+
+
+@dataclass(slots=True)
+class Page[T]:
+    """One page of ORM rows plus count and cursor information."""
+
+    items: list[T]
+    total_count: int
+    page_info: PageInfo
+
+    @property
+    def has_next_page(self) -> bool:
+        return self.page_info.has_next_page
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort-key values of a row as an opaque cursor."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """Decode a cursor produced for ``size`` sort columns."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError
+        return [_decode_value(value) for value in values]
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def _row_cursor(item: Any, order_by: Sequence[InstrumentedAttribute[Any]]) -> str:
+    return encode_cursor([getattr(item, column.key) for column in order_by])
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select[Any]) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def _estimate_count(db: AsyncSession, stmt: Select[Any]) -> int:
+    plan = (await db.execute(_Explain(stmt))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def count_rows(
+    db: AsyncSession,
+    stmt: Select[Any],
+    mode: TotalCountMode = TotalCountMode.EXACT,
+) -> int:
+    """Count the rows of a filtered query, estimating on request (PostgreSQL only)."""
+    if mode == TotalCountMode.ESTIMATED and db.get_bind().dialect.name == "postgresql":
+        estimate = await _estimate_count(db, stmt)
+        if estimate >= EXACT_COUNT_BELOW_ESTIMATE:
+            return estimate
+    return await db.scalar(select(func.count()).select_from(stmt.subquery())) or 0
+
+
+async def paginate[T](
+    db: AsyncSession,
+    stmt: Select[tuple[T]],
+    order_by: Sequence[InstrumentedAttribute[Any]],
+    *,
+    limit: int,
+    offset: int = 0,
+    after: str | None = None,
+    descending: bool = False,
+    total_count_mode: TotalCountMode = TotalCountMode.EXACT,
+) -> Page[T]:
+    """
+    Fetch one page of a filtered ORM query.
+
+    Args:
+        db: Session to query with
+        stmt: Filtered SELECT of a single ORM entity, without ORDER BY or LIMIT
+        order_by: Non-nullable sort columns, the last of which is unique
+        limit: Page size
+        offset: Rows to skip (after the cursor, if one is given)
+        after: ``endCursor`` of the previous page
+        descending: Sort every column in descending order
+        total_count_mode: Exact or planner-estimated ``totalCount``
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    total_count = await count_rows(db, stmt, total_count_mode)
+
+    page_stmt = stmt
+    if after is not None:
+        values = decode_cursor(after, len(order_by))
+        keys = tuple_(*order_by)
+        page_stmt = page_stmt.where(
+            keys < tuple_(*values) if descending else keys > tuple_(*values)
+        )
+    page_stmt = page_stmt.order_by(
+        *(column.desc() if descending else column.asc() for column in order_by)
+    )
+    if offset:
+        page_stmt = page_stmt.offset(offset)
+    rows = list((await db.execute(page_stmt.limit(limit + 1))).scalars().all())
+
+    has_next_page = len(rows) > limit
+    items = rows[:limit]
+    if after is None:
+        # An estimate must not claim fewer rows than the client has already paged through
+        total_count = max(total_count, offset + len(items) + int(has_next_page))
+
+    return Page(
+        items=items,
+        total_count=total_count,
+        page_info=PageInfo(
+            has_next_page=has_next_page,
+            has_previous_page=after is not None or offset > 0,
+            start_cursor=_row_cursor(items[0], order_by) if items else None,
+            end_cursor=_row_cursor(items[-1], order_by) if items else None,
+        ),
+    )
@@ -0,0 +1,151 @@
+"""
+Automatic persisted queries (APQ) for the GraphQL endpoint.
+
+Clients following the Apollo APQ protocol send only the SHA-256 hash of a
+document in ``extensions.persistedQuery``. An unknown hash is answered with a
+``PersistedQueryNotFound`` error, after which the client resends the hash
+together with the full document. The document is registered under its hash
+and later requests carry only the hash again.
+
+Registered documents are shared between workers in Redis and kept in a
+bounded in-process LRU in front of it. Without the shared Redis client
+(scripts, tests) only the in-process LRU is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import AsyncIterator
+from typing import Any
+
+import structlog
+from graphql import GraphQLError
+from strawberry.extensions import SchemaExtension
+
+from dotmac.platform.cache.local import LocalCache
+from dotmac.platform.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+PERSISTED_QUERY_PREFIX = "graphql:apq"
+APQ_VERSION = 1
+
+_persisted_query_store: PersistedQueryStore | None = None
+
+
+class PersistedQueryStore:
+    """Registry of GraphQL documents keyed by their SHA-256 hash."""
+
+    def __init__(self, ttl_seconds: int, max_local_entries: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._local = LocalCache(max_entries=max_local_entries, ttl_seconds=ttl_seconds)
+
+    @staticmethod
+    def _get_redis() -> Any:
+        from dotmac.platform.redis_client import redis_manager
+
+        try:
+            return redis_manager.get_client()
+        except RuntimeError:
+            # Redis not initialized (single process, scripts, tests)
+            return None
+
+    @staticmethod
+    def _key(query_hash: str) -> str:
+        return f"{PERSISTED_QUERY_PREFIX}:{query_hash}"
+
+    async def get(self, query_hash: str) -> str | None:
+        """Return the document registered under ``query_hash``, if any."""
+        key = self._key(query_hash)
+        document = self._local.get(key)
+        if document is not LocalCache.MISSING:
+            return str(document)
+
+        redis = self._get_redis()
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(key)
+        except Exception as e:
+            logger.debug("graphql.apq.get_failed", error=str(e))
+            return None
+        if raw is None:
+            return None
+
+        document = raw.decode() if isinstance(raw, bytes) else str(raw)
+        self._local.set(key, document)
+        return document
+
+    async def register(self, query_hash: str, document: str) -> None:
+        """Register a document whose hash has already been verified."""
+        key = self._key(query_hash)
+        self._local.set(key, document)
+
+        redis = self._get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(key, document, ex=self.ttl_seconds)
+        except Exception as e:
+            logger.debug("graphql.apq.register_failed", error=str(e))
+
+
+def get_persisted_query_store() -> PersistedQueryStore:
+    """Return the process-wide persisted query store."""
+    global _persisted_query_store
+    if _persisted_query_store is None:
+        _persisted_query_store = PersistedQueryStore(
+            ttl_seconds=settings.graphql.persisted_query_ttl_seconds,
+            max_local_entries=settings.graphql.persisted_query_local_entries,
+        )
+    return _persisted_query_store
+
+
+def reset_persisted_query_store() -> None:
+    """Drop the process-wide store (tests)."""
+    global _persisted_query_store
+    _persisted_query_store = None
+
+
+def _apq_error(message: str, code: str) -> GraphQLError:
+    return GraphQLError(message, extensions={"code": code})
+
+
+class PersistedQueries(SchemaExtension):
+    """
+    Resolve ``extensions.persistedQuery`` hashes to documents before parsing.
+
+    Register on the schema as a class (not an instance): the hook awaits
+    Redis, so each operation needs its own extension instance.
+    """
+
+    async def on_operation(self) -> AsyncIterator[None]:  # type: ignore[override]
+        execution_context = self.execution_context
+        persisted_query = (execution_context.operation_extensions or {}).get("persistedQuery")
+        if persisted_query is None:
+            yield
+            return
+
+        if not settings.graphql.persisted_queries_enabled:
+            raise _apq_error("PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED")
+
+        if not isinstance(persisted_query, dict) or persisted_query.get("version") != APQ_VERSION:
+            raise _apq_error("Unsupported persisted query version", "PERSISTED_QUERY_NOT_SUPPORTED")
+
+        query_hash = persisted_query.get("sha256Hash")
+        if not isinstance(query_hash, str) or not query_hash:
+            raise _apq_error("Missing persisted query hash", "BAD_USER_INPUT")
+        query_hash = query_hash.lower()
+
+        store = get_persisted_query_store()
+        if execution_context.query:
+            if hashlib.sha256(execution_context.query.encode()).hexdigest() != query_hash:
+                raise _apq_error("provided sha does not match query", "BAD_USER_INPUT")
+            await store.register(query_hash, execution_context.query)
+        else:
+            document = await store.get(query_hash)
+            if document is None:
+                raise _apq_error("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            execution_context.query = document
+
+        yield
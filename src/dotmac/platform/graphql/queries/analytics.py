@@ -82,7 +82,7 @@ class AnalyticsQueries:
         result = await _get_billing_metrics_cached(
             period_days=period_days,
             tenant_id=info.context.current_user.tenant_id,
-            session=info.context.db,
+            session=info.context.read_db,
         )
 
         return BillingMetrics(**result)
@@ -111,7 +111,7 @@ class AnalyticsQueries:
         result = await _get_customer_metrics_cached(
             period_days=period_days,
             tenant_id=info.context.current_user.tenant_id,
-            session=info.context.db,
+            session=info.context.read_db,
         )
 
         # Calculate additional fields needed for GraphQL type
@@ -204,7 +204,7 @@ class AnalyticsQueries:
                 AuditActivity.tenant_id == info.context.current_user.tenant_id
             )
 
-        result = await info.context.db.execute(activity_query)
+        result = await info.context.read_db.execute(activity_query)
         row = result.one()
 
         total_requests = row.total or 0
@@ -276,17 +276,17 @@ class AnalyticsQueries:
             _get_billing_metrics_cached(
                 period_days=period_days,
                 tenant_id=tenant_id,
-                session=info.context.db,
+                session=info.context.read_db,
             ),
             _get_customer_metrics_cached(
                 period_days=period_days,
                 tenant_id=tenant_id,
-                session=info.context.db,
+                session=info.context.read_db,
             ),
             _get_communication_stats_cached(
                 period_days=period_days,
                 tenant_id=tenant_id,
-                session=info.context.db,
+                session=info.context.read_db,
             ),
             _get_file_stats_cached(
                 period_days=period_days,
@@ -296,12 +296,12 @@ class AnalyticsQueries:
             _get_auth_metrics_cached(
                 period_days=period_days,
                 tenant_id=tenant_id,
-                session=info.context.db,
+                session=info.context.read_db,
             ),
             _get_monitoring_metrics_cached(
                 period_days=max(period_days, 1),
                 tenant_id=tenant_id,
-                session=info.context.db,
+                session=info.context.read_db,
             ),
         )
 
@@ -423,7 +423,7 @@ class AnalyticsQueries:
             _get_auth_metrics_cached(
                 period_days=period_days,
                 tenant_id=tenant_id,
-                session=info.context.db,
+                session=info.context.read_db,
             ),
             _get_api_key_metrics_cached(
                 period_days=period_days,
@@ -432,7 +432,7 @@ class AnalyticsQueries:
             _get_secrets_metrics_cached(
                 period_days=period_days,
                 tenant_id=tenant_id,
-                session=info.context.db,
+                session=info.context.read_db,
             ),
         )
 
@@ -527,12 +527,12 @@ class AnalyticsQueries:
             _get_monitoring_metrics_cached(
                 period_days=period_days,
                 tenant_id=tenant_id,
-                session=info.context.db,
+                session=info.context.read_db,
             ),
             _get_log_stats_cached(
                 period_days=period_days,
                 tenant_id=tenant_id,
-                session=info.context.db,
+                session=info.context.read_db,
             ),
         )
 
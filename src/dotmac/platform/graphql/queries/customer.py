@@ -28,6 +28,9 @@ from dotmac.platform.customer_management.models import (
     CustomerStatus,
 )
 from dotmac.platform.graphql.context import Context
+from dotmac.platform.graphql.field_cache import CachedResult
+from dotmac.platform.graphql.pagination import paginate
+from dotmac.platform.graphql.types.common import TotalCountMode
 from dotmac.platform.graphql.types.customer import (
     Customer,
     CustomerActivity,
@@ -150,6 +153,8 @@ class CustomerQueries:
         info: strawberry.Info[Context],
         limit: int = 50,
         offset: int = 0,
+        after: str | None = None,
+        total_count_mode: TotalCountMode = TotalCountMode.EXACT,
         status: CustomerStatusEnum | None = None,
         search: str | None = None,
         include_activities: bool = False,
@@ -161,6 +166,8 @@ class CustomerQueries:
         Args:
             limit: Maximum number of customers to return (default: 50)
             offset: Number of customers to skip (default: 0)
+            after: Cursor (pageInfo.endCursor) of the previous page
+            total_count_mode: Exact or planner-estimated total count (default: exact)
             status: Filter by customer status
             search: Search by name, email, or customer number
             include_activities: Whether to load activities (default: False for list view)
@@ -195,17 +202,18 @@ class CustomerQueries:
                 | (CustomerModel.company_name.ilike(search_term))
             )
 
-        # Get total count for pagination
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        count_result = await db.execute(count_stmt)
-        total_count = count_result.scalar() or 0
-
-        # Apply pagination and ordering
-        stmt = stmt.order_by(CustomerModel.created_at.desc()).limit(limit).offset(offset)
-
-        # Execute query
-        result = await db.execute(stmt)
-        customer_models = result.scalars().all()
+        # Fetch one page (keyset when a cursor is given)
+        page = await paginate(
+            db,
+            stmt,
+            [CustomerModel.created_at, CustomerModel.id],
+            limit=limit,
+            offset=offset,
+            after=after,
+            descending=True,
+            total_count_mode=total_count_mode,
+        )
+        customer_models = page.items
 
         # Convert to GraphQL types
         customers = [Customer.from_model(c) for c in customer_models]
@@ -232,11 +240,15 @@ class CustomerQueries:
 
         return CustomerConnection(
             customers=customers,
-            total_count=total_count,
-            has_next_page=(offset + limit) < total_count,
+            total_count=page.total_count,
+            has_next_page=page.has_next_page,
+            page_info=page.page_info,
         )
 
-    @strawberry.field(description="Get customer overview metrics")  # type: ignore[misc]
+    @strawberry.field(  # type: ignore[misc]
+        description="Get customer overview metrics",
+        extensions=[CachedResult(ttl_seconds=60)],
+    )
     async def customer_metrics(self, info: strawberry.Info[Context]) -> CustomerOverviewMetrics:
         """
         Get aggregated customer metrics.
@@ -21,10 +21,11 @@ from typing import Any
 from uuid import UUID
 
 import strawberry
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from strawberry.types import Info
 
+from dotmac.platform.fiber.analytics import get_network_rollup
 from dotmac.platform.fiber.models import (
     CableInstallationType as DBCableInstallationType,
 )
@@ -42,6 +43,9 @@ from dotmac.platform.fiber.models import (
     FiberHealthMetric as FiberHealthMetricModel,
 )
 from dotmac.platform.fiber.models import FiberHealthStatus as DBFiberHealthStatus
+from dotmac.platform.fiber.models import (
+    FiberNetworkRollup as FiberNetworkRollupModel,
+)
 from dotmac.platform.fiber.models import FiberType as DBFiberType
 from dotmac.platform.fiber.models import (
     OTDRTestResult as OTDRTestResultModel,
@@ -54,6 +58,9 @@ from dotmac.platform.fiber.models import (
     SplicePoint as SplicePointModel,
 )
 from dotmac.platform.fiber.models import SpliceStatus as DBSpliceStatus
+from dotmac.platform.graphql.field_cache import CachedResult
+from dotmac.platform.graphql.pagination import paginate
+from dotmac.platform.graphql.types.common import TotalCountMode
 from dotmac.platform.graphql.types.fiber import (
     CableInstallationType,
     CableRoute,
@@ -93,6 +100,8 @@ class FiberQueries:
         info: Info,
         limit: int = 50,
         offset: int = 0,
+        after: str | None = None,
+        total_count_mode: TotalCountMode = TotalCountMode.EXACT,
         status: FiberCableStatus | None = None,
         fiber_type: FiberType | None = None,
         installation_type: CableInstallationType | None = None,
@@ -105,6 +114,8 @@ class FiberQueries:
         Args:
             limit: Maximum number of results (default: 50)
             offset: Number of results to skip (default: 0)
+            after: Cursor (pageInfo.endCursor) of the previous page
+            total_count_mode: Exact or planner-estimated total count (default: exact)
             status: Filter by cable status
             fiber_type: Filter by fiber type (single-mode/multi-mode)
             installation_type: Filter by installation method
@@ -156,24 +167,26 @@ class FiberQueries:
                 )
             )
 
-        # Get total count
-        total_count_query = select(func.count()).select_from(query.subquery())
-        total_count = await db.scalar(total_count_query) or 0
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset).order_by(FiberCableModel.cable_id)
-
-        # Execute query
-        result = await db.execute(query)
-        cable_models = result.scalars().all()
+        # Fetch one page (keyset when a cursor is given)
+        page = await paginate(
+            db,
+            query,
+            [FiberCableModel.cable_id, FiberCableModel.id],
+            limit=limit,
+            offset=offset,
+            after=after,
+            total_count_mode=total_count_mode,
+        )
+        cable_models = page.items
 
         # Map to GraphQL types
         cables = [map_cable_model_to_graphql(cable) for cable in cable_models]
 
         return FiberCableConnection(
             cables=cables,
-            total_count=total_count,
-            has_next_page=(offset + limit) < total_count,
+            total_count=page.total_count,
+            has_next_page=page.has_next_page,
+            page_info=page.page_info,
         )
 
     @strawberry.field
@@ -308,6 +321,8 @@ class FiberQueries:
         info: Info,
         limit: int = 50,
         offset: int = 0,
+        after: str | None = None,
+        total_count_mode: TotalCountMode = TotalCountMode.EXACT,
         status: SpliceStatus | None = None,
         cable_id: str | None = None,
         distribution_point_id: str | None = None,
@@ -318,6 +333,8 @@ class FiberQueries:
         Args:
             limit: Maximum number of results (default: 50)
             offset: Number of results to skip (default: 0)
+            after: Cursor (pageInfo.endCursor) of the previous page
+            total_count_mode: Exact or planner-estimated total count (default: exact)
             status: Filter by splice status
             cable_id: Filter by cable ID
             distribution_point_id: Filter by distribution point
@@ -362,24 +379,26 @@ class FiberQueries:
                     DistributionPointModel.point_id == distribution_point_id
                 )
 
-        # Get total count
-        total_count_query = select(func.count()).select_from(query.subquery())
-        total_count = await db.scalar(total_count_query) or 0
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset).order_by(SplicePointModel.splice_id)
-
-        # Execute query
-        result = await db.execute(query)
-        splice_models = result.scalars().all()
+        # Fetch one page (keyset when a cursor is given)
+        page = await paginate(
+            db,
+            query,
+            [SplicePointModel.splice_id, SplicePointModel.id],
+            limit=limit,
+            offset=offset,
+            after=after,
+            total_count_mode=total_count_mode,
+        )
+        splice_models = page.items
 
         # Map to GraphQL types
         splice_points = [map_splice_point_model_to_graphql(splice) for splice in splice_models]
 
         return SplicePointConnection(
             splice_points=splice_points,
-            total_count=total_count,
-            has_next_page=(offset + limit) < total_count,
+            total_count=page.total_count,
+            has_next_page=page.has_next_page,
+            page_info=page.page_info,
         )
 
     @strawberry.field
@@ -485,6 +504,8 @@ class FiberQueries:
         info: Info,
         limit: int = 50,
         offset: int = 0,
+        after: str | None = None,
+        total_count_mode: TotalCountMode = TotalCountMode.EXACT,
         point_type: DistributionPointType | None = None,
         status: FiberCableStatus | None = None,
         site_id: str | None = None,
@@ -496,6 +517,8 @@ class FiberQueries:
         Args:
             limit: Maximum number of results (default: 50)
             offset: Number of results to skip (default: 0)
+            after: Cursor (pageInfo.endCursor) of the previous page
+            total_count_mode: Exact or planner-estimated total count (default: exact)
             point_type: Filter by distribution point type
             status: Filter by operational status
             site_id: Filter by site/area
@@ -540,24 +563,26 @@ class FiberQueries:
                 )
             )
 
-        # Get total count
-        total_count_query = select(func.count()).select_from(query.subquery())
-        total_count = await db.scalar(total_count_query) or 0
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset).order_by(DistributionPointModel.point_id)
-
-        # Execute query
-        result = await db.execute(query)
-        dp_models = result.scalars().all()
+        # Fetch one page (keyset when a cursor is given)
+        page = await paginate(
+            db,
+            query,
+            [DistributionPointModel.point_id, DistributionPointModel.id],
+            limit=limit,
+            offset=offset,
+            after=after,
+            total_count_mode=total_count_mode,
+        )
+        dp_models = page.items
 
         # Map to GraphQL types
         distribution_points = [map_distribution_point_model_to_graphql(dp) for dp in dp_models]
 
         return DistributionPointConnection(
             distribution_points=distribution_points,
-            total_count=total_count,
-            has_next_page=(offset + limit) < total_count,
+            total_count=page.total_count,
+            has_next_page=page.has_next_page,
+            page_info=page.page_info,
         )
 
     @strawberry.field
@@ -648,6 +673,8 @@ class FiberQueries:
         info: Info,
         limit: int = 50,
         offset: int = 0,
+        after: str | None = None,
+        total_count_mode: TotalCountMode = TotalCountMode.EXACT,
         area_type: ServiceAreaType | None = None,
         is_serviceable: bool | None = None,
         construction_status: str | None = None,
@@ -658,6 +685,8 @@ class FiberQueries:
         Args:
             limit: Maximum number of results (default: 50)
             offset: Number of results to skip (default: 0)
+            after: Cursor (pageInfo.endCursor) of the previous page
+            total_count_mode: Exact or planner-estimated total count (default: exact)
             area_type: Filter by area type (residential/commercial/etc)
             is_serviceable: Filter by serviceability status
             construction_status: Filter by construction phase
@@ -689,24 +718,26 @@ class FiberQueries:
         if construction_status:
             query = query.where(ServiceAreaModel.construction_status == construction_status)
 
-        # Get total count
-        total_count_query = select(func.count()).select_from(query.subquery())
-        total_count = await db.scalar(total_count_query) or 0
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset).order_by(ServiceAreaModel.name)
-
-        # Execute query
-        result = await db.execute(query)
-        area_models = result.scalars().all()
+        # Fetch one page (keyset when a cursor is given)
+        page = await paginate(
+            db,
+            query,
+            [ServiceAreaModel.name, ServiceAreaModel.id],
+            limit=limit,
+            offset=offset,
+            after=after,
+            total_count_mode=total_count_mode,
+        )
+        area_models = page.items
 
         # Map to GraphQL types
         service_areas = [map_service_area_model_to_graphql(area) for area in area_models]
 
         return ServiceAreaConnection(
             service_areas=service_areas,
-            total_count=total_count,
-            has_next_page=(offset + limit) < total_count,
+            total_count=page.total_count,
+            has_next_page=page.has_next_page,
+            page_info=page.page_info,
         )
 
     @strawberry.field
@@ -917,243 +948,10 @@ class FiberQueries:
         db: AsyncSession = info.context["db"]
         tenant_id = info.context["tenant_id"]
 
-        # Total fiber infrastructure counts
-        total_cables_query = (
-            select(func.count())
-            .select_from(FiberCableModel)
-            .where(FiberCableModel.tenant_id == tenant_id)
-        )
-        total_cables = await db.scalar(total_cables_query) or 0
-
-        total_strands_query = select(func.sum(FiberCableModel.fiber_count)).where(
-            FiberCableModel.tenant_id == tenant_id
-        )
-        total_strands = await db.scalar(total_strands_query) or 0
-
-        total_fiber_km_query = select(func.sum(FiberCableModel.length_km)).where(
-            FiberCableModel.tenant_id == tenant_id
-        )
-        total_fiber_km = await db.scalar(total_fiber_km_query) or 0.0
-
-        total_dps_query = (
-            select(func.count())
-            .select_from(DistributionPointModel)
-            .where(DistributionPointModel.tenant_id == tenant_id)
-        )
-        total_dps = await db.scalar(total_dps_query) or 0
-
-        total_splices_query = (
-            select(func.count())
-            .select_from(SplicePointModel)
-            .where(SplicePointModel.tenant_id == tenant_id)
-        )
-        total_splices = await db.scalar(total_splices_query) or 0
-
-        # Capacity metrics
-        total_capacity_query = select(func.sum(DistributionPointModel.total_ports)).where(
-            DistributionPointModel.tenant_id == tenant_id
-        )
-        total_capacity = await db.scalar(total_capacity_query) or 0
-
-        used_capacity_query = select(func.sum(DistributionPointModel.used_ports)).where(
-            DistributionPointModel.tenant_id == tenant_id
-        )
-        used_capacity = await db.scalar(used_capacity_query) or 0
-
-        available_capacity = max(0, total_capacity - used_capacity)
-        capacity_utilization = (
-            (used_capacity * 100.0 / total_capacity) if total_capacity > 0 else 0.0
-        )
-
-        # Health status counts
-        healthy_query = (
-            select(func.count())
-            .select_from(FiberCableModel)
-            .where(
-                and_(
-                    FiberCableModel.tenant_id == tenant_id,
-                    FiberCableModel.status == DBFiberCableStatus.ACTIVE,
-                )
-            )
-        )
-        healthy_cables = await db.scalar(healthy_query) or 0
-
-        degraded_query = (
-            select(func.count())
-            .select_from(FiberCableModel)
-            .where(
-                and_(
-                    FiberCableModel.tenant_id == tenant_id,
-                    FiberCableModel.status.in_(
-                        [DBFiberCableStatus.MAINTENANCE, DBFiberCableStatus.DAMAGED]
-                    ),
-                )
-            )
-        )
-        degraded_cables = await db.scalar(degraded_query) or 0
-
-        failed_query = (
-            select(func.count())
-            .select_from(FiberCableModel)
-            .where(
-                and_(
-                    FiberCableModel.tenant_id == tenant_id,
-                    FiberCableModel.status == DBFiberCableStatus.RETIRED,
-                )
-            )
-        )
-        failed_cables = await db.scalar(failed_query) or 0
-
-        # Network health score (simplified)
-        network_health_score = (healthy_cables * 100.0 / total_cables) if total_cables > 0 else 0.0
-
-        # Service area metrics
-        total_areas_query = (
-            select(func.count())
-            .select_from(ServiceAreaModel)
-            .where(ServiceAreaModel.tenant_id == tenant_id)
-        )
-        total_areas = await db.scalar(total_areas_query) or 0
-
-        active_areas_query = (
-            select(func.count())
-            .select_from(ServiceAreaModel)
-            .where(
-                and_(
-                    ServiceAreaModel.tenant_id == tenant_id,
-                    ServiceAreaModel.is_serviceable == True,  # noqa: E712
-                )
-            )
-        )
-        active_areas = await db.scalar(active_areas_query) or 0
-
-        homes_passed_query = select(func.sum(ServiceAreaModel.homes_passed)).where(
-            ServiceAreaModel.tenant_id == tenant_id
-        )
-        homes_passed = await db.scalar(homes_passed_query) or 0
-
-        homes_connected_query = select(func.sum(ServiceAreaModel.homes_connected)).where(
-            ServiceAreaModel.tenant_id == tenant_id
-        )
-        homes_connected = await db.scalar(homes_connected_query) or 0
-
-        penetration_rate = (homes_connected * 100.0 / homes_passed) if homes_passed > 0 else 0.0
-
-        # Average loss metrics
-        avg_attenuation_query = select(func.avg(FiberCableModel.attenuation_db_per_km)).where(
-            and_(
-                FiberCableModel.tenant_id == tenant_id,
-                FiberCableModel.attenuation_db_per_km.isnot(None),
-            )
-        )
-        avg_attenuation = await db.scalar(avg_attenuation_query) or 0.0
+        rollup = await get_network_rollup(db, tenant_id)
+        return map_network_rollup_to_graphql(rollup)
 
-        avg_splice_loss_query = select(func.avg(SplicePointModel.insertion_loss_db)).where(
-            and_(
-                SplicePointModel.tenant_id == tenant_id,
-                SplicePointModel.insertion_loss_db.isnot(None),
-            )
-        )
-        avg_splice_loss = await db.scalar(avg_splice_loss_query) or 0.0
-
-        # Cable status counts
-        active_cables_query = (
-            select(func.count())
-            .select_from(FiberCableModel)
-            .where(
-                and_(
-                    FiberCableModel.tenant_id == tenant_id,
-                    FiberCableModel.status == DBFiberCableStatus.ACTIVE,
-                )
-            )
-        )
-        cables_active = await db.scalar(active_cables_query) or 0
-
-        inactive_cables_query = (
-            select(func.count())
-            .select_from(FiberCableModel)
-            .where(
-                and_(
-                    FiberCableModel.tenant_id == tenant_id,
-                    FiberCableModel.status == DBFiberCableStatus.INACTIVE,
-                )
-            )
-        )
-        cables_inactive = await db.scalar(inactive_cables_query) or 0
-
-        construction_cables_query = (
-            select(func.count())
-            .select_from(FiberCableModel)
-            .where(
-                and_(
-                    FiberCableModel.tenant_id == tenant_id,
-                    FiberCableModel.status == DBFiberCableStatus.UNDER_CONSTRUCTION,
-                )
-            )
-        )
-        cables_under_construction = await db.scalar(construction_cables_query) or 0
-
-        maintenance_cables_query = (
-            select(func.count())
-            .select_from(FiberCableModel)
-            .where(
-                and_(
-                    FiberCableModel.tenant_id == tenant_id,
-                    FiberCableModel.status == DBFiberCableStatus.MAINTENANCE,
-                )
-            )
-        )
-        cables_maintenance = await db.scalar(maintenance_cables_query) or 0
-
-        # Query cables with high loss (attenuation > 0.5 dB/km)
-        high_loss_threshold = 0.5
-        high_loss_cables_query = select(FiberCableModel.cable_id).where(
-            and_(
-                FiberCableModel.tenant_id == tenant_id,
-                FiberCableModel.attenuation_db_per_km.isnot(None),
-                FiberCableModel.attenuation_db_per_km > high_loss_threshold,
-            )
-        )
-        result = await db.execute(high_loss_cables_query)
-        cables_with_high_loss = list(result.scalars().all())
-
-        distribution_points_near_capacity: list[str] = []
-        service_areas_needs_expansion: list[str] = []
-        cables_due_for_testing = 0
-
-        return FiberNetworkAnalytics(
-            total_fiber_km=float(total_fiber_km),
-            total_cables=total_cables,
-            total_strands=total_strands,
-            total_distribution_points=total_dps,
-            total_splice_points=total_splices,
-            total_capacity=total_capacity,
-            used_capacity=used_capacity,
-            available_capacity=available_capacity,
-            capacity_utilization_percent=float(capacity_utilization),
-            healthy_cables=healthy_cables,
-            degraded_cables=degraded_cables,
-            failed_cables=failed_cables,
-            network_health_score=float(network_health_score),
-            total_service_areas=total_areas,
-            active_service_areas=active_areas,
-            homes_passed=homes_passed,
-            homes_connected=homes_connected,
-            penetration_rate_percent=float(penetration_rate),
-            average_cable_loss_db_per_km=float(avg_attenuation),
-            average_splice_loss_db=float(avg_splice_loss),
-            cables_due_for_testing=cables_due_for_testing,
-            cables_active=cables_active,
-            cables_inactive=cables_inactive,
-            cables_under_construction=cables_under_construction,
-            cables_maintenance=cables_maintenance,
-            cables_with_high_loss=cables_with_high_loss,
-            distribution_points_near_capacity=distribution_points_near_capacity,
-            service_areas_needs_expansion=service_areas_needs_expansion,
-            generated_at=datetime.utcnow(),
-        )
-
-    @strawberry.field
+    @strawberry.field(extensions=[CachedResult(ttl_seconds=60)])
     async def fiber_dashboard(
         self,
         info: Info,
@@ -1581,6 +1379,55 @@ def map_otdr_test_model_to_graphql(
     )
 
 
+def map_network_rollup_to_graphql(
+    rollup: FiberNetworkRollupModel,
+) -> FiberNetworkAnalytics:
+    """Map a database FiberNetworkRollup to GraphQL network analytics."""
+    total_cables = rollup.total_cables or 0
+    total_capacity = rollup.total_capacity or 0
+    used_capacity = rollup.used_capacity or 0
+    homes_passed = rollup.homes_passed or 0
+    homes_connected = rollup.homes_connected or 0
+
+    return FiberNetworkAnalytics(
+        total_fiber_km=float(rollup.total_fiber_km or 0.0),
+        total_cables=total_cables,
+        total_strands=rollup.total_strands or 0,
+        total_distribution_points=rollup.total_distribution_points or 0,
+        total_splice_points=rollup.total_splice_points or 0,
+        total_capacity=total_capacity,
+        used_capacity=used_capacity,
+        available_capacity=max(0, total_capacity - used_capacity),
+        capacity_utilization_percent=(
+            (used_capacity * 100.0 / total_capacity) if total_capacity > 0 else 0.0
+        ),
+        healthy_cables=rollup.cables_active or 0,
+        degraded_cables=(rollup.cables_maintenance or 0) + (rollup.cables_damaged or 0),
+        failed_cables=rollup.cables_retired or 0,
+        network_health_score=(
+            ((rollup.cables_active or 0) * 100.0 / total_cables) if total_cables > 0 else 0.0
+        ),
+        total_service_areas=rollup.total_service_areas or 0,
+        active_service_areas=rollup.active_service_areas or 0,
+        homes_passed=homes_passed,
+        homes_connected=homes_connected,
+        penetration_rate_percent=(
+            (homes_connected * 100.0 / homes_passed) if homes_passed > 0 else 0.0
+        ),
+        average_cable_loss_db_per_km=float(rollup.average_cable_loss_db_per_km or 0.0),
+        average_splice_loss_db=float(rollup.average_splice_loss_db or 0.0),
+        cables_due_for_testing=0,
+        cables_active=rollup.cables_active or 0,
+        cables_inactive=rollup.cables_inactive or 0,
+        cables_under_construction=rollup.cables_under_construction or 0,
+        cables_maintenance=rollup.cables_maintenance or 0,
+        cables_with_high_loss=list(rollup.cables_with_high_loss or []),
+        distribution_points_near_capacity=[],
+        service_areas_needs_expansion=[],
+        generated_at=rollup.refreshed_at,
+    )
+
+
 # ============================================================================
 # Enum Mapping Functions
 # ============================================================================
@@ -25,6 +25,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from strawberry.types import Info
 
+from dotmac.platform.graphql.field_cache import CachedResult
+from dotmac.platform.graphql.pagination import paginate
+from dotmac.platform.graphql.types.common import TotalCountMode
 from dotmac.platform.graphql.types.wireless import (
     AccessPoint,
     AccessPointConnection,
@@ -105,6 +108,8 @@ class WirelessQueries:
         info: Info,
         limit: int = 50,
         offset: int = 0,
+        after: str | None = None,
+        total_count_mode: TotalCountMode = TotalCountMode.EXACT,
         site_id: str | None = None,
         status: AccessPointStatus | None = None,
         frequency_band: FrequencyBand | None = None,
@@ -116,6 +121,8 @@ class WirelessQueries:
         Args:
             limit: Maximum number of results (default: 50)
             offset: Number of results to skip (default: 0)
+            after: Cursor (pageInfo.endCursor) of the previous page
+            total_count_mode: Exact or planner-estimated total count (default: exact)
             site_id: Filter by site ID
             status: Filter by operational status
             frequency_band: Filter by frequency band
@@ -172,24 +179,26 @@ class WirelessQueries:
                 )
             )
 
-        # Get total count
-        total_count_query = select(func.count()).select_from(query.subquery())
-        total_count = await db.scalar(total_count_query) or 0
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset).order_by(WirelessDevice.name)
-
-        # Execute query
-        result = await db.execute(query)
-        device_models = result.scalars().all()
+        # Fetch one page (keyset when a cursor is given)
+        page = await paginate(
+            db,
+            query,
+            [WirelessDevice.name, WirelessDevice.id],
+            limit=limit,
+            offset=offset,
+            after=after,
+            total_count_mode=total_count_mode,
+        )
+        device_models = page.items
 
         # Map to GraphQL types
         access_points = [map_device_to_access_point(device) for device in device_models]
 
         return AccessPointConnection(
             access_points=access_points,
-            total_count=total_count,
-            has_next_page=(offset + limit) < total_count,
+            total_count=page.total_count,
+            has_next_page=page.has_next_page,
+            page_info=page.page_info,
         )
 
     @strawberry.field
@@ -511,6 +520,8 @@ class WirelessQueries:
         info: Info,
         limit: int = 50,
         offset: int = 0,
+        after: str | None = None,
+        total_count_mode: TotalCountMode = TotalCountMode.EXACT,
         site_id: str | None = None,
         area_type: str | None = None,
     ) -> CoverageZoneConnection:
@@ -520,6 +531,8 @@ class WirelessQueries:
         Args:
             limit: Maximum number of results (default: 50)
             offset: Number of results to skip (default: 0)
+            after: Cursor (pageInfo.endCursor) of the previous page
+            total_count_mode: Exact or planner-estimated total count (default: exact)
             site_id: Filter by site ID
             area_type: Filter by area type (indoor/outdoor/mixed)
 
@@ -537,24 +550,26 @@ class WirelessQueries:
             # Join with device to filter by site
             query = query.join(WirelessDevice).where(WirelessDevice.site_name == site_id)
 
-        # Get total count
-        total_count_query = select(func.count()).select_from(query.subquery())
-        total_count = await db.scalar(total_count_query) or 0
-
-        # Apply pagination
-        query = query.limit(limit).offset(offset).order_by(CoverageZoneModel.zone_name)
-
-        # Execute query
-        result = await db.execute(query)
-        zone_models = result.scalars().all()
+        # Fetch one page (keyset when a cursor is given)
+        page = await paginate(
+            db,
+            query,
+            [CoverageZoneModel.zone_name, CoverageZoneModel.id],
+            limit=limit,
+            offset=offset,
+            after=after,
+            total_count_mode=total_count_mode,
+        )
+        zone_models = page.items
 
         # Map to GraphQL types
         zones = [map_coverage_zone_model_to_graphql(zone) for zone in zone_models]
 
         return CoverageZoneConnection(
             zones=zones,
-            total_count=total_count,
-            has_next_page=(offset + limit) < total_count,
+            total_count=page.total_count,
+            has_next_page=page.has_next_page,
+            page_info=page.page_info,
         )
 
     @strawberry.field
@@ -1011,7 +1026,7 @@ class WirelessQueries:
             client_experience_score=health_score,
         )
 
-    @strawberry.field
+    @strawberry.field(extensions=[CachedResult(ttl_seconds=60)])
     async def wireless_dashboard(
         self,
         info: Info,
@@ -6,7 +6,9 @@ Combines all GraphQL queries and mutations into a single schema.
 
 import strawberry
 
+from dotmac.platform.graphql.extensions import DocumentCache, QueryCostLimiter
 from dotmac.platform.graphql.mutations.orchestration import OrchestrationMutations
+from dotmac.platform.graphql.persisted_queries import PersistedQueries
 from dotmac.platform.graphql.queries.analytics import AnalyticsQueries
 from dotmac.platform.graphql.queries.customer import CustomerQueries
 from dotmac.platform.graphql.queries.fiber import FiberQueries
@@ -140,4 +142,6 @@ schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
     subscription=RealtimeSubscription,
+    # Classes rather than instances: each operation gets its own extension state
+    extensions=[PersistedQueries, DocumentCache, QueryCostLimiter],
 )
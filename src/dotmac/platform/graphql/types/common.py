@@ -19,3 +19,21 @@ class BillingCycleEnum(str, Enum):
     YEARLY = "yearly"
     ANNUAL = "annual"  # Alias for yearly (used by subscriptions)
     CUSTOM = "custom"
+
+
+@strawberry.enum
+class TotalCountMode(str, Enum):
+    """How list queries compute ``totalCount``."""
+
+    EXACT = "exact"  # COUNT(*) over the filtered query
+    ESTIMATED = "estimated"  # Query planner row estimate (PostgreSQL), exact when small
+
+
+@strawberry.type
+class PageInfo:
+    """Relay-style cursors for a page of results."""
+
+    has_next_page: bool = False
+    has_previous_page: bool = False
+    start_cursor: str | None = None
+    end_cursor: str | None = None
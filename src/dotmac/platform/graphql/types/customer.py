@@ -12,6 +12,8 @@ from typing import Any
 
 import strawberry
 
+from dotmac.platform.graphql.types.common import PageInfo
+
 
 @strawberry.enum
 class CustomerStatusEnum(str, Enum):
@@ -243,6 +245,7 @@ class CustomerConnection:
     customers: list[Customer]
     total_count: int
     has_next_page: bool
+    page_info: PageInfo = strawberry.field(default_factory=PageInfo)
 
 
 @strawberry.type
@@ -16,6 +16,8 @@ from enum import Enum
 
 import strawberry
 
+from dotmac.platform.graphql.types.common import PageInfo
+
 # ============================================================================
 # Enums
 # ============================================================================
@@ -648,6 +650,7 @@ class FiberCableConnection:
     cables: list[FiberCable]
     total_count: int
     has_next_page: bool
+    page_info: PageInfo = strawberry.field(default_factory=PageInfo)
 
 
 @strawberry.type
@@ -657,6 +660,7 @@ class SplicePointConnection:
     splice_points: list[SplicePoint]
     total_count: int
     has_next_page: bool
+    page_info: PageInfo = strawberry.field(default_factory=PageInfo)
 
 
 @strawberry.type
@@ -666,6 +670,7 @@ class DistributionPointConnection:
     distribution_points: list[DistributionPoint]
     total_count: int
     has_next_page: bool
+    page_info: PageInfo = strawberry.field(default_factory=PageInfo)
 
 
 @strawberry.type
@@ -675,3 +680,4 @@ class ServiceAreaConnection:
     service_areas: list[ServiceArea]
     total_count: int
     has_next_page: bool
+    page_info: PageInfo = strawberry.field(default_factory=PageInfo)
@@ -16,6 +16,8 @@ from enum import Enum
 
 import strawberry
 
+from dotmac.platform.graphql.types.common import PageInfo
+
 # ============================================================================
 # Enums
 # ============================================================================
@@ -495,6 +497,7 @@ class AccessPointConnection:
     access_points: list[AccessPoint]
     total_count: int
     has_next_page: bool
+    page_info: PageInfo = strawberry.field(default_factory=PageInfo)
 
 
 @strawberry.type
@@ -513,3 +516,4 @@ class CoverageZoneConnection:
     zones: list[CoverageZone]
     total_count: int
     has_next_page: bool
+    page_info: PageInfo = strawberry.field(default_factory=PageInfo)
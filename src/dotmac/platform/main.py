@@ -58,6 +58,7 @@ from dotmac.platform.monitoring.error_middleware import (
 )
 from dotmac.platform.monitoring.health_checks import HealthChecker, ensure_infrastructure_running
 from dotmac.platform.platform_app import platform_app
+from dotmac.platform.realtime.connection_manager import connection_manager
 from dotmac.platform.redis_client import init_redis, redis_manager, shutdown_redis
 
 # API info for documentation
@@ -68,6 +69,7 @@ from dotmac.platform.telemetry import setup_telemetry
 from dotmac.platform.tenant import TenantMiddleware
 from dotmac.platform.tenant_app import tenant_app
 from dotmac.platform.timeseries import init_timescaledb, shutdown_timescaledb
+from dotmac.platform.webhooks.worker import start_delivery_worker, stop_delivery_worker
 
 
 def rate_limit_handler(request: Request, exc: Exception) -> Response:
@@ -279,6 +281,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     except Exception as e:
         logger.warning("auth.default_admin.failed", error=str(e), emoji="⚠️")
 
+    # Start webhook delivery worker (drains deliveries queued by EventBus.publish)
+    try:
+        if start_delivery_worker() is not None:
+            logger.info("webhooks.delivery_worker.started", emoji="✅")
+    except Exception as e:
+        logger.warning("webhooks.delivery_worker.failed", error=str(e), emoji="⚠️")
+
     logger.info("service.startup.complete", healthy=all_healthy, emoji="🎉")
     print("Startup complete")
 
@@ -288,6 +297,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     logger.info("service.shutdown.begin", emoji="👋")
     print("Shutting down")
 
+    # Stop webhook delivery worker before its database and Redis go away
+    try:
+        await stop_delivery_worker()
+    except Exception as e:
+        logger.error("webhooks.delivery_worker.shutdown_failed", error=str(e), emoji="❌")
+
+    # Stop the WebSocket broadcast relay and per-socket senders
+    try:
+        await connection_manager.close()
+    except Exception as e:
+        logger.error("realtime.connection_manager.shutdown_failed", error=str(e), emoji="❌")
+
     # Cleanup Redis connections
     try:
         await shutdown_redis()
@@ -48,7 +48,13 @@ class SubscriberNetworkProfileService:
         *,
         commit: bool = False,
     ) -> NetworkProfileResponse:
-        """Create or update a network profile for a subscriber."""
+        """
+        Create or update a network profile for a subscriber.
+
+        With ``commit=False`` the change is only flushed; callers must commit
+        and then call ``invalidate_radius_authorization(subscriber_id)`` so a
+        concurrent Access-Request cannot re-cache the old Option 82 fields.
+        """
 
         payload = data.model_dump(exclude_unset=True, by_alias=False)
 
@@ -90,6 +96,7 @@ class SubscriberNetworkProfileService:
 
         if commit:
             await self.session.commit()
+            await self.invalidate_radius_authorization(subscriber_id)
 
         logger.info(
             "subscriber_network_profile_updated",
@@ -102,7 +109,7 @@ class SubscriberNetworkProfileService:
         return NetworkProfileResponse.model_validate(instance)
 
     async def delete_profile(self, subscriber_id: str, *, commit: bool = False) -> bool:
-        """Soft-delete a profile."""
+        """Soft-delete a profile (see ``upsert_profile`` for ``commit=False``)."""
         profile = await self.get_profile(subscriber_id)
         if not profile:
             return False
@@ -110,8 +117,23 @@ class SubscriberNetworkProfileService:
         await self.session.delete(profile)
         if commit:
             await self.session.commit()
+            await self.invalidate_radius_authorization(subscriber_id)
         return True
 
+    async def invalidate_radius_authorization(self, subscriber_id: str) -> None:
+        """Drop cached RADIUS authorization data carrying this profile's Option 82 fields."""
+        from dotmac.platform.radius.auth_cache import get_authorization_cache
+        from dotmac.platform.radius.repository import RADIUSRepository
+
+        cache = get_authorization_cache()
+        if cache is None:
+            return
+        radcheck = await RADIUSRepository(self.session).get_radcheck_by_subscriber(
+            self.tenant_id, subscriber_id
+        )
+        if radcheck:
+            await cache.invalidate(self.tenant_id, str(radcheck.username))
+
     async def list_profiles(self) -> Sequence[SubscriberNetworkProfile]:
         """Return all profiles for the tenant (admin tooling)."""
         stmt = select(SubscriberNetworkProfile).where(
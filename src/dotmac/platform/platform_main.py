@@ -32,9 +32,11 @@ from dotmac.platform.monitoring.error_middleware import (
     RequestMetricsMiddleware,
 )
 from dotmac.platform.monitoring.health_checks import HealthChecker
+from dotmac.platform.realtime.connection_manager import connection_manager
 from dotmac.platform.redis_client import init_redis, shutdown_redis
 from dotmac.platform.settings import settings
 from dotmac.platform.telemetry import setup_telemetry
+from dotmac.platform.webhooks.worker import start_delivery_worker, stop_delivery_worker
 from dotmac.shared.routers import ServiceScope, register_routers_for_scope
 
 logger = structlog.get_logger(__name__)
@@ -58,11 +60,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     # Setup telemetry
     setup_telemetry(app)
 
+    start_delivery_worker()
+
     logger.info("platform_service.started")
     yield
 
     # Cleanup
     logger.info("platform_service.stopping")
+    await stop_delivery_worker()
+    await connection_manager.close()
     await shutdown_redis()
     logger.info("platform_service.stopped")
 
@@ -0,0 +1,194 @@
+"""
+RADIUS Authorization Cache.
+
+Process-wide cache of everything ``RADIUSService.authorize_subscriber`` needs
+per username (radcheck password hash, radreply attributes and the Option 82
+fields of the network profile), so Access-Request storms after an outage are
+answered from memory instead of several Postgres queries per request.
+
+Entries are dropped whenever RADIUSService changes a subscriber, and the drop
+is broadcast to other workers over Redis pub/sub. Unknown usernames are cached
+too (as ``None``) so floods of bad usernames do not reach the database.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import structlog
+
+from dotmac.platform.cache.local import LocalCache, LocalCacheInvalidator
+
+logger = structlog.get_logger(__name__)
+
+RADIUS_AUTHZ_INVALIDATION_CHANNEL = "radius:authz:invalidate"
+
+_authorization_cache: "AuthorizationCache | None" = None
+
+
+@dataclass(frozen=True, slots=True)
+class Option82Profile:
+    """Option 82 expectations taken from a subscriber network profile."""
+
+    policy: str
+    circuit_id: str | None
+    remote_id: str | None
+
+    @classmethod
+    def from_model(cls, profile: Any) -> "Option82Profile":
+        """Build from a ``SubscriberNetworkProfile`` row."""
+        return cls(
+            policy=profile.option82_policy.value if profile.option82_policy else "log",
+            circuit_id=profile.circuit_id,
+            remote_id=profile.remote_id,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AuthorizationSnapshot:
+    """Immutable authorization data for one RADIUS username."""
+
+    username: str
+    subscriber_id: str | None
+    password_hash: str
+    reply_attributes: tuple[tuple[str, str], ...]
+    network_profile: Option82Profile | None
+
+    @classmethod
+    def build(
+        cls,
+        radcheck: Any,
+        radreplies: Iterable[Any],
+        network_profile: Any | None = None,
+    ) -> "AuthorizationSnapshot":
+        """Build from radcheck/radreply rows and an optional network profile row."""
+        return cls(
+            username=radcheck.username,
+            subscriber_id=radcheck.subscriber_id,
+            password_hash=radcheck.value,
+            # Later rows win, matching the previous dict comprehension
+            reply_attributes=tuple({reply.attribute: reply.value for reply in radreplies}.items()),
+            network_profile=(
+                Option82Profile.from_model(network_profile) if network_profile else None
+            ),
+        )
+
+
+class AuthorizationCache:
+    """
+    Bounded LRU/TTL cache of ``AuthorizationSnapshot`` keyed by tenant and username.
+
+    When Redis is available, reads bypass the cache until the invalidation
+    listener is subscribed, since other workers' changes would otherwise go
+    unnoticed until the TTL expires.
+    """
+
+    MISSING = LocalCache.MISSING
+
+    def __init__(
+        self,
+        max_entries: int = 100_000,
+        ttl_seconds: float = 300.0,
+        channel: str = RADIUS_AUTHZ_INVALIDATION_CHANNEL,
+    ) -> None:
+        self.local_cache = LocalCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._invalidator = LocalCacheInvalidator(self.local_cache, channel=channel)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(tenant_id: str, username: str) -> str:
+        return f"{tenant_id}:{username}"
+
+    @staticmethod
+    def _get_redis() -> Any:
+        from dotmac.platform.redis_client import redis_manager
+
+        try:
+            return redis_manager.get_client()
+        except RuntimeError:
+            # Redis not initialized (single process, scripts, tests)
+            return None
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter; pass it back to ``set`` to detect racing invalidations."""
+        return self.local_cache.generation
+
+    def is_ready(self) -> bool:
+        """Check whether reads may be served, starting the listener on demand."""
+        redis = self._get_redis()
+        if redis is None:
+            return True
+        if not self._invalidator.is_listening:
+            self._invalidator.start(redis)
+            return False
+        return True
+
+    def get(self, tenant_id: str, username: str) -> AuthorizationSnapshot | None | object:
+        """Return the snapshot, ``None`` for a known-unknown user, or ``MISSING``."""
+        value = self.local_cache.get(self._key(tenant_id, username))
+        if value is LocalCache.MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(
+        self,
+        tenant_id: str,
+        username: str,
+        snapshot: AuthorizationSnapshot | None,
+        generation: int | None = None,
+    ) -> None:
+        """Store a snapshot (``None`` caches an unknown username)."""
+        self.local_cache.set(self._key(tenant_id, username), snapshot, generation=generation)
+
+    async def invalidate(self, tenant_id: str, *usernames: str) -> None:
+        """Drop entries for usernames here and on every other worker."""
+        keys = [self._key(tenant_id, username) for username in usernames if username]
+        if not keys:
+            return
+        self.local_cache.delete(*keys)
+        redis = self._get_redis()
+        if redis is not None:
+            await self._invalidator.publish(redis, "keys", keys)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters and size."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.local_cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.local_cache.evictions,
+            "listening": self._invalidator.is_listening,
+        }
+
+    async def close(self) -> None:
+        """Stop the invalidation listener."""
+        await self._invalidator.stop()
+
+
+def get_authorization_cache() -> AuthorizationCache | None:
+    """Get the process-wide authorization cache, or None when disabled."""
+    global _authorization_cache
+
+    from dotmac.platform.settings import settings
+
+    if not settings.radius.authz_cache_enabled:
+        return None
+
+    if _authorization_cache is None:
+        _authorization_cache = AuthorizationCache(
+            max_entries=settings.radius.authz_cache_max_entries,
+            ttl_seconds=settings.radius.authz_cache_ttl_seconds,
+        )
+    return _authorization_cache
+
+
+def reset_authorization_cache() -> None:
+    """Reset the process-wide authorization cache (useful for testing)."""
+    global _authorization_cache
+    _authorization_cache = None
@@ -6,6 +6,8 @@ for dynamic session control.
 
 This module provides functionality to send CoA/DM packets to RADIUS servers
 to disconnect sessions, update bandwidth limits, or change service policies.
+Packets are encoded with pyrad and sent over the shared asyncio transport in
+``coa_transport``, which multiplexes requests per NAS and handles retransmits.
 
 Configuration:
 - Uses dotmac.platform.settings for RADIUS server configuration
@@ -26,9 +28,10 @@ from typing import Any
 import httpx
 import pyrad.packet as radius_packet
 import structlog
-from pyrad.client import Client, Timeout
+from pyrad.client import Client
 from pyrad.dictionary import Dictionary
 
+from dotmac.platform.radius.coa_transport import CoATransport, get_coa_transport
 from dotmac.platform.settings import settings
 
 logger = structlog.get_logger(__name__)
@@ -91,6 +94,8 @@ class CoAClient:
         timeout: int | None = None,
         dictionary_paths: Iterable[str] | None = None,
         tenant_id: str | None = None,
+        max_retries: int | None = None,
+        transport: CoATransport | None = None,
     ):
         """
         Initialize CoA client.
@@ -105,12 +110,16 @@ class CoAClient:
             timeout: Request timeout in seconds (default: from settings)
             dictionary_paths: RADIUS dictionary files (default: from settings)
             tenant_id: Tenant ID for multi-tenant Vault secret lookup
+            max_retries: Retransmissions per request (default: from settings)
+            transport: UDP transport (default: the process-wide shared transport)
         """
         # Load configuration from settings if not explicitly provided
         self.radius_server = radius_server or settings.radius.server_host
         self.coa_port = coa_port or settings.radius.coa_port
         self.timeout = timeout or settings.radius.timeout_seconds
+        self.max_retries = settings.radius.max_retries if max_retries is None else max_retries
         self.tenant_id = tenant_id
+        self._transport = transport
 
         # Fetch shared secret from Vault or settings
         if radius_secret is None:
@@ -217,6 +226,18 @@ class CoAClient:
             return Dictionary(*self._dictionary_paths)
         return _load_default_dictionary()
 
+    @property
+    def transport(self) -> CoATransport:
+        """Return the UDP transport used to send packets."""
+        if self._transport is None:
+            self._transport = get_coa_transport()
+        return self._transport
+
+    @cached_property
+    def _client(self) -> Client:
+        """pyrad client used to build packets; reused across operations."""
+        return self._create_client()
+
     def _create_client(self) -> Client:
         """Instantiate a pyrad client configured for CoA operations."""
         client = Client(
@@ -245,7 +266,7 @@ class CoAClient:
         Returns:
             Dictionary with result status and structured response details.
         """
-        client = self._create_client()
+        client = self._client
 
         try:
             packet = client.CreateCoAPacket(code=self._disconnect_request_code)
@@ -257,7 +278,7 @@ class CoAClient:
             if session_id:
                 packet["Acct-Session-Id"] = session_id
 
-            response = await self._send_packet(client, packet)
+            response = await self._send_packet(packet)
         except (ValueError, RADIUSCoAError) as exc:
             logger.error(
                 "radius_disconnect_failed",
@@ -334,7 +355,7 @@ class CoAClient:
         Returns:
             Dictionary with result status and structured response details.
         """
-        client = self._create_client()
+        client = self._client
 
         try:
             # Validate IPv6 prefix format
@@ -358,7 +379,7 @@ class CoAClient:
             if session_id:
                 packet["Acct-Session-Id"] = session_id
 
-            response = await self._send_packet(client, packet)
+            response = await self._send_packet(packet)
         except (ValueError, RADIUSCoAError) as exc:
             logger.error(
                 "radius_coa_ipv6_failed",
@@ -436,7 +457,7 @@ class CoAClient:
         from dotmac.platform.radius.vendors import get_coa_strategy
         from dotmac.platform.settings import settings
 
-        client = self._create_client()
+        client = self._client
 
         try:
             if download_kbps <= 0 or upload_kbps <= 0:
@@ -479,7 +500,7 @@ class CoAClient:
                 else:
                     packet[attr_name] = attr_value
 
-            response = await self._send_packet(client, packet)
+            response = await self._send_packet(packet)
         except (ValueError, RADIUSCoAError) as exc:
             logger.error(
                 "radius_coa_bandwidth_failed",
@@ -535,17 +556,76 @@ class CoAClient:
             "details": response.to_dict(),
         }
 
-    async def _send_packet(self, client: Client, packet: Any) -> RadiusResponse:
+    async def _send_packet(self, packet: Any) -> RadiusResponse:
         """Send a CoA packet and return a structured response."""
         try:
-            reply = await asyncio.to_thread(client.SendPacket, packet)
-        except Timeout as exc:
+            reply = await self.transport.send(
+                packet,
+                self.radius_server,
+                self.coa_port,
+                timeout=self.timeout,
+                retries=self.max_retries,
+            )
+        except TimeoutError as exc:
             raise RADIUSTimeoutError("RADIUS server did not respond to CoA request") from exc
         except Exception as exc:
             raise RADIUSCoAError("Failed to send CoA packet") from exc
 
         return self._parse_response(reply)
 
+    async def change_bandwidth_many(
+        self,
+        changes: Iterable[Mapping[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """
+        Send bandwidth CoA requests concurrently.
+
+        Each item takes the keyword arguments of ``change_bandwidth``. Requests
+        share the per-NAS transport, so concurrency is bounded by
+        ``settings.radius.coa_max_in_flight_per_nas`` rather than by the batch.
+
+        Args:
+            changes: Iterable of ``change_bandwidth`` keyword argument mappings
+
+        Returns:
+            One result dictionary per item, in input order.
+        """
+        items = [dict(change) for change in changes]
+        results = await asyncio.gather(
+            *(self.change_bandwidth(**item) for item in items),
+            return_exceptions=True,
+        )
+
+        output: list[dict[str, Any]] = []
+        for item, result in zip(items, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.error(
+                    "radius_coa_bandwidth_failed",
+                    username=item.get("username"),
+                    error=str(result),
+                )
+                output.append(
+                    {
+                        "success": False,
+                        "message": f"Failed to send CoA request: {result}",
+                        "username": item.get("username"),
+                        "download_kbps": item.get("download_kbps"),
+                        "upload_kbps": item.get("upload_kbps"),
+                        "error": str(result),
+                    }
+                )
+            else:
+                output.append(result)
+
+        logger.info(
+            "radius_coa_bandwidth_batch_sent",
+            total=len(output),
+            succeeded=sum(1 for result in output if result["success"]),
+        )
+        return output
+
     def _parse_response(self, reply: Any) -> RadiusResponse:
         """Convert pyrad reply packet into structured data."""
         attributes: dict[str, list[Any]] = {}
@@ -0,0 +1,219 @@
+"""
+Asyncio UDP transport for RADIUS CoA/DM requests.
+
+pyrad's ``Client.SendPacket`` is blocking and opens a socket per client, so
+every CoA used to cost a worker thread and a fresh socket. This module keeps
+one connected datagram endpoint per NAS (host, port) and per event loop,
+multiplexes in-flight requests over the 8-bit RADIUS identifier, retransmits
+on a timer and bounds the number of outstanding requests per NAS.
+
+pyrad is still used for packet encoding and reply verification; only the
+socket handling lives here.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# RADIUS identifiers are a single octet
+_IDENTIFIER_SPACE = 256
+
+
+@dataclass(slots=True)
+class _PendingRequest:
+    packet: Any
+    future: asyncio.Future[Any]
+
+
+@dataclass(eq=False)
+class _NasEndpoint(asyncio.DatagramProtocol):
+    """Connected UDP endpoint for a single NAS."""
+
+    host: str
+    port: int
+    max_in_flight: int
+    loop: asyncio.AbstractEventLoop
+    transport: asyncio.DatagramTransport | None = None
+    pending: dict[int, _PendingRequest] = field(default_factory=dict)
+    next_identifier: int = 0
+    slots: asyncio.Semaphore = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.slots = asyncio.Semaphore(min(self.max_in_flight, _IDENTIFIER_SPACE))
+
+    @property
+    def is_open(self) -> bool:
+        return (
+            self.transport is not None
+            and not self.transport.is_closing()
+            and not self.loop.is_closed()
+        )
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        if len(data) < 20:
+            return
+
+        request = self.pending.get(data[1])
+        if request is None or request.future.done():
+            # Late reply to a request that already timed out, or a stray packet
+            return
+
+        try:
+            reply = request.packet.CreateReply(packet=data)
+            verified = request.packet.VerifyReply(reply, data)
+        except Exception:  # pyrad raises PacketError and assorted decode errors
+            logger.warning("radius_coa_reply_malformed", host=self.host, port=self.port)
+            return
+
+        if not verified:
+            logger.warning(
+                "radius_coa_reply_unverified",
+                host=self.host,
+                port=self.port,
+                identifier=data[1],
+            )
+            return
+
+        request.future.set_result(reply)
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP errors surface here; requests keep retransmitting until they time out
+        logger.debug("radius_coa_socket_error", host=self.host, port=self.port, error=str(exc))
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        for request in self.pending.values():
+            if not request.future.done():
+                request.future.set_exception(ConnectionError("CoA endpoint closed"))
+        self.pending.clear()
+
+    def allocate_identifier(self) -> int:
+        # The semaphore caps in-flight requests at 256, so a free slot always exists
+        for _ in range(_IDENTIFIER_SPACE):
+            identifier = self.next_identifier
+            self.next_identifier = (identifier + 1) % _IDENTIFIER_SPACE
+            if identifier not in self.pending:
+                return identifier
+        raise RuntimeError("No free RADIUS identifier")
+
+    def close(self) -> None:
+        if self.transport is not None and not self.loop.is_closed():
+            self.transport.close()
+
+
+class CoATransport:
+    """
+    Shared asyncio transport for CoA/DM packets.
+
+    Endpoints are created lazily per (host, port) and per event loop, so a
+    single transport can be shared by every ``CoAClient`` in the process,
+    including Celery tasks that run each job on a fresh loop.
+    """
+
+    def __init__(self, max_in_flight_per_nas: int = 32):
+        self.max_in_flight_per_nas = max_in_flight_per_nas
+        self._endpoints: dict[tuple[str, int], _NasEndpoint] = {}
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+
+    async def send(
+        self,
+        packet: Any,
+        host: str,
+        port: int,
+        *,
+        timeout: float,
+        retries: int = 0,
+    ) -> Any:
+        """
+        Send a pyrad request packet and wait for its verified reply.
+
+        The packet is encoded once and the same bytes are retransmitted
+        ``retries`` times, ``timeout`` seconds apart, so the NAS can detect
+        duplicates. Raises ``TimeoutError`` when no valid reply arrives.
+        """
+        endpoint = await self._get_endpoint(host, port)
+
+        async with endpoint.slots:
+            identifier = endpoint.allocate_identifier()
+            packet.id = identifier
+            raw = packet.RequestPacket()
+            request = _PendingRequest(packet=packet, future=endpoint.loop.create_future())
+            endpoint.pending[identifier] = request
+
+            try:
+                for attempt in range(retries + 1):
+                    if not endpoint.is_open:
+                        raise ConnectionError("CoA endpoint closed")
+                    endpoint.transport.sendto(raw)  # type: ignore[union-attr]
+                    try:
+                        return await asyncio.wait_for(asyncio.shield(request.future), timeout)
+                    except TimeoutError:
+                        logger.debug(
+                            "radius_coa_retransmit",
+                            host=host,
+                            port=port,
+                            identifier=identifier,
+                            attempt=attempt + 1,
+                        )
+                raise TimeoutError(f"No CoA reply from {host}:{port}")
+            finally:
+                endpoint.pending.pop(identifier, None)
+                if not request.future.done():
+                    request.future.cancel()
+
+    async def close(self) -> None:
+        """Close every endpoint owned by this transport."""
+        endpoints = list(self._endpoints.values())
+        self._endpoints.clear()
+        for endpoint in endpoints:
+            endpoint.close()
+
+    async def _get_endpoint(self, host: str, port: int) -> _NasEndpoint:
+        loop = asyncio.get_running_loop()
+        endpoint = self._endpoints.get((host, port))
+        if endpoint is not None and endpoint.loop is loop and endpoint.is_open:
+            return endpoint
+
+        async with self._loop_lock(loop):
+            endpoint = self._endpoints.get((host, port))
+            if endpoint is not None and endpoint.loop is loop and endpoint.is_open:
+                return endpoint
+            if endpoint is not None:
+                endpoint.close()
+
+            endpoint = _NasEndpoint(
+                host=host, port=port, max_in_flight=self.max_in_flight_per_nas, loop=loop
+            )
+            await loop.create_datagram_endpoint(lambda: endpoint, remote_addr=(host, port))
+            self._endpoints[(host, port)] = endpoint
+            return endpoint
+
+    def _loop_lock(self, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+
+_default_transport: CoATransport | None = None
+
+
+def get_coa_transport() -> CoATransport:
+    """Return the process-wide CoA transport."""
+    global _default_transport
+    if _default_transport is None:
+        from dotmac.platform.settings import settings
+
+        _default_transport = CoATransport(
+            max_in_flight_per_nas=settings.radius.coa_max_in_flight_per_nas
+        )
+    return _default_transport
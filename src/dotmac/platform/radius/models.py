@@ -182,6 +182,9 @@ class RadAcct(Base):
         Index("idx_radacct_sessionid", "acctsessionid"),
         Index("idx_radacct_starttime", "acctstarttime"),
         Index("idx_radacct_stoptime", "acctstoptime"),
+        Index("idx_radacct_stoptime_id", "acctstoptime", "radacctid"),
+        Index("idx_radacct_tenant_username_start", "tenant_id", "username", "acctstarttime"),
+        Index("idx_radacct_tenant_subscriber_start", "tenant_id", "subscriber_id", "acctstarttime"),
         Index("idx_radacct_nasip", "nasipaddress"),
         Index(
             "idx_radacct_active_session",
@@ -5,6 +5,7 @@ Data access layer for RADIUS entities.
 Handles all database operations for RADIUS tables.
 """
 
+from collections.abc import Collection
 from datetime import datetime
 from typing import Any
 
@@ -139,6 +140,16 @@ class RADIUSRepository:
         )
         return list(result.scalars().all())
 
+    async def list_radchecks_after(
+        self, tenant_id: str, after_username: str | None = None, limit: int = 1000
+    ) -> list[RadCheck]:
+        """List RADIUS check entries ordered by username, starting after a keyset cursor"""
+        stmt = select(RadCheck).where(RadCheck.tenant_id == tenant_id)
+        if after_username is not None:
+            stmt = stmt.where(RadCheck.username > after_username)
+        result = await self.session.execute(stmt.order_by(RadCheck.username).limit(limit))
+        return list(result.scalars().all())
+
     async def get_password_hashing_stats(self, tenant_id: str) -> dict[str, int]:
         """
         Get statistics on password hashing methods used.
@@ -206,6 +217,19 @@ class RADIUSRepository:
         )
         return list(result.scalars().all())
 
+    async def get_radreplies_for_usernames(
+        self, tenant_id: str, usernames: list[str]
+    ) -> list[RadReply]:
+        """Get RADIUS reply entries for many usernames in one query"""
+        if not usernames:
+            return []
+        result = await self.session.execute(
+            select(RadReply)
+            .where(and_(RadReply.tenant_id == tenant_id, RadReply.username.in_(usernames)))
+            .order_by(RadReply.id)
+        )
+        return list(result.scalars().all())
+
     async def delete_radreply(self, tenant_id: str, username: str, attribute: str) -> int:
         """Delete ALL RADIUS reply attributes matching the criteria.
 
@@ -370,6 +394,122 @@ class RADIUSRepository:
             "active_sessions": active_sessions,
         }
 
+    @staticmethod
+    def _session_time_sum() -> Any:
+        """Sum of session times, derived from start/stop when none was reported."""
+        derived = func.extract("epoch", RadAcct.acctstoptime - RadAcct.acctstarttime)
+        return func.sum(func.coalesce(func.nullif(RadAcct.acctsessiontime, 0), derived))
+
+    def _usage_window_filters(
+        self,
+        tenant_id: str,
+        start_date: datetime | None,
+        end_date: datetime | None,
+        active_only: bool = False,
+    ) -> list[Any]:
+        """Filters selecting sessions that started and ended within a window."""
+        filters: list[Any] = [RadAcct.tenant_id == tenant_id]
+        if start_date:
+            filters.append(RadAcct.acctstarttime >= start_date)
+        if end_date:
+            # Active sessions are bounded by their last interim update
+            last_seen = func.coalesce(RadAcct.acctstoptime, RadAcct.acctupdatetime)
+            filters.append(last_seen.is_(None) | (last_seen <= end_date))
+        if active_only:
+            filters.append(RadAcct.acctstoptime.is_(None))
+        return filters
+
+    async def get_subscriber_usage_aggregate(
+        self,
+        tenant_id: str,
+        subscriber_id: str | None = None,
+        username: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        active_only: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Aggregate a subscriber's sessions in one query.
+
+        Served by the (tenant_id, username, acctstarttime) and
+        (tenant_id, subscriber_id, acctstarttime) indexes.
+        """
+        query = select(
+            func.count(RadAcct.radacctid).label("total_sessions"),
+            self._session_time_sum().label("total_session_time"),
+            func.sum(RadAcct.acctinputoctets).label("total_input_octets"),
+            func.sum(RadAcct.acctoutputoctets).label("total_output_octets"),
+            func.count(RadAcct.radacctid)
+            .filter(RadAcct.acctstoptime.is_(None))
+            .label("active_sessions"),
+            func.max(RadAcct.acctstarttime).label("last_session_start"),
+            func.max(RadAcct.acctstoptime).label("last_session_stop"),
+            func.min(RadAcct.subscriber_id).label("subscriber_id"),
+            func.min(RadAcct.username).label("username"),
+        ).where(and_(*self._usage_window_filters(tenant_id, start_date, end_date, active_only)))
+
+        if subscriber_id:
+            query = query.where(RadAcct.subscriber_id == subscriber_id)
+        if username:
+            query = query.where(RadAcct.username == username)
+
+        row = (await self.session.execute(query)).first()
+        total_input_octets = int(row.total_input_octets or 0) if row else 0
+        total_output_octets = int(row.total_output_octets or 0) if row else 0
+
+        return {
+            "total_sessions": int(row.total_sessions or 0) if row else 0,
+            "total_session_time": int(row.total_session_time or 0) if row else 0,
+            "total_input_octets": total_input_octets,
+            "total_output_octets": total_output_octets,
+            "total_bytes": total_input_octets + total_output_octets,
+            "active_sessions": int(row.active_sessions or 0) if row else 0,
+            "last_session_start": row.last_session_start if row else None,
+            "last_session_stop": row.last_session_stop if row else None,
+            "subscriber_id": row.subscriber_id if row else None,
+            "username": row.username if row else None,
+        }
+
+    async def get_tenant_usage_aggregate(
+        self,
+        tenant_id: str,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        exclude_subscribers: Collection[str] = (),
+    ) -> dict[str, int]:
+        """
+        Aggregate usage across all of a tenant's sessions in one query.
+
+        Subscribers (username, else subscriber ID) in ``exclude_subscribers``
+        are left out of ``total_subscribers`` so callers can add subscribers
+        counted elsewhere without double counting.
+        """
+        subscriber_key = func.coalesce(RadAcct.username, RadAcct.subscriber_id)
+        subscriber_count = func.count(func.distinct(subscriber_key))
+        if exclude_subscribers:
+            subscriber_count = subscriber_count.filter(
+                subscriber_key.not_in(list(exclude_subscribers))
+            )
+        query = select(
+            subscriber_count.label("total_subscribers"),
+            self._session_time_sum().label("total_session_time"),
+            func.sum(RadAcct.acctinputoctets).label("total_input_octets"),
+            func.sum(RadAcct.acctoutputoctets).label("total_output_octets"),
+            func.count(RadAcct.radacctid)
+            .filter(RadAcct.acctstoptime.is_(None))
+            .label("active_sessions"),
+        ).where(and_(*self._usage_window_filters(tenant_id, start_date, end_date)))
+
+        row = (await self.session.execute(query)).first()
+
+        return {
+            "total_subscribers": int(row.total_subscribers or 0) if row else 0,
+            "total_session_time": int(row.total_session_time or 0) if row else 0,
+            "total_input_octets": int(row.total_input_octets or 0) if row else 0,
+            "total_output_octets": int(row.total_output_octets or 0) if row else 0,
+            "active_sessions": int(row.active_sessions or 0) if row else 0,
+        }
+
     # =========================================================================
     # NAS Operations
     # =========================================================================
@@ -18,6 +18,12 @@ from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from dotmac.platform.network.models import SubscriberNetworkProfile
+from dotmac.platform.radius.auth_cache import (
+    AuthorizationCache,
+    AuthorizationSnapshot,
+    Option82Profile,
+    get_authorization_cache,
+)
 from dotmac.platform.radius.coa_client import CoAClient, CoAClientHTTP
 from dotmac.platform.radius.repository import RADIUSRepository
 from dotmac.platform.radius.schemas import (
@@ -220,6 +226,8 @@ class RADIUSService:
                 service_instance.ip_address = data.framed_ipv4_address
                 await self.session.commit()
 
+        await self._invalidate_authorization(data.username)
+
         response = RADIUSSubscriberResponse(
             id=radcheck.id,
             tenant_id=radcheck.tenant_id,
@@ -264,6 +272,7 @@ class RADIUSService:
                 op=":=",
             )
             await self.session.commit()
+            await self._invalidate_authorization(username)
         return await self.get_subscriber(username)
 
     async def resume_subscriber(self, subscriber_id: str) -> RADIUSSubscriberResponse | None:
@@ -276,6 +285,7 @@ class RADIUSService:
         deleted = await self.repository.delete_radreply(self.tenant_id, username, "Auth-Type")
         if deleted:
             await self.session.commit()
+            await self._invalidate_authorization(username)
         return await self.get_subscriber(username)
 
     async def get_subscriber(
@@ -511,112 +521,152 @@ class RADIUSService:
         return self._build_session_response(record)
 
     async def get_subscriber_usage(self, query: RADIUSUsageQuery) -> RADIUSUsageResponse:
-        """Aggregate usage statistics for a subscriber."""
+        """
+        Aggregate usage statistics for a subscriber.
+
+        Aggregated in SQL over radacct, so sessions recorded by any process
+        are included. Sessions recorded in-memory via ``start_session``
+        (lightweight mode) are never written to radacct; this instance's
+        history of them is added on top.
+        """
+        stats = await self.repository.get_subscriber_usage_aggregate(
+            tenant_id=self.tenant_id,
+            subscriber_id=query.subscriber_id,
+            username=query.username,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            active_only=query.include_active_only,
+        )
+        if self._session_history:
+            stats = self._merge_usage_stats(stats, self._subscriber_usage_from_history(query))
+
+        subscriber_id = query.subscriber_id
+        if not subscriber_id and query.username:
+            subscriber_id = await self._resolve_subscriber_id(query.username)
+
+        return RADIUSUsageResponse(
+            subscriber_id=str(subscriber_id or stats["subscriber_id"] or "unknown"),
+            username=query.username or stats["username"] or "unknown",
+            total_sessions=stats["total_sessions"],
+            total_session_time=stats["total_session_time"],
+            total_download_bytes=stats["total_input_octets"],
+            total_upload_bytes=stats["total_output_octets"],
+            total_bytes=stats["total_bytes"],
+            active_sessions=stats["active_sessions"],
+            last_session_start=stats["last_session_start"],
+            last_session_stop=stats["last_session_stop"],
+        )
+
+    @staticmethod
+    def _merge_usage_stats(db_stats: dict[str, Any], local_stats: dict[str, Any]) -> dict[str, Any]:
+        """Combine radacct and in-memory usage aggregates (disjoint session sets)."""
+        merged = dict(db_stats)
+        for field in (
+            "total_sessions",
+            "total_session_time",
+            "total_input_octets",
+            "total_output_octets",
+            "total_bytes",
+            "active_sessions",
+        ):
+            merged[field] = db_stats[field] + local_stats[field]
+        for field in ("last_session_start", "last_session_stop"):
+            # Aggregates over timestamptz come back naive on some backends
+            values = [
+                v if v.tzinfo is not None else v.replace(tzinfo=UTC)
+                for v in (db_stats[field], local_stats[field])
+                if v is not None
+            ]
+            merged[field] = max(values) if values else None
+        for field in ("subscriber_id", "username"):
+            merged[field] = db_stats[field] or local_stats[field]
+        return merged
+
+    @staticmethod
+    def _history_session_time(record: dict[str, Any]) -> int:
+        """Reported session time, derived from start/stop when none was reported."""
+        session_time = record.get("acctsessiontime") or 0
+        start_time = record.get("acctstarttime")
+        stop_time = record.get("acct_stop_time")
+        if session_time == 0 and start_time and stop_time:
+            session_time = int((stop_time - start_time).total_seconds())
+        return int(session_time)
+
+    def _history_in_window(self, record: dict[str, Any], query: RADIUSUsageQuery) -> bool:
+        start_time = record.get("acctstarttime") or record.get("last_update")
+        stop_time = record.get("acct_stop_time") or record.get("last_update")
+        if query.start_date and start_time and start_time < query.start_date:
+            return False
+        if query.end_date and stop_time and stop_time > query.end_date:
+            return False
+        return True
+
+    def _subscriber_usage_from_history(self, query: RADIUSUsageQuery) -> dict[str, Any]:
+        """Aggregate usage from sessions recorded in-memory on this instance."""
         records = []
         for record in self._session_history:
             if query.subscriber_id and record.get("subscriber_id") != query.subscriber_id:
                 continue
             if query.username and record.get("username") != query.username:
                 continue
-
-            start_time = record.get("acctstarttime") or record.get("last_update")
-            stop_time = record.get("acct_stop_time") or record.get("last_update")
-
-            if query.start_date and start_time and start_time < query.start_date:
+            if not self._history_in_window(record, query):
                 continue
-            if query.end_date and stop_time and stop_time > query.end_date:
-                continue
-
             if query.include_active_only and not record.get("is_active", True):
                 continue
-
             records.append(record)
 
-        if query.subscriber_id:
-            subscriber_id = query.subscriber_id
-        elif query.username:
-            subscriber_id = self._get_subscriber_id_by_username(query.username) or "unknown"
+        subscriber_id = None
+        if query.username:
+            subscriber_id = self._get_subscriber_id_by_username(query.username)
         elif records:
-            subscriber_id = records[0].get("subscriber_id") or "unknown"
-        else:
-            subscriber_id = query.subscriber_id or "unknown"
-
-        username = query.username
-        if not username and records:
-            username = records[0].get("username")
-
-        total_sessions = len(records)
-        total_session_time = 0
-        total_download = 0
-        total_upload = 0
-        active_sessions = 0
-        last_start = None
-        last_stop = None
-
-        for record in records:
-            start_time = record.get("acctstarttime")
-            stop_time = record.get("acct_stop_time")
-            session_time = record.get("acctsessiontime") or 0
-            if session_time == 0 and start_time and stop_time:
-                session_time = int((stop_time - start_time).total_seconds())
-            total_session_time += session_time
-            total_download += record.get("acctinputoctets", 0) or 0
-            total_upload += record.get("acctoutputoctets", 0) or 0
-            if record.get("is_active", True):
-                active_sessions += 1
-            if start_time and (last_start is None or start_time > last_start):
-                last_start = start_time
-            if stop_time and (last_stop is None or stop_time > last_stop):
-                last_stop = stop_time
+            subscriber_id = records[0].get("subscriber_id")
 
-        return RADIUSUsageResponse(
-            subscriber_id=str(subscriber_id),
-            username=username or "unknown",
-            total_sessions=total_sessions,
-            total_session_time=total_session_time,
-            total_download_bytes=total_download,
-            total_upload_bytes=total_upload,
-            total_bytes=total_download + total_upload,
-            active_sessions=active_sessions,
-            last_session_start=last_start,
-            last_session_stop=last_stop,
-        )
-
-    async def get_tenant_usage_summary(self, query: RADIUSUsageQuery) -> SimpleNamespace:
-        """Return aggregated usage summary for the tenant."""
-        records = []
-        for record in self._session_history:
-            start_time = record.get("acctstarttime") or record.get("last_update")
-            stop_time = record.get("acct_stop_time") or record.get("last_update")
+        total_download = sum(record.get("acctinputoctets", 0) or 0 for record in records)
+        total_upload = sum(record.get("acctoutputoctets", 0) or 0 for record in records)
+        start_times = [r["acctstarttime"] for r in records if r.get("acctstarttime")]
+        stop_times = [r["acct_stop_time"] for r in records if r.get("acct_stop_time")]
 
-            if query.start_date and start_time and start_time < query.start_date:
-                continue
-            if query.end_date and stop_time and stop_time > query.end_date:
-                continue
-            records.append(record)
+        return {
+            "total_sessions": len(records),
+            "total_session_time": sum(self._history_session_time(r) for r in records),
+            "total_input_octets": total_download,
+            "total_output_octets": total_upload,
+            "total_bytes": total_download + total_upload,
+            "active_sessions": sum(1 for record in records if record.get("is_active", True)),
+            "last_session_start": max(start_times) if start_times else None,
+            "last_session_stop": max(stop_times) if stop_times else None,
+            "subscriber_id": subscriber_id,
+            "username": records[0].get("username") if records else None,
+        }
 
-        subscribers = {
+    async def get_tenant_usage_summary(self, query: RADIUSUsageQuery) -> SimpleNamespace:
+        """Return aggregated usage summary for the tenant (radacct plus in-memory history)."""
+        records = [
+            record for record in self._session_history if self._history_in_window(record, query)
+        ]
+        local_subscribers = {
             record.get("username") or record.get("subscriber_id")
             for record in records
             if record.get("username") or record.get("subscriber_id")
         }
-        total_download = sum(record.get("acctinputoctets", 0) or 0 for record in records)
-        total_upload = sum(record.get("acctoutputoctets", 0) or 0 for record in records)
-        total_session_time = 0
-        for record in records:
-            session_time = record.get("acctsessiontime") or 0
-            if session_time == 0 and record.get("acctstarttime") and record.get("acct_stop_time"):
-                session_time = int(
-                    (record["acct_stop_time"] - record["acctstarttime"]).total_seconds()
-                )
-            total_session_time += session_time
+
+        stats = await self.repository.get_tenant_usage_aggregate(
+            tenant_id=self.tenant_id,
+            start_date=query.start_date,
+            end_date=query.end_date,
+            exclude_subscribers=local_subscribers,
+        )
 
         return SimpleNamespace(
-            total_subscribers=len(subscribers),
-            total_download_bytes=total_download,
-            total_upload_bytes=total_upload,
-            total_session_time=total_session_time,
-            active_sessions=sum(1 for record in records if record.get("is_active", True)),
+            total_subscribers=stats["total_subscribers"] + len(local_subscribers),
+            total_download_bytes=stats["total_input_octets"]
+            + sum(record.get("acctinputoctets", 0) or 0 for record in records),
+            total_upload_bytes=stats["total_output_octets"]
+            + sum(record.get("acctoutputoctets", 0) or 0 for record in records),
+            total_session_time=stats["total_session_time"]
+            + sum(self._history_session_time(record) for record in records),
+            active_sessions=stats["active_sessions"]
+            + sum(1 for record in records if record.get("is_active", True)),
         )
 
     async def update_subscriber(
@@ -756,6 +806,7 @@ class RADIUSService:
                 await self.disable_subscriber(username)
 
         await self.session.commit()
+        await self._invalidate_authorization(username)
 
         return await self.get_subscriber(username)
 
@@ -791,6 +842,7 @@ class RADIUSService:
         await self.repository.delete_all_radreplies(self.tenant_id, username)
 
         await self.session.commit()
+        await self._invalidate_authorization(username)
 
         self._subscriber_cache.pop(username, None)
         self._subscriber_username_to_id.pop(username, None)
@@ -806,6 +858,7 @@ class RADIUSService:
         # Remove any deny attributes
         await self.repository.delete_radreply(self.tenant_id, username, "Auth-Type")
         await self.session.commit()
+        await self._invalidate_authorization(username)
 
         # Return the updated subscriber
         return await self.get_subscriber(username)
@@ -824,6 +877,7 @@ class RADIUSService:
                 value="Reject",
             )
             await self.session.commit()
+            await self._invalidate_authorization(username)
 
             # Return the updated subscriber
             return await self.get_subscriber(username)
@@ -906,6 +960,12 @@ class RADIUSService:
 
         Returns:
             Updated subscriber response or None if not found
+
+        Note:
+            Changes are flushed but not committed. Callers must commit and then
+            call ``_invalidate_authorization(username)``; invalidating before
+            the commit lets a concurrent Access-Request re-cache the old
+            attributes.
         """
         from dotmac.platform.radius.vendors import get_bandwidth_builder
         from dotmac.platform.settings import settings
@@ -1034,6 +1094,7 @@ class RADIUSService:
             op=":=",
         )
 
+        # Flushed only: callers commit, then drop the cached authorization
         await self.session.flush()
 
         logger.info(
@@ -1435,9 +1496,6 @@ class RADIUSService:
                 "remote_id_expected": str | None,
             }
         """
-        # Parse Option 82 from RADIUS request
-        option82 = self.parse_option82(access_request)
-
         # Fetch subscriber's network profile
         result = await self.session.execute(
             select(SubscriberNetworkProfile).where(
@@ -1450,6 +1508,22 @@ class RADIUSService:
         )
         profile = result.scalar_one_or_none()
 
+        return self._evaluate_option82(
+            subscriber_id,
+            access_request,
+            Option82Profile.from_model(profile) if profile else None,
+        )
+
+    def _evaluate_option82(
+        self,
+        subscriber_id: str,
+        access_request: dict[str, Any],
+        profile: Option82Profile | None,
+    ) -> dict[str, Any]:
+        """Check Option 82 attributes against a network profile's expectations."""
+        # Parse Option 82 from RADIUS request
+        option82 = self.parse_option82(access_request)
+
         # No profile = no validation
         if not profile:
             return {
@@ -1462,8 +1536,7 @@ class RADIUSService:
                 "remote_id_expected": None,
             }
 
-        # Get policy from profile
-        policy = profile.option82_policy.value if profile.option82_policy else "log"
+        policy = profile.policy
 
         # If policy is IGNORE, skip validation
         if policy.lower() == "ignore":
@@ -1549,6 +1622,9 @@ class RADIUSService:
         4. Bandwidth profile application
         5. IPv4/IPv6 address assignment
 
+        Subscriber data is served from the process-wide authorization cache
+        when enabled, so repeated Access-Requests do not touch the database.
+
         Args:
             request: RADIUS Access-Request with Option 82 attributes
 
@@ -1556,8 +1632,8 @@ class RADIUSService:
             Authorization decision (Accept/Reject) with reply attributes
         """
         # Step 1: Check if subscriber exists
-        subscriber = await self.get_subscriber(request.username)
-        if not subscriber:
+        snapshot = await self._get_authorization_snapshot(request.username)
+        if snapshot is None:
             logger.warning(
                 "radius.authorization.user_not_found",
                 username=request.username,
@@ -1572,24 +1648,8 @@ class RADIUSService:
 
         # Step 2: Validate password (if provided)
         if request.password:
-            radcheck = await self.repository.get_radcheck_by_username(
-                self.tenant_id, request.username
-            )
-            if not radcheck:
-                logger.warning(
-                    "radius.authorization.no_radcheck",
-                    username=request.username,
-                    tenant_id=self.tenant_id,
-                )
-                return RADIUSAuthorizationResponse(
-                    accept=False,
-                    reason="Invalid password",
-                    reply_attributes={},
-                    option82_validation=None,
-                )
-
             # Verify password using proper hash verification
-            if not verify_radius_password(request.password, radcheck.value):
+            if not verify_radius_password(request.password, snapshot.password_hash):
                 logger.warning(
                     "radius.authorization.invalid_password",
                     username=request.username,
@@ -1614,7 +1674,7 @@ class RADIUSService:
             access_request["Alcatel-Lucent-Agent-Remote-Id"] = request.alcatel_agent_remote_id
 
         # Step 4: Validate Option 82
-        if not subscriber.subscriber_id:
+        if not snapshot.subscriber_id:
             # No subscriber_id means no network profile, skip Option 82 validation
             option82_result = {
                 "valid": True,
@@ -1626,9 +1686,8 @@ class RADIUSService:
                 "remote_id_expected": None,
             }
         else:
-            option82_result = await self.validate_option82(
-                subscriber_id=subscriber.subscriber_id,
-                access_request=access_request,
+            option82_result = self._evaluate_option82(
+                snapshot.subscriber_id, access_request, snapshot.network_profile
             )
 
         # Step 5: Enforce Option 82 policy
@@ -1646,11 +1705,8 @@ class RADIUSService:
                 option82_validation=option82_result,
             )
 
-        # Step 6: Get reply attributes from database
-        radreplies = await self.repository.get_radreplies_by_username(
-            self.tenant_id, request.username
-        )
-        reply_attributes = {reply.attribute: reply.value for reply in radreplies}
+        # Step 6: Reply attributes (bandwidth, VLAN, addressing) from the snapshot
+        reply_attributes = dict(snapshot.reply_attributes)
 
         # Step 7: Authorization successful
         logger.info(
@@ -1669,6 +1725,125 @@ class RADIUSService:
             option82_validation=option82_result,
         )
 
+    # =========================================================================
+    # Authorization Cache
+    # =========================================================================
+
+    async def _fetch_authorization_snapshot(self, username: str) -> AuthorizationSnapshot | None:
+        """Load authorization data for one username from the database."""
+        radcheck = await self.repository.get_radcheck_by_username(self.tenant_id, username)
+        if not radcheck:
+            return None
+
+        radreplies = await self.repository.get_radreplies_by_username(self.tenant_id, username)
+        profiles = await self._get_option82_profiles(
+            [cast(str, radcheck.subscriber_id)] if radcheck.subscriber_id else []
+        )
+        return AuthorizationSnapshot.build(
+            radcheck, radreplies, profiles.get(cast(str, radcheck.subscriber_id))
+        )
+
+    async def _get_option82_profiles(
+        self, subscriber_ids: list[str]
+    ) -> dict[str, SubscriberNetworkProfile]:
+        """Fetch active network profiles for many subscribers in one query."""
+        if not subscriber_ids:
+            return {}
+        result = await self.session.execute(
+            select(SubscriberNetworkProfile).where(
+                and_(
+                    SubscriberNetworkProfile.subscriber_id.in_(subscriber_ids),
+                    SubscriberNetworkProfile.tenant_id == self.tenant_id,
+                    SubscriberNetworkProfile.deleted_at.is_(None),
+                )
+            )
+        )
+        return {str(profile.subscriber_id): profile for profile in result.scalars().all()}
+
+    async def _get_authorization_snapshot(self, username: str) -> AuthorizationSnapshot | None:
+        """Get authorization data for a username, reading through the cache."""
+        cache = get_authorization_cache()
+        if cache is None or not cache.is_ready():
+            return await self._fetch_authorization_snapshot(username)
+
+        cached = cache.get(self.tenant_id, username)
+        if cached is not AuthorizationCache.MISSING:
+            return cast(AuthorizationSnapshot | None, cached)
+
+        generation = cache.generation
+        snapshot = await self._fetch_authorization_snapshot(username)
+        cache.set(self.tenant_id, username, snapshot, generation=generation)
+        return snapshot
+
+    async def _invalidate_authorization(self, *usernames: str) -> None:
+        """Drop cached authorization data after a subscriber change."""
+        cache = get_authorization_cache()
+        if cache is not None:
+            await cache.invalidate(self.tenant_id, *usernames)
+
+    async def warm_authorization_cache(self, batch_size: int = 1000) -> int:
+        """
+        Preload the authorization cache with every subscriber of the tenant.
+
+        Subscribers are read in keyset-paginated batches with three queries per
+        batch. A batch that races with an invalidation is not stored, so no
+        stale entry can be cached.
+
+        Args:
+            batch_size: Usernames loaded per batch
+
+        Returns:
+            Number of subscribers loaded
+        """
+        cache = get_authorization_cache()
+        if cache is None:
+            return 0
+
+        loaded = 0
+        after_username: str | None = None
+        while True:
+            generation = cache.generation
+            radchecks = await self.repository.list_radchecks_after(
+                self.tenant_id, after_username, batch_size
+            )
+            if not radchecks:
+                break
+
+            usernames = [cast(str, radcheck.username) for radcheck in radchecks]
+            replies_by_username: dict[str, list[Any]] = {username: [] for username in usernames}
+            for reply in await self.repository.get_radreplies_for_usernames(
+                self.tenant_id, usernames
+            ):
+                replies_by_username[cast(str, reply.username)].append(reply)
+            profiles = await self._get_option82_profiles(
+                [
+                    cast(str, radcheck.subscriber_id)
+                    for radcheck in radchecks
+                    if radcheck.subscriber_id
+                ]
+            )
+
+            for radcheck in radchecks:
+                username = cast(str, radcheck.username)
+                snapshot = AuthorizationSnapshot.build(
+                    radcheck,
+                    replies_by_username[username],
+                    profiles.get(cast(str, radcheck.subscriber_id)),
+                )
+                cache.set(self.tenant_id, username, snapshot, generation=generation)
+
+            loaded += len(radchecks)
+            if len(radchecks) < batch_size:
+                break
+            after_username = usernames[-1]
+
+        logger.info(
+            "radius.authorization.cache_warmed",
+            tenant_id=self.tenant_id,
+            subscribers=loaded,
+        )
+        return loaded
+
     # =========================================================================
     # Usage Tracking
     # =========================================================================
@@ -2003,6 +2178,7 @@ class RADIUSService:
 
         if radcheck:
             await self.session.commit()
+            await self._invalidate_authorization(username)
             logger.info(
                 "password_hash_upgraded",
                 username=username,
@@ -4,39 +4,102 @@ Celery Tasks for RADIUS Operations.
 Background tasks for RADIUS session synchronization and maintenance.
 """
 
-from datetime import datetime, timedelta
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import structlog
-from sqlalchemy import and_, select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import Row, and_, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from dotmac.platform.celery_app import celery_app
 from dotmac.platform.db import AsyncSessionLocal
 from dotmac.platform.radius.models import RadAcct
 from dotmac.platform.settings import settings
 from dotmac.platform.timeseries import TimeSeriesSessionLocal
-from dotmac.platform.timeseries.models import RadAcctTimeSeries
+from dotmac.platform.timeseries.models import RadAcctSyncWatermark, RadAcctTimeSeries
 
 logger = structlog.get_logger(__name__)
 
+SYNC_WATERMARK_NAME = "radacct_timeseries"
+
+# Rows per INSERT statement (15 columns each, under Postgres' 32767 bind limit)
+_MAX_INSERT_ROWS = 2000
+
+# Serializes schema upgrades between workers (pg_advisory_xact_lock key)
+_SYNC_SCHEMA_LOCK_ID = 0x5241_4443  # "RADC"
+
+# Databases created before the sync used ON CONFLICT and a persisted
+# high-water mark lack the unique index and watermark table; rows synced
+# twice by the old time-window sync must go before the index can be built.
+_SYNC_SCHEMA_STATEMENTS = (
+    """
+    CREATE TABLE IF NOT EXISTS radacct_sync_watermark (
+        name VARCHAR(64) PRIMARY KEY,
+        last_stop_time TIMESTAMPTZ NOT NULL,
+        last_radacctid BIGINT NOT NULL,
+        updated_at TIMESTAMPTZ NOT NULL
+    )
+    """,
+    # Duplicates share a time value, so they always live in the same chunk
+    """
+    DELETE FROM radacct_timeseries a
+    USING radacct_timeseries b
+    WHERE a.time = b.time
+      AND a.tenant_id = b.tenant_id
+      AND a.nas_ip_address = b.nas_ip_address
+      AND a.session_id = b.session_id
+      AND a.tableoid = b.tableoid
+      AND a.ctid > b.ctid
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_radacct_ts_session
+        ON radacct_timeseries(time, tenant_id, nas_ip_address, session_id)
+    """,
+)
+
+_sync_schema_ready = False
+
+# Only the columns the time-series rows need; avoids hydrating ORM objects
+_SYNC_COLUMNS = (
+    RadAcct.radacctid,
+    RadAcct.tenant_id,
+    RadAcct.subscriber_id,
+    RadAcct.username,
+    RadAcct.acctsessionid,
+    RadAcct.nasipaddress,
+    RadAcct.acctinputoctets,
+    RadAcct.acctoutputoctets,
+    RadAcct.acctsessiontime,
+    RadAcct.framedipaddress,
+    RadAcct.framedipv6address,
+    RadAcct.acctterminatecause,
+    RadAcct.acctstarttime,
+    RadAcct.acctstoptime,
+)
+
 
 @celery_app.task(name="radius.sync_sessions_to_timescaledb", bind=True, max_retries=3)
 def sync_sessions_to_timescaledb(
     self: Any,
-    batch_size: int = 100,
+    batch_size: int = 1000,
     max_age_hours: int = 24,
+    max_rows: int = 500_000,
 ) -> dict[str, Any]:
     """
     Sync completed RADIUS sessions from PostgreSQL to TimescaleDB.
 
     This task runs periodically to ensure all completed sessions are
-    captured in TimescaleDB for analytics. It's idempotent - duplicate
-    insertions are handled gracefully.
+    captured in TimescaleDB for analytics. Progress is tracked with a
+    persisted high-water mark on (acctstoptime, radacctid), so each run
+    continues where the previous one stopped. It's idempotent - rows that
+    already exist are skipped by ``ON CONFLICT DO NOTHING``.
 
     Args:
         batch_size: Number of sessions to process per batch
-        max_age_hours: Only sync sessions completed within this many hours
+        max_age_hours: Where to start when no high-water mark exists yet
+        max_rows: Upper bound of sessions synced per run (the next run resumes)
 
     Returns:
         dict: Statistics about the sync operation
@@ -57,27 +120,186 @@ def sync_sessions_to_timescaledb(
 
     import asyncio
 
-    return asyncio.run(_sync_sessions_async(batch_size, max_age_hours))
+    return asyncio.run(_sync_sessions_async(batch_size, max_age_hours, max_rows=max_rows))
+
 
+async def _ensure_sync_schema(ts_session: AsyncSession) -> None:
+    """
+    Upgrade the TimescaleDB schema for the sync, once per process.
 
-async def _sync_sessions_async(batch_size: int, max_age_hours: int) -> dict[str, Any]:
+    Idempotent: creates the watermark table if missing and, when the
+    ``uq_radacct_ts_session`` index does not exist yet, deletes duplicate
+    session rows and builds it. Concurrent workers serialize on an advisory
+    lock; the duplicate scan only runs on databases without the index.
+    """
+    global _sync_schema_ready
+    if _sync_schema_ready:
+        return
+
+    await ts_session.execute(
+        text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": _SYNC_SCHEMA_LOCK_ID}
+    )
+    index_exists = (
+        await ts_session.execute(
+            text("SELECT 1 FROM pg_indexes WHERE indexname = 'uq_radacct_ts_session'")
+        )
+    ).scalar_one_or_none()
+
+    create_table, deduplicate, create_index = _SYNC_SCHEMA_STATEMENTS
+    await ts_session.execute(text(create_table))
+    if index_exists is None:
+        deleted = (await ts_session.execute(text(deduplicate))).rowcount
+        await ts_session.execute(text(create_index))
+        logger.info("timescaledb.sync.schema_upgraded", duplicates_deleted=deleted)
+    await ts_session.commit()
+    _sync_schema_ready = True
+
+
+async def _load_watermark(ts_session: AsyncSession) -> tuple[datetime, int] | None:
+    """Load the sync high-water mark (stop time, radacctid), if any."""
+    result = await ts_session.execute(
+        select(RadAcctSyncWatermark.last_stop_time, RadAcctSyncWatermark.last_radacctid).where(
+            RadAcctSyncWatermark.name == SYNC_WATERMARK_NAME
+        )
+    )
+    row = result.one_or_none()
+    return (row[0], row[1]) if row is not None else None
+
+
+async def _save_watermark(ts_session: AsyncSession, stop_time: datetime, radacctid: int) -> None:
+    """Upsert the sync high-water mark (committed with the batch it covers)."""
+    stmt = pg_insert(RadAcctSyncWatermark).values(
+        name=SYNC_WATERMARK_NAME,
+        last_stop_time=stop_time,
+        last_radacctid=radacctid,
+        updated_at=datetime.now(UTC),
+    )
+    await ts_session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[RadAcctSyncWatermark.name],
+            set_={
+                "last_stop_time": stmt.excluded.last_stop_time,
+                "last_radacctid": stmt.excluded.last_radacctid,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    )
+
+
+async def _fetch_completed_sessions(
+    pg_session: AsyncSession, after: tuple[datetime, int], batch_size: int
+) -> Sequence[Row[Any]]:
+    """Fetch the next batch of completed sessions after a keyset position."""
+    stmt = (
+        select(*_SYNC_COLUMNS)
+        .where(
+            and_(
+                RadAcct.acctstoptime.isnot(None),
+                tuple_(RadAcct.acctstoptime, RadAcct.radacctid) > tuple_(*after),
+            )
+        )
+        .order_by(RadAcct.acctstoptime.asc(), RadAcct.radacctid.asc())
+        .limit(batch_size)
+    )
+    result = await pg_session.execute(stmt)
+    return result.all()
+
+
+def _to_timeseries_row(session: Row[Any]) -> dict[str, Any]:
+    """Map a radacct row onto a radacct_timeseries row."""
+    input_octets = session.acctinputoctets or 0
+    output_octets = session.acctoutputoctets or 0
+    return {
+        "time": session.acctstoptime,
+        "tenant_id": session.tenant_id,
+        "subscriber_id": session.subscriber_id,
+        "username": session.username,
+        "session_id": session.acctsessionid,
+        "nas_ip_address": session.nasipaddress,
+        "total_bytes": input_octets + output_octets,
+        "input_octets": input_octets,
+        "output_octets": output_octets,
+        "session_duration": session.acctsessiontime or 0,
+        "framed_ip_address": session.framedipaddress,
+        "framed_ipv6_address": session.framedipv6address,
+        "terminate_cause": session.acctterminatecause,
+        "session_start_time": session.acctstarttime or session.acctstoptime,
+        "session_stop_time": session.acctstoptime,
+    }
+
+
+async def _insert_timeseries_rows(ts_session: AsyncSession, rows: list[dict[str, Any]]) -> int:
+    """Bulk insert rows, skipping ones already synced; returns rows inserted."""
+    inserted = 0
+    for start in range(0, len(rows), _MAX_INSERT_ROWS):
+        stmt = (
+            pg_insert(RadAcctTimeSeries)
+            .values(rows[start : start + _MAX_INSERT_ROWS])
+            .on_conflict_do_nothing()
+            .returning(RadAcctTimeSeries.session_id)
+        )
+        result = await ts_session.execute(stmt)
+        inserted += len(result.all())
+    return inserted
+
+
+async def _insert_rows_individually(
+    ts_session: AsyncSession, rows: list[dict[str, Any]]
+) -> tuple[int, int]:
+    """Insert rows one transaction each after a failed batch; returns (inserted, failed)."""
+    inserted = 0
+    failed = 0
+    for row in rows:
+        try:
+            inserted += await _insert_timeseries_rows(ts_session, [row])
+            await ts_session.commit()
+        except Exception as e:
+            await ts_session.rollback()
+            failed += 1
+            logger.error(
+                "timescaledb.sync.row_failed",
+                error=str(e),
+                session_id=row["session_id"],
+                time=row["time"].isoformat(),
+            )
+    return inserted, failed
+
+
+async def _sync_sessions_async(
+    batch_size: int,
+    max_age_hours: int,
+    max_rows: int = 500_000,
+    lookback_seconds: int = 300,
+) -> dict[str, Any]:
     """
     Async implementation of session synchronization.
 
+    Sessions are read with keyset pagination on (acctstoptime, radacctid)
+    and written with multi-row ``INSERT ... ON CONFLICT DO NOTHING``. The
+    high-water mark is committed together with each batch, so memory stays
+    bounded by ``batch_size`` and an interrupted run resumes from its last
+    committed batch. When a batch insert fails its rows are retried one by
+    one; rows that still fail are counted as errors and skipped, so a single
+    bad row cannot stall the sync.
+
     Args:
         batch_size: Number of sessions per batch
-        max_age_hours: Max age of sessions to sync
+        max_age_hours: Max age of sessions to sync on the first run
+        max_rows: Max sessions to sync in this run
+        lookback_seconds: Re-scan window behind the high-water mark for
+            stop records that were written late
 
     Returns:
         dict: Sync statistics
     """
-    start_time = datetime.now()
+    start_time = datetime.now(UTC)
     total_synced = 0
     total_skipped = 0
     total_errors = 0
+    batches = 0
 
     # Calculate cutoff time
-    cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+    cutoff_time = start_time - timedelta(hours=max_age_hours)
 
     logger.info(
         "timescaledb.sync.start",
@@ -93,106 +315,73 @@ async def _sync_sessions_async(batch_size: int, max_age_hours: int) -> dict[str,
                 raise RuntimeError("TimescaleDB session not initialized")
 
             async with session_factory() as ts_session:
-                # Query for completed sessions not yet in TimescaleDB
-                # We'll process in batches
-                offset = 0
-
-                while True:
-                    # Fetch batch of completed sessions
-                    stmt = (
-                        select(RadAcct)
-                        .where(
-                            and_(
-                                RadAcct.acctstoptime.isnot(None),
-                                RadAcct.acctstoptime >= cutoff_time,
-                            )
-                        )
-                        .order_by(RadAcct.acctstoptime.desc())
-                        .offset(offset)
-                        .limit(batch_size)
-                    )
-
-                    result = await pg_session.execute(stmt)
-                    sessions = result.scalars().all()
-
+                await _ensure_sync_schema(ts_session)
+                watermark = await _load_watermark(ts_session)
+                if watermark is None:
+                    position = (cutoff_time, 0)
+                else:
+                    position = (watermark[0] - timedelta(seconds=lookback_seconds), 0)
+
+                while total_synced + total_skipped < max_rows:
+                    sessions = await _fetch_completed_sessions(pg_session, position, batch_size)
                     if not sessions:
                         break
 
-                    # Process each session
-                    for session in sessions:
-                        try:
-                            # Calculate total bytes
-                            input_octets = session.acctinputoctets or 0
-                            output_octets = session.acctoutputoctets or 0
-                            total_bytes = input_octets + output_octets
-
-                            # Create TimescaleDB record
-                            ts_record = RadAcctTimeSeries(
-                                time=session.acctstoptime,
-                                tenant_id=session.tenant_id,
-                                subscriber_id=session.subscriber_id,
-                                username=session.username,
-                                session_id=session.acctsessionid,
-                                nas_ip_address=session.nasipaddress,
-                                total_bytes=total_bytes,
-                                input_octets=input_octets,
-                                output_octets=output_octets,
-                                session_duration=session.acctsessiontime or 0,
-                                framed_ip_address=session.framedipaddress,
-                                framed_ipv6_address=session.framedipv6address,
-                                terminate_cause=session.acctterminatecause,
-                                session_start_time=session.acctstarttime,
-                                session_stop_time=session.acctstoptime,
-                            )
-
-                            ts_session.add(ts_record)
-                            total_synced += 1
-
-                        except IntegrityError:
-                            # Duplicate - already exists in TimescaleDB
-                            await ts_session.rollback()
-                            total_skipped += 1
-                            logger.debug(
-                                "timescaledb.sync.duplicate",
-                                session_id=session.acctsessionid,
-                                username=session.username,
-                            )
+                    rows = [_to_timeseries_row(session) for session in sessions]
+                    last = sessions[-1]
+                    position = (last.acctstoptime, last.radacctid)
+                    advances = watermark is None or position > watermark
 
-                        except Exception as e:
-                            # Other error - log and continue
-                            await ts_session.rollback()
-                            total_errors += 1
-                            logger.error(
-                                "timescaledb.sync.error",
-                                session_id=session.acctsessionid,
-                                error=str(e),
-                            )
-
-                    # Commit batch
+                    failed = 0
                     try:
+                        inserted = await _insert_timeseries_rows(ts_session, rows)
+                        if advances:
+                            await _save_watermark(ts_session, *position)
                         await ts_session.commit()
                     except Exception as e:
                         await ts_session.rollback()
-                        logger.error("timescaledb.sync.batch_commit_failed", error=str(e))
-
-                    # Move to next batch
-                    offset += batch_size
-
-                    # Safety limit to prevent runaway processing
-                    if offset >= 10000:
                         logger.warning(
-                            "timescaledb.sync.batch_limit_reached",
-                            offset=offset,
-                            synced=total_synced,
+                            "timescaledb.sync.batch_failed",
+                            error=str(e),
+                            batch_start=rows[0]["time"].isoformat(),
+                            batch_size=len(rows),
                         )
+                        inserted, failed = await _insert_rows_individually(ts_session, rows)
+                        try:
+                            if advances:
+                                await _save_watermark(ts_session, *position)
+                            await ts_session.commit()
+                        except Exception as e:
+                            # TimescaleDB is unavailable; the next run resumes
+                            # from the last committed high-water mark
+                            await ts_session.rollback()
+                            total_synced += inserted
+                            total_errors += failed
+                            logger.error("timescaledb.sync.watermark_failed", error=str(e))
+                            break
+
+                    if advances:
+                        watermark = position
+                    batches += 1
+                    total_synced += inserted
+                    total_errors += failed
+                    total_skipped += len(rows) - inserted - failed
+
+                    if len(sessions) < batch_size:
                         break
+                else:
+                    logger.info(
+                        "timescaledb.sync.run_limit_reached",
+                        max_rows=max_rows,
+                        synced=total_synced,
+                    )
 
     except Exception as e:
         logger.error("timescaledb.sync.fatal_error", error=str(e))
         raise
 
     # Calculate duration
-    duration = (datetime.now() - start_time).total_seconds()
+    duration = (datetime.now(UTC) - start_time).total_seconds()
 
     # Log completion
     logger.info(
@@ -200,6 +389,7 @@ async def _sync_sessions_async(batch_size: int, max_age_hours: int) -> dict[str,
         synced=total_synced,
         skipped=total_skipped,
         errors=total_errors,
+        batches=batches,
         duration_seconds=duration,
     )
 
@@ -208,6 +398,8 @@ async def _sync_sessions_async(batch_size: int, max_age_hours: int) -> dict[str,
         "synced": total_synced,
         "skipped": total_skipped,
         "errors": total_errors,
+        "batches": batches,
+        "watermark": watermark[0].isoformat() if watermark else None,
         "duration_seconds": duration,
         "rate_per_second": total_synced / duration if duration > 0 else 0,
     }
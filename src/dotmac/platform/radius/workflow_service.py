@@ -65,6 +65,7 @@ class RADIUSService:
         """
         from sqlalchemy import select
 
+        from .auth_cache import get_authorization_cache
         from .models import RadCheck, RadiusBandwidthProfile, RadReply
 
         logger.info(
@@ -205,6 +206,11 @@ class RADIUSService:
         # Commit all changes
         await self.db.commit()
 
+        # The username may be cached as unknown by the authorization fast path
+        authorization_cache = get_authorization_cache()
+        if authorization_cache is not None:
+            await authorization_cache.invalidate(tenant_id, username)
+
         logger.info(
             f"RADIUS subscriber created successfully: username={username}, "
             f"radcheck_id={radcheck.id}, radreply_count={len(radreply_ids)}, "
@@ -11,6 +11,13 @@ from dotmac.platform.rate_limit.decorators import (
     rate_limit_per_ip,
     rate_limit_per_minute,
 )
+from dotmac.platform.rate_limit.engine import (
+    RateLimitDecision,
+    RateLimitEngine,
+    RateLimitRuleIndex,
+    get_rate_limit_engine,
+    notify_rate_limit_rules_changed,
+)
 from dotmac.platform.rate_limit.middleware import RateLimitMiddleware
 from dotmac.platform.rate_limit.models import (
     RateLimitAction,
@@ -31,6 +38,12 @@ __all__ = [
     # Service
     "RateLimitService",
     "RateLimitExceeded",
+    # Engine
+    "RateLimitEngine",
+    "RateLimitRuleIndex",
+    "RateLimitDecision",
+    "get_rate_limit_engine",
+    "notify_rate_limit_rules_changed",
     # Middleware
     "RateLimitMiddleware",
     # Decorators
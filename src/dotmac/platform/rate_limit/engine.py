@@ -0,0 +1,523 @@
+"""
+Rate Limiting Engine.
+
+Hot-path rate limit evaluation for the middleware:
+
+- Rules are loaded once per tenant into an in-process index with their
+  endpoint patterns pre-compiled, so a request never touches the database.
+- The index is invalidated on rule CRUD by broadcasting the tenant id over
+  Redis pub/sub (with a TTL as a safety net for missed messages).
+- All applicable rules are evaluated in a single Lua script that trims,
+  checks, increments and expires every sliding-window counter atomically,
+  so a request costs exactly one Redis round trip.
+"""
+
+import asyncio
+import re
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, replace
+from typing import Any
+from uuid import UUID, uuid4
+
+import structlog
+from sqlalchemy import select
+
+from dotmac.platform.rate_limit.models import (
+    RateLimitAction,
+    RateLimitRule,
+    RateLimitScope,
+    RateLimitWindow,
+)
+from dotmac.platform.rate_limit.service import generate_rate_limit_key, get_identifier
+from dotmac.platform.redis_client import RedisClientType
+
+logger = structlog.get_logger(__name__)
+
+RULE_INVALIDATION_CHANNEL = "ratelimit:rules:invalidate"
+
+# Sliding window over sorted sets, evaluated for every rule key at once.
+#
+# KEYS: one sorted-set key per applicable rule
+# ARGV: now, member, then (limit, window_seconds, enforce) per key
+#
+# Returns {blocked_index, count_1, ..., count_n} where counts are the number of
+# requests already in each window (before this one) and blocked_index is the
+# 1-based index of the first enforcing rule over its limit (0 when allowed).
+# A blocked request is not recorded in any window.
+SLIDING_WINDOW_SCRIPT = """
+local now = tonumber(ARGV[1])
+local member = ARGV[2]
+local counts = {}
+local blocked = 0
+
+for i, key in ipairs(KEYS) do
+    local base = 2 + (i - 1) * 3
+    local limit = tonumber(ARGV[base + 1])
+    local window = tonumber(ARGV[base + 2])
+    local enforce = ARGV[base + 3] == "1"
+
+    redis.call("ZREMRANGEBYSCORE", key, 0, now - window)
+    local count = redis.call("ZCARD", key)
+    counts[i] = count
+
+    if blocked == 0 and enforce and count >= limit then
+        blocked = i
+    end
+end
+
+if blocked == 0 then
+    for i, key in ipairs(KEYS) do
+        local window = tonumber(ARGV[2 + (i - 1) * 3 + 2])
+        redis.call("ZADD", key, now, member)
+        redis.call("EXPIRE", key, window + 60)
+    end
+end
+
+local result = {blocked}
+for i = 1, #counts do
+    result[i + 1] = counts[i]
+end
+return result
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRule:
+    """Immutable snapshot of a rate limit rule with its endpoint pattern compiled."""
+
+    id: UUID
+    tenant_id: str
+    name: str
+    scope: RateLimitScope
+    pattern: re.Pattern[str] | None
+    max_requests: int
+    window: RateLimitWindow
+    window_seconds: int
+    action: RateLimitAction
+    priority: int
+    exempt_user_ids: frozenset[str] = field(default_factory=frozenset)
+    exempt_ip_addresses: frozenset[str] = field(default_factory=frozenset)
+    exempt_api_keys: frozenset[str] = field(default_factory=frozenset)
+
+    @classmethod
+    def from_model(cls, rule: RateLimitRule) -> "CompiledRule | None":
+        """Build a compiled rule, skipping rules whose pattern does not compile."""
+        pattern: re.Pattern[str] | None = None
+        if rule.endpoint_pattern and rule.scope != RateLimitScope.GLOBAL:
+            try:
+                pattern = re.compile(rule.endpoint_pattern)
+            except re.error as e:
+                logger.warning(
+                    "Invalid rate limit endpoint pattern",
+                    rule=rule.name,
+                    pattern=rule.endpoint_pattern,
+                    error=str(e),
+                )
+                return None
+
+        return cls(
+            id=rule.id,
+            tenant_id=rule.tenant_id,
+            name=rule.name,
+            scope=rule.scope,
+            pattern=pattern,
+            max_requests=rule.max_requests,
+            window=rule.window,
+            window_seconds=rule.window_seconds,
+            action=rule.action,
+            priority=rule.priority,
+            exempt_user_ids=frozenset(rule.exempt_user_ids or []),
+            exempt_ip_addresses=frozenset(rule.exempt_ip_addresses or []),
+            exempt_api_keys=frozenset(rule.exempt_api_keys or []),
+        )
+
+    def matches(self, endpoint: str) -> bool:
+        """Check whether the rule applies to the endpoint."""
+        return self.pattern is None or self.pattern.match(endpoint) is not None
+
+    def is_exempt(
+        self, user_id: UUID | str | None, ip_address: str | None, api_key_id: str | None
+    ) -> bool:
+        """Check whether the request is exempt from this rule."""
+        if user_id and str(user_id) in self.exempt_user_ids:
+            return True
+        if ip_address and ip_address in self.exempt_ip_addresses:
+            return True
+        if api_key_id and api_key_id in self.exempt_api_keys:
+            return True
+        return False
+
+
+@dataclass(slots=True)
+class _TenantRules:
+    rules: tuple[CompiledRule, ...]
+    loaded_at: float
+    # Endpoint -> applicable rules; bounded by the number of routes in practice
+    by_endpoint: dict[str, tuple[CompiledRule, ...]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitDecision:
+    """Result of evaluating all applicable rules for one request."""
+
+    allowed: bool
+    rule: CompiledRule | None = None
+    current_count: int = 0
+    violated: bool = False
+    # Window keys this request was recorded in, and its member in each window
+    keys: tuple[str, ...] = ()
+    member: str | None = None
+
+    @property
+    def remaining(self) -> int:
+        """Requests left in the window of the reported rule."""
+        if self.rule is None:
+            return 0
+        return max(0, self.rule.max_requests - self.current_count - 1)
+
+
+SessionFactory = Callable[[], Any]
+
+
+class RateLimitRuleIndex:
+    """
+    Per-tenant, in-process index of compiled rate limit rules.
+
+    Rules are loaded lazily on first use per tenant and kept until invalidated
+    via :meth:`invalidate` (local) or a message on ``RULE_INVALIDATION_CHANNEL``
+    (cluster-wide). ``ttl_seconds`` bounds staleness if a message is missed.
+    """
+
+    def __init__(
+        self,
+        session_factory: SessionFactory | None = None,
+        ttl_seconds: float = 300.0,
+        max_endpoints_per_tenant: int = 2048,
+        listener_restart_seconds: float = 5.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._ttl_seconds = ttl_seconds
+        self._max_endpoints = max_endpoints_per_tenant
+        self._listener_restart_seconds = listener_restart_seconds
+        self._tenants: dict[str, _TenantRules] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._listener_task: asyncio.Task[None] | None = None
+        self._listener_started_at: float | None = None
+
+    def _get_session_factory(self) -> SessionFactory:
+        if self._session_factory is not None:
+            return self._session_factory
+        # Resolve at call time so test overrides of the session factory apply
+        from dotmac.platform import db
+
+        return db.AsyncSessionLocal
+
+    async def _load_rules(self, tenant_id: str) -> tuple[CompiledRule, ...]:
+        """Load active rules for a tenant from the database."""
+        stmt = (
+            select(RateLimitRule)
+            .where(
+                RateLimitRule.tenant_id == tenant_id,
+                RateLimitRule.is_active.is_(True),
+                RateLimitRule.deleted_at.is_(None),
+            )
+            .order_by(RateLimitRule.priority.desc())
+        )
+
+        async with self._get_session_factory()() as session:
+            result = await session.execute(stmt)
+            models = list(result.scalars().all())
+
+        compiled = (CompiledRule.from_model(rule) for rule in models)
+        return tuple(rule for rule in compiled if rule is not None)
+
+    async def get_tenant_rules(self, tenant_id: str) -> tuple[CompiledRule, ...]:
+        """Get all compiled rules for a tenant, loading them if needed."""
+        entry = self._tenants.get(tenant_id)
+        if entry is not None and time.monotonic() - entry.loaded_at < self._ttl_seconds:
+            return entry.rules
+
+        lock = self._locks.setdefault(tenant_id, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have loaded the rules while we waited
+            entry = self._tenants.get(tenant_id)
+            if entry is not None and time.monotonic() - entry.loaded_at < self._ttl_seconds:
+                return entry.rules
+
+            rules = await self._load_rules(tenant_id)
+            self._tenants[tenant_id] = _TenantRules(rules=rules, loaded_at=time.monotonic())
+            return rules
+
+    async def get_applicable_rules(self, tenant_id: str, endpoint: str) -> tuple[CompiledRule, ...]:
+        """Get rules applicable to the endpoint, ordered by priority."""
+        rules = await self.get_tenant_rules(tenant_id)
+        entry = self._tenants.get(tenant_id)
+        if entry is None:
+            return tuple(rule for rule in rules if rule.matches(endpoint))
+
+        applicable = entry.by_endpoint.get(endpoint)
+        if applicable is None:
+            applicable = tuple(rule for rule in entry.rules if rule.matches(endpoint))
+            if len(entry.by_endpoint) >= self._max_endpoints:
+                entry.by_endpoint.clear()
+            entry.by_endpoint[endpoint] = applicable
+        return applicable
+
+    def invalidate(self, tenant_id: str | None = None) -> None:
+        """Drop cached rules for a tenant (or all tenants) in this process."""
+        if tenant_id is None:
+            self._tenants.clear()
+        else:
+            self._tenants.pop(tenant_id, None)
+
+    async def publish_invalidation(self, redis: RedisClientType, tenant_id: str) -> None:
+        """Invalidate locally and broadcast the invalidation to other workers."""
+        self.invalidate(tenant_id)
+        try:
+            await redis.publish(RULE_INVALIDATION_CHANNEL, tenant_id)
+        except Exception as e:
+            logger.warning(
+                "Failed to broadcast rate limit rule invalidation",
+                tenant_id=tenant_id,
+                error=str(e),
+            )
+
+    @property
+    def listener_running(self) -> bool:
+        """Whether the background pub/sub listener task is alive."""
+        return self._listener_task is not None and not self._listener_task.done()
+
+    def start_listener(self, redis: RedisClientType) -> None:
+        """
+        Start the background pub/sub listener if it is not already running.
+
+        A listener that exited (e.g. on a Redis error) is restarted, at most
+        once per ``listener_restart_seconds`` so a Redis outage does not spawn
+        a task per request.
+        """
+        if self.listener_running:
+            return
+        now = time.monotonic()
+        if (
+            self._listener_task is not None
+            and self._listener_started_at is not None
+            and now - self._listener_started_at < self._listener_restart_seconds
+        ):
+            return
+        self._listener_started_at = now
+        self._listener_task = asyncio.create_task(self._listen(redis))
+
+    async def stop_listener(self) -> None:
+        """Stop the background pub/sub listener."""
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            pass
+        self._listener_task = None
+        self._listener_started_at = None
+
+    async def _listen(self, redis: RedisClientType) -> None:
+        """Apply invalidations broadcast by other workers."""
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(RULE_INVALIDATION_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                data = message.get("data")
+                tenant_id = data.decode() if isinstance(data, bytes) else str(data)
+                self.invalidate(tenant_id or None)
+                logger.debug("Rate limit rules invalidated", tenant_id=tenant_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Fall back to TTL-based expiry; drop everything to avoid stale rules
+            logger.error("Rate limit invalidation listener failed", error=str(e))
+            self.invalidate()
+        finally:
+            try:
+                await pubsub.unsubscribe(RULE_INVALIDATION_CHANNEL)
+                await pubsub.close()
+            except Exception:  # nosec B110 - best-effort cleanup
+                pass
+
+
+class RateLimitEngine:
+    """
+    Evaluate rate limits with zero database queries and one Redis round trip.
+
+    Counters use the same keys as :class:`RateLimitService`, so status
+    lookups and ``reset_limit`` keep working against engine-managed windows.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClientType | None = None,
+        rule_index: RateLimitRuleIndex | None = None,
+    ) -> None:
+        self.redis = redis
+        self.rule_index = rule_index or RateLimitRuleIndex()
+        self._script: Any = None
+
+    async def _get_redis(self) -> RedisClientType:
+        """Get Redis connection."""
+        if self.redis is None:
+            import redis.asyncio as aioredis
+
+            from dotmac.platform.settings import settings
+
+            self.redis = aioredis.from_url(
+                settings.redis.redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+            )
+        return self.redis
+
+    def _get_script(self, redis: RedisClientType) -> Any:
+        # register_script caches the SHA and falls back to EVAL on NOSCRIPT
+        if self._script is None:
+            self._script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+        return self._script
+
+    @property
+    def listening(self) -> bool:
+        """Whether rule invalidations are currently being received."""
+        return self.rule_index.listener_running
+
+    async def start(self) -> None:
+        """Start (or restart) listening for rule invalidations."""
+        self.rule_index.start_listener(await self._get_redis())
+
+    async def stop(self) -> None:
+        """Stop listening for rule invalidations."""
+        await self.rule_index.stop_listener()
+
+    async def rules_changed(self, tenant_id: str) -> None:
+        """Notify all workers that a tenant's rules were created/updated/deleted."""
+        await self.rule_index.publish_invalidation(await self._get_redis(), tenant_id)
+
+    async def evaluate(
+        self,
+        tenant_id: str,
+        endpoint: str,
+        user_id: UUID | str | None = None,
+        ip_address: str | None = None,
+        api_key_id: str | None = None,
+    ) -> RateLimitDecision:
+        """Check and record a request against every applicable rule atomically."""
+        rules = await self.rule_index.get_applicable_rules(tenant_id, endpoint)
+        if not rules:
+            return RateLimitDecision(allowed=True)
+
+        keyed: list[tuple[CompiledRule, str]] = []
+        for rule in rules:
+            if rule.is_exempt(user_id, ip_address, api_key_id):
+                continue
+            identifier = get_identifier(
+                rule.scope, tenant_id, user_id, ip_address, api_key_id, endpoint
+            )
+            if identifier is None:
+                continue
+            keyed.append(
+                (rule, generate_rate_limit_key(tenant_id, rule.scope, identifier, str(rule.id)))
+            )
+
+        if not keyed:
+            return RateLimitDecision(allowed=True)
+
+        now = time.time()
+        member = f"{now}:{uuid4().hex[:8]}"
+        counts, blocked_index = await self._run_script(keyed, now, member)
+        decision = self._decide(keyed, counts, blocked_index)
+        if decision.allowed:
+            # The script recorded the request in every window
+            decision = replace(decision, keys=tuple(key for _, key in keyed), member=member)
+        return decision
+
+    async def refund(self, decision: RateLimitDecision) -> None:
+        """Remove a recorded request from its windows (e.g. it failed)."""
+        if not decision.keys or decision.member is None:
+            return
+        redis = await self._get_redis()
+        pipe = redis.pipeline(transaction=False)
+        for key in decision.keys:
+            pipe.zrem(key, decision.member)
+        await pipe.execute()
+
+    async def _run_script(
+        self, keyed: Sequence[tuple[CompiledRule, str]], now: float, member: str
+    ) -> tuple[list[int], int]:
+        redis = await self._get_redis()
+        args: list[Any] = [now, member]
+        for rule, _ in keyed:
+            enforce = "0" if rule.action == RateLimitAction.LOG_ONLY else "1"
+            args.extend([rule.max_requests, rule.window_seconds, enforce])
+
+        result = await self._get_script(redis)(keys=[key for _, key in keyed], args=args)
+        blocked_index = int(result[0])
+        counts = [int(count) for count in result[1:]]
+        return counts, blocked_index
+
+    def _decide(
+        self,
+        keyed: Sequence[tuple[CompiledRule, str]],
+        counts: Sequence[int],
+        blocked_index: int,
+    ) -> RateLimitDecision:
+        if blocked_index:
+            rule = keyed[blocked_index - 1][0]
+            return RateLimitDecision(
+                allowed=False,
+                rule=rule,
+                current_count=counts[blocked_index - 1],
+                violated=True,
+            )
+
+        # Surface log-only violations so the caller can record them
+        for (rule, _), count in zip(keyed, counts, strict=True):
+            if count >= rule.max_requests:
+                logger.warning(
+                    "Rate limit exceeded (log only)",
+                    rule=rule.name,
+                    count=count,
+                    limit=rule.max_requests,
+                )
+                return RateLimitDecision(
+                    allowed=True, rule=rule, current_count=count, violated=True
+                )
+
+        # Report the tightest rule for X-RateLimit-* headers
+        rule, count = min(
+            ((rule, count) for (rule, _), count in zip(keyed, counts, strict=True)),
+            key=lambda item: item[0].max_requests - item[1],
+        )
+        return RateLimitDecision(allowed=True, rule=rule, current_count=count)
+
+
+_engine: RateLimitEngine | None = None
+
+
+def get_rate_limit_engine() -> RateLimitEngine:
+    """Get the process-wide rate limit engine."""
+    global _engine
+    if _engine is None:
+        _engine = RateLimitEngine()
+    return _engine
+
+
+def set_rate_limit_engine(engine: RateLimitEngine | None) -> None:
+    """Override the process-wide rate limit engine (mainly for tests)."""
+    global _engine
+    _engine = engine
+
+
+async def notify_rate_limit_rules_changed(tenant_id: str) -> None:
+    """Invalidate cached rules for a tenant across all workers."""
+    try:
+        await get_rate_limit_engine().rules_changed(tenant_id)
+    except Exception as e:
+        logger.warning("Failed to invalidate rate limit rules", tenant_id=tenant_id, error=str(e))
@@ -4,19 +4,48 @@ Rate Limiting Middleware.
 FastAPI middleware for automatic rate limiting.
 """
 
+from uuid import UUID
+
 import structlog
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp
 
 from dotmac.platform.database import get_async_session
-from dotmac.platform.rate_limit.service import RateLimitService
+from dotmac.platform.rate_limit.engine import (
+    RateLimitDecision,
+    RateLimitEngine,
+    get_rate_limit_engine,
+)
+from dotmac.platform.rate_limit.models import RateLimitLog
 
 logger = structlog.get_logger(__name__)
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware to enforce rate limiting on all requests."""
+    """
+    Middleware to enforce rate limiting on all requests.
+
+    Uses :class:`RateLimitEngine`, so allowed requests cost no database
+    queries and a single Redis round trip. The database is only touched to
+    record violations.
+
+    Only successful (2xx/3xx) responses count against the limits: a request
+    is recorded up front so concurrent requests cannot overshoot, and its
+    slot is refunded when the response is an error.
+    """
+
+    def __init__(self, app: ASGIApp, engine: RateLimitEngine | None = None) -> None:
+        super().__init__(app)
+        self._engine = engine
+
+    @property
+    def engine(self) -> RateLimitEngine:
+        """Rate limit engine (defaults to the process-wide engine)."""
+        if self._engine is None:
+            self._engine = get_rate_limit_engine()
+        return self._engine
 
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         """Process request with rate limiting."""
@@ -39,71 +68,113 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             tenant_id = "public"  # Use special tenant for public endpoints
 
         try:
-            # Check rate limit
-            async for db in get_async_session():
-                service = RateLimitService(db)
-
-                is_allowed, rule_applied, current_count = await service.check_rate_limit(
-                    tenant_id=tenant_id,
-                    endpoint=endpoint,
-                    method=method,
-                    user_id=user_id,
-                    ip_address=ip_address,
-                    api_key_id=api_key_id,
-                )
-
-                if not is_allowed and rule_applied:
-                    # Calculate retry-after
-                    retry_after = rule_applied.window_seconds
-
-                    # Commit the violation log
-                    await db.commit()
-
-                    return JSONResponse(
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                        content={
-                            "error": "rate_limit_exceeded",
-                            "message": f"Rate limit exceeded: {current_count}/{rule_applied.max_requests} per {rule_applied.window.value}",
-                            "rule": rule_applied.name,
-                            "limit": rule_applied.max_requests,
-                            "window": rule_applied.window.value,
-                            "retry_after": retry_after,
-                        },
-                        headers={"Retry-After": str(retry_after)},
-                    )
+            if not self.engine.listening:
+                await self.engine.start()
+
+            decision = await self.engine.evaluate(
+                tenant_id=tenant_id,
+                endpoint=endpoint,
+                user_id=user_id,
+                ip_address=ip_address,
+                api_key_id=api_key_id,
+            )
+        except Exception as e:
+            logger.error("Rate limit middleware error", error=str(e))
+            # Don't block requests if rate limiting fails
+            return await call_next(request)
 
-                # Process request
-                response = await call_next(request)
+        rule = decision.rule
+
+        if decision.violated and rule is not None:
+            await self._record_violation(
+                tenant_id=tenant_id,
+                decision=decision,
+                endpoint=endpoint,
+                method=method,
+                user_id=user_id,
+                ip_address=ip_address,
+                api_key_id=api_key_id,
+            )
+
+        if not decision.allowed and rule is not None:
+            retry_after = rule.window_seconds
+            return JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={
+                    "error": "rate_limit_exceeded",
+                    "message": f"Rate limit exceeded: {decision.current_count}/{rule.max_requests} per {rule.window.value}",
+                    "rule": rule.name,
+                    "limit": rule.max_requests,
+                    "window": rule.window.value,
+                    "retry_after": retry_after,
+                },
+                headers={"Retry-After": str(retry_after)},
+            )
+
+        response = await call_next(request)
+
+        # Count successful requests only
+        if not 200 <= response.status_code < 400:
+            try:
+                await self.engine.refund(decision)
+            except Exception as e:
+                logger.warning("Failed to refund rate limit slot", error=str(e))
+
+        # Add rate limit headers
+        if rule is not None:
+            response.headers["X-RateLimit-Limit"] = str(rule.max_requests)
+            response.headers["X-RateLimit-Remaining"] = str(decision.remaining)
+            response.headers["X-RateLimit-Reset"] = str(rule.window_seconds)
+
+        return response
+
+    async def _record_violation(
+        self,
+        tenant_id: str,
+        decision: RateLimitDecision,
+        endpoint: str,
+        method: str,
+        user_id: UUID | None,
+        ip_address: str | None,
+        api_key_id: str | None,
+    ) -> None:
+        """Persist a rate limit violation log entry."""
+        rule = decision.rule
+        if rule is None:
+            return
+
+        logger.warning(
+            "Rate limit exceeded",
+            rule=rule.name,
+            endpoint=endpoint,
+            user_id=str(user_id) if user_id else None,
+            ip_address=ip_address,
+            current_count=decision.current_count,
+            limit=rule.max_requests,
+        )
 
-                # Increment counter for successful requests
-                if 200 <= response.status_code < 400:
-                    await service.increment(
+        try:
+            async for db in get_async_session():
+                db.add(
+                    RateLimitLog(
                         tenant_id=tenant_id,
-                        endpoint=endpoint,
+                        rule_id=rule.id,
+                        rule_name=rule.name,
                         user_id=user_id,
                         ip_address=ip_address,
                         api_key_id=api_key_id,
+                        endpoint=endpoint,
+                        method=method,
+                        current_count=decision.current_count,
+                        limit=rule.max_requests,
+                        window=rule.window,
+                        action=rule.action,
+                        was_blocked=not decision.allowed,
                     )
-
-                # Add rate limit headers
-                if rule_applied:
-                    remaining = max(0, rule_applied.max_requests - current_count - 1)
-                    retry_after = rule_applied.window_seconds
-                    response.headers["X-RateLimit-Limit"] = str(rule_applied.max_requests)
-                    response.headers["X-RateLimit-Remaining"] = str(remaining)
-                    response.headers["X-RateLimit-Reset"] = str(retry_after)
-
+                )
                 await db.commit()
-
-                return response
-
         except Exception as e:
-            logger.error("Rate limit middleware error", error=str(e))
-            # Don't block requests if rate limiting fails
-            return await call_next(request)
-
-        # Fallback (should not reach here)
-        return await call_next(request)
+            logger.error("Failed to record rate limit violation", error=str(e))
 
     def _get_client_ip(self, request: Request) -> str:
         """Extract client IP address from request."""
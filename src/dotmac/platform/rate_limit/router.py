@@ -15,6 +15,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from dotmac.platform.auth.core import get_current_user
 from dotmac.platform.database import get_async_session
+from dotmac.platform.rate_limit.engine import notify_rate_limit_rules_changed
 from dotmac.platform.rate_limit.models import (
     RateLimitAction,
     RateLimitLog,
@@ -153,6 +154,7 @@ async def create_rate_limit_rule(
     db.add(rule)
     await db.commit()
     await db.refresh(rule)
+    await notify_rate_limit_rules_changed(current_user.tenant_id)
 
     return rule
 
@@ -265,6 +267,7 @@ async def update_rate_limit_rule(
 
     await db.commit()
     await db.refresh(rule)
+    await notify_rate_limit_rules_changed(current_user.tenant_id)
 
     return rule
 
@@ -299,6 +302,7 @@ async def delete_rate_limit_rule(
 
     rule.deleted_at = datetime.now(UTC)
     await db.commit()
+    await notify_rate_limit_rules_changed(current_user.tenant_id)
 
 
 @router.get(
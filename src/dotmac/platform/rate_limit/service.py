@@ -48,6 +48,44 @@ class RateLimitExceeded(Exception):
         )
 
 
+def generate_rate_limit_key(
+    tenant_id: str,
+    scope: RateLimitScope,
+    identifier: str,
+    rule_id: str,
+) -> str:
+    """Generate Redis key for rate limit tracking."""
+    # Use hash to keep key length reasonable
+    # MD5 used for identifier hashing, not security
+    id_hash = hashlib.md5(identifier.encode(), usedforsecurity=False).hexdigest()[:12]  # nosec B324
+    return f"ratelimit:{tenant_id}:{scope.value}:{id_hash}:{rule_id}"
+
+
+def get_identifier(
+    scope: RateLimitScope,
+    tenant_id: str,
+    user_id: UUID | str | None,
+    ip_address: str | None,
+    api_key_id: str | None,
+    endpoint: str,
+) -> str | None:
+    """Get the counter identifier for a rule scope."""
+    if scope == RateLimitScope.GLOBAL:
+        return "global"
+    elif scope == RateLimitScope.PER_TENANT:
+        return tenant_id
+    elif scope == RateLimitScope.PER_USER:
+        return str(user_id) if user_id else None
+    elif scope == RateLimitScope.PER_IP:
+        return ip_address
+    elif scope == RateLimitScope.PER_API_KEY:
+        return api_key_id
+    elif scope == RateLimitScope.PER_ENDPOINT:
+        return endpoint
+    else:
+        return None
+
+
 class RateLimitService:
     """Service for rate limiting with Redis backend."""
 
@@ -91,10 +129,7 @@ class RateLimitService:
         rule_id: str,
     ) -> str:
         """Generate Redis key for rate limit tracking."""
-        # Use hash to keep key length reasonable
-        # MD5 used for identifier hashing, not security
-        id_hash = hashlib.md5(identifier.encode(), usedforsecurity=False).hexdigest()[:12]  # nosec B324
-        return f"ratelimit:{tenant_id}:{scope.value}:{id_hash}:{rule_id}"
+        return generate_rate_limit_key(tenant_id, scope, identifier, rule_id)
 
     async def check_rate_limit(
         self,
@@ -241,20 +276,7 @@ class RateLimitService:
         endpoint: str,
     ) -> str | None:
         """Get identifier based on scope."""
-        if scope == RateLimitScope.GLOBAL:
-            return "global"
-        elif scope == RateLimitScope.PER_TENANT:
-            return tenant_id
-        elif scope == RateLimitScope.PER_USER:
-            return str(user_id) if user_id else None
-        elif scope == RateLimitScope.PER_IP:
-            return ip_address
-        elif scope == RateLimitScope.PER_API_KEY:
-            return api_key_id
-        elif scope == RateLimitScope.PER_ENDPOINT:
-            return endpoint
-        else:
-            return None
+        return get_identifier(scope, tenant_id, user_id, ip_address, api_key_id, endpoint)
 
     async def _check_limit(
         self, tenant_id: str, rule: RateLimitRule, identifier: str
@@ -4,6 +4,7 @@ Real-Time Infrastructure Module
 Provides WebSocket and Server-Sent Events (SSE) for real-time updates.
 """
 
+from dotmac.platform.realtime.multiplexer import ChannelMultiplexer, get_channel_multiplexer
 from dotmac.platform.realtime.publishers import (
     EventPublisher,
     publish_job_update,
@@ -67,6 +68,8 @@ __all__ = [
     "create_alert_stream",
     "create_ticket_stream",
     "create_subscriber_stream",
+    "ChannelMultiplexer",
+    "get_channel_multiplexer",
     # WebSocket
     "WebSocketConnection",
     "handle_sessions_ws",
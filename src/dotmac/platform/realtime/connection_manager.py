@@ -2,16 +2,27 @@
 WebSocket Connection Manager with Tenant Isolation.
 
 Manages active WebSocket connections with proper tenant isolation and resource tracking.
+
+Broadcasts are serialized once and handed to a bounded send queue per socket,
+drained by its own sender task, so one slow dashboard cannot hold up the
+fan-out; a socket whose queue overflows or whose send times out is dropped.
+Broadcasts are also relayed to the other workers over Redis.
 """
 
+import asyncio
+import json
 from collections import defaultdict
+from collections.abc import Iterable
 from typing import Any
 from uuid import UUID, uuid4
 
 import structlog
-from fastapi import WebSocket
+from fastapi import WebSocket, status
 
 from dotmac.platform.auth.core import UserInfo
+from dotmac.platform.realtime.fanout import BroadcastRelay
+from dotmac.platform.redis_client import redis_manager
+from dotmac.platform.settings import settings
 
 logger = structlog.get_logger(__name__)
 
@@ -45,6 +56,10 @@ class ConnectionInfo:
         self.resource_type = resource_type
         self.resource_id = resource_id
 
+        # Created on first send, since registration may happen outside a loop
+        self.send_queue: asyncio.Queue[str] | None = None
+        self.sender_task: asyncio.Task[None] | None = None
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
         return {
@@ -70,8 +85,27 @@ class WebSocketConnectionManager:
     - Statistics and monitoring
     """
 
-    def __init__(self) -> None:
-        """Initialize connection manager."""
+    def __init__(
+        self,
+        send_queue_size: int | None = None,
+        send_timeout: float | None = None,
+        channel: str | None = None,
+    ) -> None:
+        """
+        Initialize connection manager.
+
+        Args:
+            send_queue_size: Messages buffered per socket before it is dropped
+            send_timeout: Seconds a single send may take before the socket is dropped
+            channel: Redis channel relaying broadcasts between workers
+        """
+        config = settings.realtime
+        self.send_queue_size = send_queue_size or config.ws_send_queue_size
+        self.send_timeout = send_timeout or config.ws_send_timeout_seconds
+        self._relay = BroadcastRelay(channel or config.ws_broadcast_channel, self._apply_remote)
+        self._background: set[asyncio.Task[None]] = set()
+        self.dropped_connections = 0
+
         # All active connections by connection_id
         self._connections: dict[UUID, ConnectionInfo] = {}
 
@@ -128,6 +162,8 @@ class WebSocketConnectionManager:
             resource_key = f"{resource_type}:{resource_id}"
             self._resource_connections[resource_key].add(connection_id)
 
+        self._ensure_relay()
+
         logger.info(
             "connection_manager.registered",
             connection_id=str(connection_id),
@@ -162,6 +198,10 @@ class WebSocketConnectionManager:
         # Remove main entry
         del self._connections[connection_id]
 
+        sender = conn_info.sender_task
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+
         logger.info(
             "connection_manager.unregistered",
             connection_id=str(connection_id),
@@ -176,7 +216,7 @@ class WebSocketConnectionManager:
         exclude: set[UUID] | None = None,
     ) -> int:
         """
-        Broadcast message to all connections in a tenant.
+        Broadcast message to all connections in a tenant, on every worker.
 
         Args:
             tenant_id: Tenant ID
@@ -184,37 +224,9 @@ class WebSocketConnectionManager:
             exclude: Optional set of connection IDs to exclude
 
         Returns:
-            Number of connections message was sent to
+            Number of local connections the message was queued for
         """
-        exclude = exclude or set()
-        connection_ids = self._tenant_connections.get(tenant_id, set())
-        sent_count = 0
-
-        for conn_id in connection_ids:
-            if conn_id in exclude:
-                continue
-
-            conn_info = self._connections.get(conn_id)
-            if conn_info:
-                try:
-                    await conn_info.websocket.send_json(message)
-                    sent_count += 1
-                except Exception as e:
-                    logger.error(
-                        "connection_manager.broadcast_failed",
-                        connection_id=str(conn_id),
-                        tenant_id=tenant_id,
-                        error=str(e),
-                    )
-
-        logger.info(
-            "connection_manager.broadcast_to_tenant",
-            tenant_id=tenant_id,
-            sent_count=sent_count,
-            total_connections=len(connection_ids),
-        )
-
-        return sent_count
+        return await self._broadcast("tenant", tenant_id, message, exclude)
 
     async def broadcast_to_resource(
         self,
@@ -224,7 +236,7 @@ class WebSocketConnectionManager:
         exclude: set[UUID] | None = None,
     ) -> int:
         """
-        Broadcast message to all connections watching a specific resource.
+        Broadcast message to all connections watching a specific resource, on every worker.
 
         Args:
             resource_type: Resource type (e.g., "job", "campaign")
@@ -233,40 +245,9 @@ class WebSocketConnectionManager:
             exclude: Optional set of connection IDs to exclude
 
         Returns:
-            Number of connections message was sent to
+            Number of local connections the message was queued for
         """
-        exclude = exclude or set()
-        resource_key = f"{resource_type}:{resource_id}"
-        connection_ids = self._resource_connections.get(resource_key, set())
-        sent_count = 0
-
-        for conn_id in connection_ids:
-            if conn_id in exclude:
-                continue
-
-            conn_info = self._connections.get(conn_id)
-            if conn_info:
-                try:
-                    await conn_info.websocket.send_json(message)
-                    sent_count += 1
-                except Exception as e:
-                    logger.error(
-                        "connection_manager.broadcast_failed",
-                        connection_id=str(conn_id),
-                        resource_type=resource_type,
-                        resource_id=resource_id,
-                        error=str(e),
-                    )
-
-        logger.info(
-            "connection_manager.broadcast_to_resource",
-            resource_type=resource_type,
-            resource_id=resource_id,
-            sent_count=sent_count,
-            total_connections=len(connection_ids),
-        )
-
-        return sent_count
+        return await self._broadcast("resource", f"{resource_type}:{resource_id}", message, exclude)
 
     async def broadcast_to_user(
         self,
@@ -275,7 +256,7 @@ class WebSocketConnectionManager:
         exclude: set[UUID] | None = None,
     ) -> int:
         """
-        Broadcast message to all connections of a specific user.
+        Broadcast message to all connections of a specific user, on every worker.
 
         Args:
             user_id: User ID
@@ -283,38 +264,168 @@ class WebSocketConnectionManager:
             exclude: Optional set of connection IDs to exclude
 
         Returns:
-            Number of connections message was sent to
+            Number of local connections the message was queued for
         """
-        exclude = exclude or set()
-        connection_ids = self._user_connections.get(user_id, set())
-        sent_count = 0
+        return await self._broadcast("user", user_id, message, exclude)
 
-        for conn_id in connection_ids:
-            if conn_id in exclude:
-                continue
+    def _group(self, scope: str) -> dict[str, set[UUID]]:
+        if scope == "tenant":
+            return self._tenant_connections
+        if scope == "resource":
+            return self._resource_connections
+        return self._user_connections
 
-            conn_info = self._connections.get(conn_id)
-            if conn_info:
-                try:
-                    await conn_info.websocket.send_json(message)
-                    sent_count += 1
-                except Exception as e:
-                    logger.error(
-                        "connection_manager.broadcast_failed",
-                        connection_id=str(conn_id),
-                        user_id=user_id,
-                        error=str(e),
-                    )
+    async def _broadcast(
+        self,
+        scope: str,
+        key: str,
+        message: dict[str, Any],
+        exclude: set[UUID] | None,
+    ) -> int:
+        """Serialize once, queue for local sockets and relay to the other workers."""
+        # Same encoding as WebSocket.send_json
+        text = json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+        exclude_ids = {str(conn_id) for conn_id in exclude or ()}
+
+        connection_ids = self._group(scope).get(key, set())
+        sent_count = self._deliver_local(connection_ids, text, exclude_ids)
+
+        redis = self._get_redis()
+        if redis is not None:
+            await self._relay.publish(redis, scope, key, text, exclude_ids)
 
         logger.info(
-            "connection_manager.broadcast_to_user",
-            user_id=user_id,
+            f"connection_manager.broadcast_to_{scope}",
+            key=key,
             sent_count=sent_count,
             total_connections=len(connection_ids),
         )
+        return sent_count
 
+    def _apply_remote(self, scope: str, key: str, text: str, exclude: set[str]) -> None:
+        """Deliver a broadcast relayed from another worker."""
+        self._deliver_local(self._group(scope).get(key, set()), text, exclude)
+
+    def _deliver_local(self, connection_ids: Iterable[UUID], text: str, exclude: set[str]) -> int:
+        """Queue text on each local socket without waiting for any send."""
+        sent_count = 0
+        for conn_id in list(connection_ids):
+            if str(conn_id) in exclude:
+                continue
+            conn_info = self._connections.get(conn_id)
+            if conn_info is None:
+                continue
+            if self._enqueue(conn_info, text):
+                sent_count += 1
+            else:
+                self._drop(conn_info, "send queue full")
         return sent_count
 
+    def _enqueue(self, conn_info: ConnectionInfo, text: str) -> bool:
+        if conn_info.send_queue is None:
+            conn_info.send_queue = asyncio.Queue(maxsize=self.send_queue_size)
+            conn_info.sender_task = asyncio.create_task(
+                self._send_loop(conn_info), name=f"ws-sender-{conn_info.connection_id}"
+            )
+        try:
+            conn_info.send_queue.put_nowait(text)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _send_loop(self, conn_info: ConnectionInfo) -> None:
+        """Drain one socket's queue; a failed or stalled send drops the socket."""
+        queue = conn_info.send_queue
+        assert queue is not None
+        while True:
+            text = await queue.get()
+            try:
+                await asyncio.wait_for(conn_info.websocket.send_text(text), self.send_timeout)
+            except asyncio.CancelledError:
+                queue.task_done()
+                raise
+            except Exception as e:
+                queue.task_done()
+                reason = "send timed out" if isinstance(e, TimeoutError) else "send failed"
+                logger.error(
+                    "connection_manager.broadcast_failed",
+                    connection_id=str(conn_info.connection_id),
+                    tenant_id=conn_info.tenant_id,
+                    error=str(e) or reason,
+                )
+                self._drop(conn_info, reason)
+                return
+            queue.task_done()
+
+    def _drop(self, conn_info: ConnectionInfo, reason: str) -> None:
+        """Unregister a slow or broken socket and close it in the background."""
+        if conn_info.connection_id not in self._connections:
+            return
+        self.dropped_connections += 1
+        logger.warning(
+            "connection_manager.slow_consumer_dropped",
+            connection_id=str(conn_info.connection_id),
+            tenant_id=conn_info.tenant_id,
+            reason=reason,
+        )
+        self.unregister(conn_info.connection_id)
+
+        # Release anything still queued so flush() does not wait on it
+        queue = conn_info.send_queue
+        while queue is not None and not queue.empty():
+            queue.get_nowait()
+            queue.task_done()
+
+        task = asyncio.create_task(self._close(conn_info, reason))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    @staticmethod
+    async def _close(conn_info: ConnectionInfo, reason: str) -> None:
+        sender = conn_info.sender_task
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
+        try:
+            await conn_info.websocket.close(code=status.WS_1013_TRY_AGAIN_LATER, reason=reason)
+        except Exception:  # nosec B110 - socket may already be gone
+            pass
+
+    async def flush(self) -> None:
+        """Wait until every queued message has been sent or its socket dropped."""
+        queues = [
+            conn.send_queue for conn in self._connections.values() if conn.send_queue is not None
+        ]
+        await asyncio.gather(*(queue.join() for queue in queues))
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    @staticmethod
+    def _get_redis() -> Any:
+        try:
+            return redis_manager.get_client()
+        except RuntimeError:
+            # Redis not initialized (single process, scripts, tests)
+            return None
+
+    def _ensure_relay(self) -> None:
+        """Start relaying other workers' broadcasts once this worker holds a socket."""
+        if self._relay.is_listening:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        redis = self._get_redis()
+        if redis is not None:
+            self._relay.start(redis)
+
+    async def close(self) -> None:
+        """Stop the relay listener and every sender task."""
+        await self._relay.stop()
+        for conn_info in self._connections.values():
+            if conn_info.sender_task is not None:
+                conn_info.sender_task.cancel()
+
     def get_tenant_connections(self, tenant_id: str) -> list[ConnectionInfo]:
         """
         Get all connections for a tenant.
@@ -376,6 +487,12 @@ class WebSocketConnectionManager:
             "total_tenants": len(self._tenant_connections),
             "total_users": len(self._user_connections),
             "total_resources": len(self._resource_connections),
+            "dropped_connections": self.dropped_connections,
+            "queued_messages": sum(
+                conn.send_queue.qsize()
+                for conn in self._connections.values()
+                if conn.send_queue is not None
+            ),
             "connections_by_tenant": {
                 tenant_id: len(conn_ids) for tenant_id, conn_ids in self._tenant_connections.items()
             },
@@ -0,0 +1,113 @@
+"""
+Cross-worker WebSocket broadcast relay.
+
+Every uvicorn worker only holds its own sockets, so a broadcast sent from one
+worker is relayed to the others over Redis pub/sub. The message is serialized
+once by the sender and carried as a pre-encoded string, so receiving workers
+forward the text to their sockets without decoding or re-encoding it.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable, Iterable
+from typing import Any
+from uuid import uuid4
+
+import structlog
+
+from dotmac.platform.redis_client import RedisClientType
+
+logger = structlog.get_logger(__name__)
+
+# Called with (scope, key, text, exclude) for broadcasts from other workers
+type BroadcastHandler = Callable[[str, str, str, set[str]], None]
+
+
+class BroadcastRelay:
+    """
+    Publishes broadcasts to Redis and applies those of other workers.
+
+    Each process tags its messages with an origin id and ignores its own,
+    since local delivery has already happened.
+    """
+
+    def __init__(self, channel: str, handler: BroadcastHandler) -> None:
+        self.channel = channel
+        self.handler = handler
+        self.origin = uuid4().hex
+        self._listener_task: asyncio.Task[None] | None = None
+
+    async def publish(
+        self,
+        redis: RedisClientType,
+        scope: str,
+        key: str,
+        text: str,
+        exclude: Iterable[Any] = (),
+    ) -> None:
+        """Relay a serialized broadcast (scope ``tenant``, ``resource`` or ``user``)."""
+        envelope = json.dumps(
+            {
+                "origin": self.origin,
+                "scope": scope,
+                "key": key,
+                "exclude": [str(conn_id) for conn_id in exclude],
+                "data": text,
+            }
+        )
+        try:
+            await redis.publish(self.channel, envelope)
+        except Exception as e:
+            logger.warning("realtime.broadcast_relay.publish_failed", scope=scope, error=str(e))
+
+    def apply(self, raw_message: str | bytes) -> None:
+        """Deliver a broadcast received from another worker."""
+        try:
+            envelope = json.loads(raw_message)
+            scope, key, text = envelope["scope"], envelope["key"], envelope["data"]
+        except (TypeError, ValueError, KeyError):
+            logger.warning("realtime.broadcast_relay.malformed_message")
+            return
+
+        if envelope.get("origin") == self.origin:
+            return
+        self.handler(scope, key, text, set(envelope.get("exclude") or ()))
+
+    @property
+    def is_listening(self) -> bool:
+        return self._listener_task is not None and not self._listener_task.done()
+
+    def start(self, redis: RedisClientType) -> None:
+        """Start the background listener if it is not already running."""
+        if self.is_listening:
+            return
+        self._listener_task = asyncio.create_task(self._listen(redis))
+
+    async def stop(self) -> None:
+        """Stop the background listener."""
+        if self._listener_task is None:
+            return
+        self._listener_task.cancel()
+        try:
+            await self._listener_task
+        except asyncio.CancelledError:
+            pass
+        self._listener_task = None
+
+    async def _listen(self, redis: RedisClientType) -> None:
+        pubsub = redis.pubsub()
+        try:
+            await pubsub.subscribe(self.channel)
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    self.apply(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("realtime.broadcast_relay.listener_failed", error=str(e))
+        finally:
+            try:
+                await pubsub.unsubscribe(self.channel)
+                await pubsub.close()
+            except Exception:  # nosec B110 - best-effort cleanup
+                pass
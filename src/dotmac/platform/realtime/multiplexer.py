@@ -0,0 +1,410 @@
+"""
+Shared Redis Channel Multiplexer
+
+Fans Redis pub/sub messages out to in-process subscribers, so SSE clients
+share one Redis connection per process instead of opening one each.
+
+Each channel is subscribed on Redis once, while at least one local stream
+wants it. Messages are decoded once and offered to a bounded buffer per
+subscriber; high-rate updates (ONU status per serial, RADIUS interim updates
+per session) replace an older update for the same key still waiting in the
+buffer. A subscriber whose buffer overflows is closed so it cannot hold the
+others back; the browser's EventSource reconnects it.
+"""
+
+import asyncio
+import json
+import weakref
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import cached_property
+from itertools import count
+from typing import Any
+
+import structlog
+from prometheus_client import Counter, Gauge
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from dotmac.platform.redis_client import RedisClientType
+from dotmac.platform.settings import settings
+
+logger = structlog.get_logger(__name__)
+
+# Metrics are labelled by channel prefix ("onu_status", "alerts", ...) rather
+# than the full tenant-scoped channel name to keep cardinality bounded
+sse_subscribers = Gauge(
+    "realtime_sse_subscribers",
+    "Number of SSE subscribers attached to the channel multiplexer",
+    ["channel"],
+)
+
+sse_queued_messages = Gauge(
+    "realtime_sse_queued_messages",
+    "Messages waiting in SSE subscriber buffers",
+    ["channel"],
+)
+
+sse_messages_coalesced_total = Counter(
+    "realtime_sse_messages_coalesced_total",
+    "Messages replaced by a newer update for the same key before delivery",
+    ["channel"],
+)
+
+sse_subscribers_dropped_total = Counter(
+    "realtime_sse_subscribers_dropped_total",
+    "SSE subscribers closed because their buffer overflowed",
+)
+
+
+def channel_prefix(channel: str) -> str:
+    """Metric label of a tenant-scoped channel name."""
+    return channel.split(":", 1)[0]
+
+
+def coalesce_key(channel: str, payload: dict[str, Any]) -> str | None:
+    """
+    Key under which a newer message supersedes a pending older one.
+
+    ONU status events carry the full current state (and the previous status),
+    so only the latest per serial matters to a dashboard. RADIUS interim
+    updates are cumulative counters; session start and stop always pass
+    through.
+    """
+    prefix = channel_prefix(channel)
+    if prefix == "onu_status" and payload.get("onu_serial"):
+        return f"{channel}|onu|{payload['onu_serial']}"
+    if (
+        prefix == "radius_sessions"
+        and payload.get("event_type") == "session.updated"
+        and payload.get("session_id")
+    ):
+        return f"{channel}|session|{payload['session_id']}"
+    return None
+
+
+def _decode(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else str(value)
+
+
+@dataclass(frozen=True)
+class ChannelMessage:
+    """A pub/sub message decoded once and shared by every subscriber."""
+
+    channel: str
+    data: str
+    payload: dict[str, Any]
+
+    @property
+    def event_type(self) -> str:
+        return str(self.payload.get("event_type", "unknown"))
+
+    @cached_property
+    def sourced_data(self) -> str:
+        """Payload tagged with its source channel, as sent by combined streams."""
+        if "source" in self.payload:
+            return self.data
+        return json.dumps({**self.payload, "source": self.channel})
+
+
+@dataclass(eq=False)
+class ChannelSubscription:
+    """
+    One local consumer of a set of channels.
+
+    Iterate with ``async for``; iteration ends when the subscription is closed,
+    after which ``overflowed`` or ``error`` explain why (both unset when the
+    channel itself went away).
+    """
+
+    multiplexer: "ChannelMultiplexer" = field(repr=False)
+    channels: tuple[str, ...]
+    maxsize: int
+    coalesce: bool = True
+    overflowed: bool = False
+    error: str | None = None
+    closed: bool = False
+    coalesced: int = 0
+    _pending: OrderedDict[object, ChannelMessage] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _ready: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+    _seq: "count[int]" = field(default_factory=count, init=False, repr=False)
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def offer(self, message: ChannelMessage, key: str | None) -> bool:
+        """Buffer a message without waiting; False when the buffer is full."""
+        if self.closed:
+            return True
+        if self.coalesce and key is not None and key in self._pending:
+            self._pending[key] = message  # Keeps the older update's position
+            self.coalesced += 1
+            sse_messages_coalesced_total.labels(channel=channel_prefix(message.channel)).inc()
+            return True
+        if len(self._pending) >= self.maxsize:
+            return False
+        self._pending[key if self.coalesce and key is not None else next(self._seq)] = message
+        sse_queued_messages.labels(channel=channel_prefix(message.channel)).inc()
+        self._ready.set()
+        return True
+
+    def close(self, *, overflowed: bool = False, error: str | None = None) -> None:
+        """
+        Stop accepting messages and end iteration.
+
+        Buffered messages are still delivered after a clean close, but
+        discarded when the subscriber overflowed or the connection failed.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        self.overflowed = overflowed
+        self.error = error
+        if overflowed or error:
+            self._discard_pending()
+        self._ready.set()
+
+    def _discard_pending(self) -> None:
+        for message in self._pending.values():
+            sse_queued_messages.labels(channel=channel_prefix(message.channel)).dec()
+        self._pending.clear()
+
+    def __aiter__(self) -> "ChannelSubscription":
+        return self
+
+    async def __anext__(self) -> ChannelMessage:
+        while not self._pending:
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        _, message = self._pending.popitem(last=False)
+        sse_queued_messages.labels(channel=channel_prefix(message.channel)).dec()
+        return message
+
+    async def aclose(self) -> None:
+        """Close, drop anything buffered and release the channels."""
+        self.close()
+        self._discard_pending()
+        await self.multiplexer.release(self)
+
+
+class ChannelMultiplexer:
+    """
+    Per-process fan-out of Redis pub/sub channels to local subscribers.
+
+    All channels share one ``PubSub`` connection, read by a single background
+    task that runs while any channel is subscribed.
+    """
+
+    def __init__(
+        self,
+        redis: RedisClientType,
+        queue_size: int | None = None,
+        coalesce: bool | None = None,
+    ) -> None:
+        self.redis = redis
+        self.queue_size = queue_size or settings.realtime.sse_queue_size
+        self.coalesce = settings.realtime.sse_coalesce_updates if coalesce is None else coalesce
+        self.dropped_subscribers = 0
+
+        self._pubsub: PubSub | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+        self._channels: dict[str, set[ChannelSubscription]] = {}
+        # UNSUBSCRIBE confirmations still to come for channels released here,
+        # so they are not mistaken for the server dropping a live channel
+        self._unsubscribing: dict[str, int] = {}
+
+    async def subscribe(self, channels: Iterable[str]) -> ChannelSubscription:
+        """
+        Attach a new subscriber, subscribing on Redis to channels not yet held.
+
+        Raises:
+            RedisError: If the Redis subscription fails
+        """
+        channels = tuple(dict.fromkeys(channels))
+        subscription = ChannelSubscription(
+            multiplexer=self, channels=channels, maxsize=self.queue_size, coalesce=self.coalesce
+        )
+        async with self._lock:
+            new_channels = [channel for channel in channels if channel not in self._channels]
+            if new_channels:
+                if self._pubsub is None:
+                    self._pubsub = self.redis.pubsub()
+                await self._pubsub.subscribe(*new_channels)
+                logger.info("sse.multiplexer.channels_subscribed", channels=new_channels)
+
+            for channel in channels:
+                self._channels.setdefault(channel, set()).add(subscription)
+                sse_subscribers.labels(channel=channel_prefix(channel)).inc()
+
+            if self._reader_task is None or self._reader_task.done():
+                self._reader_task = asyncio.create_task(
+                    self._read(self._pubsub), name="sse-channel-multiplexer"
+                )
+        return subscription
+
+    async def release(self, subscription: ChannelSubscription) -> None:
+        """Detach a subscriber, unsubscribing channels nobody listens to anymore."""
+        async with self._lock:
+            idle: list[str] = []
+            for channel in subscription.channels:
+                subscribers = self._channels.get(channel)
+                if subscribers is None or subscription not in subscribers:
+                    continue
+                subscribers.discard(subscription)
+                sse_subscribers.labels(channel=channel_prefix(channel)).dec()
+                if not subscribers:
+                    del self._channels[channel]
+                    idle.append(channel)
+
+            if not idle or self._pubsub is None:
+                return
+
+            try:
+                await self._pubsub.unsubscribe(*idle)
+                for channel in idle:
+                    self._unsubscribing[channel] = self._unsubscribing.get(channel, 0) + 1
+            except RedisError as exc:
+                logger.warning("sse.multiplexer.unsubscribe_failed", channels=idle, error=str(exc))
+            if not self._channels:
+                await self._shutdown()
+            logger.info("sse.multiplexer.channels_unsubscribed", channels=idle)
+
+    async def close(self) -> None:
+        """Close every subscriber and the shared Redis connection."""
+        async with self._lock:
+            for subscribers in self._channels.values():
+                for subscription in subscribers:
+                    subscription.close()
+            for channel, subscribers in self._channels.items():
+                sse_subscribers.labels(channel=channel_prefix(channel)).dec(len(subscribers))
+            self._channels.clear()
+            await self._shutdown()
+
+    async def _shutdown(self) -> None:
+        """Stop the reader and close the connection; caller holds the lock."""
+        task, self._reader_task = self._reader_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        pubsub, self._pubsub = self._pubsub, None
+        self._unsubscribing.clear()
+        if pubsub is not None:
+            try:
+                await pubsub.close()
+            except RedisError as exc:
+                logger.warning("sse.multiplexer.close_failed", error=str(exc))
+
+    async def _read(self, pubsub: PubSub | None) -> None:
+        if pubsub is None:
+            return
+        try:
+            while True:
+                message = await pubsub.get_message(ignore_subscribe_messages=False, timeout=1.0)
+                if not message:
+                    await asyncio.sleep(0)
+                    continue
+                if message["type"] == "message":
+                    self._dispatch(_decode(message["channel"]), message["data"])
+                elif message["type"] == "unsubscribe":
+                    self._channel_gone(_decode(message["channel"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.error("sse.multiplexer.reader_failed", error=str(exc))
+            async with self._lock:
+                await self._fail_all(
+                    "Redis error" if isinstance(exc, RedisError) else "Stream error", exc
+                )
+
+    def _dispatch(self, channel: str, raw: Any) -> None:
+        """Decode one message and offer it to the channel's subscribers."""
+        subscribers = self._channels.get(channel)
+        if not subscribers:
+            return
+        data = _decode(raw)
+        try:
+            payload = json.loads(data)
+        except json.JSONDecodeError:
+            logger.warning("sse.invalid_json", channel=channel)
+            return
+        if not isinstance(payload, dict):
+            logger.warning("sse.invalid_json", channel=channel)
+            return
+
+        message = ChannelMessage(channel=channel, data=data, payload=payload)
+        key = coalesce_key(channel, payload)
+        for subscription in list(subscribers):
+            if not subscription.offer(message, key):
+                self.dropped_subscribers += 1
+                sse_subscribers_dropped_total.inc()
+                logger.warning(
+                    "sse.multiplexer.slow_subscriber_dropped",
+                    channels=subscription.channels,
+                    queue_size=subscription.maxsize,
+                )
+                subscription.close(overflowed=True)
+
+    def _channel_gone(self, channel: str) -> None:
+        """Handle an UNSUBSCRIBE confirmation for ``channel``."""
+        pending = self._unsubscribing.get(channel, 0)
+        if pending:
+            if pending == 1:
+                del self._unsubscribing[channel]
+            else:
+                self._unsubscribing[channel] = pending - 1
+            return
+        # Not requested by us: the channel is gone, so end its streams
+        for subscription in list(self._channels.get(channel, ())):
+            subscription.close()
+
+    async def _fail_all(self, error: str, exc: Exception) -> None:
+        """
+        End every stream after the reader failed; caller holds the lock.
+
+        The channels and the broken connection are dropped, so the next
+        subscribe starts over with a new connection and reader.
+        """
+        for channel, subscribers in self._channels.items():
+            for subscription in subscribers:
+                subscription.close(error=f"{error}: {exc}" if str(exc) else error)
+            sse_subscribers.labels(channel=channel_prefix(channel)).dec(len(subscribers))
+        self._channels.clear()
+        await self._shutdown()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Subscriber and buffer statistics for this process."""
+        subscriptions = {sub for subscribers in self._channels.values() for sub in subscribers}
+        depths = [subscription.depth for subscription in subscriptions]
+        return {
+            "channels": len(self._channels),
+            "subscribers": len(subscriptions),
+            "subscribers_by_channel": {
+                channel: len(subscribers) for channel, subscribers in self._channels.items()
+            },
+            "queued_messages": sum(depths),
+            "max_queue_depth": max(depths, default=0),
+            "coalesced_messages": sum(sub.coalesced for sub in subscriptions),
+            "dropped_subscribers": self.dropped_subscribers,
+        }
+
+
+_multiplexers: "weakref.WeakKeyDictionary[Any, ChannelMultiplexer]" = weakref.WeakKeyDictionary()
+
+
+def get_channel_multiplexer(redis: RedisClientType) -> ChannelMultiplexer:
+    """Return the process-wide multiplexer for a Redis client."""
+    multiplexer = _multiplexers.get(redis)
+    if multiplexer is None:
+        multiplexer = _multiplexers[redis] = ChannelMultiplexer(redis)
+    return multiplexer
@@ -2,6 +2,10 @@
 Server-Sent Events (SSE) Handlers
 
 Real-time one-way event streaming for ONU status, alerts, and tickets.
+
+All streams in a process share one Redis pub/sub connection through the
+channel multiplexer, which buffers, coalesces and fans messages out to each
+client.
 """
 
 import asyncio
@@ -11,11 +15,14 @@ from typing import Any
 
 import structlog
 from fastapi import HTTPException
-from redis.asyncio.client import PubSub
 from redis.exceptions import RedisError
-from redis.exceptions import TimeoutError as RedisTimeoutError
 from sse_starlette.sse import EventSourceResponse
 
+from dotmac.platform.realtime.multiplexer import (
+    ChannelSubscription,
+    channel_prefix,
+    get_channel_multiplexer,
+)
 from dotmac.platform.redis_client import RedisClientType
 from dotmac.platform.resilience.circuit_breaker import (
     CircuitBreakerError,
@@ -30,35 +37,37 @@ def _normalize_tenant(tenant_id: str | None) -> str:
 
 
 class SSEStream:
-    """Base class for SSE event streams."""
+    """
+    Base class for SSE event streams.
+
+    Streams attach to the process-wide channel multiplexer rather than opening
+    a Redis pub/sub connection per client.
+    """
 
     def __init__(self, redis: RedisClientType, tenant_id: str | None):
         self.redis = redis
         self.tenant_id = _normalize_tenant(tenant_id)
-        self.pubsub: PubSub | None = None
+        self.subscription: ChannelSubscription | None = None
 
-    async def subscribe(self, channel: str) -> AsyncGenerator[dict[str, Any]]:
+    async def _open(self, channels: list[str], log_prefix: str) -> ChannelSubscription:
         """
-        Subscribe to Redis channel and yield SSE events.
-
-        Args:
-            channel: Redis pub/sub channel name
-
-        Yields:
-            SSE event dictionaries
+        Attach to the multiplexer for the given channels.
 
         Raises:
             HTTPException: 503 if Redis is unavailable or circuit breaker is open
         """
         circuit_breaker = get_redis_pubsub_breaker()
+        log_context: dict[str, Any] = (
+            {"channel": channels[0]} if len(channels) == 1 else {"channels": channels}
+        )
 
         # Check circuit breaker state before attempting subscription
         if circuit_breaker.is_open:
             logger.error(
-                "sse.circuit_breaker_open",
+                f"{log_prefix}.circuit_breaker_open",
                 tenant_id=self.tenant_id,
-                channel=channel,
                 circuit_state=circuit_breaker.get_state(),
+                **log_context,
             )
             raise HTTPException(
                 status_code=503,
@@ -69,22 +78,23 @@ class SSEStream:
                 },
             )
 
-        async def _subscribe_with_breaker() -> PubSub:
-            """Subscribe to channel with circuit breaker protection."""
-            pubsub = self.redis.pubsub()
-            await pubsub.subscribe(channel)
-            return pubsub
+        multiplexer = get_channel_multiplexer(self.redis)
+
+        async def _subscribe_with_breaker() -> ChannelSubscription:
+            """Subscribe to channels with circuit breaker protection."""
+            return await multiplexer.subscribe(channels)
 
         try:
             # Use circuit breaker for subscription
-            self.pubsub = await circuit_breaker.call(_subscribe_with_breaker)
-            logger.info("sse.subscribed", tenant_id=self.tenant_id, channel=channel)
+            subscription = await circuit_breaker.call(_subscribe_with_breaker)
+            logger.info(f"{log_prefix}.subscribed", tenant_id=self.tenant_id, **log_context)
+            return subscription
         except CircuitBreakerError as exc:
             logger.error(
-                "sse.circuit_breaker_open",
+                f"{log_prefix}.circuit_breaker_open",
                 tenant_id=self.tenant_id,
-                channel=channel,
                 error=str(exc),
+                **log_context,
             )
             raise HTTPException(
                 status_code=503,
@@ -95,10 +105,10 @@ class SSEStream:
             )
         except RedisError as exc:
             logger.error(
-                "sse.redis_subscribe_failed",
+                f"{log_prefix}.redis_subscribe_failed",
                 tenant_id=self.tenant_id,
-                channel=channel,
                 error=str(exc),
+                **log_context,
             )
             raise HTTPException(
                 status_code=503,
@@ -110,10 +120,10 @@ class SSEStream:
             )
         except Exception as exc:  # pragma: no cover - defensive
             logger.error(
-                "sse.subscribe_failed",
+                f"{log_prefix}.subscribe_failed",
                 tenant_id=self.tenant_id,
-                channel=channel,
                 error=str(exc),
+                **log_context,
             )
             raise HTTPException(
                 status_code=503,
@@ -124,74 +134,53 @@ class SSEStream:
                 },
             )
 
+    def _end_event(self, subscription: ChannelSubscription) -> dict[str, Any] | None:
+        """Error event explaining why a subscription ended, if it did not end cleanly."""
+        if subscription.overflowed:
+            return {
+                "event": "error",
+                "data": json.dumps(
+                    {"error": "Stream fell behind", "detail": "Reconnect to resume"}
+                ),
+            }
+        if subscription.error:
+            return {
+                "event": "error",
+                "data": json.dumps({"error": "Redis error", "detail": subscription.error}),
+            }
+        return None
+
+    async def subscribe(self, channel: str) -> AsyncGenerator[dict[str, Any]]:
+        """
+        Subscribe to Redis channel and yield SSE events.
+
+        Args:
+            channel: Redis pub/sub channel name
+
+        Yields:
+            SSE event dictionaries
+
+        Raises:
+            HTTPException: 503 if Redis is unavailable or circuit breaker is open
+        """
+        self.subscription = subscription = await self._open([channel], "sse")
+
         try:
             # Send initial connection event
             yield {"event": "connected", "data": json.dumps({"channel": channel})}
 
-            while True:
-                try:
-                    message = await self.pubsub.get_message(
-                        ignore_subscribe_messages=False, timeout=1.0
-                    )
-                except RedisTimeoutError:
-                    # Idle timeout - keep connection alive
-                    continue
-
-                if not message:
-                    continue
-
-                if message["type"] == "message":
-                    try:
-                        event_data = json.loads(message["data"])
-                        event_type = event_data.get("event_type", "unknown")
-                        yield {"event": event_type, "data": message["data"]}
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            "sse.invalid_json",
-                            tenant_id=self.tenant_id,
-                            channel=channel,
-                        )
-                        continue
-                elif message["type"] == "unsubscribe":
-                    break
+            async for message in subscription:
+                yield {"event": message.event_type, "data": message.data}
+
+            end_event = self._end_event(subscription)
+            if end_event is not None:
+                yield end_event
 
         except asyncio.CancelledError:
             logger.info("sse.cancelled", tenant_id=self.tenant_id, channel=channel)
             raise
-        except RedisError as exc:
-            logger.error(
-                "sse.redis_error",
-                tenant_id=self.tenant_id,
-                channel=channel,
-                error=str(exc),
-            )
-            yield {
-                "event": "error",
-                "data": json.dumps({"error": "Redis error", "detail": str(exc)}),
-            }
-        except Exception as e:  # pragma: no cover - defensive
-            logger.error(
-                "sse.error",
-                tenant_id=self.tenant_id,
-                channel=channel,
-                error=str(e),
-            )
-            yield {
-                "event": "error",
-                "data": json.dumps({"error": "Stream error occurred"}),
-            }
         finally:
-            if self.pubsub:
-                try:
-                    await self.pubsub.unsubscribe(channel)
-                    await self.pubsub.close()
-                except RedisError as exc:
-                    logger.warning(
-                        "sse.redis_unsubscribe_failed",
-                        tenant_id=self.tenant_id,
-                        channel=channel,
-                        error=str(exc),
-                    )
+            await subscription.aclose()
             logger.info("sse.unsubscribed", tenant_id=self.tenant_id, channel=channel)
 
 
@@ -269,160 +258,25 @@ class CombinedEventStream(SSEStream):
 
     async def stream(self) -> AsyncGenerator[dict[str, Any]]:
         """Subscribe to all real-time channels and forward events."""
-        circuit_breaker = get_redis_pubsub_breaker()
-
-        if circuit_breaker.is_open:
-            logger.error(
-                "sse.combined.circuit_breaker_open",
-                tenant_id=self.tenant_id,
-                channels=self.channels,
-                circuit_state=circuit_breaker.get_state(),
-            )
-            raise HTTPException(
-                status_code=503,
-                detail={
-                    "error": "Redis pub/sub temporarily unavailable",
-                    "message": "Service is experiencing connection issues. Please try again later.",
-                    "circuit_breaker_state": circuit_breaker.get_state(),
-                },
-            )
-
-        async def _subscribe_with_breaker() -> PubSub:
-            pubsub = self.redis.pubsub()
-            await pubsub.subscribe(*self.channels)
-            return pubsub
-
-        try:
-            self.pubsub = await circuit_breaker.call(_subscribe_with_breaker)
-            logger.info(
-                "sse.combined.subscribed",
-                tenant_id=self.tenant_id,
-                channels=self.channels,
-            )
-        except CircuitBreakerError as exc:
-            logger.error(
-                "sse.combined.circuit_breaker_open",
-                tenant_id=self.tenant_id,
-                channels=self.channels,
-                error=str(exc),
-            )
-            raise HTTPException(
-                status_code=503,
-                detail={
-                    "error": "Redis pub/sub temporarily unavailable",
-                    "message": str(exc),
-                },
-            )
-        except RedisError as exc:
-            logger.error(
-                "sse.combined.redis_subscribe_failed",
-                tenant_id=self.tenant_id,
-                channels=self.channels,
-                error=str(exc),
-            )
-            raise HTTPException(
-                status_code=503,
-                detail={
-                    "error": "Redis connection failed",
-                    "message": "Unable to establish connection to Redis pub/sub. Please check Redis status.",
-                    "detail": str(exc),
-                },
-            )
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.error(
-                "sse.combined.subscribe_failed",
-                tenant_id=self.tenant_id,
-                channels=self.channels,
-                error=str(exc),
-            )
-            raise HTTPException(
-                status_code=503,
-                detail={
-                    "error": "Stream initialization failed",
-                    "message": "Unable to initialize event stream.",
-                    "detail": str(exc),
-                },
-            )
+        self.subscription = subscription = await self._open(self.channels, "sse.combined")
 
         try:
             # Send initial connection event with channel list for client context
             yield {"event": "connected", "data": json.dumps({"channels": self.channels})}
 
-            while True:
-                try:
-                    message = await self.pubsub.get_message(
-                        ignore_subscribe_messages=False, timeout=1.0
-                    )
-                except RedisTimeoutError:
-                    continue
-
-                if not message:
-                    continue
-
-                if message["type"] == "message":
-                    channel_raw = message.get("channel")
-                    channel = (
-                        channel_raw.decode() if isinstance(channel_raw, bytes) else str(channel_raw)
-                    )
-
-                    try:
-                        event_data = json.loads(message["data"])
-                    except json.JSONDecodeError:
-                        logger.warning(
-                            "sse.combined.invalid_json",
-                            tenant_id=self.tenant_id,
-                            channel=channel,
-                        )
-                        continue
-
-                    event_type = event_data.get("event_type") or (
-                        channel.split(":", 1)[0] if channel else "message"
-                    )
-
-                    if "source" not in event_data:
-                        event_data["source"] = channel
-
-                    yield {"event": str(event_type), "data": json.dumps(event_data)}
-                elif message["type"] == "unsubscribe":
-                    break
+            async for message in subscription:
+                event_type = message.payload.get("event_type") or channel_prefix(message.channel)
+                yield {"event": str(event_type), "data": message.sourced_data}
+
+            end_event = self._end_event(subscription)
+            if end_event is not None:
+                yield end_event
 
         except asyncio.CancelledError:
             logger.info("sse.combined.cancelled", tenant_id=self.tenant_id, channels=self.channels)
             raise
-        except RedisError as exc:
-            logger.error(
-                "sse.combined.redis_error",
-                tenant_id=self.tenant_id,
-                channels=self.channels,
-                error=str(exc),
-            )
-            yield {
-                "event": "error",
-                "data": json.dumps({"error": "Redis error", "detail": str(exc)}),
-            }
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.error(
-                "sse.combined.error",
-                tenant_id=self.tenant_id,
-                channels=self.channels,
-                error=str(exc),
-            )
-            yield {
-                "event": "error",
-                "data": json.dumps({"error": "Stream error occurred"}),
-            }
         finally:
-            if self.pubsub:
-                try:
-                    await self.pubsub.unsubscribe(*self.channels)
-                    await self.pubsub.close()
-                except RedisError as exc:
-                    logger.warning(
-                        "sse.combined.redis_unsubscribe_failed",
-                        tenant_id=self.tenant_id,
-                        channels=self.channels,
-                        error=str(exc),
-                    )
+            await subscription.aclose()
             logger.info(
                 "sse.combined.unsubscribed", tenant_id=self.tenant_id, channels=self.channels
             )
@@ -25,6 +25,7 @@ from dotmac.platform.genieacs.service import GenieACSService
 from dotmac.platform.netbox.service import NetBoxService
 from dotmac.platform.notifications.models import NotificationPriority, NotificationType
 from dotmac.platform.notifications.service import NotificationService
+from dotmac.platform.radius.auth_cache import get_authorization_cache
 from dotmac.platform.radius.models import RadCheck
 from dotmac.platform.radius.schemas import RADIUSSubscriberCreate
 from dotmac.platform.radius.service import RADIUSService
@@ -81,6 +82,12 @@ class OrchestrationService:
         """Return a tenant-scoped RADIUS service instance."""
         return self._radius_service_factory(self.db, tenant_id)
 
+    async def _invalidate_radius_authorization(self, tenant_id: str, username: str) -> None:
+        """Drop cached RADIUS authorization data after a committed radcheck change."""
+        authorization_cache = get_authorization_cache()
+        if authorization_cache is not None:
+            await authorization_cache.invalidate(tenant_id, username)
+
     async def convert_lead_to_customer(
         self,
         tenant_id: str,
@@ -601,6 +608,9 @@ class OrchestrationService:
 
         await self.db.commit()
 
+        if radcheck_entry:
+            await self._invalidate_radius_authorization(tenant_id, radcheck_entry.username)
+
         logger.info("Subscriber suspended", tenant_id=tenant_id, subscriber_id=subscriber_id)
 
         return {
@@ -673,6 +683,9 @@ class OrchestrationService:
 
         await self.db.commit()
 
+        if radcheck_entry:
+            await self._invalidate_radius_authorization(tenant_id, radcheck_entry.username)
+
         logger.info("Subscriber reactivated", tenant_id=tenant_id, subscriber_id=subscriber_id)
 
         return {
@@ -296,6 +296,20 @@ class RADIUSSettings(BaseModel):  # BaseModel resolves to Any in isolation
     # Connection settings
     timeout_seconds: int = Field(5, description="RADIUS request timeout in seconds")
     max_retries: int = Field(2, description="Maximum retry attempts for failed requests")
+    coa_max_in_flight_per_nas: int = Field(
+        32, ge=1, le=256, description="Maximum outstanding CoA/DM requests per NAS"
+    )
+
+    # In-process authorization cache (Access-Request fast path)
+    authz_cache_enabled: bool = Field(
+        True, description="Serve authorization from an in-process cache"
+    )
+    authz_cache_max_entries: int = Field(
+        100_000, ge=1, description="Max usernames held in the authorization cache"
+    )
+    authz_cache_ttl_seconds: float = Field(
+        300.0, gt=0, description="Max lifetime of a cached authorization (bounds staleness)"
+    )
 
     # HTTP API fallback (optional alternative to native RADIUS)
     use_http_api: bool = Field(False, description="Use HTTP API instead of native RADIUS protocol")
@@ -326,6 +340,22 @@ class RADIUSSettings(BaseModel):  # BaseModel resolves to Any in isolation
             data["timeout_seconds"] = int(os.getenv("RADIUS_TIMEOUT", "5"))
         if "max_retries" not in data:
             data["max_retries"] = int(os.getenv("RADIUS_MAX_RETRIES", "2"))
+        if "coa_max_in_flight_per_nas" not in data:
+            data["coa_max_in_flight_per_nas"] = int(
+                os.getenv("RADIUS_COA_MAX_IN_FLIGHT_PER_NAS", "32")
+            )
+        if "authz_cache_enabled" not in data:
+            data["authz_cache_enabled"] = os.getenv(
+                "RADIUS_AUTHZ_CACHE_ENABLED", "true"
+            ).lower() in {"true", "1"}
+        if "authz_cache_max_entries" not in data:
+            data["authz_cache_max_entries"] = int(
+                os.getenv("RADIUS_AUTHZ_CACHE_MAX_ENTRIES", "100000")
+            )
+        if "authz_cache_ttl_seconds" not in data:
+            data["authz_cache_ttl_seconds"] = float(
+                os.getenv("RADIUS_AUTHZ_CACHE_TTL_SECONDS", "300")
+            )
         if "use_http_api" not in data:
             data["use_http_api"] = os.getenv("RADIUS_USE_HTTP_API", "false").lower() in {
                 "true",
@@ -482,6 +512,25 @@ class AuthSettings(BaseModel):  # BaseModel resolves to Any in isolation
         description="Maximum concurrent sessions allowed per user",
     )
 
+    # In-process verification cache (blacklist, session and API key lookups)
+    verification_cache_enabled: bool = Field(
+        True, description="Serve token/session/API key checks from an in-process cache"
+    )
+    verification_cache_max_entries: int = Field(
+        50_000, ge=1, description="Max entries held in the verification cache"
+    )
+    verification_cache_ttl_seconds: float = Field(
+        5.0,
+        gt=0,
+        le=60,
+        description="Max lifetime of a cached check (bounds staleness if a revocation broadcast is lost)",
+    )
+    session_touch_interval_seconds: int = Field(
+        60,
+        ge=0,
+        description="Minimum seconds between sliding-expiry refreshes of the same session",
+    )
+
     def __init__(self, **data: Any):
         """Initialize with environment variable overrides."""
         super().__init__(**data)
@@ -817,6 +866,21 @@ class Settings(BaseSettings):
         pool_recycle: int = Field(3600, description="Recycle connections after seconds")
         pool_pre_ping: bool = Field(True, description="Test connections before use")
 
+        # Read replicas (see dotmac.platform.db.replicas)
+        read_replica_urls: list[str] = Field(
+            default_factory=list,
+            description="Async URLs of streaming read replicas; empty disables read routing",
+        )
+        replica_max_lag_seconds: float = Field(
+            5.0, gt=0, description="Replicas lagging further behind are skipped for reads"
+        )
+        replica_check_interval_seconds: float = Field(
+            10.0, gt=0, description="Seconds between replica lag checks"
+        )
+        replica_check_timeout_seconds: float = Field(
+            2.0, gt=0, description="Replicas not answering a lag check in time are skipped"
+        )
+
         # Options
         echo: bool = Field(False, description="Echo SQL statements")
         echo_pool: bool = Field(False, description="Echo pool events")
@@ -899,6 +963,40 @@ class Settings(BaseSettings):
 
     redis: RedisSettings = RedisSettings()  # type: ignore[call-arg]
 
+    # ============================================================
+    # Application Cache
+    # ============================================================
+
+    class CacheSettings(BaseModel):  # BaseModel resolves to Any in isolation
+        """Application cache (CacheService) configuration."""
+
+        model_config = ConfigDict()
+
+        # In-process L1 cache in front of Redis
+        local_enabled: bool = Field(False, description="Enable in-process L1 cache")
+        local_namespaces: list[str] = Field(
+            default_factory=lambda: ["settings", "feature_flags", "tenant", "subscription"],
+            description="Cache namespaces served from the L1 cache",
+        )
+        local_max_entries: int = Field(10_000, description="Max entries held in the L1 cache")
+        local_ttl_seconds: float = Field(
+            30.0, description="Max lifetime of an L1 entry (bounds staleness)"
+        )
+
+        # Value encoding (readers decode every installed codec, so these can
+        # be changed without flushing the cache)
+        serializer: str = Field(
+            "auto", description="Cache serializer: auto, json, orjson or msgpack"
+        )
+        compressor: str = Field(
+            "auto", description="Cache compressor: auto, none, zlib, zstd or lz4"
+        )
+        compression_threshold_bytes: int = Field(
+            1024, description="Compress serialized values larger than this"
+        )
+
+    cache: CacheSettings = CacheSettings()  # type: ignore[call-arg]
+
     # ============================================================
     # TimescaleDB Configuration (Time-Series Metrics)
     # ============================================================
@@ -1473,8 +1571,177 @@ class Settings(BaseSettings):
         retry_attempts: int = Field(3, description="Number of retry attempts for failed webhooks")
         timeout_seconds: int = Field(30, description="Webhook request timeout")
 
+        # Delivery worker
+        delivery_worker_enabled: bool = Field(
+            False,
+            description=(
+                "Queue deliveries for the background worker instead of sending inline; "
+                "also starts an in-process worker in each app process"
+            ),
+        )
+        worker_batch_size: int = Field(200, description="Deliveries claimed per worker batch")
+        worker_concurrency: int = Field(100, description="Concurrent deliveries per worker")
+        worker_max_per_endpoint: int = Field(
+            8, description="Concurrent deliveries (and pooled connections) per endpoint"
+        )
+        worker_poll_interval_seconds: float = Field(
+            5.0, description="Idle poll interval when no wakeup is received"
+        )
+        worker_claim_lease_seconds: int = Field(
+            300, description="Seconds before an unfinished claimed delivery is reclaimed"
+        )
+        worker_circuit_failure_threshold: int = Field(
+            5, description="Consecutive endpoint failures before its circuit opens"
+        )
+        worker_circuit_recovery_seconds: float = Field(
+            60.0, description="Seconds an open endpoint circuit waits before probing"
+        )
+        worker_http2: bool = Field(True, description="Use HTTP/2 when the h2 package is installed")
+
     webhooks: WebhookSettings = WebhookSettings()  # type: ignore[call-arg]
 
+    # ============================================================
+    # Real-Time (WebSocket / SSE)
+    # ============================================================
+
+    class RealtimeSettings(BaseModel):  # BaseModel resolves to Any in isolation
+        """WebSocket and SSE fan-out configuration."""
+
+        model_config = ConfigDict()
+
+        ws_broadcast_channel: str = Field(
+            "realtime:ws:broadcast", description="Redis channel relaying broadcasts between workers"
+        )
+        ws_send_queue_size: int = Field(
+            256, description="Messages buffered per WebSocket before it is dropped as slow"
+        )
+        ws_send_timeout_seconds: float = Field(
+            5.0, description="Seconds a single WebSocket send may take before the socket is dropped"
+        )
+        sse_queue_size: int = Field(
+            512, description="Messages buffered per SSE stream before it is closed as slow"
+        )
+        sse_coalesce_updates: bool = Field(
+            True,
+            description="Replace pending ONU status and RADIUS interim updates with newer ones",
+        )
+
+    realtime: RealtimeSettings = RealtimeSettings()  # type: ignore[call-arg]
+
+    # ============================================================
+    # GraphQL
+    # ============================================================
+
+    class GraphQLSettings(BaseModel):  # BaseModel resolves to Any in isolation
+        """GraphQL endpoint execution limits and caching."""
+
+        model_config = ConfigDict()
+
+        persisted_queries_enabled: bool = Field(
+            True, description="Accept automatic persisted queries (sha256 hash instead of query)"
+        )
+        persisted_query_ttl_seconds: int = Field(
+            7 * 24 * 3600, gt=0, description="Seconds a registered persisted query is kept in Redis"
+        )
+        persisted_query_local_entries: int = Field(
+            2000, gt=0, description="Persisted query documents kept in process memory"
+        )
+        document_cache_size: int = Field(
+            1000, gt=0, description="Parsed and validated documents kept in the LRU cache"
+        )
+        max_query_cost: int = Field(
+            20_000, gt=0, description="Operations with a higher estimated cost are rejected"
+        )
+        max_query_depth: int = Field(
+            12, gt=0, description="Operations nesting fields deeper than this are rejected"
+        )
+        default_list_size: int = Field(
+            20, gt=0, description="Assumed length of list fields without a limit argument"
+        )
+        field_cache_max_entries: int = Field(
+            10_000, gt=0, description="Cached field results kept in process memory"
+        )
+
+    graphql: GraphQLSettings = GraphQLSettings()  # type: ignore[call-arg]
+
+    # ============================================================
+    # GenieACS Bulk Execution
+    # ============================================================
+
+    class GenieACSSettings(BaseModel):  # BaseModel resolves to Any in isolation
+        """Tuning for bulk CPE operations, device statistics and the CPE inventory."""
+
+        model_config = ConfigDict()
+
+        rate_limit_per_second: float = Field(
+            0.0,
+            ge=0,
+            description=(
+                "Device requests started per second against one ACS (0 disables); "
+                "overridable per tenant via the OSS config extra 'rate_limit_per_second'"
+            ),
+        )
+        status_flush_size: int = Field(
+            100, gt=0, description="Per-device results written and published per batch"
+        )
+        status_flush_interval_seconds: float = Field(
+            2.0, gt=0, description="Longest delay before buffered per-device results are written"
+        )
+        bulk_max_concurrent: int = Field(
+            20, gt=0, description="Device tasks in flight for bulk API operations by default"
+        )
+        stats_refresh_interval_seconds: float = Field(
+            30.0, ge=0, description="How long cached device statistics are served before refreshing"
+        )
+        stats_full_resync_seconds: float = Field(
+            900.0,
+            ge=0,
+            description="Interval between full device statistics rebuilds (catches deleted devices)",
+        )
+        stats_page_size: int = Field(
+            1000, gt=0, description="Devices fetched per page when aggregating statistics"
+        )
+        inventory_sync_interval_seconds: float = Field(
+            30.0,
+            ge=0,
+            description="How long the CPE inventory is served before an incremental sync",
+        )
+        inventory_full_resync_seconds: float = Field(
+            900.0,
+            ge=0,
+            description="Interval between full CPE inventory rebuilds (catches deleted devices)",
+        )
+        inventory_page_size: int = Field(
+            1000, gt=0, description="Devices fetched per page when syncing the CPE inventory"
+        )
+        device_cache_ttl_seconds: float = Field(
+            5.0,
+            ge=0,
+            description="How long a GenieACS client reuses a fetched device document (0 disables)",
+        )
+
+    genieacs: GenieACSSettings = GenieACSSettings()  # type: ignore[call-arg]
+
+    # ============================================================
+    # VOLTHA PON Topology
+    # ============================================================
+
+    class VOLTHASettings(BaseModel):  # BaseModel resolves to Any in isolation
+        """Caching of the OLT/PON/ONU topology used by ONU discovery and provisioning."""
+
+        model_config = ConfigDict()
+
+        topology_ttl_seconds: float = Field(
+            300.0,
+            ge=0,
+            description="Longest time the cached PON topology is used without a rebuild",
+        )
+        topology_port_fetch_concurrency: int = Field(
+            10, gt=0, description="OLT port listings fetched in parallel when building the topology"
+        )
+
+    voltha: VOLTHASettings = VOLTHASettings()  # type: ignore[call-arg]
+
     # ============================================================
     # RADIUS Server
     # ============================================================
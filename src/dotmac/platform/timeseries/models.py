@@ -1,6 +1,6 @@
 """TimescaleDB Time-Series Models."""
 
-from sqlalchemy import TIMESTAMP, BigInteger, Column, Integer, String
+from sqlalchemy import TIMESTAMP, BigInteger, Column, Index, Integer, String
 from sqlalchemy.dialects.postgresql import INET
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -36,3 +36,27 @@ class RadAcctTimeSeries(TimeSeriesBase):
     # Timestamps
     session_start_time = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
     session_stop_time = Column(TIMESTAMP(timezone=True))
+
+    __table_args__ = (
+        # Makes re-syncing a session a no-op (hypertable unique indexes must
+        # include the time column)
+        Index(
+            "uq_radacct_ts_session",
+            "time",
+            "tenant_id",
+            "nas_ip_address",
+            "session_id",
+            unique=True,
+        ),
+    )
+
+
+class RadAcctSyncWatermark(TimeSeriesBase):
+    """High-water mark of the radacct -> radacct_timeseries sync."""
+
+    __tablename__ = "radacct_sync_watermark"
+
+    name = Column(String(64), primary_key=True)
+    last_stop_time = Column(TIMESTAMP(timezone=True), nullable=False)
+    last_radacctid = Column(BigInteger, nullable=False)
+    updated_at = Column(TIMESTAMP(timezone=True), nullable=False)
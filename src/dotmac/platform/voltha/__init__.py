@@ -30,6 +30,7 @@ Components:
 - client: VOLTHA gRPC/REST client wrapper
 - schemas: Pydantic schemas for VOLTHA entities
 - service: Business logic for PON management
+- topology: Cached OLT/PON/ONU topology for discovery and provisioning lookups
 - router: FastAPI endpoints for VOLTHA operations
 """
 
@@ -68,7 +68,7 @@ async def get_voltha_service(
         timeout_seconds=config.timeout_seconds,
         max_retries=config.max_retries,
     )
-    return VOLTHAService(client=client)
+    return VOLTHAService(client=client, tenant_id=tenant.id)
 
 
 # =============================================================================
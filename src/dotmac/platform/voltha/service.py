@@ -38,6 +38,12 @@ from dotmac.platform.voltha.schemas import (
     VOLTHAEventStreamResponse,
     VOLTHAHealthResponse,
 )
+from dotmac.platform.voltha.topology import (
+    PonTopology,
+    TopologyCache,
+    get_topology_cache,
+    new_topology_cache,
+)
 
 # Python 3.9/3.10 compatibility: UTC was added in 3.11
 UTC = UTC
@@ -89,6 +95,24 @@ class VOLTHAService:
         """
         self.client = client or VOLTHAClient(tenant_id=tenant_id)
         self.tenant_id = tenant_id
+        self._topology_cache: TopologyCache | None = None
+
+    @property
+    def topology_cache(self) -> TopologyCache:
+        """PON topology cache shared by every service for the same VOLTHA instance."""
+        if self._topology_cache is None:
+            base_url = getattr(self.client, "base_url", None)
+            self._topology_cache = (
+                get_topology_cache(self.tenant_id, base_url)
+                if isinstance(base_url, str)
+                else new_topology_cache()
+            )
+        return self._topology_cache
+
+    def _update_cached_device(self, device_id: str, **changes: Any) -> None:
+        topology = self.topology_cache.topology
+        if topology is not None:
+            topology.update_device(device_id, **changes)
 
     # =========================================================================
     # Health and Status
@@ -151,6 +175,7 @@ class VOLTHAService:
         """Enable device"""
         try:
             await self.client.enable_device(device_id)
+            self._update_cached_device(device_id, admin_state="ENABLED")
             return DeviceOperationResponse(
                 success=True,
                 message=f"Device {device_id} enabled successfully",
@@ -168,6 +193,7 @@ class VOLTHAService:
         """Disable device"""
         try:
             await self.client.disable_device(device_id)
+            self._update_cached_device(device_id, admin_state="DISABLED")
             return DeviceOperationResponse(
                 success=True,
                 message=f"Device {device_id} disabled successfully",
@@ -201,6 +227,9 @@ class VOLTHAService:
     async def delete_device(self, device_id: str) -> bool:
         """Delete device"""
         result = await self.client.delete_device(device_id)
+        topology = self.topology_cache.topology
+        if result and topology is not None:
+            topology.remove_device(device_id)
         return bool(result)
 
     async def delete_onu(self, device_id: str) -> bool:
@@ -339,93 +368,50 @@ class VOLTHAService:
         Returns:
             ONUDiscoveryResponse with list of discovered ONUs
         """
-        from datetime import datetime
-
         discovered_onus: list[DiscoveredONU] = []
-        devices_raw = await self.client.get_devices()
-        devices = [self._coerce_mapping(device) for device in devices_raw]
-        devices_by_parent: dict[str, list[dict[str, Any]]] = {}
-
-        for device in devices:
-            parent_id = device.get("parent_id")
-            if parent_id is None:
-                continue
-            parent_key = str(parent_id)
-            devices_by_parent.setdefault(parent_key, []).append(device)
+        # ONU states change without topology events; read them on every scan
+        topology = await self.topology_cache.refresh_devices(self.client)
 
-        # Get all logical devices (OLTs) or specific OLT
+        # Get all OLTs or the requested one (by logical device ID)
         if olt_device_id:
-            olt_raw = await self.client.get_logical_device(olt_device_id)
-            olts = [self._coerce_mapping(olt_raw)] if olt_raw else []
+            olt = topology.olt_for_logical_device(olt_device_id)
+            if olt is None:
+                # May have been added since the topology was built
+                topology = await self.topology_cache.refresh(self.client)
+                olt = topology.olt_for_logical_device(olt_device_id)
+            olts = [olt] if olt is not None else []
         else:
-            olts = [self._coerce_mapping(olt) for olt in await self.client.get_logical_devices()]
+            olts = list(topology.olts.values())
 
         for olt in olts:
-            olt_id = olt.get("id")
-            if not olt_id:
-                continue
-
-            root_device_id = olt.get("root_device_id")
-            if root_device_id is None:
-                continue
-
-            # Get ports for this OLT
-            ports = [
-                self._coerce_mapping(port)
-                for port in await self.client.get_logical_device_ports(olt_id)
-            ]
-            olt_devices = devices_by_parent.get(str(root_device_id), [])
-
-            for port in ports:
-                port_no = port.get("device_port_no")
-                if port_no is None:
-                    continue
-                try:
-                    port_no_int = int(port_no)
-                except (TypeError, ValueError):
-                    continue
-
-                # Find ONUs connected to this port that are discovered but not provisioned
-                for device in olt_devices:
-                    # Check if device is child of this OLT and on this port
-                    parent_id = device.get("parent_id")
-                    parent_port = device.get("parent_port_no")
-
-                    parent_port_int = self._coerce_int(parent_port)
-                    if parent_port_int is None:
-                        continue
-
-                    if (
-                        str(parent_id) == str(olt.get("root_device_id"))
-                        and parent_port_int == port_no_int
-                    ):
-                        serial_value = device.get("serial_number")
-                        serial = str(serial_value) if serial_value is not None else ""
-                        admin_state = device.get("admin_state")
-                        oper_status = device.get("oper_status")
-
-                        # ONU is discovered if it has serial number but is not fully activated
-                        if serial and (admin_state != "ENABLED" or oper_status != "ACTIVE"):
-                            # Extract vendor ID and vendor specific from serial number
-                            # Format is typically: VENDORSPECIFIC (e.g., ALCL12345678)
-                            vendor_id = serial[:4] if len(serial) >= 4 else None
-                            vendor_specific = serial[4:] if len(serial) > 4 else None
-
-                            proxy_address = self._coerce_mapping(device.get("proxy_address"))
-                            onu_id = proxy_address.get("onu_id")
-
-                            discovered_onus.append(
-                                DiscoveredONU(
-                                    serial_number=serial,
-                                    vendor_id=vendor_id,
-                                    vendor_specific=vendor_specific,
-                                    olt_device_id=str(parent_id),
-                                    pon_port=port_no_int,
-                                    onu_id=onu_id,
-                                    discovered_at=datetime.now(UTC).isoformat(),
-                                    status="discovered",
-                                )
-                            )
+            for port_no, device in topology.pon_port_onus(olt):
+                serial_value = device.get("serial_number")
+                serial = str(serial_value) if serial_value is not None else ""
+                admin_state = device.get("admin_state")
+                oper_status = device.get("oper_status")
+
+                # ONU is discovered if it has serial number but is not fully activated
+                if serial and (admin_state != "ENABLED" or oper_status != "ACTIVE"):
+                    # Extract vendor ID and vendor specific from serial number
+                    # Format is typically: VENDORSPECIFIC (e.g., ALCL12345678)
+                    vendor_id = serial[:4] if len(serial) >= 4 else None
+                    vendor_specific = serial[4:] if len(serial) > 4 else None
+
+                    proxy_address = self._coerce_mapping(device.get("proxy_address"))
+                    onu_id = proxy_address.get("onu_id")
+
+                    discovered_onus.append(
+                        DiscoveredONU(
+                            serial_number=serial,
+                            vendor_id=vendor_id,
+                            vendor_specific=vendor_specific,
+                            olt_device_id=olt.root_device_id,
+                            pon_port=port_no,
+                            onu_id=onu_id,
+                            discovered_at=datetime.now(UTC).isoformat(),
+                            status="discovered",
+                        )
+                    )
 
         logger.info(
             "voltha.discover_onus",
@@ -463,27 +449,12 @@ class VOLTHAService:
             provision_request = ONUProvisionRequest(**provision_request)
 
         try:
-            # Find the device by serial number
-            devices_raw = await self.client.get_devices()
-            target_device: dict[str, Any] | None = None
-
-            for raw_device in devices_raw:
-                device = self._coerce_mapping(raw_device)
-                if device.get("serial_number") == provision_request.serial_number:
-                    parent_id = device.get("parent_id")
-                    parent_port = device.get("parent_port_no")
-
-                    parent_port_int = self._coerce_int(parent_port)
-                    if parent_port_int is None:
-                        continue
-
-                    # Verify OLT and port match
-                    if (
-                        str(parent_id) == str(provision_request.olt_device_id)
-                        and parent_port_int == provision_request.pon_port
-                    ):
-                        target_device = device
-                        break
+            # Find the device by serial number; a miss may be a newly discovered ONU
+            topology = await self.topology_cache.get(self.client)
+            target_device = self._match_provision_target(topology, provision_request)
+            if target_device is None:
+                topology = await self.topology_cache.refresh(self.client)
+                target_device = self._match_provision_target(topology, provision_request)
 
             if not target_device:
                 return ONUProvisionResponse(
@@ -503,6 +474,7 @@ class VOLTHAService:
 
             # Enable the device
             await self.client.enable_device(device_id)
+            topology.update_device(device_id, admin_state="ENABLED")
 
             # Configure VLAN and bandwidth profile if provided
             config_errors = []
@@ -566,6 +538,20 @@ class VOLTHAService:
                 pon_port=provision_request.pon_port,
             )
 
+    def _match_provision_target(
+        self, topology: PonTopology, provision_request: ONUProvisionRequest
+    ) -> dict[str, Any] | None:
+        device = topology.find_onu(provision_request.serial_number)
+        if device is None:
+            return None
+        # Verify OLT and port match
+        if (
+            str(device.get("parent_id")) == str(provision_request.olt_device_id)
+            and self._coerce_int(device.get("parent_port_no")) == provision_request.pon_port
+        ):
+            return device
+        return None
+
     # =========================================================================
     # Service Configuration (VLAN/Bandwidth)
     # =========================================================================
@@ -691,6 +677,25 @@ class VOLTHAService:
                 )
                 raise
 
+    async def _resolve_logical_device(self, parent_id: str) -> str:
+        """Logical device ID of an OLT, from the cached topology."""
+        topology = await self.topology_cache.get(self.client)
+        logical_device_id = topology.logical_device_id(parent_id)
+        if logical_device_id is None:
+            topology = await self.topology_cache.refresh(self.client)
+            logical_device_id = topology.logical_device_id(parent_id)
+        if logical_device_id is None:
+            raise ValueError(f"Logical device not found for OLT {parent_id}")
+        return logical_device_id
+
+    async def _resolve_flow_target(self, device_id: str, parent_id: str) -> tuple[str, int]:
+        """(OLT logical device ID, ONU UNI port) for installing an ONU's flows."""
+        logical_device_id = await self._resolve_logical_device(parent_id)
+        uni_port = await self.topology_cache.uni_port(self.client, device_id)
+        if uni_port is None:
+            raise ValueError(f"UNI port not found for device {device_id}")
+        return logical_device_id, uni_port
+
     async def _configure_vlan_flow(
         self,
         device_id: str,
@@ -709,28 +714,7 @@ class VOLTHAService:
             parent_id: Parent OLT device ID
             vlan: VLAN tag (C-TAG)
         """
-        # Get logical device for the OLT
-        logical_devices = await self.client.get_logical_devices()
-        logical_device_id = None
-
-        for ld in logical_devices:
-            if ld.get("root_device_id") == parent_id:
-                logical_device_id = ld.get("id")
-                break
-
-        if not logical_device_id:
-            raise ValueError(f"Logical device not found for OLT {parent_id}")
-
-        # Get device ports to find the UNI port
-        ports = await self.client.get_device_ports(device_id)
-        uni_port = None
-        for port in ports:
-            if port.get("type") == "ETHERNET_UNI":
-                uni_port = port.get("port_no")
-                break
-
-        if uni_port is None:
-            raise ValueError(f"UNI port not found for device {device_id}")
+        logical_device_id, uni_port = await self._resolve_flow_target(device_id, parent_id)
 
         # Create upstream flow (ONU -> OLT): Add VLAN tag
         upstream_flow = {
@@ -833,28 +817,7 @@ class VOLTHAService:
                 2. Action: Pop S-VLAN, Pop C-VLAN (deliver untagged to subscriber)
                 3. Forward: To UNI port
         """
-        # Get logical device for the OLT
-        logical_devices = await self.client.get_logical_devices()
-        logical_device_id = None
-
-        for ld in logical_devices:
-            if ld.get("root_device_id") == parent_id:
-                logical_device_id = ld.get("id")
-                break
-
-        if not logical_device_id:
-            raise ValueError(f"Logical device not found for OLT {parent_id}")
-
-        # Get device ports to find the UNI port
-        ports = await self.client.get_device_ports(device_id)
-        uni_port = None
-        for port in ports:
-            if port.get("type") == "ETHERNET_UNI":
-                uni_port = port.get("port_no")
-                break
-
-        if uni_port is None:
-            raise ValueError(f"UNI port not found for device {device_id}")
+        logical_device_id, uni_port = await self._resolve_flow_target(device_id, parent_id)
 
         # Create upstream QinQ flow (ONU -> OLT): Push C-VLAN then S-VLAN
         upstream_flow = {
@@ -966,17 +929,7 @@ class VOLTHAService:
             This is a simplified implementation. In production, bandwidth profiles
             would be looked up from a database or configuration store.
         """
-        # Get logical device for the OLT
-        logical_devices = await self.client.get_logical_devices()
-        logical_device_id = None
-
-        for ld in logical_devices:
-            if ld.get("root_device_id") == parent_id:
-                logical_device_id = ld.get("id")
-                break
-
-        if not logical_device_id:
-            raise ValueError(f"Logical device not found for OLT {parent_id}")
+        logical_device_id = await self._resolve_logical_device(parent_id)
 
         # Parse bandwidth profile name to get rates
         # Format: "XG" where X is the bandwidth in Mbps/Gbps
@@ -1144,6 +1097,8 @@ class VOLTHAService:
             else:
                 event_items = []
 
+            self.topology_cache.apply_events(event_items)
+
             events = []
             for event_data in event_items:
                 # Apply filters
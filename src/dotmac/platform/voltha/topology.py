@@ -0,0 +1,323 @@
+"""
+Cached PON topology for VOLTHA.
+
+``PonTopology`` is a snapshot of OLT -> PON port -> ONU -> UNI port built
+from one device listing, one logical device listing and the port listings
+of every OLT (fetched in parallel). ``TopologyCache`` keeps the snapshot
+for one VOLTHA instance and rebuilds it when its TTL expires, when a
+topology-changing VOLTHA event newer than the snapshot is seen, or when a
+lookup misses. Local operations (enable/disable/delete) patch the snapshot
+in place instead of discarding it. ``TopologyCache.refresh_devices`` re-reads
+only the device list (one call) into the cached OLT and PON port structure,
+for callers that need current ONU states.
+
+ONU UNI ports are fetched on first use and kept with the snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+import structlog
+
+from dotmac.platform.settings import settings
+from dotmac.platform.voltha.schemas import VOLTHAEventType
+
+if TYPE_CHECKING:
+    from dotmac.platform.voltha.client import VOLTHAClient
+
+logger = structlog.get_logger(__name__)
+
+# Events after which the cached topology no longer matches VOLTHA
+TOPOLOGY_EVENT_TYPES = frozenset(
+    {
+        VOLTHAEventType.ONU_DISCOVERED,
+        VOLTHAEventType.ONU_ACTIVATED,
+        VOLTHAEventType.ONU_DEACTIVATED,
+        VOLTHAEventType.OLT_PORT_UP,
+        VOLTHAEventType.OLT_PORT_DOWN,
+        VOLTHAEventType.DEVICE_STATE_CHANGE,
+    }
+)
+
+
+def _mapping(payload: Any) -> dict[str, Any]:
+    return dict(payload) if isinstance(payload, Mapping) else {}
+
+
+def _int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
+class OltNode:
+    """An OLT, its logical device and the ONUs on each of its PON ports."""
+
+    root_device_id: str
+    logical_device_id: str
+    # PON port number -> ONU device IDs, in VOLTHA's port order
+    pon_ports: dict[int, list[str]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class PonTopology:
+    """Point-in-time OLT/PON/ONU topology."""
+
+    built_at: float
+    devices: dict[str, dict[str, Any]] = field(default_factory=dict)
+    olts: dict[str, OltNode] = field(default_factory=dict)
+    # Logical device ID -> OLT root device ID
+    olt_by_logical_id: dict[str, str] = field(default_factory=dict)
+    onu_by_serial: dict[str, str] = field(default_factory=dict)
+    uni_ports: dict[str, int] = field(default_factory=dict)
+
+    def logical_device_id(self, olt_device_id: str) -> str | None:
+        """Logical device ID for an OLT root device ID."""
+        olt = self.olts.get(olt_device_id)
+        return olt.logical_device_id if olt is not None else None
+
+    def olt_for_logical_device(self, logical_device_id: str) -> OltNode | None:
+        root_device_id = self.olt_by_logical_id.get(logical_device_id)
+        return self.olts.get(root_device_id) if root_device_id is not None else None
+
+    def find_onu(self, serial_number: str) -> dict[str, Any] | None:
+        device_id = self.onu_by_serial.get(serial_number)
+        return self.devices.get(device_id) if device_id is not None else None
+
+    def pon_port_onus(self, olt: OltNode) -> Iterable[tuple[int, dict[str, Any]]]:
+        """(PON port, ONU device) pairs for an OLT in port order."""
+        for port_no, onu_ids in olt.pon_ports.items():
+            for onu_id in onu_ids:
+                device = self.devices.get(onu_id)
+                if device is not None:
+                    yield port_no, device
+
+    def update_device(self, device_id: str, **changes: Any) -> None:
+        device = self.devices.get(device_id)
+        if device is not None:
+            device.update(changes)
+
+    def remove_device(self, device_id: str) -> None:
+        device = self.devices.pop(device_id, None)
+        if device is None:
+            return
+        self.uni_ports.pop(device_id, None)
+        serial = device.get("serial_number")
+        if serial is not None and self.onu_by_serial.get(str(serial)) == device_id:
+            del self.onu_by_serial[str(serial)]
+        olt = self.olts.get(str(device.get("parent_id")))
+        port_no = _int(device.get("parent_port_no"))
+        if olt is not None and port_no in olt.pon_ports:
+            onu_ids = olt.pon_ports[port_no]
+            if device_id in onu_ids:
+                onu_ids.remove(device_id)
+
+
+def _index_devices(
+    topology: PonTopology, devices_raw: Iterable[Any]
+) -> dict[tuple[str, int], list[str]]:
+    """Add devices to a topology; returns ONU IDs by (parent device, parent port)."""
+    onus_by_parent: dict[tuple[str, int], list[str]] = {}
+    for raw_device in devices_raw:
+        device = _mapping(raw_device)
+        device_id = device.get("id")
+        if not device_id:
+            continue
+        device_id = str(device_id)
+        topology.devices[device_id] = device
+        serial = device.get("serial_number")
+        if serial:
+            topology.onu_by_serial.setdefault(str(serial), device_id)
+        parent_id = device.get("parent_id")
+        parent_port = _int(device.get("parent_port_no"))
+        if parent_id is not None and parent_port is not None:
+            onus_by_parent.setdefault((str(parent_id), parent_port), []).append(device_id)
+    return onus_by_parent
+
+
+async def build_topology(client: VOLTHAClient, port_fetch_concurrency: int) -> PonTopology:
+    """Read devices, logical devices and OLT ports (in parallel) into a topology."""
+    devices_raw, logical_devices = await asyncio.gather(
+        client.get_devices(), client.get_logical_devices()
+    )
+    topology = PonTopology(built_at=time.time())
+    onus_by_parent = _index_devices(topology, devices_raw)
+
+    olts: list[OltNode] = []
+    for raw_logical in logical_devices:
+        logical = _mapping(raw_logical)
+        logical_id = logical.get("id")
+        root_device_id = logical.get("root_device_id")
+        if not logical_id or root_device_id is None:
+            continue
+        olts.append(OltNode(root_device_id=str(root_device_id), logical_device_id=str(logical_id)))
+
+    semaphore = asyncio.Semaphore(port_fetch_concurrency)
+
+    async def fetch_ports(olt: OltNode) -> list[Any]:
+        async with semaphore:
+            return await client.get_logical_device_ports(olt.logical_device_id)
+
+    olt_ports = await asyncio.gather(*(fetch_ports(olt) for olt in olts))
+    for olt, ports in zip(olts, olt_ports, strict=True):
+        for raw_port in ports:
+            port_no = _int(_mapping(raw_port).get("device_port_no"))
+            if port_no is None or port_no in olt.pon_ports:
+                continue
+            olt.pon_ports[port_no] = onus_by_parent.get((olt.root_device_id, port_no), [])
+        topology.olts.setdefault(olt.root_device_id, olt)
+        topology.olt_by_logical_id[olt.logical_device_id] = olt.root_device_id
+
+    return topology
+
+
+def _with_devices(topology: PonTopology, devices_raw: Iterable[Any]) -> PonTopology:
+    """Copy of a topology with its devices replaced and ONUs re-attached to PON ports."""
+    updated = PonTopology(built_at=topology.built_at)
+    onus_by_parent = _index_devices(updated, devices_raw)
+    for root_device_id, olt in topology.olts.items():
+        updated.olts[root_device_id] = OltNode(
+            root_device_id=olt.root_device_id,
+            logical_device_id=olt.logical_device_id,
+            pon_ports={
+                port_no: onus_by_parent.get((olt.root_device_id, port_no), [])
+                for port_no in olt.pon_ports
+            },
+        )
+    updated.olt_by_logical_id = dict(topology.olt_by_logical_id)
+    updated.uni_ports = {
+        device_id: port_no
+        for device_id, port_no in topology.uni_ports.items()
+        if device_id in updated.devices
+    }
+    return updated
+
+
+class TopologyCache:
+    """
+    Cached ``PonTopology`` for one VOLTHA instance.
+
+    Like the GenieACS device caches, rebuilds are not serialized: a rebuild
+    produces a new snapshot that replaces the old one, so overlapping
+    rebuilds only repeat work.
+    """
+
+    def __init__(self, ttl_seconds: float, port_fetch_concurrency: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.port_fetch_concurrency = port_fetch_concurrency
+        self._topology: PonTopology | None = None
+        self._expires_at = 0.0
+
+    @property
+    def topology(self) -> PonTopology | None:
+        """The cached snapshot, fresh or not."""
+        return self._topology
+
+    async def get(self, client: VOLTHAClient) -> PonTopology:
+        """Return the cached topology, rebuilding it when stale."""
+        if self._topology is None or time.monotonic() >= self._expires_at:
+            return await self.refresh(client)
+        return self._topology
+
+    async def refresh(self, client: VOLTHAClient) -> PonTopology:
+        """Rebuild the topology from VOLTHA."""
+        started = time.monotonic()
+        topology = await build_topology(client, self.port_fetch_concurrency)
+        self._topology = topology
+        self._expires_at = time.monotonic() + self.ttl_seconds
+        logger.debug(
+            "voltha.topology.refreshed",
+            olts=len(topology.olts),
+            devices=len(topology.devices),
+            duration_seconds=round(time.monotonic() - started, 3),
+        )
+        return topology
+
+    async def refresh_devices(self, client: VOLTHAClient) -> PonTopology:
+        """
+        Return the topology with a freshly read device list.
+
+        OLTs, logical devices and PON ports come from the cached snapshot
+        (rebuilt when stale), so this costs one device listing.
+        """
+        if self._topology is None or time.monotonic() >= self._expires_at:
+            return await self.refresh(client)
+        topology = _with_devices(self._topology, await client.get_devices())
+        self._topology = topology
+        return topology
+
+    def invalidate(self) -> None:
+        """Rebuild on next use."""
+        self._expires_at = 0.0
+
+    def apply_events(self, events: Iterable[Mapping[str, Any]]) -> None:
+        """Invalidate if a topology-changing event happened after the last build."""
+        topology = self._topology
+        if topology is None:
+            return
+        for event in events:
+            if event.get("event_type") not in TOPOLOGY_EVENT_TYPES:
+                continue
+            try:
+                happened_at = datetime.fromisoformat(str(event.get("timestamp")))
+            except ValueError:
+                continue
+            if happened_at.tzinfo is None:
+                happened_at = happened_at.replace(tzinfo=UTC)
+            if happened_at.timestamp() >= topology.built_at:
+                logger.debug(
+                    "voltha.topology.invalidated",
+                    event_type=event.get("event_type"),
+                    resource_id=event.get("resource_id"),
+                )
+                self.invalidate()
+                return
+
+    async def uni_port(self, client: VOLTHAClient, device_id: str) -> int | None:
+        """UNI port number of an ONU, fetched once per snapshot."""
+        topology = await self.get(client)
+        if device_id not in topology.uni_ports:
+            for raw_port in await client.get_device_ports(device_id):
+                port = _mapping(raw_port)
+                if port.get("type") == "ETHERNET_UNI" and port.get("port_no") is not None:
+                    topology.uni_ports[device_id] = port["port_no"]
+                    break
+        return topology.uni_ports.get(device_id)
+
+
+_caches: dict[tuple[str | None, str], TopologyCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_topology_cache(tenant_id: str | None, base_url: str) -> TopologyCache:
+    """Return the process-wide topology cache for a tenant's VOLTHA instance."""
+    key = (tenant_id, base_url.rstrip("/"))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = new_topology_cache()
+            _caches[key] = cache
+        return cache
+
+
+def new_topology_cache() -> TopologyCache:
+    """Create a topology cache configured from settings."""
+    return TopologyCache(
+        ttl_seconds=settings.voltha.topology_ttl_seconds,
+        port_fetch_concurrency=settings.voltha.topology_port_fetch_concurrency,
+    )
+
+
+def reset_topology_caches() -> None:
+    """Drop all process-wide topology caches (tests)."""
+    with _caches_lock:
+        _caches.clear()
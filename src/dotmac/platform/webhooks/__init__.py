@@ -5,6 +5,7 @@ This module provides:
 - Webhook subscription management (CRUD)
 - Event publishing via EventBus
 - Reliable webhook delivery with retries
+- Background delivery worker with pooled, concurrent HTTP clients
 - HMAC signature generation for security
 - Delivery logging and monitoring
 """
@@ -18,6 +19,7 @@ from .models import (
     WebhookSubscription,
 )
 from .service import WebhookSubscriptionService
+from .worker import WebhookDeliveryWorker
 
 __all__ = [
     "EventBus",
@@ -29,4 +31,5 @@ __all__ = [
     "WebhookEvent",
     "WebhookSubscriptionService",
     "WebhookDeliveryService",
+    "WebhookDeliveryWorker",
 ]
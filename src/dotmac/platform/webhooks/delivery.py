@@ -23,6 +23,71 @@ from .service import WebhookSubscriptionService
 
 logger = structlog.get_logger(__name__)
 
+# Retry delays: 5min, 1hr, 6hrs
+RETRY_DELAYS_SECONDS = (300, 3600, 21600)
+
+
+def retry_delay_seconds(attempt_number: int) -> int:
+    """Backoff before retrying after the given (1-based) failed attempt."""
+    return RETRY_DELAYS_SECONDS[min(attempt_number - 1, len(RETRY_DELAYS_SECONDS) - 1)]
+
+
+def sign_payload(payload: bytes, secret: str) -> str:
+    """Generate HMAC-SHA256 signature for webhook payload."""
+    return hmac.new(
+        secret.encode("utf-8"),
+        payload,
+        hashlib.sha256,
+    ).hexdigest()
+
+
+def build_webhook_headers(
+    subscription: WebhookSubscription,
+    signature: str,
+    event_id: str,
+    event_type: str,
+) -> dict[str, str]:
+    """Build HTTP headers for webhook request."""
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": "DotMac-Webhooks/1.0",
+        "X-Webhook-Signature": signature,
+        "X-Webhook-Event-Id": event_id,
+        "X-Webhook-Event-Type": event_type,
+        "X-Webhook-Timestamp": datetime.now(UTC).isoformat(),
+    }
+
+    # Add custom headers from subscription
+    headers.update(subscription.headers)
+
+    return headers
+
+
+def build_webhook_request(
+    subscription: WebhookSubscription,
+    event_type: str,
+    event_data: dict[str, Any],
+    event_id: str,
+    tenant_id: str | None,
+) -> tuple[bytes, dict[str, str]]:
+    """Serialize and sign a webhook payload, returning body bytes and headers."""
+    payload = WebhookEventPayload(
+        id=event_id,
+        type=event_type,
+        timestamp=datetime.now(UTC),
+        data=event_data,
+        tenant_id=tenant_id,
+    )
+    payload_bytes = payload.model_dump_json().encode("utf-8")
+    signature = sign_payload(payload_bytes, subscription.secret)
+    headers = build_webhook_headers(
+        subscription=subscription,
+        signature=signature,
+        event_id=event_id,
+        event_type=event_type,
+    )
+    return payload_bytes, headers
+
 
 class WebhookDeliveryService:
     """Service for delivering webhooks with retry logic."""
@@ -33,11 +98,7 @@ class WebhookDeliveryService:
 
     def _generate_signature(self, payload: bytes, secret: str) -> str:
         """Generate HMAC-SHA256 signature for webhook payload."""
-        return hmac.new(
-            secret.encode("utf-8"),
-            payload,
-            hashlib.sha256,
-        ).hexdigest()
+        return sign_payload(payload, secret)
 
     def _build_headers(
         self,
@@ -47,19 +108,7 @@ class WebhookDeliveryService:
         event_type: str,
     ) -> dict[str, str]:
         """Build HTTP headers for webhook request."""
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "DotMac-Webhooks/1.0",
-            "X-Webhook-Signature": signature,
-            "X-Webhook-Event-Id": event_id,
-            "X-Webhook-Event-Type": event_type,
-            "X-Webhook-Timestamp": datetime.now(UTC).isoformat(),
-        }
-
-        # Add custom headers from subscription
-        headers.update(subscription.headers)
-
-        return headers
+        return build_webhook_headers(subscription, signature, event_id, event_type)
 
     async def deliver(
         self,
@@ -90,27 +139,9 @@ class WebhookDeliveryService:
         if event_id is None:
             event_id = str(uuid.uuid4())
 
-        # Build webhook payload
-        payload = WebhookEventPayload(
-            id=event_id,
-            type=event_type,
-            timestamp=datetime.now(UTC),
-            data=event_data,
-            tenant_id=tenant_id,
-        )
-
-        payload_json = payload.model_dump_json()
-        payload_bytes = payload_json.encode("utf-8")
-
-        # Generate signature
-        signature = self._generate_signature(payload_bytes, subscription.secret)
-
-        # Build headers
-        headers = self._build_headers(
-            subscription=subscription,
-            signature=signature,
-            event_id=event_id,
-            event_type=event_type,
+        # Build signed payload and headers
+        payload_bytes, headers = build_webhook_request(
+            subscription, event_type, event_data, event_id, tenant_id
         )
 
         # Create delivery record
@@ -138,6 +169,56 @@ class WebhookDeliveryService:
 
         return delivery
 
+    async def enqueue(
+        self,
+        subscriptions: list[WebhookSubscription],
+        event_type: str,
+        event_data: dict[str, Any],
+        event_id: str,
+        tenant_id: str | None = None,
+    ) -> list[WebhookDelivery]:
+        """
+        Queue one delivery per subscription for the delivery worker.
+
+        All rows are written with a single commit; sending happens later in
+        ``WebhookDeliveryWorker``.
+
+        Args:
+            subscriptions: Subscriptions to deliver to
+            event_type: Event type (e.g., "invoice.created")
+            event_data: Event payload data
+            event_id: Event ID for idempotency
+            tenant_id: Optional tenant ID (defaults to each subscription's tenant)
+
+        Returns:
+            Queued WebhookDelivery records
+        """
+        deliveries = [
+            WebhookDelivery(
+                tenant_id=tenant_id if tenant_id is not None else subscription.tenant_id,
+                subscription_id=subscription.id,
+                event_type=event_type,
+                event_id=event_id,
+                event_data=event_data,
+                status=DeliveryStatus.QUEUED,
+                attempt_number=1,
+            )
+            for subscription in subscriptions
+        ]
+        if not deliveries:
+            return deliveries
+
+        self.db.add_all(deliveries)
+        await self.db.commit()
+
+        logger.debug(
+            "Webhook deliveries queued",
+            event_type=event_type,
+            event_id=event_id,
+            count=len(deliveries),
+        )
+        return deliveries
+
     async def _attempt_delivery(
         self,
         delivery: WebhookDelivery,
@@ -243,10 +324,7 @@ class WebhookDeliveryService:
         # Check if retry is enabled and within retry limit
         if subscription.retry_enabled and delivery.attempt_number < subscription.max_retries:
             # Schedule retry with exponential backoff
-            # Retry delays: 5min, 1hr, 6hrs
-            retry_delays = [300, 3600, 21600]  # seconds
-            delay_index = min(delivery.attempt_number - 1, len(retry_delays) - 1)
-            delay_seconds = retry_delays[delay_index]
+            delay_seconds = retry_delay_seconds(delivery.attempt_number)
 
             delivery.status = DeliveryStatus.RETRYING
             delivery.next_retry_at = datetime.now(UTC) + timedelta(seconds=delay_seconds)
@@ -305,27 +383,9 @@ class WebhookDeliveryService:
             )
             return False
 
-        # Create new payload
-        payload = WebhookEventPayload(
-            id=delivery.event_id,
-            type=delivery.event_type,
-            timestamp=datetime.now(UTC),
-            data=delivery.event_data,
-            tenant_id=tenant_id,
-        )
-
-        payload_json = payload.model_dump_json()
-        payload_bytes = payload_json.encode("utf-8")
-
-        # Generate new signature
-        signature = self._generate_signature(payload_bytes, subscription.secret)
-
-        # Build headers
-        headers = self._build_headers(
-            subscription=subscription,
-            signature=signature,
-            event_id=delivery.event_id,
-            event_type=delivery.event_type,
+        # Rebuild payload with a fresh timestamp and signature
+        payload_bytes, headers = build_webhook_request(
+            subscription, delivery.event_type, delivery.event_data, delivery.event_id, tenant_id
         )
 
         # Increment attempt number
@@ -392,23 +452,12 @@ class WebhookDeliveryService:
                 continue
 
             # Retry delivery
-            payload = WebhookEventPayload(
-                id=delivery.event_id,
-                type=delivery.event_type,
-                timestamp=datetime.now(UTC),
-                data=delivery.event_data,
-                tenant_id=delivery.tenant_id,
-            )
-
-            payload_json = payload.model_dump_json()
-            payload_bytes = payload_json.encode("utf-8")
-
-            signature = self._generate_signature(payload_bytes, subscription.secret)
-            headers = self._build_headers(
-                subscription=subscription,
-                signature=signature,
-                event_id=delivery.event_id,
-                event_type=delivery.event_type,
+            payload_bytes, headers = build_webhook_request(
+                subscription,
+                delivery.event_type,
+                delivery.event_data,
+                delivery.event_id,
+                delivery.tenant_id,
             )
 
             delivery.attempt_number += 1
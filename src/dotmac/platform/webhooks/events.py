@@ -9,9 +9,12 @@ import structlog
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from dotmac.platform.settings import settings
+
 from .delivery import WebhookDeliveryService
 from .models import WebhookEvent
 from .service import WebhookSubscriptionService
+from .worker import notify_delivery_worker
 
 logger = structlog.get_logger(__name__)
 
@@ -118,7 +121,7 @@ class EventBus:
             event_id: Optional event ID for idempotency
 
         Returns:
-            Number of webhooks triggered
+            Number of webhooks triggered (queued when the delivery worker is enabled)
         """
         # Validate event type is registered
         if not self.is_registered(event_type):
@@ -166,8 +169,28 @@ class EventBus:
             )
             return 0
 
-        # Deliver to each subscription
         delivery_service = WebhookDeliveryService(db)
+
+        # Queue for the delivery worker instead of sending inside the caller's request
+        if settings.webhooks.delivery_worker_enabled:
+            await delivery_service.enqueue(
+                subscriptions=subscriptions,
+                event_type=event_type,
+                event_data=event_data,
+                event_id=event_id,
+                tenant_id=tenant_id,
+            )
+            notify_delivery_worker()
+
+            logger.info(
+                "Event queued for webhook delivery",
+                event_type=event_type,
+                event_id=event_id,
+                subscriptions_triggered=len(subscriptions),
+            )
+            return len(subscriptions)
+
+        # Deliver to each subscription
         delivered_count = 0
 
         for subscription in subscriptions:
@@ -21,6 +21,8 @@ class DeliveryStatus(str, Enum):
     """Webhook delivery status."""
 
     PENDING = "pending"
+    QUEUED = "queued"  # Waiting for the delivery worker
+    DELIVERING = "delivering"  # Claimed by a delivery worker
     SUCCESS = "success"
     FAILED = "failed"
     RETRYING = "retrying"
@@ -0,0 +1,560 @@
+"""
+Background webhook delivery worker.
+
+``EventBus.publish`` only queues ``WebhookDelivery`` rows; this worker drains
+them. Each batch is claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` so
+several workers can share the queue, sent concurrently over pooled HTTP
+clients (HTTP/2 when ``h2`` is installed) with a concurrency cap and circuit
+breaker per endpoint, and written back with bulk UPDATEs.
+
+Run standalone with ``python -m dotmac.platform.webhooks.worker``.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+import structlog
+from sqlalchemy import and_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dotmac.platform.resilience.circuit_breaker import CircuitBreaker, CircuitBreakerError
+
+from .delivery import build_webhook_request, retry_delay_seconds
+from .models import DeliveryStatus, WebhookDelivery, WebhookSubscription
+from .service import WebhookSubscriptionService
+
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    H2_AVAILABLE = False
+
+logger = structlog.get_logger(__name__)
+
+_delivery_worker: "WebhookDeliveryWorker | None" = None
+
+
+class _EndpointUnavailable(Exception):
+    """Raised inside the circuit breaker for responses that indicate an unhealthy endpoint."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+@dataclass(slots=True)
+class DeliveryJob:
+    """A claimed delivery, detached from the ORM session while it is being sent."""
+
+    delivery_id: uuid.UUID
+    subscription_id: uuid.UUID
+    tenant_id: str | None
+    endpoint: str
+    url: str
+    event_type: str
+    attempt_number: int
+    timeout_seconds: int
+    retry_enabled: bool
+    max_retries: int
+    payload_bytes: bytes
+    headers: dict[str, str]
+
+
+@dataclass(slots=True)
+class DeliveryOutcome:
+    """Result of sending one job, ready to be written back."""
+
+    job: DeliveryJob
+    status: DeliveryStatus
+    response_code: int | None = None
+    response_body: str | None = None
+    error_message: str | None = None
+    duration_ms: int | None = None
+    next_retry_at: datetime | None = None
+    counts_as_success: bool | None = None  # None leaves statistics untouched
+    disable_subscription: bool = False
+
+    def to_params(self) -> dict[str, Any]:
+        """Parameters for the bulk UPDATE of ``webhook_deliveries``."""
+        return {
+            "id": self.job.delivery_id,
+            "status": self.status,
+            "attempt_number": self.job.attempt_number,
+            "response_code": self.response_code,
+            "response_body": self.response_body,
+            "error_message": self.error_message,
+            "duration_ms": self.duration_ms,
+            "next_retry_at": self.next_retry_at,
+        }
+
+
+@dataclass(slots=True)
+class _SubscriptionStats:
+    successes: int = 0
+    failures: int = 0
+    tenant_id: str | None = None
+    disable: bool = False
+
+
+def endpoint_key(url: str) -> str:
+    """Group URLs by origin (scheme, host and port) for pooling and limits."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+
+class WebhookDeliveryWorker:
+    """
+    Drains queued webhook deliveries with pooled, concurrent HTTP requests.
+
+    Endpoints are keyed by origin: each gets one ``httpx.AsyncClient`` whose
+    connection pool is sized to ``max_per_endpoint``, a semaphore enforcing the
+    same limit, and a ``CircuitBreaker``. While a circuit is open its
+    deliveries are pushed back without using up a retry attempt.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Any] | None = None,
+        batch_size: int = 200,
+        concurrency: int = 100,
+        max_per_endpoint: int = 8,
+        poll_interval: float = 5.0,
+        claim_lease_seconds: int = 300,
+        circuit_failure_threshold: int = 5,
+        circuit_recovery_seconds: float = 60.0,
+        http2: bool = True,
+    ) -> None:
+        if session_factory is None:
+            from dotmac.platform.db import AsyncSessionLocal
+
+            session_factory = AsyncSessionLocal
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_per_endpoint = max_per_endpoint
+        self.poll_interval = poll_interval
+        self.claim_lease = timedelta(seconds=claim_lease_seconds)
+        self.circuit_failure_threshold = circuit_failure_threshold
+        self.circuit_recovery_seconds = circuit_recovery_seconds
+        self.http2 = http2 and H2_AVAILABLE
+
+        self._concurrency = asyncio.Semaphore(concurrency)
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._endpoint_limits: dict[str, asyncio.Semaphore] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+        self._wakeup = asyncio.Event()
+        self._running = False
+        self._task: asyncio.Task[None] | None = None
+
+    @classmethod
+    def from_settings(cls, **overrides: Any) -> "WebhookDeliveryWorker":
+        """Build a worker from ``settings.webhooks``."""
+        from dotmac.platform.settings import settings
+
+        config = settings.webhooks
+        options: dict[str, Any] = {
+            "batch_size": config.worker_batch_size,
+            "concurrency": config.worker_concurrency,
+            "max_per_endpoint": config.worker_max_per_endpoint,
+            "poll_interval": config.worker_poll_interval_seconds,
+            "claim_lease_seconds": config.worker_claim_lease_seconds,
+            "circuit_failure_threshold": config.worker_circuit_failure_threshold,
+            "circuit_recovery_seconds": config.worker_circuit_recovery_seconds,
+            "http2": config.worker_http2,
+        }
+        options.update(overrides)
+        return cls(**options)
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def notify(self) -> None:
+        """Wake the worker so freshly queued deliveries go out without waiting for the poll."""
+        self._wakeup.set()
+
+    def _client(self, endpoint: str) -> httpx.AsyncClient:
+        client = self._clients.get(endpoint)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_per_endpoint,
+                    max_keepalive_connections=self.max_per_endpoint,
+                ),
+            )
+            self._clients[endpoint] = client
+        return client
+
+    def _endpoint_limit(self, endpoint: str) -> asyncio.Semaphore:
+        limit = self._endpoint_limits.get(endpoint)
+        if limit is None:
+            limit = self._endpoint_limits[endpoint] = asyncio.Semaphore(self.max_per_endpoint)
+        return limit
+
+    def _breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(
+                name=f"webhook:{endpoint}",
+                failure_threshold=self.circuit_failure_threshold,
+                recovery_timeout=self.circuit_recovery_seconds,
+            )
+        return breaker
+
+    async def _claim(self, session: AsyncSession) -> list[DeliveryJob]:
+        """Lock a batch of due deliveries, lease them and detach them as jobs."""
+        now = datetime.now(UTC)
+        stmt = (
+            select(WebhookDelivery, WebhookSubscription)
+            .join(WebhookSubscription, WebhookSubscription.id == WebhookDelivery.subscription_id)
+            .where(
+                or_(
+                    and_(
+                        WebhookDelivery.status.in_(
+                            [DeliveryStatus.QUEUED, DeliveryStatus.RETRYING]
+                        ),
+                        or_(
+                            WebhookDelivery.next_retry_at.is_(None),
+                            WebhookDelivery.next_retry_at <= now,
+                        ),
+                    ),
+                    # Lease expired: the worker that claimed it died mid-batch
+                    and_(
+                        WebhookDelivery.status == DeliveryStatus.DELIVERING,
+                        WebhookDelivery.next_retry_at <= now,
+                    ),
+                )
+            )
+            .order_by(WebhookDelivery.created_at)
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True, of=WebhookDelivery)
+        )
+        rows = (await session.execute(stmt)).all()
+        if not rows:
+            await session.commit()
+            return []
+
+        lease_until = now + self.claim_lease
+        jobs: list[DeliveryJob] = []
+        claims: list[dict[str, Any]] = []
+        for delivery, subscription in rows:
+            if not subscription.is_active:
+                claims.append(
+                    {
+                        "id": delivery.id,
+                        "status": DeliveryStatus.FAILED,
+                        "error_message": "Subscription no longer active",
+                        "next_retry_at": None,
+                    }
+                )
+                continue
+
+            # RETRYING rows hold the attempt that failed; QUEUED/DELIVERING hold the next one
+            attempt_number = delivery.attempt_number
+            if delivery.status == DeliveryStatus.RETRYING:
+                attempt_number += 1
+
+            payload_bytes, headers = build_webhook_request(
+                subscription,
+                delivery.event_type,
+                delivery.event_data,
+                delivery.event_id,
+                delivery.tenant_id,
+            )
+            jobs.append(
+                DeliveryJob(
+                    delivery_id=delivery.id,
+                    subscription_id=subscription.id,
+                    tenant_id=subscription.tenant_id,
+                    endpoint=endpoint_key(subscription.url),
+                    url=subscription.url,
+                    event_type=delivery.event_type,
+                    attempt_number=attempt_number,
+                    timeout_seconds=subscription.timeout_seconds,
+                    retry_enabled=subscription.retry_enabled,
+                    max_retries=subscription.max_retries,
+                    payload_bytes=payload_bytes,
+                    headers=headers,
+                )
+            )
+            claims.append(
+                {
+                    "id": delivery.id,
+                    "status": DeliveryStatus.DELIVERING,
+                    "attempt_number": attempt_number,
+                    "next_retry_at": lease_until,
+                }
+            )
+
+        await session.execute(update(WebhookDelivery), claims)
+        await session.commit()
+        return jobs
+
+    async def _post(self, job: DeliveryJob) -> httpx.Response:
+        response = await self._client(job.endpoint).post(
+            job.url,
+            content=job.payload_bytes,
+            headers=job.headers,
+            timeout=job.timeout_seconds,
+        )
+        if response.status_code >= 500 or response.status_code == 429:
+            raise _EndpointUnavailable(response)
+        return response
+
+    async def _send(self, job: DeliveryJob) -> DeliveryOutcome:
+        """Send one job and classify the result like ``_attempt_delivery`` does."""
+        async with self._concurrency, self._endpoint_limit(job.endpoint):
+            start_time = time.time()
+            try:
+                response = await self._breaker(job.endpoint).call(self._post, job)
+            except CircuitBreakerError:
+                # Endpoint is known to be down: push back without spending an attempt
+                return DeliveryOutcome(
+                    job=job,
+                    status=DeliveryStatus.QUEUED,
+                    error_message=f"Circuit open for {job.endpoint}",
+                    next_retry_at=datetime.now(UTC)
+                    + timedelta(seconds=self.circuit_recovery_seconds),
+                )
+            except _EndpointUnavailable as exc:
+                response = exc.response
+            except httpx.TimeoutException:
+                return self._failure(
+                    job,
+                    error_message=f"Request timeout after {job.timeout_seconds}s",
+                    duration_ms=int((time.time() - start_time) * 1000),
+                )
+            except Exception as e:
+                return self._failure(
+                    job,
+                    error_message=f"Delivery error: {str(e)}",
+                    duration_ms=int((time.time() - start_time) * 1000),
+                )
+
+        duration_ms = int((time.time() - start_time) * 1000)
+        response_body = response.text[:1000]  # Truncate large responses
+
+        if response.status_code == 410:
+            return DeliveryOutcome(
+                job=job,
+                status=DeliveryStatus.DISABLED,
+                response_code=response.status_code,
+                response_body=response_body,
+                error_message="Endpoint returned 410 Gone (permanently disabled)",
+                duration_ms=duration_ms,
+                disable_subscription=True,
+            )
+
+        if 200 <= response.status_code < 300:
+            return DeliveryOutcome(
+                job=job,
+                status=DeliveryStatus.SUCCESS,
+                response_code=response.status_code,
+                response_body=response_body,
+                duration_ms=duration_ms,
+                counts_as_success=True,
+            )
+
+        outcome = self._failure(
+            job,
+            error_message=f"HTTP {response.status_code}: {response.text[:500]}",
+            duration_ms=duration_ms,
+        )
+        outcome.response_code = response.status_code
+        outcome.response_body = response_body
+        return outcome
+
+    @staticmethod
+    def _failure(job: DeliveryJob, error_message: str, duration_ms: int) -> DeliveryOutcome:
+        if job.retry_enabled and job.attempt_number < job.max_retries:
+            status = DeliveryStatus.RETRYING
+            next_retry_at: datetime | None = datetime.now(UTC) + timedelta(
+                seconds=retry_delay_seconds(job.attempt_number)
+            )
+        else:
+            status = DeliveryStatus.FAILED
+            next_retry_at = None
+        return DeliveryOutcome(
+            job=job,
+            status=status,
+            error_message=error_message,
+            duration_ms=duration_ms,
+            next_retry_at=next_retry_at,
+            counts_as_success=False,
+        )
+
+    async def _write_back(self, session: AsyncSession, outcomes: list[DeliveryOutcome]) -> None:
+        """Persist a batch of outcomes: one bulk UPDATE plus one UPDATE per subscription."""
+        await session.execute(
+            update(WebhookDelivery), [outcome.to_params() for outcome in outcomes]
+        )
+
+        stats: dict[uuid.UUID, _SubscriptionStats] = defaultdict(_SubscriptionStats)
+        for outcome in outcomes:
+            entry = stats[outcome.job.subscription_id]
+            entry.tenant_id = outcome.job.tenant_id
+            if outcome.counts_as_success is True:
+                entry.successes += 1
+            elif outcome.counts_as_success is False:
+                entry.failures += 1
+            entry.disable = entry.disable or outcome.disable_subscription
+
+        now = datetime.now(UTC)
+        for subscription_id, entry in stats.items():
+            if not entry.successes and not entry.failures:
+                continue
+            values: dict[str, Any] = {"last_triggered_at": now}
+            if entry.successes:
+                values["success_count"] = WebhookSubscription.success_count + entry.successes
+                values["last_success_at"] = now
+            if entry.failures:
+                values["failure_count"] = WebhookSubscription.failure_count + entry.failures
+                values["last_failure_at"] = now
+            await session.execute(
+                update(WebhookSubscription)
+                .where(WebhookSubscription.id == subscription_id)
+                .values(**values)
+            )
+        await session.commit()
+
+        subscription_service = WebhookSubscriptionService(session)
+        for subscription_id, entry in stats.items():
+            if entry.disable:
+                await subscription_service.disable_subscription(
+                    subscription_id=str(subscription_id),
+                    tenant_id=entry.tenant_id,
+                    reason="Endpoint returned 410 Gone",
+                )
+
+    async def run_once(self) -> int:
+        """Claim, send and record one batch. Returns the number of deliveries sent."""
+        async with self._session_factory() as session:
+            jobs = await self._claim(session)
+        if not jobs:
+            return 0
+
+        outcomes = await asyncio.gather(*(self._send(job) for job in jobs))
+
+        async with self._session_factory() as session:
+            await self._write_back(session, list(outcomes))
+
+        counts: dict[str, int] = defaultdict(int)
+        for outcome in outcomes:
+            counts[outcome.status.value] += 1
+        logger.info("Webhook delivery batch processed", claimed=len(jobs), **counts)
+        return len(jobs)
+
+    async def run(self) -> None:
+        """Drain the queue until ``stop`` is called."""
+        self._running = True
+        logger.info(
+            "webhook_delivery_worker.started",
+            batch_size=self.batch_size,
+            max_per_endpoint=self.max_per_endpoint,
+            http2=self.http2,
+        )
+        try:
+            while self._running:
+                self._wakeup.clear()
+                try:
+                    claimed = await self.run_once()
+                except Exception as e:
+                    logger.error(
+                        "webhook_delivery_worker.batch_failed",
+                        error=str(e),
+                        error_type=type(e).__name__,
+                    )
+                    claimed = 0
+
+                if claimed >= self.batch_size:
+                    continue  # Backlog: keep draining
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except TimeoutError:
+                    pass
+        finally:
+            self._running = False
+            await self.close()
+
+    def start(self) -> asyncio.Task[None]:
+        """Run the worker as a background task on the current loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run(), name="webhook-delivery-worker")
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the loop and close pooled clients."""
+        self._running = False
+        self._wakeup.set()
+        if self._task is not None:
+            try:
+                await asyncio.wait_for(self._task, timeout=self.poll_interval + 5)
+            except TimeoutError:
+                self._task.cancel()
+            self._task = None
+        await self.close()
+
+    async def close(self) -> None:
+        """Close every pooled HTTP client."""
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+def get_delivery_worker() -> WebhookDeliveryWorker | None:
+    """Get the in-process delivery worker, if one was started."""
+    return _delivery_worker
+
+
+def notify_delivery_worker() -> None:
+    """Wake the in-process delivery worker (no-op when it runs in another process)."""
+    if _delivery_worker is not None:
+        _delivery_worker.notify()
+
+
+def start_delivery_worker() -> WebhookDeliveryWorker | None:
+    """Start the in-process delivery worker if enabled in settings."""
+    global _delivery_worker
+
+    from dotmac.platform.settings import settings
+
+    if not settings.webhooks.delivery_worker_enabled:
+        return None
+    if _delivery_worker is None:
+        _delivery_worker = WebhookDeliveryWorker.from_settings()
+    _delivery_worker.start()
+    return _delivery_worker
+
+
+async def stop_delivery_worker() -> None:
+    """Stop the in-process delivery worker."""
+    global _delivery_worker
+
+    if _delivery_worker is not None:
+        await _delivery_worker.stop()
+        _delivery_worker = None
+
+
+if __name__ == "__main__":
+    """Run the delivery worker as a standalone process."""
+    import logging
+    import sys
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stdout,
+    )
+
+    asyncio.run(WebhookDeliveryWorker.from_settings().run())
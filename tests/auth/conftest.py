@@ -26,15 +26,18 @@ def clear_global_cache():
 
     This fixture runs automatically before every test in the auth directory.
     """
+    from dotmac.platform.auth.permission_cache import reset_permission_cache
     from dotmac.platform.core.caching import cache_clear
 
     # Clear all cached data before test
     cache_clear(flush_all=True)  # Use flush_all to ensure complete cleanup
+    reset_permission_cache()
 
     yield  # Run the test
 
     # Clear again after test to prevent pollution of subsequent tests
     cache_clear(flush_all=True)
+    reset_permission_cache()
 
 
 @pytest_asyncio.fixture(autouse=True, scope="function")
@@ -15,6 +15,14 @@ import pytest
 from dotmac.platform.auth.core import APIKeyService
 
 
+def _redis_with(store: dict[str, str]) -> AsyncMock:
+    """Mock Redis client serving GET and MGET from a dict."""
+    mock_redis = AsyncMock()
+    mock_redis.get = AsyncMock(side_effect=store.get)
+    mock_redis.mget = AsyncMock(side_effect=lambda keys: [store.get(key) for key in keys])
+    return mock_redis
+
+
 @pytest.fixture
 def api_key_service():
     """Create API key service instance."""
@@ -90,8 +98,7 @@ class TestAPIKeyRedisUnavailable:
     ):
         """Test that verify_api_key uses Redis when available (not falling back)."""
         # Create mock Redis client
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(return_value=json.dumps(api_key_data))
+        mock_redis = _redis_with({f"api_key:{api_key_hash}": json.dumps(api_key_data)})
 
         # Patch _get_redis to return mock Redis client
         with patch.object(api_key_service, "_get_redis", return_value=mock_redis):
@@ -100,9 +107,9 @@ class TestAPIKeyRedisUnavailable:
         # Assert Redis was used (not memory fallback)
         assert result is not None
         assert result["user_id"] == "test-user-123"
-        # Verify Redis get was called (implementation calls it multiple times for key, lookup, metadata)
-        assert mock_redis.get.called
-        assert mock_redis.get.call_count >= 1  # At least once for the main key lookup
+        # Key record and lookup entry are read in one round trip
+        mock_redis.mget.assert_awaited_once()
+        assert not mock_redis.get.called
 
     @pytest.mark.asyncio
     async def test_verify_api_key_falls_back_when_redis_raises_exception(
@@ -115,6 +122,7 @@ class TestAPIKeyRedisUnavailable:
         # Create mock Redis that raises exception
         mock_redis = AsyncMock()
         mock_redis.get = AsyncMock(side_effect=Exception("Redis connection failed"))
+        mock_redis.mget = AsyncMock(side_effect=Exception("Redis connection failed"))
 
         # Patch _get_redis to return failing Redis client
         with patch.object(api_key_service, "_get_redis", return_value=mock_redis):
@@ -133,15 +141,12 @@ class TestAPIKeyMetadataValidation:
     ):
         """Test that inactive keys are rejected even with Redis available."""
         # Create mock Redis with inactive key metadata
-        mock_redis = AsyncMock()
-
-        # Mock the main key data
-        mock_redis.get = AsyncMock(
-            side_effect=lambda key: {
+        mock_redis = _redis_with(
+            {
                 f"api_key:{api_key_hash}": json.dumps(api_key_data),
                 f"api_key_lookup:{api_key_hash}": "key_123",
                 "api_key_meta:key_123": json.dumps({"is_active": False}),
-            }.get(key)
+            }
         )
 
         with patch.object(api_key_service, "_get_redis", return_value=mock_redis):
@@ -161,13 +166,12 @@ class TestAPIKeyMetadataValidation:
         expired_time = (datetime.now(UTC) - timedelta(days=1)).isoformat()
 
         # Create mock Redis with expired key metadata
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(
-            side_effect=lambda key: {
+        mock_redis = _redis_with(
+            {
                 f"api_key:{api_key_hash}": json.dumps(api_key_data),
                 f"api_key_lookup:{api_key_hash}": "key_123",
                 "api_key_meta:key_123": json.dumps({"is_active": True, "expires_at": expired_time}),
-            }.get(key)
+            }
         )
 
         with patch.object(api_key_service, "_get_redis", return_value=mock_redis):
@@ -187,15 +191,14 @@ class TestAPIKeyMetadataValidation:
         future_time = (datetime.now(UTC) + timedelta(days=30)).isoformat()
 
         # Create mock Redis with valid key metadata
-        mock_redis = AsyncMock()
-        mock_redis.get = AsyncMock(
-            side_effect=lambda key: {
+        mock_redis = _redis_with(
+            {
                 f"api_key:{api_key_hash}": json.dumps(api_key_data),
                 f"api_key_lookup:{api_key_hash}": "key_123",
                 "api_key_meta:key_123": json.dumps(
                     {"is_active": True, "expires_at": future_time, "name": "Updated Name"}
                 ),
-            }.get(key)
+            }
         )
 
         # Mock _deserialize to return the metadata dict
@@ -164,7 +164,7 @@ class TestAPIKeyTenantIsolation:
             "created_at": datetime.now(UTC).isoformat(),
         }
 
-        mock_redis.get = AsyncMock(return_value=json.dumps(stored_data))
+        mock_redis.mget = AsyncMock(return_value=[json.dumps(stored_data), None])
 
         with patch.object(api_key_service, "_get_redis", return_value=mock_redis):
             key_data = await api_key_service.verify_api_key(api_key)
@@ -1,9 +1,9 @@
 """
 Unit tests for RBAC cache invalidation logic.
 
-Tests that role/permission mutations properly clear both cached permission
-variants (include_expired=True and include_expired=False) to prevent stale
-grants from lingering in lookups.
+Tests that role/permission mutations retire every cached permission variant
+(include_expired=True/False, every tenant scope) to prevent stale grants from
+lingering in lookups.
 
 Note: These tests use mocks for the database operations to avoid SQLite
 foreign key constraint issues. The cache invalidation logic is what we're
@@ -16,8 +16,10 @@ from uuid import uuid4
 
 import pytest
 
+from dotmac.platform.auth.permission_cache import get_permission_cache
 from dotmac.platform.auth.rbac_service import RBACService
-from dotmac.platform.core.caching import cache_delete, cache_get, cache_set
+
+VARIANTS = [(None, False), (None, True), ("tenant-1", False)]
 
 
 @pytest.fixture
@@ -64,11 +66,24 @@ def test_permission_name() -> str:
     return f"test.permission.{uuid4().hex[:8]}"
 
 
-def clear_test_cache(user_id: str):
-    """Clear all cache keys for a user."""
-    cache_delete(f"user_perms:{user_id}")
-    cache_delete(f"user_perms:{user_id}:expired=False")
-    cache_delete(f"user_perms:{user_id}:expired=True")
+async def seed_cache(user_id: str, permission: str, variants=VARIANTS) -> None:
+    """Cache a snapshot for each (tenant, include_expired) variant."""
+    cache = get_permission_cache()
+    for tenant_scope, include_expired in variants:
+        _, version = await cache.get(user_id, tenant_scope, include_expired)
+        await cache.set(
+            user_id, tenant_scope, include_expired, {"allows": [permission], "denies": []}, version
+        )
+
+
+async def cached_allows(user_id: str) -> list[list[str] | None]:
+    """Return the cached allows of every variant (None when not served)."""
+    cache = get_permission_cache()
+    results = []
+    for tenant_scope, include_expired in VARIANTS:
+        payload, _ = await cache.get(user_id, tenant_scope, include_expired)
+        results.append(payload["allows"] if payload else None)
+    return results
 
 
 class TestRoleCacheInvalidation:
@@ -84,14 +99,10 @@ class TestRoleCacheInvalidation:
     ):
         """Test that assign_role_to_user clears both expired=True and expired=False cache keys."""
         # Seed both cache keys with dummy data
-        cache_set(f"user_perms:{test_user_id}", ["old.permission"])
-        cache_set(f"user_perms:{test_user_id}:expired=False", ["old.permission.false"])
-        cache_set(f"user_perms:{test_user_id}:expired=True", ["old.permission.true"])
+        await seed_cache(test_user_id, "old.permission")
 
         # Verify cache is seeded
-        assert cache_get(f"user_perms:{test_user_id}") == ["old.permission"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") == ["old.permission.false"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") == ["old.permission.true"]
+        assert await cached_allows(test_user_id) == [["old.permission"]] * 3
 
         # Mock the database operations but let the cache invalidation run
         mock_role = MagicMock()
@@ -105,10 +116,8 @@ class TestRoleCacheInvalidation:
                 granted_by=test_granter_id,
             )
 
-        # Assert all three cache keys are cleared
-        assert cache_get(f"user_perms:{test_user_id}") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        # Assert every cached variant is retired
+        assert await cached_allows(test_user_id) == [None] * 3
 
     @pytest.mark.asyncio
     async def test_revoke_role_clears_both_cache_keys(
@@ -120,14 +129,10 @@ class TestRoleCacheInvalidation:
     ):
         """Test that revoke_role_from_user clears both expired=True and expired=False cache keys."""
         # Seed both cache keys with dummy data
-        cache_set(f"user_perms:{test_user_id}", ["stale.permission"])
-        cache_set(f"user_perms:{test_user_id}:expired=False", ["stale.permission.false"])
-        cache_set(f"user_perms:{test_user_id}:expired=True", ["stale.permission.true"])
+        await seed_cache(test_user_id, "stale.permission")
 
         # Verify cache is seeded
-        assert cache_get(f"user_perms:{test_user_id}") == ["stale.permission"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") == ["stale.permission.false"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") == ["stale.permission.true"]
+        assert await cached_allows(test_user_id) == [["stale.permission"]] * 3
 
         # Mock the database operations
         mock_role = MagicMock()
@@ -141,10 +146,8 @@ class TestRoleCacheInvalidation:
                 revoked_by=test_granter_id,
             )
 
-        # Assert all three cache keys are cleared
-        assert cache_get(f"user_perms:{test_user_id}") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        # Assert every cached variant is retired
+        assert await cached_allows(test_user_id) == [None] * 3
 
 
 class TestPermissionCacheInvalidation:
@@ -160,14 +163,10 @@ class TestPermissionCacheInvalidation:
     ):
         """Test that grant_permission_to_user clears both expired=True and expired=False cache keys."""
         # Seed both cache keys with dummy data
-        cache_set(f"user_perms:{test_user_id}", ["old.permission"])
-        cache_set(f"user_perms:{test_user_id}:expired=False", ["old.permission.false"])
-        cache_set(f"user_perms:{test_user_id}:expired=True", ["old.permission.true"])
+        await seed_cache(test_user_id, "old.permission")
 
         # Verify cache is seeded
-        assert cache_get(f"user_perms:{test_user_id}") == ["old.permission"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") == ["old.permission.false"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") == ["old.permission.true"]
+        assert await cached_allows(test_user_id) == [["old.permission"]] * 3
 
         # Mock the database operations
         mock_permission = MagicMock()
@@ -181,10 +180,8 @@ class TestPermissionCacheInvalidation:
                 granted_by=test_granter_id,
             )
 
-        # Assert all three cache keys are cleared
-        assert cache_get(f"user_perms:{test_user_id}") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        # Assert every cached variant is retired
+        assert await cached_allows(test_user_id) == [None] * 3
 
     @pytest.mark.asyncio
     async def test_revoke_permission_clears_both_cache_keys(
@@ -196,14 +193,10 @@ class TestPermissionCacheInvalidation:
     ):
         """Test that revoke_permission_from_user clears both expired=True and expired=False cache keys."""
         # Seed both cache keys with dummy data
-        cache_set(f"user_perms:{test_user_id}", ["stale.permission"])
-        cache_set(f"user_perms:{test_user_id}:expired=False", ["stale.permission.false"])
-        cache_set(f"user_perms:{test_user_id}:expired=True", ["stale.permission.true"])
+        await seed_cache(test_user_id, "stale.permission")
 
         # Verify cache is seeded
-        assert cache_get(f"user_perms:{test_user_id}") == ["stale.permission"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") == ["stale.permission.false"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") == ["stale.permission.true"]
+        assert await cached_allows(test_user_id) == [["stale.permission"]] * 3
 
         # Mock the database operations
         mock_permission = MagicMock()
@@ -217,10 +210,8 @@ class TestPermissionCacheInvalidation:
                 revoked_by=test_granter_id,
             )
 
-        # Assert all three cache keys are cleared
-        assert cache_get(f"user_perms:{test_user_id}") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        # Assert every cached variant is retired
+        assert await cached_allows(test_user_id) == [None] * 3
 
 
 class TestExpiredPermissionCacheHandling:
@@ -236,8 +227,7 @@ class TestExpiredPermissionCacheHandling:
     ):
         """Test that granting an expired permission still clears cache properly."""
         # Seed cache
-        cache_set(f"user_perms:{test_user_id}:expired=False", ["cached.permission"])
-        cache_set(f"user_perms:{test_user_id}:expired=True", ["cached.expired.permission"])
+        await seed_cache(test_user_id, "cached.permission")
 
         # Grant permission that's already expired
         past_time = datetime.now(UTC) - timedelta(days=1)
@@ -254,9 +244,8 @@ class TestExpiredPermissionCacheHandling:
                 expires_at=past_time,
             )
 
-        # Both cache keys should be cleared
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        # Every cached variant should be retired
+        assert await cached_allows(test_user_id) == [None] * 3
 
     @pytest.mark.asyncio
     async def test_revoke_expired_permission_clears_cache(
@@ -268,8 +257,7 @@ class TestExpiredPermissionCacheHandling:
     ):
         """Test that revoking an expired permission still clears cache properly."""
         # Seed cache
-        cache_set(f"user_perms:{test_user_id}:expired=False", ["cached.permission"])
-        cache_set(f"user_perms:{test_user_id}:expired=True", ["cached.expired.permission"])
+        await seed_cache(test_user_id, "cached.permission")
 
         mock_permission = MagicMock()
         mock_permission.id = uuid4()
@@ -282,9 +270,8 @@ class TestExpiredPermissionCacheHandling:
                 revoked_by=test_granter_id,
             )
 
-        # Both cache keys should be cleared
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        # Every cached variant should be retired
+        assert await cached_allows(test_user_id) == [None] * 3
 
 
 class TestDirectInvalidationMethod:
@@ -296,43 +283,30 @@ class TestDirectInvalidationMethod:
     ):
         """Test that _invalidate_user_permission_cache clears all cache key variants."""
         # Seed all three cache key variants
-        cache_set(f"user_perms:{test_user_id}", ["legacy.permission"])
-        cache_set(f"user_perms:{test_user_id}:expired=False", ["current.permission"])
-        cache_set(f"user_perms:{test_user_id}:expired=True", ["expired.permission"])
+        await seed_cache(test_user_id, "legacy.permission")
 
         # Verify cache is seeded
-        assert cache_get(f"user_perms:{test_user_id}") == ["legacy.permission"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") == ["current.permission"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") == ["expired.permission"]
+        assert await cached_allows(test_user_id) == [["legacy.permission"]] * 3
 
         # Call the invalidation method directly
-        rbac_service._invalidate_user_permission_cache(test_user_id)
+        await rbac_service._invalidate_user_permission_cache(test_user_id)
 
-        # Assert all three cache keys are cleared
-        assert cache_get(f"user_perms:{test_user_id}") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        # Assert every cached variant is retired
+        assert await cached_allows(test_user_id) == [None] * 3
 
     @pytest.mark.asyncio
     async def test_invalidation_with_no_cached_data(
         self, rbac_service: RBACService, test_user_id: str
     ):
         """Test that invalidation doesn't error when no cache exists."""
-        # Clear any existing cache
-        clear_test_cache(test_user_id)
-
         # Verify cache is empty
-        assert cache_get(f"user_perms:{test_user_id}") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        assert await cached_allows(test_user_id) == [None] * 3
 
         # Call invalidation - should not error
-        rbac_service._invalidate_user_permission_cache(test_user_id)
+        await rbac_service._invalidate_user_permission_cache(test_user_id)
 
         # Still empty
-        assert cache_get(f"user_perms:{test_user_id}") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        assert await cached_allows(test_user_id) == [None] * 3
 
     @pytest.mark.asyncio
     async def test_invalidation_partial_cache(
@@ -340,17 +314,83 @@ class TestDirectInvalidationMethod:
     ):
         """Test that invalidation works with only some cache keys set."""
         # Only set one variant
-        cache_set(f"user_perms:{test_user_id}:expired=False", ["partial.permission"])
+        await seed_cache(test_user_id, "partial.permission", variants=[(None, False)])
 
         # Verify only one is set
-        assert cache_get(f"user_perms:{test_user_id}") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") == ["partial.permission"]
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        assert await cached_allows(test_user_id) == [["partial.permission"], None, None]
 
         # Invalidate
-        rbac_service._invalidate_user_permission_cache(test_user_id)
+        await rbac_service._invalidate_user_permission_cache(test_user_id)
 
         # All should be None
-        assert cache_get(f"user_perms:{test_user_id}") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=False") is None
-        assert cache_get(f"user_perms:{test_user_id}:expired=True") is None
+        assert await cached_allows(test_user_id) == [None] * 3
+
+
+class TestPermissionResolutionCaching:
+    """Test the versioned cache and per-request memoization in get_user_permissions."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_is_served_from_cache_and_request_memo(
+        self, mock_session, test_user_id: str
+    ):
+        """A second service instance hits the shared cache; the same instance its memo."""
+        role_result = MagicMock()
+        role_result.scalars.return_value.all.return_value = ["ticket.read"]
+        direct_result = MagicMock()
+        direct_result.all.return_value = [("ticket.delete", False)]
+        mock_session.execute = AsyncMock(side_effect=[role_result, direct_result])
+
+        first = RBACService(mock_session)
+        with patch.object(first, "_include_parent_permissions", side_effect=lambda perms: perms):
+            snapshot = await first.get_user_permissions(test_user_id, tenant_id="tenant-1")
+        assert await first.get_user_permissions(test_user_id, tenant_id="tenant-1") is snapshot
+
+        second = RBACService(mock_session)
+        cached = await second.get_user_permissions(test_user_id, tenant_id="tenant-1")
+        assert cached.allows == {"ticket.read"}
+        assert cached.denies == {"ticket.delete"}
+        assert mock_session.execute.await_count == 2
+
+        await second._invalidate_user_permission_cache(test_user_id)
+        assert await cached_allows(test_user_id) == [None] * 3
+
+    @pytest.mark.asyncio
+    async def test_snapshot_computed_during_invalidation_is_not_served(self, test_user_id: str):
+        """A snapshot stored under a version that was bumped meanwhile is ignored."""
+        cache = get_permission_cache()
+        _, version = await cache.get(test_user_id, None, False)
+        await cache.invalidate_user(test_user_id)
+        await cache.set(test_user_id, None, False, {"allows": ["stale"], "denies": []}, version)
+
+        payload, _ = await cache.get(test_user_id, None, False)
+        assert payload is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all_retires_every_user(self, test_user_id: str):
+        """Bumping the global version retires snapshots of all users."""
+        other_user_id = str(uuid4())
+        await seed_cache(test_user_id, "a.read")
+        await seed_cache(other_user_id, "b.read")
+
+        await get_permission_cache().invalidate_all()
+
+        assert await cached_allows(test_user_id) == [None] * 3
+        assert await cached_allows(other_user_id) == [None] * 3
+
+    @pytest.mark.asyncio
+    async def test_redis_backend_invalidates_with_one_version_bump(self, test_user_id: str):
+        """On Redis the snapshot and versions come back in one MGET; invalidation is an INCR."""
+        from fakeredis import aioredis
+
+        redis = aioredis.FakeRedis(decode_responses=True)
+        cache = get_permission_cache()
+        with patch.object(cache, "_get_redis", return_value=redis):
+            await seed_cache(test_user_id, "ticket.read")
+            assert await cached_allows(test_user_id) == [["ticket.read"]] * 3
+            keys_before = set(await redis.keys("*"))
+
+            await cache.invalidate_user(test_user_id)
+
+            assert await cached_allows(test_user_id) == [None] * 3
+            new_keys = set(await redis.keys("*")) - keys_before
+            assert new_keys == {f"user_perms:{test_user_id}:version"}
@@ -188,7 +188,7 @@ class TestRoleManagement:
             rbac_service.db.execute = AsyncMock(return_value=mock_result)
 
             with patch.object(rbac_service, "_log_permission_grant"):
-                with patch("dotmac.platform.auth.rbac_service.cache_delete"):
+                with patch.object(rbac_service, "_invalidate_user_permission_cache"):
                     with patch(
                         "dotmac.platform.auth.rbac_service.get_current_tenant_id",
                         return_value="tenant1",
@@ -238,7 +238,7 @@ class TestRoleManagement:
             rbac_service.db.execute = AsyncMock(return_value=mock_result)
 
             with patch.object(rbac_service, "_log_permission_grant"):
-                with patch("dotmac.platform.auth.rbac_service.cache_delete"):
+                with patch.object(rbac_service, "_invalidate_user_permission_cache"):
                     with patch(
                         "dotmac.platform.auth.rbac_service.get_current_tenant_id",
                         return_value="tenant1",
@@ -318,7 +318,7 @@ class TestPermissionManagement:
             rbac_service.db.execute = AsyncMock(return_value=mock_result)
 
             with patch.object(rbac_service, "_log_permission_grant"):
-                with patch("dotmac.platform.auth.rbac_service.cache_delete"):
+                with patch.object(rbac_service, "_invalidate_user_permission_cache"):
                     with patch(
                         "dotmac.platform.auth.rbac_service.get_current_tenant_id",
                         return_value="tenant1",
@@ -346,7 +346,7 @@ class TestPermissionManagement:
             rbac_service.db.execute = AsyncMock(return_value=mock_result)
 
             with patch.object(rbac_service, "_log_permission_grant"):
-                with patch("dotmac.platform.auth.rbac_service.cache_delete"):
+                with patch.object(rbac_service, "_invalidate_user_permission_cache"):
                     with patch(
                         "dotmac.platform.auth.rbac_service.get_current_tenant_id",
                         return_value="tenant1",
@@ -387,7 +387,7 @@ class TestPermissionManagement:
             rbac_service.db.execute = AsyncMock(return_value=mock_result)
 
             with patch.object(rbac_service, "_log_permission_grant"):
-                with patch("dotmac.platform.auth.rbac_service.cache_delete"):
+                with patch.object(rbac_service, "_invalidate_user_permission_cache"):
                     with patch(
                         "dotmac.platform.auth.rbac_service.get_current_tenant_id",
                         return_value="tenant1",
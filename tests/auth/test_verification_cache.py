@@ -0,0 +1,158 @@
+"""Tests for the in-process auth verification cache."""
+
+import asyncio
+import hashlib
+import json
+from contextlib import ExitStack, contextmanager
+from unittest.mock import patch
+
+import pytest
+from fakeredis import FakeServer, aioredis
+
+from dotmac.platform.auth import core, verification_cache
+from dotmac.platform.auth.core import APIKeyService, JWTService, SessionManager, TokenType
+from dotmac.platform.auth.verification_cache import AuthVerificationCache
+
+pytestmark = pytest.mark.asyncio
+
+REDIS_URL = "redis://verification-cache-test:6379"
+
+
+async def _start_listening(cache: AuthVerificationCache) -> None:
+    cache.is_ready()
+    for _ in range(100):
+        if cache.is_ready():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("revocation listener never subscribed")
+
+
+@contextmanager
+def _no_redis_calls(redis):
+    """Fail the test if any of the verification reads reach Redis."""
+    failure = AssertionError("unexpected Redis round trip")
+    with ExitStack() as stack:
+        for method in ("pipeline", "exists", "get", "mget"):
+            stack.enter_context(patch.object(redis, method, side_effect=failure))
+        yield
+
+
+@pytest.fixture
+def server():
+    return FakeServer()
+
+
+@pytest.fixture
+def redis(server):
+    return aioredis.FakeRedis(server=server, decode_responses=True)
+
+
+@pytest.fixture
+async def cache(redis, monkeypatch):
+    auth_cache = AuthVerificationCache(max_entries=100, ttl_seconds=30)
+    monkeypatch.setattr(auth_cache, "_get_redis", lambda: redis)
+    monkeypatch.setattr(verification_cache, "_verification_cache", auth_cache)
+    await _start_listening(auth_cache)
+    yield auth_cache
+    await auth_cache.close()
+
+
+@pytest.fixture
+def sessions(redis, monkeypatch):
+    manager = SessionManager(redis_url=REDIS_URL)
+    manager._redis = redis
+    monkeypatch.setattr(core, "session_manager", manager)
+    return manager
+
+
+@pytest.fixture
+def jwt_service(redis):
+    service = JWTService(secret="test-secret", redis_url=REDIS_URL)
+    service._redis = redis
+    return service
+
+
+async def test_verified_token_is_served_from_cache(cache, sessions, jwt_service, redis):
+    session_id = await sessions.create_session("user-1", {})
+    token = jwt_service.create_access_token("user-1", additional_claims={"session_id": session_id})
+
+    claims = await jwt_service.verify_token_async(token, TokenType.ACCESS)
+    assert claims["session_id"] == session_id
+
+    with _no_redis_calls(redis):
+        assert (await jwt_service.verify_token_async(token, TokenType.ACCESS))["sub"] == "user-1"
+    assert cache.stats()["hits"] >= 2
+
+
+async def test_logout_and_revocation_take_effect_immediately(cache, sessions, jwt_service):
+    session_id = await sessions.create_session("user-1", {})
+    token = jwt_service.create_access_token("user-1", additional_claims={"session_id": session_id})
+    await jwt_service.verify_token_async(token, TokenType.ACCESS)
+
+    await sessions.delete_session(session_id)
+    with pytest.raises(core.HTTPException, match="Session has been invalidated"):
+        await jwt_service.verify_token_async(token, TokenType.ACCESS)
+
+    other_token = jwt_service.create_access_token("user-1")
+    await jwt_service.verify_token_async(other_token)
+    assert await jwt_service.revoke_token(other_token)
+    with pytest.raises(core.HTTPException, match="revoked"):
+        await jwt_service.verify_token_async(other_token)
+
+
+async def test_revocations_reach_other_workers(cache, server):
+    other_redis = aioredis.FakeRedis(server=server, decode_responses=True)
+    other = AuthVerificationCache(max_entries=100, ttl_seconds=30)
+    with patch.object(other, "_get_redis", return_value=other_redis):
+        await _start_listening(other)
+        other.set_token_revoked("jti-1", False)
+        other.set_session("session-1", {"user_id": "user-1"})
+
+        await cache.invalidate(jtis=["jti-1"], session_ids=["session-1"])
+        for _ in range(100):
+            if other.token_revoked("jti-1") is other.MISSING:
+                break
+            await asyncio.sleep(0.01)
+
+        assert other.token_revoked("jti-1") is other.MISSING
+        assert other.session("session-1") is other.MISSING
+        await other.close()
+
+
+async def test_api_key_checks_use_one_round_trip_then_none(cache, redis):
+    service = APIKeyService(redis_url=REDIS_URL)
+    service._redis = redis
+    api_key = await service.create_api_key("user-1", "Integration", ["read"])
+    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+    key_id = "key-1"
+    meta = {"id": key_id, "name": "Integration", "is_active": True}
+    await redis.set(f"api_key_lookup:{api_key_hash}", key_id)
+    await redis.set(f"api_key_meta:{key_id}", json.dumps(meta))
+
+    assert (await service.verify_api_key(api_key))["user_id"] == "user-1"
+    cache.local_cache.clear()
+    with patch.object(redis, "get", side_effect=AssertionError("metadata id not cached")):
+        assert (await service.verify_api_key(api_key))["user_id"] == "user-1"
+
+    with _no_redis_calls(redis):
+        assert (await service.verify_api_key(api_key))["user_id"] == "user-1"
+
+    await redis.set(f"api_key_meta:{key_id}", json.dumps({**meta, "is_active": False}))
+    await cache.invalidate_api_keys()
+    assert await service.verify_api_key(api_key) is None
+
+    assert await service.revoke_api_key(api_key)
+    assert cache.api_key(api_key_hash) is cache.MISSING
+    assert await service.verify_api_key(api_key) is None
+
+
+async def test_stored_pending_session_replaces_cached_miss(cache, sessions):
+    pending_key = "2fa_pending:user-1"
+    assert await sessions.get_session(pending_key) is None
+    assert cache.session(pending_key) is None
+
+    assert await sessions.store_session(pending_key, {"pending_2fa": True}, ttl=300)
+    assert (await sessions.get_session(pending_key)) == {"pending_2fa": True}
+
+    await sessions.delete_session(pending_key)
+    assert await sessions.get_session(pending_key) is None
@@ -0,0 +1,131 @@
+import json
+import zlib
+from datetime import UTC, datetime
+from enum import Enum
+
+import pytest
+from pydantic import BaseModel
+
+from dotmac.platform.cache.codecs import (
+    CODEC_HEADER_V1,
+    COMPRESSORS,
+    CacheCodec,
+    CodecError,
+    CompressorId,
+    SerializerId,
+)
+from dotmac.platform.cache.service import CacheService
+
+pytestmark = pytest.mark.unit
+
+
+class Plan(BaseModel):
+    name: str
+    price: int
+
+
+class Status(Enum):
+    ACTIVE = "active"
+
+
+def test_json_codec_round_trip_with_header():
+    codec = CacheCodec(serializer="json", compressor="none")
+    value = {"plan": Plan(name="gold", price=10), "status": Status.ACTIVE, "n": [1, 2]}
+
+    encoded = codec.encode(value)
+
+    assert encoded[0] == CODEC_HEADER_V1
+    assert encoded[1] == SerializerId.JSON
+    assert codec.decode(encoded) == {
+        "plan": {"name": "gold", "price": 10},
+        "status": "active",
+        "n": [1, 2],
+    }
+
+
+def test_compression_only_above_threshold():
+    codec = CacheCodec(serializer="json", compressor="zlib", compression_threshold=100)
+
+    small = codec.encode({"a": 1})
+    large = codec.encode({"rows": ["x" * 10] * 100})
+
+    assert small[1] >> 4 == CompressorId.NONE
+    assert large[1] >> 4 == CompressorId.ZLIB
+    assert codec.decode(large) == {"rows": ["x" * 10] * 100}
+
+
+def test_forced_compression_without_configured_compressor():
+    codec = CacheCodec(serializer="json", compressor="none")
+
+    encoded = codec.encode({"a": 1}, compress=True)
+
+    assert encoded[1] >> 4 == CompressorId.ZLIB
+    assert codec.decode(encoded) == {"a": 1}
+
+
+def test_decodes_legacy_headerless_payloads():
+    codec = CacheCodec()
+    legacy = json.dumps({"a": 1}).encode()
+
+    assert codec.decode(legacy) == {"a": 1}
+    assert codec.decode(zlib.compress(legacy)) == {"a": 1}
+
+
+def test_reads_payloads_written_by_other_codecs():
+    writer = CacheCodec(serializer="json", compressor="zlib", compression_threshold=0)
+    reader = CacheCodec(serializer="auto", compressor="auto")
+    value = {"ts": datetime(2024, 1, 1, tzinfo=UTC), "rows": list(range(50))}
+
+    assert reader.decode(writer.encode(value)) == {
+        "ts": "2024-01-01T00:00:00+00:00",
+        "rows": list(range(50)),
+    }
+
+
+@pytest.mark.parametrize("module", ["orjson", "msgpack"])
+def test_optional_serializers_match_json_semantics(module):
+    pytest.importorskip(module)
+    codec = CacheCodec(serializer=module, compressor="none")
+    value = {"plan": Plan(name="gold", price=10), 1: "int-key", "ts": datetime(2024, 1, 1)}
+
+    decoded = codec.decode(codec.encode(value))
+
+    assert decoded["plan"] == {"name": "gold", "price": 10}
+    assert decoded["ts"] == "2024-01-01T00:00:00"
+
+
+def test_unknown_or_missing_codec_raises():
+    codec = CacheCodec()
+
+    with pytest.raises(CodecError):
+        codec.decode(bytes((CODEC_HEADER_V1, 0x0F)) + b"{}")
+    if CompressorId.LZ4 not in COMPRESSORS:
+        with pytest.raises(CodecError):
+            codec.decode(bytes((CODEC_HEADER_V1, (CompressorId.LZ4 << 4) | 1)) + b"{}")
+
+
+def test_unserializable_value_raises_value_error():
+    with pytest.raises(ValueError):
+        CacheCodec().encode({"obj": object()})
+
+
+@pytest.mark.asyncio
+async def test_cache_service_mixed_codecs_coexist():
+    pytest.importorskip("lupa")
+    import fakeredis.aioredis
+
+    redis = fakeredis.aioredis.FakeRedis()
+    legacy_key = CacheService(redis=redis)._generate_key("settings", "legacy", "t1")
+    await redis.set(legacy_key, json.dumps({"v": "legacy"}).encode())
+
+    writer = CacheService(
+        redis=redis, codec=CacheCodec(serializer="json", compressor="zlib", compression_threshold=0)
+    )
+    reader = CacheService(redis=redis, codec=CacheCodec(serializer="json", compressor="none"))
+
+    assert await writer.set("fresh", {"v": "new"}, "settings", "t1")
+    assert await reader.get("fresh", "settings", "t1") == {"v": "new"}
+    assert await reader.get_many(["fresh", "legacy"], "settings", "t1") == {
+        "fresh": {"v": "new"},
+        "legacy": {"v": "legacy"},
+    }
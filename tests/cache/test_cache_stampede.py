@@ -0,0 +1,178 @@
+import asyncio
+import time
+
+import pytest
+
+from dotmac.platform.cache.decorators import cached
+from dotmac.platform.cache.stampede import CacheEnvelope, SingleFlight
+
+pytestmark = pytest.mark.unit
+
+
+class StubCacheService:
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str, namespace, tenant_id):
+        return self.data.get(key)
+
+    async def set(self, key: str, value, namespace, tenant_id, ttl):
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    stub = StubCacheService()
+    monkeypatch.setattr("dotmac.platform.cache.decorators.get_cache_service", lambda: stub)
+    return stub
+
+
+async def _drain_background_refreshes():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_compute_once(cache):
+    calls = {"count": 0}
+
+    @cached(include_tenant=False)
+    async def load_report(report_id: int):
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        return {"id": report_id}
+
+    results = await asyncio.gather(*(load_report(7) for _ in range(20)))
+
+    assert calls["count"] == 1
+    assert all(result == {"id": 7} for result in results)
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_share_exception():
+    flight = SingleFlight()
+    calls = {"count": 0}
+
+    async def failing():
+        calls["count"] += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend down")
+
+    results = await asyncio.gather(
+        *(flight.run("key", failing) for _ in range(3)), return_exceptions=True
+    )
+
+    assert calls["count"] == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not flight.in_flight("key")
+
+
+@pytest.mark.asyncio
+async def test_wait_joins_background_call():
+    flight = SingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.01)
+        return "loaded"
+
+    assert flight.run_in_background("key", load)
+    assert not flight.run_in_background("key", load)
+
+    assert await flight.wait("key") == "loaded"
+    assert await flight.wait("key") is None
+
+
+@pytest.mark.asyncio
+async def test_calls_on_other_event_loops_run_their_own():
+    flight = SingleFlight()
+    calls = {"count": 0}
+
+    async def load():
+        calls["count"] += 1
+        await asyncio.sleep(0.05)
+        return calls["count"]
+
+    assert flight.run_in_background("key", load)
+    # A Celery-style caller with its own loop cannot await this loop's future
+    result = await asyncio.to_thread(asyncio.run, flight.run("key", load))
+    await flight.wait("key")
+
+    assert result == 2
+    assert calls["count"] == 2
+    assert not flight.in_flight("key")
+
+
+@pytest.mark.asyncio
+async def test_stale_value_served_while_refreshing_in_background(cache):
+    calls = {"count": 0}
+
+    @cached(ttl=60, stale_ttl=300, include_tenant=False)
+    async def load_plan(plan_id: int):
+        calls["count"] += 1
+        return {"version": calls["count"]}
+
+    await load_plan(1)
+    key = next(iter(cache.data))
+    assert cache.ttls[key] == 360
+
+    # Expire the logical TTL while Redis still holds the entry
+    expired = CacheEnvelope.from_cached(cache.data[key])
+    cache.data[key] = CacheEnvelope(expired.value, time.time() - 1, 0.01).to_dict()
+
+    stale = await asyncio.gather(*(load_plan(1) for _ in range(5)))
+    await _drain_background_refreshes()
+
+    assert all(result == {"version": 1} for result in stale)
+    assert calls["count"] == 2
+    assert await load_plan(1) == {"version": 2}
+
+
+@pytest.mark.asyncio
+async def test_probabilistic_early_refresh(cache):
+    calls = {"count": 0}
+
+    @cached(ttl=60, early_refresh_beta=1.0, include_tenant=False)
+    async def load_plan(plan_id: int):
+        calls["count"] += 1
+        return calls["count"]
+
+    await load_plan(1)
+    key = next(iter(cache.data))
+
+    # Far from expiry with a cheap recompute: never refreshed early
+    cache.data[key] = CacheEnvelope(1, time.time() + 3600, 0.001).to_dict()
+    assert await load_plan(1) == 1
+    await _drain_background_refreshes()
+    assert calls["count"] == 1
+
+    # Recompute cost dwarfs the remaining TTL: refreshed early, fresh value served
+    cache.data[key] = CacheEnvelope(1, time.time() + 0.001, 1000.0).to_dict()
+    assert await load_plan(1) == 1
+    await _drain_background_refreshes()
+    assert calls["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_lock_waiter_uses_value_computed_by_other_worker(cache, monkeypatch):
+    async def lock_held_elsewhere(key, timeout=30):
+        return None
+
+    monkeypatch.setattr("dotmac.platform.cache.decorators.try_lock", lock_held_elsewhere)
+    calls = {"count": 0}
+
+    @cached(lock_timeout=5, include_tenant=False, key_prefix="shared")
+    async def load_plan(plan_id: int):
+        calls["count"] += 1
+        return "computed-here"
+
+    async def other_worker():
+        await asyncio.sleep(0.06)
+        cache.data["shared:plan_id:1"] = "computed-elsewhere"
+
+    result, _ = await asyncio.gather(load_plan(1), other_worker())
+
+    assert result == "computed-elsewhere"
+    assert calls["count"] == 0
@@ -0,0 +1,152 @@
+from types import SimpleNamespace
+
+import pytest
+
+from dotmac.platform.cache.decorators import cached, invalidate_cache
+from dotmac.platform.cache.models import CacheNamespace
+from dotmac.platform.cache.service import CacheService
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+async def cache_service():
+    pytest.importorskip("lupa")
+    import fakeredis.aioredis
+
+    redis = fakeredis.aioredis.FakeRedis()
+    yield CacheService(redis=redis)
+    await redis.aclose()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_deletes_only_tagged_keys(cache_service):
+    await cache_service.set("a", 1, CacheNamespace.CUSTOMER, "t1", ttl=60, tags=["customer:1"])
+    await cache_service.set("b", 2, CacheNamespace.CUSTOMER, "t1", ttl=60, tags=["customer:2"])
+    await cache_service.set("c", 3, CacheNamespace.INVOICE, "t1", tags=["customer:1"])
+
+    deleted = await cache_service.invalidate_tags("customer:1")
+
+    assert deleted == 2
+    assert await cache_service.get("a", CacheNamespace.CUSTOMER, "t1") is None
+    assert await cache_service.get("c", CacheNamespace.INVOICE, "t1") is None
+    assert await cache_service.get("b", CacheNamespace.CUSTOMER, "t1") == 2
+    assert not await cache_service.redis.exists(cache_service._tag_key("customer:1"))
+
+
+@pytest.mark.asyncio
+async def test_tag_set_ttl_tracks_longest_member(cache_service):
+    tag_key = cache_service._tag_key("tenant:t1")
+
+    await cache_service.set("a", 1, tenant_id="t1", ttl=30, tags=["tenant:t1"])
+    assert 0 < await cache_service.redis.ttl(tag_key) <= 30
+
+    await cache_service.set("b", 1, tenant_id="t1", ttl=300, tags=["tenant:t1"])
+    assert 30 < await cache_service.redis.ttl(tag_key) <= 300
+
+    await cache_service.set("c", 1, tenant_id="t1", tags=["tenant:t1"])
+    assert await cache_service.redis.ttl(tag_key) == -1
+
+    await cache_service.set("d", 1, tenant_id="t1", ttl=10, tags=["tenant:t1"])
+    assert await cache_service.redis.ttl(tag_key) == -1
+
+
+@pytest.mark.asyncio
+async def test_tag_set_prunes_expired_members(cache_service, monkeypatch):
+    tag_key = cache_service._tag_key("tenant:t1")
+    monkeypatch.setattr("dotmac.platform.cache.service.time.time", lambda: 1000.0)
+    await cache_service.set("a", 1, tenant_id="t1", ttl=30, tags=["tenant:t1"])
+    await cache_service.set("b", 1, tenant_id="t1", tags=["tenant:t1"])
+
+    monkeypatch.setattr("dotmac.platform.cache.service.time.time", lambda: 1031.0)
+    await cache_service.set("c", 1, tenant_id="t1", ttl=30, tags=["tenant:t1"])
+
+    members = await cache_service.redis.zrange(tag_key, 0, -1, withscores=True)
+    assert {key.decode().rsplit(":", 1)[1]: score for key, score in members} == {
+        "c": 1061.0,
+        "b": float("inf"),
+    }
+
+
+@pytest.mark.asyncio
+async def test_untagged_keys_register_no_tag_sets(cache_service):
+    await cache_service.set_many({"a": 1, "b": 2}, CacheNamespace.SETTINGS, "t1", ttl=60)
+
+    assert await cache_service.redis.keys("cache:tag:*") == []
+
+
+@pytest.mark.asyncio
+async def test_clear_namespace_scans_namespace_keys(cache_service):
+    await cache_service.set_many({"a": 1, "b": 2}, CacheNamespace.SETTINGS, "t1", ttl=60)
+    await cache_service.set("a", 1, CacheNamespace.SETTINGS, "t2", ttl=60)
+
+    deleted = await cache_service.clear_namespace(CacheNamespace.SETTINGS, "t1")
+
+    assert deleted == 2
+    assert await cache_service.get_many(["a", "b"], CacheNamespace.SETTINGS, "t1") == {}
+    assert await cache_service.get("a", CacheNamespace.SETTINGS, "t2") == 1
+
+
+class TaggingCacheService:
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.tags: dict[str, set[str]] = {}
+
+    async def get(self, key: str, namespace, tenant_id):
+        return self.data.get(key)
+
+    async def set(self, key: str, value, namespace, tenant_id, ttl, tags=None):
+        self.data[key] = value
+        for tag in tags or []:
+            self.tags.setdefault(tag, set()).add(key)
+        return True
+
+    async def invalidate_tags(self, *tags: str):
+        deleted = 0
+        for tag in tags:
+            for key in self.tags.pop(tag, set()):
+                deleted += int(self.data.pop(key, None) is not None)
+        return deleted
+
+
+@pytest.mark.asyncio
+async def test_decorators_resolve_tag_templates(monkeypatch):
+    cache = TaggingCacheService()
+    monkeypatch.setattr("dotmac.platform.cache.decorators.get_cache_service", lambda: cache)
+
+    calls = {"count": 0}
+
+    @cached(
+        namespace=CacheNamespace.CUSTOMER, tags=["tenant:{tenant_id}", "customer:{customer_id}"]
+    )
+    async def get_customer(customer_id: str, tenant_id: str):
+        calls["count"] += 1
+        return {"id": customer_id}
+
+    @invalidate_cache(namespace=CacheNamespace.CUSTOMER, tags=["customer:{customer_id}"])
+    async def update_customer(customer_id: str, tenant_id: str):
+        return True
+
+    await get_customer("c1", tenant_id="t1")
+    await get_customer("c2", tenant_id="t1")
+    assert set(cache.tags) == {"tenant:t1", "customer:c1", "customer:c2"}
+
+    await update_customer("c1", tenant_id="t1")
+    await get_customer("c1", tenant_id="t1")
+    await get_customer("c2", tenant_id="t1")
+
+    assert calls["count"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cached_accepts_tag_callable(monkeypatch):
+    cache = TaggingCacheService()
+    monkeypatch.setattr("dotmac.platform.cache.decorators.get_cache_service", lambda: cache)
+
+    @cached(include_tenant=False, tags=lambda plan: [f"plan:{plan.id}"])
+    async def load_plan(plan):
+        return {"id": plan.id}
+
+    await load_plan(SimpleNamespace(id="p1"))
+
+    assert set(cache.tags) == {"plan:p1"}
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from dotmac.platform.cache.local import L1_INVALIDATION_CHANNEL, LocalCache, LocalCacheInvalidator
+from dotmac.platform.cache.models import CacheNamespace
+from dotmac.platform.cache.service import CacheService
+
+pytestmark = pytest.mark.unit
+
+
+def test_local_cache_evicts_least_recently_used():
+    cache = LocalCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # refresh "a"
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is LocalCache.MISSING
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_local_cache_ttl_is_capped(monkeypatch):
+    cache = LocalCache(ttl_seconds=10)
+    now = time.monotonic()
+    monkeypatch.setattr("dotmac.platform.cache.local.time.monotonic", lambda: now)
+    cache.set("a", 1, ttl=3600)
+    cache.set("b", 2, ttl=5)
+
+    monkeypatch.setattr("dotmac.platform.cache.local.time.monotonic", lambda: now + 6)
+    assert cache.get("a") == 1
+    assert cache.get("b") is LocalCache.MISSING
+
+    monkeypatch.setattr("dotmac.platform.cache.local.time.monotonic", lambda: now + 11)
+    assert cache.get("a") is LocalCache.MISSING
+
+
+def test_local_cache_skips_set_after_racing_invalidation():
+    cache = LocalCache()
+    generation = cache.generation
+
+    cache.delete("a")  # invalidation arrives while the reader awaits Redis
+    cache.set("a", "stale", generation=generation)
+
+    assert cache.get("a") is LocalCache.MISSING
+
+
+def test_invalidator_applies_remote_messages_only():
+    cache = LocalCache()
+    invalidator = LocalCacheInvalidator(cache)
+    for key in ("cache:t1:settings:a", "cache:t1:settings:b", "cache:t2:settings:a"):
+        cache.set(key, 1)
+
+    invalidator.apply(json.dumps({"origin": invalidator.origin, "op": "clear", "values": []}))
+    assert len(cache) == 3
+
+    invalidator.apply(
+        json.dumps({"origin": "other", "op": "keys", "values": ["cache:t1:settings:a"]})
+    )
+    assert cache.get("cache:t1:settings:a") is LocalCache.MISSING
+
+    invalidator.apply(json.dumps({"origin": "other", "op": "pattern", "values": ["cache:t1:*"]}))
+    assert cache.get("cache:t1:settings:b") is LocalCache.MISSING
+    assert cache.get("cache:t2:settings:a") == 1
+
+
+@pytest.fixture
+async def fake_redis():
+    pytest.importorskip("lupa")
+    import fakeredis.aioredis
+
+    redis = fakeredis.aioredis.FakeRedis()
+    yield redis
+    await redis.aclose()
+
+
+async def _start(service: CacheService) -> None:
+    """Start the invalidation listener and wait until it is subscribed."""
+    service._uses_local(CacheNamespace.SETTINGS, service.redis)
+    for _ in range(50):
+        await asyncio.sleep(0.01)
+        if service._uses_local(CacheNamespace.SETTINGS, service.redis):
+            return
+
+
+@pytest.mark.asyncio
+async def test_two_tier_cache_serves_l1_and_stays_coherent(fake_redis):
+    worker_a = CacheService(fake_redis, LocalCache(), [CacheNamespace.SETTINGS])
+    worker_b = CacheService(fake_redis, LocalCache(), [CacheNamespace.SETTINGS])
+    await _start(worker_a)
+    await _start(worker_b)
+
+    try:
+        await worker_a.set("flags", {"beta": False}, CacheNamespace.SETTINGS, "t1", ttl=60)
+        await asyncio.sleep(0.05)  # let worker_b process the broadcast
+
+        assert await worker_b.get("flags", CacheNamespace.SETTINGS, "t1") == {"beta": False}
+        assert await worker_b.get("flags", CacheNamespace.SETTINGS, "t1") == {"beta": False}
+
+        stats = worker_b.get_stats()["settings"]
+        assert stats["l1_hits"] == 1
+        assert stats["l1_misses"] == 1
+        assert stats["l1_hit_rate"] == 50.0
+        assert stats["l2_hits"] == 1
+
+        await worker_a.set("flags", {"beta": True}, CacheNamespace.SETTINGS, "t1", ttl=60)
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if len(worker_b.local_cache) == 0:
+                break
+
+        assert await worker_b.get("flags", CacheNamespace.SETTINGS, "t1") == {"beta": True}
+    finally:
+        await worker_a.close()
+        await worker_b.close()
+
+
+@pytest.mark.asyncio
+async def test_namespaces_without_l1_bypass_local_cache(fake_redis):
+    service = CacheService(fake_redis, LocalCache(), [CacheNamespace.SETTINGS])
+    await _start(service)
+
+    try:
+        await service.set("report", {"rows": 1}, CacheNamespace.REPORTS, "t1", ttl=60)
+        assert await service.get("report", CacheNamespace.REPORTS, "t1") == {"rows": 1}
+
+        assert len(service.local_cache) == 0
+        assert service.get_stats()["reports"]["l1_hits"] == 0
+    finally:
+        await service.close()
+
+
+@pytest.mark.asyncio
+async def test_writes_broadcast_only_for_l1_namespaces(fake_redis):
+    service = CacheService(fake_redis, LocalCache(), [CacheNamespace.SETTINGS])
+    pubsub = fake_redis.pubsub()
+    await pubsub.subscribe(L1_INVALIDATION_CHANNEL)
+    await pubsub.get_message(timeout=0.1)  # subscribe confirmation
+
+    try:
+        await service.set("report", {"rows": 1}, CacheNamespace.REPORTS, "t1", ttl=60)
+        await service.set_many({"a": 1, "b": 2}, CacheNamespace.REPORTS, "t1", ttl=60)
+        assert await pubsub.get_message(timeout=0.1) is None
+
+        await service.set_many({"a": 1, "b": 2}, CacheNamespace.SETTINGS, "t1", ttl=60)
+        message = await pubsub.get_message(timeout=0.1)
+        assert json.loads(message["data"])["values"] == [
+            "cache:t1:settings:a",
+            "cache:t1:settings:b",
+        ]
+        assert await pubsub.get_message(timeout=0.1) is None
+    finally:
+        await pubsub.aclose()
+        await service.close()
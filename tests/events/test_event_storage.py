@@ -2,106 +2,144 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from datetime import UTC, datetime
 
 import pytest
+from fakeredis import aioredis
 
+from dotmac.platform.events.bus import EventBus
 from dotmac.platform.events.models import Event, EventStatus
 from dotmac.platform.events.storage import EventStorage
 
 pytestmark = pytest.mark.unit
 
 
-class FakeRedis:
-    """Minimal Redis client shim for testing indexing logic."""
+@pytest.fixture
+def fake_redis():
+    return aioredis.FakeRedis(decode_responses=True)
 
-    def __init__(self) -> None:
-        self.store: dict[str, str] = {}
-        self.sorted_sets: dict[str, dict[str, float]] = defaultdict(dict)
 
-    # Key-value operations -------------------------------------------------
-    def setex(self, key: str, ttl: int, value: str) -> None:
-        self.store[key] = value
+@pytest.fixture
+def storage(fake_redis):
+    return EventStorage(use_redis=True, redis_client=fake_redis)
 
-    def get(self, key: str) -> str | None:
-        return self.store.get(key)
 
-    def publish(self, channel: str, message: str) -> None:  # pragma: no cover - noop
-        return None
-
-    # Sorted-set operations ------------------------------------------------
-    def zadd(self, key: str, mapping: dict[str, float]) -> int:
-        zset = self.sorted_sets.setdefault(key, {})
-        new_members = 0
-        for member, score in mapping.items():
-            if member not in zset:
-                new_members += 1
-            zset[member] = score
-        return new_members
-
-    def expire(self, key: str, ttl: int) -> bool:  # pragma: no cover - noop
-        return True
-
-    def zrem(self, key: str, member: str) -> int:
-        zset = self.sorted_sets.get(key)
-        if not zset or member not in zset:
-            return 0
-        del zset[member]
-        return 1
-
-    def zrevrange(self, key: str, start: int, end: int) -> list[bytes]:
-        zset = self.sorted_sets.get(key, {})
-        if not zset:
-            return []
-
-        members_sorted = sorted(zset.items(), key=lambda item: item[1], reverse=True)
-        # Redis treats end as inclusive; adjust Python slicing accordingly
-        inclusive_end = None if end == -1 else end + 1
-        slice_members = [member for member, _ in members_sorted][start:inclusive_end]
-        return [member.encode() for member in slice_members]
+def _fail(*args, **kwargs):
+    raise AssertionError("save must not read the previous version back")
 
 
 @pytest.mark.asyncio
-async def test_redis_indices_clean_up_on_status_change(monkeypatch):
-    fake_redis = FakeRedis()
-    monkeypatch.setattr("dotmac.platform.events.storage.get_redis", lambda: fake_redis)
-
-    storage = EventStorage(use_redis=True)
+async def test_redis_indices_clean_up_on_status_change(storage, fake_redis, monkeypatch):
+    monkeypatch.setattr(fake_redis, "get", _fail)
     event = Event(
         event_type="billing.invoice.created", payload={}, metadata={"tenant_id": "tenant-1"}
     )
 
     await storage.save_event(event)
 
-    assert event.event_id in fake_redis.sorted_sets["events:status:pending"]
-    assert event.event_id in fake_redis.sorted_sets["events:type:billing.invoice.created"]
-    assert event.event_id in fake_redis.sorted_sets["events:tenant:tenant-1"]
-    assert event.event_id in fake_redis.sorted_sets["events:all"]
+    assert await fake_redis.zscore("events:status:pending", event.event_id) is not None
+    assert await fake_redis.zscore("events:type:billing.invoice.created", event.event_id)
+    assert await fake_redis.zscore("events:tenant:tenant-1", event.event_id)
+    assert await fake_redis.zscore("events:all", event.event_id)
+    assert await fake_redis.ttl(f"event:{event.event_id}") > 0
 
     event.status = EventStatus.COMPLETED
     await storage.update_event(event)
 
-    assert event.event_id not in fake_redis.sorted_sets["events:status:pending"]
-    assert event.event_id in fake_redis.sorted_sets["events:status:completed"]
+    assert await fake_redis.zscore("events:status:pending", event.event_id) is None
+    assert await fake_redis.zscore("events:status:completed", event.event_id) is not None
     # Type and tenant indices should be re-populated for the updated record
-    assert event.event_id in fake_redis.sorted_sets["events:type:billing.invoice.created"]
-    assert event.event_id in fake_redis.sorted_sets["events:tenant:tenant-1"]
-    assert event.event_id in fake_redis.sorted_sets["events:all"]
+    assert await fake_redis.zscore("events:type:billing.invoice.created", event.event_id)
+    assert await fake_redis.zscore("events:tenant:tenant-1", event.event_id)
+    assert await fake_redis.zcard("events:all") == 1
 
 
 @pytest.mark.asyncio
-async def test_query_without_filters_reads_all_index(monkeypatch):
-    fake_redis = FakeRedis()
-    monkeypatch.setattr("dotmac.platform.events.storage.get_redis", lambda: fake_redis)
+async def test_uninitialized_shared_client_falls_back_to_own_client(fake_redis, monkeypatch):
+    from dotmac.platform.redis_client import redis_manager
 
+    monkeypatch.setattr(redis_manager, "_client", None)
+    monkeypatch.setattr("redis.asyncio.Redis", lambda **kwargs: fake_redis)
     storage = EventStorage(use_redis=True)
+    event = Event(event_type="worker.event", payload={})
 
+    await storage.save_event(event)
+
+    assert await fake_redis.zscore("events:all", event.event_id) is not None
+    assert event.event_id not in storage._memory_store
+
+
+@pytest.mark.asyncio
+async def test_query_without_filters_reads_all_index(storage):
     event_a = Event(event_type="alpha.event", payload={})
     event_b = Event(event_type="beta.event", payload={})
 
-    await storage.save_event(event_a)
-    await storage.save_event(event_b)
+    await storage.save_events([event_a, event_b])
 
     results = await storage.query_events()
 
-    assert {e.event_id for e in results} == {event_a.event_id, event_b.event_id}
+    assert [e.event_id for e in results] == [event_b.event_id, event_a.event_id]
+    assert (await storage.get_event(event_a.event_id)).event_type == "alpha.event"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_redis", [True, False])
+async def test_cursor_pages_through_ties_in_order(fake_redis, use_redis, monkeypatch):
+    monkeypatch.setattr("dotmac.platform.events.storage.SCAN_CHUNK_SIZE", 2)
+    storage = EventStorage(use_redis=use_redis, redis_client=fake_redis if use_redis else None)
+    same_time = datetime(2026, 1, 1, tzinfo=UTC)
+    events = [
+        Event(event_type="tie.event", payload={"n": n}, created_at=same_time) for n in range(5)
+    ]
+    events.append(Event(event_type="tie.event", payload={"n": 5}))
+    await storage.save_events(events)
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        page, cursor = await storage.query_events_page(
+            event_type="tie.event", limit=2, cursor=cursor
+        )
+        seen.extend(e.event_id for e in page)
+        if cursor is None:
+            break
+
+    assert len(seen) == len(set(seen)) == 6
+    assert seen[0] == events[-1].event_id  # newest first
+
+
+@pytest.mark.asyncio
+async def test_replay_events_streams_failed_events(storage, monkeypatch):
+    monkeypatch.setattr("dotmac.platform.events.storage.SCAN_CHUNK_SIZE", 2)
+    bus = EventBus(storage=storage, redis_client=None, enable_persistence=True)
+    handled: list[str] = []
+
+    async def handler(event: Event) -> None:
+        handled.append(event.event_id)
+
+    bus.subscribe("retry.event", handler)
+
+    failed = [Event(event_type="retry.event", status=EventStatus.FAILED) for _ in range(5)]
+    await storage.save_events([*failed, Event(event_type="retry.event")])
+
+    # Replayed events leave the failed index while it is being paged
+    assert await bus.replay_events(status=EventStatus.FAILED) == 5
+
+    assert sorted(handled) == sorted(e.event_id for e in failed)
+    assert await storage.query_events(status=EventStatus.FAILED) == []
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_persists_all_events(storage):
+    bus = EventBus(storage=storage, redis_client=None, enable_persistence=True)
+
+    published = await bus.publish_batch(
+        [
+            {"event_type": "batch.one", "payload": {"n": 1}},
+            {"event_type": "batch.two", "metadata": {"tenant_id": "tenant-9"}},
+        ]
+    )
+
+    assert [e.event_type for e in published] == ["batch.one", "batch.two"]
+    stored = await bus.get_events(tenant_id="tenant-9")
+    assert [e.event_id for e in stored] == [published[1].event_id]
@@ -0,0 +1,178 @@
+"""
+Tests for the fiber network analytics rollups.
+"""
+
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dotmac.platform.fiber import analytics as analytics_module
+from dotmac.platform.fiber.analytics import (
+    compute_network_rollup,
+    get_network_rollup,
+    refresh_network_rollups,
+)
+from dotmac.platform.fiber.models import (
+    DistributionPoint,
+    DistributionPointType,
+    FiberCable,
+    FiberCableStatus,
+    FiberNetworkRollup,
+    FiberType,
+    ServiceArea,
+    ServiceAreaType,
+    SplicePoint,
+)
+from dotmac.platform.graphql.queries.fiber import map_network_rollup_to_graphql
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio]
+
+
+def _cable(tenant_id: str, status: FiberCableStatus, **kwargs) -> FiberCable:
+    return FiberCable(
+        cable_id=f"FC-{uuid4().hex[:8]}",
+        fiber_type=FiberType.SINGLE_MODE,
+        status=status,
+        tenant_id=tenant_id,
+        **kwargs,
+    )
+
+
+@pytest_asyncio.fixture
+async def network(db_session: AsyncSession, test_tenant_id: str) -> dict[str, FiberCable]:
+    """Create a small fiber network, plus a cable belonging to another tenant."""
+    cables = {
+        "active": _cable(
+            test_tenant_id,
+            FiberCableStatus.ACTIVE,
+            fiber_count=24,
+            length_km=5.5,
+            attenuation_db_per_km=0.3,
+        ),
+        "damaged": _cable(
+            test_tenant_id,
+            FiberCableStatus.DAMAGED,
+            fiber_count=12,
+            length_km=2.0,
+            attenuation_db_per_km=0.9,
+        ),
+        "retired": _cable(test_tenant_id, FiberCableStatus.RETIRED, fiber_count=48),
+    }
+    db_session.add_all(cables.values())
+    db_session.add(
+        _cable(f"other-{uuid4().hex}", FiberCableStatus.ACTIVE, fiber_count=96, length_km=40.0)
+    )
+    await db_session.flush()
+
+    db_session.add_all(
+        [
+            DistributionPoint(
+                point_id=f"DP-{uuid4().hex[:8]}",
+                point_type=DistributionPointType.FDH,
+                total_ports=32,
+                used_ports=8,
+                tenant_id=test_tenant_id,
+            ),
+            SplicePoint(
+                splice_id=f"SP-{uuid4().hex[:8]}",
+                cable_id=cables["active"].id,
+                insertion_loss_db=0.1,
+                tenant_id=test_tenant_id,
+            ),
+            SplicePoint(
+                splice_id=f"SP-{uuid4().hex[:8]}",
+                cable_id=cables["active"].id,
+                insertion_loss_db=0.3,
+                tenant_id=test_tenant_id,
+            ),
+            ServiceArea(
+                area_id=f"SA-{uuid4().hex[:8]}",
+                name="Serviceable",
+                area_type=ServiceAreaType.RESIDENTIAL,
+                is_serviceable=True,
+                homes_passed=500,
+                homes_connected=250,
+                tenant_id=test_tenant_id,
+            ),
+            ServiceArea(
+                area_id=f"SA-{uuid4().hex[:8]}",
+                name="Planned",
+                area_type=ServiceAreaType.RESIDENTIAL,
+                is_serviceable=False,
+                homes_passed=300,
+                homes_connected=0,
+                tenant_id=test_tenant_id,
+            ),
+        ]
+    )
+    await db_session.commit()
+    return cables
+
+
+async def test_compute_network_rollup_aggregates_tenant_network(
+    db_session: AsyncSession, test_tenant_id: str, network: dict[str, FiberCable]
+):
+    rollup = await compute_network_rollup(db_session, test_tenant_id)
+    analytics = map_network_rollup_to_graphql(rollup)
+
+    assert analytics.total_cables == 3
+    assert analytics.total_strands == 84
+    assert analytics.total_fiber_km == pytest.approx(7.5)
+    assert analytics.healthy_cables == 1
+    assert analytics.degraded_cables == 1
+    assert analytics.failed_cables == 1
+    assert analytics.network_health_score == pytest.approx(100 / 3)
+    assert analytics.average_cable_loss_db_per_km == pytest.approx(0.6)
+    assert analytics.cables_with_high_loss == [network["damaged"].cable_id]
+
+    assert analytics.total_distribution_points == 1
+    assert analytics.available_capacity == 24
+    assert analytics.capacity_utilization_percent == pytest.approx(25.0)
+    assert analytics.total_splice_points == 2
+    assert analytics.average_splice_loss_db == pytest.approx(0.2)
+
+    assert analytics.total_service_areas == 2
+    assert analytics.active_service_areas == 1
+    assert analytics.homes_passed == 800
+    assert analytics.penetration_rate_percent == pytest.approx(31.25)
+
+
+async def test_stored_rollup_is_served_until_stale(
+    db_session: AsyncSession, test_tenant_id: str, network: dict[str, FiberCable]
+):
+    assert await refresh_network_rollups(db_session) >= 2
+    stored = await db_session.get(FiberNetworkRollup, test_tenant_id)
+    assert stored is not None and stored.total_cables == 3
+
+    db_session.add(_cable(test_tenant_id, FiberCableStatus.INACTIVE, fiber_count=12))
+    await db_session.commit()
+
+    assert await get_network_rollup(db_session, test_tenant_id) is stored
+    live = await get_network_rollup(db_session, test_tenant_id, max_age_seconds=0)
+    assert live is not stored
+    assert (live.total_cables, live.cables_inactive) == (4, 1)
+
+    await refresh_network_rollups(db_session)
+    assert (await get_network_rollup(db_session, test_tenant_id)).total_cables == 4
+
+
+async def test_failing_tenant_does_not_stop_refresh(
+    db_session: AsyncSession,
+    test_tenant_id: str,
+    network: dict[str, FiberCable],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    refresh_one = analytics_module.refresh_network_rollup
+
+    async def refresh_or_fail(session: AsyncSession, tenant_id: str):
+        if tenant_id != test_tenant_id:
+            raise RuntimeError("broken tenant")
+        return await refresh_one(session, tenant_id)
+
+    monkeypatch.setattr(analytics_module, "refresh_network_rollup", refresh_or_fail)
+
+    assert await refresh_network_rollups(db_session) == 1
+    stored = await db_session.get(FiberNetworkRollup, test_tenant_id)
+    assert stored is not None and stored.total_cables == 3
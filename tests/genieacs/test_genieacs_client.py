@@ -105,6 +105,34 @@ class TestGenieACSDeviceOperations:
             assert call_args[0][1] == "devices"
             assert "query" in call_args[1]["params"]
 
+    @pytest.mark.asyncio
+    async def test_iter_devices_pages_by_id(self):
+        """Test iterating devices with keyset paging on _id"""
+        client = GenieACSClient(base_url="http://genieacs:7557")
+        pages = [
+            [{"_id": "device1"}, {"_id": "device2"}],
+            [{"_id": "device3"}],
+        ]
+
+        with patch.object(client, "get_devices", new_callable=AsyncMock) as mock_get:
+            mock_get.side_effect = pages
+            devices = [
+                device
+                async for device in client.iter_devices(
+                    query={"_tags": "fiber"}, projection="_lastInform", page_size=2
+                )
+            ]
+
+        assert [device["_id"] for device in devices] == ["device1", "device2", "device3"]
+        first, second = mock_get.call_args_list
+        assert first.kwargs == {
+            "query": {"_tags": "fiber"},
+            "projection": "_id,_lastInform",
+            "limit": 2,
+            "sort": {"_id": 1},
+        }
+        assert second.kwargs["query"] == {"_tags": "fiber", "_id": {"$gt": "device2"}}
+
     @pytest.mark.asyncio
     async def test_get_device(self):
         """Test getting single device by ID"""
@@ -124,6 +152,29 @@ class TestGenieACSDeviceOperations:
             # get_device uses URL-encoded device ID in endpoint
             mock_req.assert_called_once_with("GET", "devices/device1")
 
+    @pytest.mark.asyncio
+    async def test_get_device_reuses_recent_documents(self):
+        """Bursts of get_device calls share one read until the device is changed"""
+        client = GenieACSClient(base_url="http://genieacs:7557", device_cache_ttl_seconds=60)
+
+        with patch.object(client, "_genieacs_request", new_callable=AsyncMock) as mock_req:
+            mock_req.return_value = {"_id": "device1", "_lastInform": 1234567890000}
+
+            assert (await client.get_device("device1"))["_id"] == "device1"
+            assert (await client.get_device("device1"))["_id"] == "device1"
+            assert mock_req.await_count == 1
+
+            await client.reboot_device("device1")
+            await client.get_device("device1")
+            assert [call.args[0] for call in mock_req.await_args_list] == ["GET", "POST", "GET"]
+
+        uncached = GenieACSClient(base_url="http://genieacs:7557", device_cache_ttl_seconds=0)
+        with patch.object(uncached, "_genieacs_request", new_callable=AsyncMock) as mock_req:
+            mock_req.return_value = {"_id": "device1"}
+            await uncached.get_device("device1")
+            await uncached.get_device("device1")
+            assert mock_req.await_count == 2
+
     @pytest.mark.asyncio
     async def test_get_device_not_found(self):
         """Test getting non-existent device returns None"""
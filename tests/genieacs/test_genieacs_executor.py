@@ -0,0 +1,139 @@
+"""
+Tests for concurrent GenieACS device execution and bulk operations.
+"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from starlette.requests import Request
+
+from dotmac.platform.genieacs.executor import (
+    AcsRateLimiter,
+    get_acs_rate_limiter,
+    reset_acs_rate_limiters,
+    run_device_operations,
+)
+from dotmac.platform.genieacs.router import _stream_bulk_results
+from dotmac.platform.genieacs.schemas import BulkSetParametersRequest
+from dotmac.platform.genieacs.service import GenieACSService
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+
+@pytest.fixture(autouse=True)
+def _reset_limiters():
+    reset_acs_rate_limiters()
+    yield
+    reset_acs_rate_limiters()
+
+
+async def test_run_device_operations_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def operation(device_id: str) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return device_id.upper()
+
+    device_ids = [f"cpe-{i}" for i in range(20)]
+    outcomes = [
+        outcome async for outcome in run_device_operations(device_ids, operation, max_concurrent=4)
+    ]
+
+    assert peak == 4
+    assert sorted(o.device_id for o in outcomes) == sorted(device_ids)
+    assert all(o.success and o.result == o.device_id.upper() for o in outcomes)
+
+
+async def test_run_device_operations_captures_failures():
+    async def operation(device_id: str) -> None:
+        if device_id == "bad":
+            raise RuntimeError("ACS rejected task")
+
+    outcomes = {
+        outcome.device_id: outcome
+        async for outcome in run_device_operations(["ok", "bad"], operation, max_concurrent=2)
+    }
+
+    assert outcomes["ok"].success
+    assert not outcomes["bad"].success
+    assert str(outcomes["bad"].error) == "ACS rejected task"
+    assert outcomes["bad"].completed_at >= outcomes["bad"].started_at
+
+
+async def test_rate_limiter_spaces_out_requests():
+    limiter = AcsRateLimiter(rate_per_second=100)
+    started: list[float] = []
+
+    async def operation(device_id: str) -> None:
+        started.append(time.monotonic())
+
+    async for _ in run_device_operations(
+        [str(i) for i in range(5)], operation, max_concurrent=5, rate_limiter=limiter
+    ):
+        pass
+
+    assert started[-1] - started[0] >= 0.035
+
+
+def test_rate_limiters_are_shared_per_acs():
+    limiter = get_acs_rate_limiter("http://acs:7557/", 50)
+
+    assert get_acs_rate_limiter("http://acs:7557", 50) is limiter
+    assert get_acs_rate_limiter("http://other:7557", 50) is not limiter
+    assert get_acs_rate_limiter("http://acs:7557", 0) is None
+
+
+class ParameterClient:
+    """Client stub whose task creation for ``cpe-1`` times out."""
+
+    max_connections = 2
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self.in_flight = 0
+        self.peak = 0
+
+    async def set_parameter_values(self, device_id: str, parameters: dict) -> dict:
+        self.calls[device_id] = self.calls.get(device_id, 0) + 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        if device_id == "cpe-1":
+            raise httpx.ReadTimeout("ACS busy")
+        return {"id": f"task-{device_id}"}
+
+
+async def test_bulk_set_parameters_streams_results():
+    client = ParameterClient()
+    service = GenieACSService(client=client, tenant_id="tenant-1")
+    bulk_request = BulkSetParametersRequest(
+        device_ids=["cpe-2", "cpe-1", "cpe-3", "cpe-2"],
+        parameters={"Device.ManagementServer.PeriodicInformInterval": 300},
+        max_concurrent=10,
+    )
+
+    # The client owns retries, so failures are reported after one call; the
+    # duplicate shares its task and concurrency stays within the pool
+    task_ids = await service.bulk_set_parameters(bulk_request)
+    assert task_ids == ["task-cpe-2", "task-cpe-3", "task-cpe-2"]
+    assert client.calls == {"cpe-1": 1, "cpe-2": 1, "cpe-3": 1}
+    assert client.peak == 2
+
+    http_request = Request({"type": "http", "headers": [(b"accept", b"application/json")]})
+    response = _stream_bulk_results(http_request, service.stream_bulk_set_parameters(bulk_request))
+    events = [json.loads(line) async for line in response.body_iterator]
+
+    assert response.media_type == "application/x-ndjson"
+    assert [event["event"] for event in events] == ["device_result"] * 3 + ["summary"]
+    assert {event["data"]["device_id"] for event in events[:3]} == {"cpe-1", "cpe-2", "cpe-3"}
+    assert events[-1]["data"]["succeeded"] == 2
+    assert events[-1]["data"]["failed"] == 1
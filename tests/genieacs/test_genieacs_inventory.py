@@ -0,0 +1,220 @@
+"""
+Tests for the incrementally synced GenieACS CPE inventory.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from dotmac.platform.genieacs import inventory as inventory_module
+from dotmac.platform.genieacs import stats as stats_module
+from dotmac.platform.genieacs.inventory import (
+    INVENTORY_PROJECTION,
+    CpeInventory,
+    InventoryRecord,
+    reset_cpe_inventories,
+)
+from dotmac.platform.genieacs.schemas import DeviceQuery
+from dotmac.platform.genieacs.service import GenieACSService
+from dotmac.platform.genieacs.stats import (
+    DeviceStatsAggregator,
+    format_acs_timestamp,
+    parse_last_inform,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+NOW = datetime.now(UTC)
+
+
+@pytest.fixture(autouse=True)
+def _reset_inventories():
+    reset_cpe_inventories()
+    yield
+    reset_cpe_inventories()
+
+
+def _device(
+    serial: str,
+    last_inform: datetime,
+    *,
+    oui: str = "00259E",
+    product_class: str = "HG8245H",
+    registered: datetime | None = None,
+) -> dict:
+    return {
+        "_id": f"{oui}-{product_class}-{serial}",
+        "_deviceId": {
+            "_Manufacturer": "Huawei",
+            "_OUI": oui,
+            "_ProductClass": product_class,
+            "_SerialNumber": serial,
+        },
+        "_lastInform": format_acs_timestamp(last_inform.timestamp()),
+        "_registered": format_acs_timestamp((registered or last_inform).timestamp()),
+        "InternetGatewayDevice": {
+            "DeviceInfo": {"SoftwareVersion": {"_value": "V5R021C00S125"}},
+        },
+    }
+
+
+def _matches(device: dict, query: dict | None) -> bool:
+    if not query:
+        return True
+    if "$or" in query:
+        return any(_matches(device, condition) for condition in query["$or"])
+    ((field, condition),) = query.items()
+    return parse_last_inform(device[field]) >= parse_last_inform(condition["$gte"])
+
+
+class DeviceSourceStub:
+    """Serves devices through ``iter_devices`` and records each query."""
+
+    base_url = "http://acs.test:7557/"
+
+    def __init__(self, devices: list[dict]) -> None:
+        self.devices = {device["_id"]: device for device in devices}
+        self.queries: list[dict | None] = []
+
+    async def iter_devices(self, query=None, projection=None, page_size=1000):
+        assert projection == INVENTORY_PROJECTION
+        self.queries.append(query)
+        for device in sorted(self.devices.values(), key=lambda d: d["_id"]):
+            if _matches(device, query):
+                yield device
+
+    async def delete_device(self, device_id: str) -> bool:
+        return self.devices.pop(device_id, None) is not None
+
+
+def _ids(records: list[InventoryRecord]) -> list[str]:
+    return [record.device_id for record in records]
+
+
+async def test_inventory_indexed_lookups():
+    source = DeviceSourceStub(
+        [
+            _device("SN001", NOW - timedelta(minutes=1)),
+            _device("SN002", NOW - timedelta(days=2)),
+            _device("SN003", NOW - timedelta(minutes=2), product_class="EG8145V5"),
+            _device("SN004", NOW, oui="A0F3C1", product_class="F660"),
+        ]
+    )
+    inventory = CpeInventory(sync_interval_seconds=3600, full_resync_seconds=3600, page_size=2)
+    await inventory.sync(source)
+
+    records, total = inventory.query(skip=1, limit=2)
+    assert total == 4
+    assert _ids(records) == ["00259E-HG8245H-SN001", "00259E-HG8245H-SN002"]
+
+    record = inventory.query(serial_number="SN003")[0][0]
+    assert (record.oui, record.product_class, record.manufacturer) == (
+        "00259E",
+        "EG8145V5",
+        "Huawei",
+    )
+    assert record.software_version == "V5R021C00S125"
+
+    assert inventory.query(oui="00259E")[1] == 3
+    assert _ids(inventory.query(oui="00259E", product_class="HG8245H", online=True)[0]) == [
+        "00259E-HG8245H-SN001"
+    ]
+    assert _ids(inventory.query(online=False)[0]) == ["00259E-HG8245H-SN002"]
+    assert inventory.query(online=True)[1] == 3
+    assert inventory.query(serial_number="missing") == ([], 0)
+
+
+async def test_online_boundary_matches_device_stats(monkeypatch):
+    boundary = _device("SN001", NOW)
+    devices = [boundary, _device("SN002", NOW - timedelta(seconds=1))]
+    cutoff = parse_last_inform(boundary["_lastInform"])
+    monkeypatch.setattr(inventory_module, "online_cutoff", lambda: cutoff)
+    monkeypatch.setattr(stats_module, "online_cutoff", lambda: cutoff)
+
+    class StatsSource:
+        async def iter_devices(self, query=None, projection=None, page_size=1000):
+            for device in devices:
+                yield device
+
+    inventory = CpeInventory(sync_interval_seconds=3600, full_resync_seconds=3600, page_size=2)
+    await inventory.sync(DeviceSourceStub(devices))
+    aggregator = DeviceStatsAggregator(
+        refresh_interval_seconds=3600, full_resync_seconds=3600, page_size=2
+    )
+    snapshot = await aggregator.get_snapshot(StatsSource())
+
+    # A device informing exactly at the cutoff is online everywhere
+    assert _ids(inventory.query(online=True)[0]) == ["00259E-HG8245H-SN001"]
+    assert _ids(inventory.query(oui="00259E", online=True)[0]) == ["00259E-HG8245H-SN001"]
+    assert snapshot.online_devices == 1
+
+
+async def test_inventory_syncs_incrementally():
+    source = DeviceSourceStub(
+        [
+            _device("SN001", NOW - timedelta(hours=1)),
+            _device("SN002", NOW - timedelta(days=2)),
+        ]
+    )
+    inventory = CpeInventory(sync_interval_seconds=0, full_resync_seconds=3600, page_size=100)
+    await inventory.sync(source)
+    assert source.queries == [None]
+
+    # SN002 comes back online; SN005 is new
+    source.devices["00259E-HG8245H-SN002"] = _device("SN002", NOW)
+    new_device = _device("SN005", NOW - timedelta(seconds=30), product_class="F660")
+    source.devices[new_device["_id"]] = new_device
+    await inventory.sync(source)
+    assert len(inventory) == 2
+    await inventory.wait_for_sync()
+
+    last_inform = format_acs_timestamp((NOW - timedelta(hours=1)).timestamp())
+    assert source.queries[-1] == {
+        "$or": [
+            {"_lastInform": {"$gte": last_inform}},
+            {"_registered": {"$gte": last_inform}},
+        ]
+    }
+    assert len(inventory) == 3
+    assert inventory.query(online=True)[1] == 2
+    assert _ids(inventory.query(product_class="F660")[0]) == ["00259E-F660-SN005"]
+
+    inventory.discard("00259E-F660-SN005")
+    assert inventory.query(product_class="F660") == ([], 0)
+    assert len(inventory) == 2
+
+
+async def test_concurrent_syncs_share_one_read():
+    source = DeviceSourceStub([_device("SN001", NOW)])
+    inventory = CpeInventory(sync_interval_seconds=0, full_resync_seconds=3600, page_size=100)
+
+    await asyncio.gather(*(inventory.sync(source) for _ in range(5)))
+    assert source.queries == [None]
+    assert len(inventory) == 1
+
+    await asyncio.gather(*(inventory.sync(source) for _ in range(5)))
+    await inventory.wait_for_sync()
+    assert len(source.queries) == 2
+
+
+async def test_service_lists_devices_from_inventory():
+    source = DeviceSourceStub(
+        [
+            _device("SN001", NOW),
+            _device("SN002", NOW - timedelta(days=2)),
+        ]
+    )
+    service = GenieACSService(client=source, tenant_id="tenant-1")
+
+    response = await service.list_devices(DeviceQuery(online=False), return_response=True)
+    assert response.total == 1
+    assert response.devices[0].serial_number == "SN002"
+    assert response.devices[0].last_inform.tzinfo is not None
+
+    assert await service.delete_device("00259E-HG8245H-SN002")
+    # Another request for the same tenant reuses the synced inventory
+    other = GenieACSService(client=source, tenant_id="tenant-1")
+    devices = await other.list_devices()
+    assert [device["_id"] for device in devices] == ["00259E-HG8245H-SN001"]
+    assert source.queries == [None]
@@ -13,6 +13,8 @@ import pytest_asyncio
 from aiohttp import web
 
 from dotmac.platform.genieacs.client import GenieACSClient
+from dotmac.platform.genieacs.schemas import BulkSetParametersRequest
+from dotmac.platform.genieacs.service import GenieACSService
 
 pytestmark = pytest.mark.unit
 
@@ -41,6 +43,8 @@ async def performance_genieacs_server(aiohttp_server):
         "get_device": 0,
         "create_task": 0,
         "start_time": None,
+        # Simulated ACS processing time per task creation (seconds)
+        "task_latency": 0.0,
     }
 
     async def get_devices(request):
@@ -76,6 +80,8 @@ async def performance_genieacs_server(aiohttp_server):
 
         device_id = request.match_info["device_id"]
         task_data = await request.json()
+        if request_stats["task_latency"]:
+            await asyncio.sleep(request_stats["task_latency"])
 
         return web.json_response(
             {
@@ -397,3 +403,34 @@ class TestGenieACSScalability:
         assert len(all_devices) == 1000
         # Memory should not grow excessively (this is mainly observational)
         print(f"\n✓ Fetched {len(all_devices)} devices efficiently in chunks")
+
+    @pytest.mark.asyncio
+    @pytest.mark.slow
+    @pytest.mark.performance
+    async def test_bulk_set_parameters_throughput(
+        self, performance_genieacs_server, reset_circuit_breaker
+    ):
+        """Benchmark bulk parameter updates (devices/sec), sequential vs concurrent"""
+        performance_genieacs_server.app["request_stats"]["task_latency"] = 0.02
+        client = GenieACSClient(base_url=str(performance_genieacs_server.make_url("/")))
+        service = GenieACSService(client=client)
+        device_ids = [f"device-{i:04d}" for i in range(200)]
+        parameters = {"InternetGatewayDevice.ManagementServer.PeriodicInformInterval": 300}
+
+        throughput: dict[int, float] = {}
+        for max_concurrent in (1, 20):
+            request = BulkSetParametersRequest(
+                device_ids=device_ids, parameters=parameters, max_concurrent=max_concurrent
+            )
+            start_time = time.perf_counter()
+            task_ids = await service.bulk_set_parameters(request)
+            elapsed_time = time.perf_counter() - start_time
+
+            assert len(task_ids) == len(device_ids)
+            throughput[max_concurrent] = len(device_ids) / elapsed_time
+            print(
+                f"\n✓ Bulk set parameters, max_concurrent={max_concurrent}: "
+                f"{throughput[max_concurrent]:.0f} devices/sec"
+            )
+
+        assert throughput[20] > 2 * throughput[1]
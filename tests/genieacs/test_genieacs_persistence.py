@@ -10,7 +10,11 @@ import pytest
 pytestmark = pytest.mark.integration
 
 import dotmac.platform.genieacs.models  # noqa: F401  # Ensure tables are registered
-from dotmac.platform.genieacs.models import FirmwareUpgradeSchedule, MassConfigJob
+from dotmac.platform.genieacs.models import (
+    FirmwareUpgradeSchedule,
+    MassConfigJob,
+    MassConfigResult,
+)
 from dotmac.platform.genieacs.schemas import (
     FirmwareUpgradeScheduleCreate,
     MassConfigFilter,
@@ -18,9 +22,11 @@ from dotmac.platform.genieacs.schemas import (
 )
 from dotmac.platform.genieacs.service_db import GenieACSServiceDB
 from dotmac.platform.genieacs.tasks import (
+    _execute_mass_config_async,
     _replay_pending_operations_async,
 )
 from dotmac.platform.tenant.models import BillingCycle, Tenant, TenantPlanType, TenantStatus
+from dotmac.platform.tenant.oss_config import ServiceConfig
 
 UTC = UTC
 
@@ -265,3 +271,70 @@ async def test_replay_pending_operations(monkeypatch, async_db_session):
     assert job_refreshed.status == "queued"
     assert job_refreshed.started_at is None
     assert job_refreshed.pending_devices == job_refreshed.total_devices
+
+
+@pytest.mark.asyncio
+async def test_mass_config_resumes_from_persisted_results(monkeypatch, async_db_session):
+    """Devices that already succeeded are skipped; the rest run concurrently in batches."""
+    from contextlib import asynccontextmanager
+
+    import fakeredis.aioredis
+
+    import dotmac.platform.genieacs.tasks as genieacs_tasks
+    from dotmac.platform.settings import settings
+
+    @asynccontextmanager
+    async def _session_ctx():
+        yield async_db_session
+
+    stub_client = StubGenieACSClient()
+    stub_client.devices = [{"_id": "device-1"}, {"_id": "device-2"}, {"_id": "device-3"}]
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    async def _get_service_config(*_, **__):
+        return ServiceConfig(url="http://acs.test:7557")
+
+    async def _get_redis_client():
+        return redis
+
+    monkeypatch.setattr(genieacs_tasks.db_module, "async_session_maker", _session_ctx)
+    monkeypatch.setattr(genieacs_tasks, "get_service_config", _get_service_config)
+    monkeypatch.setattr(genieacs_tasks, "GenieACSClient", lambda **_: stub_client)
+    monkeypatch.setattr(genieacs_tasks, "get_redis_client", _get_redis_client)
+    monkeypatch.setattr(settings.genieacs, "status_flush_size", 1)
+
+    tenant = await _create_tenant(async_db_session)
+    job = MassConfigJob(
+        job_id=str(uuid4()),
+        tenant_id=tenant.id,
+        name="Resume",
+        device_filter={"_id": {"$exists": True}},
+        config_changes={
+            "custom_parameters": {"Device.ManagementServer.PeriodicInformInterval": 300}
+        },
+        status="queued",
+        dry_run="false",
+        max_concurrent=2,
+    )
+    async_db_session.add(job)
+    async_db_session.add_all(
+        [
+            MassConfigResult(job_id=job.job_id, device_id="device-1", status="success"),
+            MassConfigResult(job_id=job.job_id, device_id="device-2", status="failed"),
+        ]
+    )
+    await async_db_session.commit()
+
+    summary = await _execute_mass_config_async(job.job_id, DummyTask())
+
+    assert summary["resumed"] == 1
+    assert summary["completed"] == 3
+    assert summary["failed"] == 0
+    assert sorted(device_id for device_id, _ in stub_client.parameter_sets) == [
+        "device-2",
+        "device-3",
+    ]
+
+    await async_db_session.refresh(job)
+    assert job.status == "completed"
+    assert (job.total_devices, job.completed_devices, job.pending_devices) == (3, 3, 0)
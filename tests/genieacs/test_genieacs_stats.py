@@ -0,0 +1,165 @@
+"""
+Tests for incrementally aggregated GenieACS device statistics.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from dotmac.platform.genieacs.service import GenieACSService
+from dotmac.platform.genieacs.stats import (
+    STATS_PROJECTION,
+    DeviceStatsAggregator,
+    get_parameter_value,
+    parse_last_inform,
+    reset_device_stats_aggregators,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+
+@pytest.fixture(autouse=True)
+def _reset_aggregators():
+    reset_device_stats_aggregators()
+    yield
+    reset_device_stats_aggregators()
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _device(device_id: str, last_inform: datetime, manufacturer: str, model: str) -> dict:
+    # Nested, as GenieACS returns projected parameters
+    return {
+        "_id": device_id,
+        "_lastInform": _iso(last_inform),
+        "InternetGatewayDevice": {
+            "DeviceInfo": {
+                "Manufacturer": {"_value": manufacturer},
+                "ModelName": {"_value": model},
+            }
+        },
+    }
+
+
+class DeviceSourceStub:
+    """Serves devices through ``iter_devices`` and records each call."""
+
+    def __init__(self, devices: list[dict]) -> None:
+        self.devices = {device["_id"]: device for device in devices}
+        self.calls: list[dict] = []
+
+    async def iter_devices(self, query=None, projection=None, page_size=1000):
+        self.calls.append({"query": query, "projection": projection})
+        since = (query or {}).get("_lastInform", {}).get("$gte")
+        for device in list(self.devices.values()):
+            if since is None or parse_last_inform(device["_lastInform"]) >= parse_last_inform(
+                since
+            ):
+                yield device
+
+
+async def test_aggregator_refreshes_incrementally():
+    now = datetime.now(UTC)
+    source = DeviceSourceStub(
+        [
+            _device("cpe-1", now - timedelta(minutes=1), "Huawei", "HG8245H"),
+            _device("cpe-2", now - timedelta(hours=2), "Huawei", "HG8546M"),
+            _device("cpe-3", now - timedelta(hours=3), "ZTE", "F660"),
+        ]
+    )
+    aggregator = DeviceStatsAggregator(
+        refresh_interval_seconds=0, full_resync_seconds=3600, page_size=2
+    )
+
+    stats = await aggregator.get_snapshot(source)
+    assert (stats.total_devices, stats.online_devices, stats.offline_devices) == (3, 1, 2)
+    assert stats.manufacturers == {"Huawei": 2, "ZTE": 1}
+    assert stats.models == {"HG8245H": 1, "HG8546M": 1, "F660": 1}
+    assert source.calls == [{"query": None, "projection": STATS_PROJECTION}]
+
+    # cpe-2 informs again after a firmware swap; only recent informs are re-read
+    # while the previous statistics are served
+    source.devices["cpe-2"] = _device("cpe-2", now, "Nokia", "G-240W")
+    assert (await aggregator.get_snapshot(source)).manufacturers == {"Huawei": 2, "ZTE": 1}
+    await aggregator.wait_for_refresh()
+    stats = aggregator.snapshot()
+
+    assert source.calls[-1]["query"] == {"_lastInform": {"$gte": _iso(now - timedelta(minutes=1))}}
+    assert (stats.total_devices, stats.online_devices) == (3, 2)
+    assert stats.manufacturers == {"Huawei": 1, "ZTE": 1, "Nokia": 1}
+    assert stats.models == {"HG8245H": 1, "F660": 1, "G-240W": 1}
+
+    aggregator.discard("cpe-3")
+    assert aggregator.snapshot().manufacturers == {"Huawei": 1, "Nokia": 1}
+
+
+async def test_cached_stats_are_served_between_refreshes():
+    now = datetime.now(UTC)
+    source = DeviceSourceStub([_device("cpe-1", now, "Huawei", "HG8245H")])
+    aggregator = DeviceStatsAggregator(
+        refresh_interval_seconds=3600, full_resync_seconds=3600, page_size=100
+    )
+
+    await aggregator.get_snapshot(source)
+    await aggregator.get_snapshot(source)
+
+    assert len(source.calls) == 1
+
+
+async def test_concurrent_callers_share_one_refresh():
+    now = datetime.now(UTC)
+    source = DeviceSourceStub([_device("cpe-1", now, "Huawei", "HG8245H")])
+    aggregator = DeviceStatsAggregator(
+        refresh_interval_seconds=0, full_resync_seconds=3600, page_size=100
+    )
+
+    snapshots = await asyncio.gather(*(aggregator.get_snapshot(source) for _ in range(5)))
+    assert [stats.total_devices for stats in snapshots] == [1] * 5
+    assert len(source.calls) == 1
+
+    source.devices["cpe-2"] = _device("cpe-2", now, "ZTE", "F660")
+    snapshots = await asyncio.gather(*(aggregator.get_snapshot(source) for _ in range(5)))
+    assert [stats.total_devices for stats in snapshots] == [1] * 5
+    await aggregator.wait_for_refresh()
+    assert len(source.calls) == 2
+    assert aggregator.snapshot().total_devices == 2
+
+
+async def test_service_stats_and_delete():
+    now = datetime.now(UTC)
+
+    class Client(DeviceSourceStub):
+        base_url = "http://acs.test:7557/"
+
+        async def delete_device(self, device_id: str) -> bool:
+            return self.devices.pop(device_id, None) is not None
+
+    client = Client(
+        [
+            _device("cpe-1", now, "Huawei", "HG8245H"),
+            _device("cpe-2", now - timedelta(days=1), "ZTE", "F660"),
+        ]
+    )
+    service = GenieACSService(client=client, tenant_id="tenant-1")
+
+    stats = await service.get_device_stats()
+    assert (stats.total_devices, stats.online_devices, stats.offline_devices) == (2, 1, 1)
+
+    assert await service.delete_device("cpe-2")
+    # A second service for the same tenant and ACS shares the cached counters
+    stats = await GenieACSService(client=client, tenant_id="tenant-1").get_device_stats()
+    assert stats.total_devices == 1
+    assert stats.manufacturers == {"Huawei": 1}
+
+
+def test_parameter_and_inform_parsing():
+    flat = {"Device.DeviceInfo.ModelName": {"_value": "F660"}}
+    assert get_parameter_value(flat, "Device.DeviceInfo.ModelName") == "F660"
+    assert get_parameter_value(flat, "Device.DeviceInfo.Manufacturer") is None
+
+    assert parse_last_inform(1_700_000_000_000) == 1_700_000_000
+    assert parse_last_inform("2023-11-14T22:13:20.000Z") == 1_700_000_000
+    assert parse_last_inform("not a date") is None
@@ -54,6 +54,7 @@ def mock_context(mock_user):
     mock_db.execute = AsyncMock(return_value=mock_result)
 
     context.db = mock_db
+    context.read_db = mock_db
     return context
 
 
@@ -95,6 +96,7 @@ class TestAnalyticsQueries:
         guest_context = MagicMock(spec=Context)
         guest_context.current_user = None
         guest_context.db = AsyncMock()
+        guest_context.read_db = guest_context.db
 
         result = await graphql_client.execute(query, context_value=guest_context)
 
@@ -0,0 +1,125 @@
+"""
+Tests for persisted queries, document caching, cost limits and field caching.
+"""
+
+import hashlib
+
+import pytest
+import strawberry
+from graphql import parse
+
+from dotmac.platform.graphql.extensions import _parse_document, estimate_query_cost
+from dotmac.platform.graphql.field_cache import CachedResult, reset_field_result_cache
+from dotmac.platform.graphql.persisted_queries import reset_persisted_query_store
+from dotmac.platform.graphql.schema import schema
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+VERSION_QUERY = "query Version { version }"
+VERSION_HASH = hashlib.sha256(VERSION_QUERY.encode()).hexdigest()
+
+NESTED_CABLES_QUERY = """
+query Cables($limit: Int) {
+  fiberCables(limit: $limit) {
+    totalCount
+    cables { id strands { strandId } }
+  }
+}
+"""
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    reset_persisted_query_store()
+    reset_field_result_cache()
+    yield
+    reset_persisted_query_store()
+    reset_field_result_cache()
+
+
+def _persisted(query_hash: str) -> dict:
+    return {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+
+async def test_persisted_query_registration_and_lookup():
+    missing = await schema.execute(None, operation_extensions=_persisted(VERSION_HASH))
+    assert missing.errors[0].message == "PersistedQueryNotFound"
+    assert missing.errors[0].extensions["code"] == "PERSISTED_QUERY_NOT_FOUND"
+
+    registered = await schema.execute(VERSION_QUERY, operation_extensions=_persisted(VERSION_HASH))
+    assert registered.errors is None
+    assert registered.data == {"version": registered.data["version"]}
+
+    by_hash = await schema.execute(None, operation_extensions=_persisted(VERSION_HASH))
+    assert by_hash.errors is None
+    assert by_hash.data == registered.data
+
+
+async def test_persisted_query_hash_must_match_document():
+    result = await schema.execute(
+        VERSION_QUERY, operation_extensions=_persisted(hashlib.sha256(b"other").hexdigest())
+    )
+    assert result.errors[0].message == "provided sha does not match query"
+
+    lookup = await schema.execute(None, operation_extensions=_persisted(VERSION_HASH))
+    assert lookup.errors[0].message == "PersistedQueryNotFound"
+
+
+async def test_repeated_documents_are_parsed_once():
+    query = "query CachedVersion { version }"
+    await schema.execute(query)
+    hits = _parse_document.cache_info().hits
+
+    result = await schema.execute(query)
+
+    assert result.errors is None
+    assert _parse_document.cache_info().hits == hits + 1
+
+
+def test_cost_multiplies_nested_lists():
+    document = parse(NESTED_CABLES_QUERY)
+
+    # fiberCables: 1 + 50 * (totalCount + cables); cables is the page itself,
+    # strands falls back to the default list size of 20
+    cost, depth = estimate_query_cost(schema._schema, document, variables={"limit": 50})
+    assert (cost, depth) == (1 + 50 * (1 + (1 + 1 + (1 + 20 * 1))), 4)
+
+    # Without the variable the schema default (limit=50) applies
+    assert estimate_query_cost(schema._schema, document) == (cost, depth)
+
+
+async def test_expensive_query_is_rejected_before_execution():
+    result = await schema.execute(NESTED_CABLES_QUERY, variable_values={"limit": 100_000})
+
+    assert result.data is None
+    assert result.errors[0].extensions["code"] == "QUERY_TOO_COMPLEX"
+    assert result.errors[0].extensions["cost"] > result.errors[0].extensions["maxCost"]
+
+
+async def test_cached_result_is_scoped_by_tenant_and_arguments():
+    calls: list[tuple[str, int]] = []
+
+    @strawberry.type
+    class Query:
+        @strawberry.field(extensions=[CachedResult(ttl_seconds=60)])
+        async def total(self, info: strawberry.Info, factor: int = 1) -> int:
+            calls.append((info.context["tenant_id"], factor))
+            return len(calls) * factor
+
+    test_schema = strawberry.Schema(query=Query)
+
+    async def total(tenant_id: str | None, factor: int = 1) -> int:
+        result = await test_schema.execute(
+            f"{{ total(factor: {factor}) }}", context_value={"tenant_id": tenant_id}
+        )
+        assert result.errors is None
+        return result.data["total"]
+
+    assert await total("tenant-a") == 1
+    assert await total("tenant-a") == 1
+    assert await total("tenant-b") == 2
+    assert await total("tenant-a", factor=3) == 9
+    # Without a tenant nothing is cached
+    assert await total(None) == 4
+    assert await total(None) == 5
+    assert calls[:3] == [("tenant-a", 1), ("tenant-b", 1), ("tenant-a", 3)]
@@ -0,0 +1,88 @@
+"""
+Unit tests for the batching DataLoader base class.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, cast
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dotmac.platform.graphql.loaders import (
+    BatchLoader,
+    DataLoaderRegistry,
+    PaymentInvoiceLoader,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.asyncio]
+
+
+class DoublingLoader(BatchLoader[int, int]):
+    """Loader that records every batch it is asked for."""
+
+    name = "test_doubling"
+    max_batch_size = 3
+
+    def __init__(self, *, fail: bool = False) -> None:
+        super().__init__(cast(AsyncSession, None))
+        self.batches: list[list[int]] = []
+        self.fail = fail
+
+    async def batch_load(self, keys: list[int]) -> list[int]:
+        self.batches.append(keys)
+        if self.fail:
+            raise RuntimeError("backend unavailable")
+        return [key * 2 for key in keys]
+
+
+async def test_loads_in_same_tick_are_coalesced():
+    loader = DoublingLoader()
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+    assert results == [2, 4, 2]
+    assert loader.batches == [[1, 2]]
+
+
+async def test_results_are_cached_for_the_request():
+    loader = DoublingLoader()
+
+    assert await loader.load_many([1, 2]) == [2, 4]
+    assert await loader.load_many([2, 3, 1]) == [4, 6, 2]
+    assert loader.batches == [[1, 2], [3]]
+
+    loader.clear(3)
+    assert await loader.load(3) == 6
+    assert loader.batches[-1] == [3]
+
+
+async def test_batches_are_split_at_max_batch_size():
+    loader = DoublingLoader()
+
+    assert await loader.load_many(list(range(7))) == [0, 2, 4, 6, 8, 10, 12]
+    assert loader.batches == [[0, 1, 2], [3, 4, 5], [6]]
+
+
+async def test_failed_batch_is_raised_and_not_cached():
+    loader = DoublingLoader(fail=True)
+
+    with pytest.raises(RuntimeError, match="backend unavailable"):
+        await loader.load_many([1, 2])
+
+    loader.fail = False
+    assert await loader.load(1) == 2
+    assert loader.batches == [[1, 2], [1]]
+
+
+async def test_registry_reuses_loaders_and_skips_missing_invoice_ids():
+    registry = DataLoaderRegistry(cast(AsyncSession, None))
+    loader = registry.get_payment_invoice_loader()
+
+    assert isinstance(loader, PaymentInvoiceLoader)
+    assert registry.get_payment_invoice_loader() is loader
+
+    # No invoice IDs means no query against the (absent) session
+    result: list[Any] = await loader.load_many([None, ""])
+    assert result == [None, None]
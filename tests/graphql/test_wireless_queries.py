@@ -407,6 +407,51 @@ async def test_access_points_pagination(graphql_client, graphql_context, sample_
     assert result.data["accessPoints"]["hasNextPage"] is True
 
 
+@pytest.mark.asyncio
+async def test_access_points_cursor_pagination(
+    graphql_client, graphql_context, sample_access_points
+):
+    """Test walking access_points with pageInfo cursors."""
+    query = """
+        query ($after: String) {
+            accessPoints(limit: 2, after: $after, totalCountMode: ESTIMATED) {
+                accessPoints {
+                    name
+                }
+                totalCount
+                pageInfo {
+                    hasNextPage
+                    hasPreviousPage
+                    endCursor
+                }
+            }
+        }
+    """
+
+    names: list[str] = []
+    after = None
+    for _ in range(5):
+        result = await graphql_client.execute(
+            query, variable_values={"after": after}, context_value=graphql_context
+        )
+        assert result.errors is None
+        connection = result.data["accessPoints"]
+        assert connection["totalCount"] == 5
+        assert connection["pageInfo"]["hasPreviousPage"] is (after is not None)
+        names.extend(ap["name"] for ap in connection["accessPoints"])
+        if not connection["pageInfo"]["hasNextPage"]:
+            break
+        after = connection["pageInfo"]["endCursor"]
+
+    assert names == sorted(ap.name for ap in sample_access_points)
+
+    result = await graphql_client.execute(
+        query, variable_values={"after": "not-a-cursor"}, context_value=graphql_context
+    )
+    assert result.errors is not None
+    assert "Invalid pagination cursor" in result.errors[0].message
+
+
 @pytest.mark.asyncio
 async def test_access_points_filter_by_status(
     graphql_client, graphql_context, sample_access_points
@@ -0,0 +1,144 @@
+"""
+Cache codec microbenchmark.
+
+Compares every installed serializer/compressor combination on payload shapes
+we actually cache: tenant settings, GraphQL list results and report fragments.
+
+Run directly for a table of encode/decode timings and sizes:
+    python tests/performance/test_cache_codec_benchmark.py
+"""
+
+from __future__ import annotations
+
+import time
+import timeit
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+
+from dotmac.platform.cache.codecs import COMPRESSORS, SERIALIZERS, CacheCodec
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.benchmark,
+]
+
+
+def _tenant_settings() -> dict[str, Any]:
+    return {
+        "tenant_id": "tenant-123",
+        "features": {f"feature_{i}": i % 2 == 0 for i in range(40)},
+        "branding": {"primary_color": "#0055ff", "logo_url": "https://cdn.example.com/logo.png"},
+        "updated_at": datetime(2024, 1, 1, tzinfo=UTC).isoformat(),
+    }
+
+
+def _graphql_subscribers(count: int = 200) -> dict[str, Any]:
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    return {
+        "data": {
+            "subscribers": {
+                "totalCount": count,
+                "hasNextPage": True,
+                "subscribers": [
+                    {
+                        "id": f"sub-{i}",
+                        "username": f"user{i}@isp.example",
+                        "status": "ACTIVE" if i % 5 else "SUSPENDED",
+                        "framedIpAddress": f"10.0.{i // 256}.{i % 256}",
+                        "bandwidthProfileId": f"profile-{i % 7}",
+                        "createdAt": (start + timedelta(hours=i)).isoformat(),
+                        "sessions": [
+                            {
+                                "radacctid": i * 10 + j,
+                                "nasipaddress": "192.0.2.1",
+                                "acctsessiontime": 3600 * j,
+                                "acctinputoctets": 1_000_000 * j,
+                                "acctoutputoctets": 5_000_000 * j,
+                            }
+                            for j in range(3)
+                        ],
+                    }
+                    for i in range(count)
+                ],
+            }
+        }
+    }
+
+
+def _report_fragment(rows: int = 2000) -> dict[str, Any]:
+    return {
+        "columns": ["date", "revenue", "invoices", "paid", "overdue"],
+        "rows": [
+            [f"2024-01-{i % 28 + 1:02d}", i * 12.5, i, i - i // 10, i // 10] for i in range(rows)
+        ],
+    }
+
+
+PAYLOADS = {
+    "tenant_settings": _tenant_settings(),
+    "graphql_subscribers": _graphql_subscribers(),
+    "report_fragment": _report_fragment(),
+}
+
+
+def _codecs() -> list[tuple[str, CacheCodec]]:
+    codecs = []
+    for serializer in SERIALIZERS.values():
+        codecs.append((f"{serializer.name}+none", CacheCodec(serializer.name, "none")))
+        for compressor in COMPRESSORS.values():
+            codecs.append(
+                (
+                    f"{serializer.name}+{compressor.name}",
+                    CacheCodec(serializer.name, compressor.name, compression_threshold=1024),
+                )
+            )
+    return codecs
+
+
+def run_benchmark(number: int = 50) -> list[dict[str, Any]]:
+    """Time encode/decode per codec and payload; returns one row per pair."""
+    results = []
+    for payload_name, payload in PAYLOADS.items():
+        for codec_name, codec in _codecs():
+            encoded = codec.encode(payload)
+            encode_s = timeit.timeit(lambda c=codec, p=payload: c.encode(p), number=number)
+            decode_s = timeit.timeit(lambda c=codec, e=encoded: c.decode(e), number=number)
+            results.append(
+                {
+                    "payload": payload_name,
+                    "codec": codec_name,
+                    "bytes": len(encoded),
+                    "encode_us": encode_s / number * 1_000_000,
+                    "decode_us": decode_s / number * 1_000_000,
+                }
+            )
+    return results
+
+
+@pytest.mark.parametrize("payload_name", sorted(PAYLOADS))
+def test_all_codecs_round_trip(payload_name: str) -> None:
+    payload = PAYLOADS[payload_name]
+    reference = CacheCodec("json", "none").decode(CacheCodec("json", "none").encode(payload))
+
+    for codec_name, codec in _codecs():
+        assert codec.decode(codec.encode(payload)) == reference, codec_name
+
+
+def test_codec_benchmark_runs() -> None:
+    started = time.perf_counter()
+    results = run_benchmark(number=3)
+
+    assert {row["payload"] for row in results} == set(PAYLOADS)
+    assert all(row["bytes"] > 0 for row in results)
+    assert time.perf_counter() - started < 60
+
+
+if __name__ == "__main__":
+    print(f"{'payload':<22}{'codec':<18}{'bytes':>10}{'encode us':>12}{'decode us':>12}")
+    for row in run_benchmark():
+        print(
+            f"{row['payload']:<22}{row['codec']:<18}{row['bytes']:>10}"
+            f"{row['encode_us']:>12.1f}{row['decode_us']:>12.1f}"
+        )
@@ -0,0 +1,163 @@
+"""
+RADIUS authorization storm benchmark.
+
+Replays an Access-Request storm (every ONT re-authenticating at once after a
+power outage) against RADIUSService. The repository is replaced by an
+in-memory fake that charges a fixed latency per query through a small
+connection pool, so the run measures how many queries the storm needs and
+how long it queues behind the pool, with and without a warmed cache.
+
+Run directly for a summary:
+    python tests/performance/test_radius_auth_storm_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from dotmac.platform.radius.auth_cache import reset_authorization_cache
+from dotmac.platform.radius.schemas import RADIUSAuthorizationRequest
+from dotmac.platform.radius.service import RADIUSService
+from dotmac.platform.settings import settings
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.benchmark,
+]
+
+TENANT_ID = "tenant-storm"
+
+
+class FakeRADIUSRepository:
+    """Serves radcheck/radreply rows from memory with simulated query latency."""
+
+    def __init__(self, subscribers: int, query_latency: float, pool_size: int) -> None:
+        self.query_latency = query_latency
+        self.pool = asyncio.Semaphore(pool_size)
+        self.queries = 0
+        self.radchecks: dict[str, Any] = {}
+        self.radreplies: dict[str, list[Any]] = {}
+        for i in range(subscribers):
+            username = f"ont{i:06d}@isp"
+            self.radchecks[username] = SimpleNamespace(
+                username=username, subscriber_id=None, value="cleartext:secret"
+            )
+            self.radreplies[username] = [
+                SimpleNamespace(username=username, attribute=attribute, value=value)
+                for attribute, value in (
+                    ("Framed-IP-Address", f"10.{i // 65536}.{i // 256 % 256}.{i % 256}"),
+                    ("Mikrotik-Rate-Limit", "100M/100M"),
+                    ("X-Bandwidth-Profile-ID", "profile-100m"),
+                    ("Tunnel-Type", "VLAN"),
+                    ("Tunnel-Medium-Type", "IEEE-802"),
+                    ("Tunnel-Private-Group-ID", str(100 + i % 50)),
+                )
+            ]
+
+    async def _query(self) -> None:
+        async with self.pool:
+            self.queries += 1
+            await asyncio.sleep(self.query_latency)
+
+    async def get_radcheck_by_username(self, tenant_id: str, username: str) -> Any:
+        await self._query()
+        return self.radchecks.get(username)
+
+    async def get_radreplies_by_username(self, tenant_id: str, username: str) -> list[Any]:
+        await self._query()
+        return list(self.radreplies.get(username, []))
+
+    async def list_radchecks_after(
+        self, tenant_id: str, after_username: str | None = None, limit: int = 1000
+    ) -> list[Any]:
+        await self._query()
+        usernames = sorted(
+            u for u in self.radchecks if after_username is None or u > after_username
+        )
+        return [self.radchecks[u] for u in usernames[:limit]]
+
+    async def get_radreplies_for_usernames(self, tenant_id: str, usernames: list[str]) -> list[Any]:
+        await self._query()
+        return [reply for username in usernames for reply in self.radreplies.get(username, [])]
+
+
+async def _storm(service: RADIUSService, usernames: list[str], concurrency: int) -> float:
+    """Authorize every username with bounded concurrency; returns elapsed seconds."""
+    gate = asyncio.Semaphore(concurrency)
+
+    async def authorize(username: str) -> None:
+        async with gate:
+            result = await service.authorize_subscriber(
+                RADIUSAuthorizationRequest(username=username, password="secret")
+            )
+            assert result.accept, result.reason
+
+    started = time.perf_counter()
+    await asyncio.gather(*(authorize(username) for username in usernames))
+    return time.perf_counter() - started
+
+
+async def run_benchmark(
+    subscribers: int = 5000,
+    query_latency: float = 0.002,
+    pool_size: int = 20,
+    concurrency: int = 500,
+) -> dict[str, dict[str, float]]:
+    """Replay the storm uncached, then against a warmed cache."""
+    results: dict[str, dict[str, float]] = {}
+    enabled = settings.radius.authz_cache_enabled
+    try:
+        for mode in ("uncached", "warmed"):
+            settings.radius.authz_cache_enabled = mode == "warmed"
+            reset_authorization_cache()
+
+            repository = FakeRADIUSRepository(subscribers, query_latency, pool_size)
+            service = RADIUSService(None, TENANT_ID)  # type: ignore[arg-type]
+            service.repository = repository  # type: ignore[assignment]
+
+            warm_started = time.perf_counter()
+            await service.warm_authorization_cache(batch_size=1000)
+            warm_seconds = time.perf_counter() - warm_started
+            warm_queries = repository.queries
+
+            elapsed = await _storm(service, list(repository.radchecks), concurrency)
+            results[mode] = {
+                "warm_seconds": warm_seconds,
+                "warm_queries": warm_queries,
+                "storm_seconds": elapsed,
+                "storm_queries": repository.queries - warm_queries,
+                "auth_per_second": subscribers / elapsed,
+            }
+    finally:
+        settings.radius.authz_cache_enabled = enabled
+        reset_authorization_cache()
+    return results
+
+
+@pytest.mark.asyncio
+async def test_warmed_cache_absorbs_auth_storm() -> None:
+    results = await run_benchmark(subscribers=1000, query_latency=0.001, concurrency=200)
+    uncached, warmed = results["uncached"], results["warmed"]
+
+    # radcheck + radreply per Access-Request without the cache
+    assert uncached["storm_queries"] == 2 * 1000
+    # one radcheck page and one radreply batch, plus the empty closing page
+    assert warmed["warm_queries"] == 3
+    assert warmed["storm_queries"] == 0
+    assert warmed["storm_seconds"] < uncached["storm_seconds"]
+
+
+if __name__ == "__main__":
+    report = asyncio.run(run_benchmark())
+    print(f"{'mode':<10}{'warm s':>10}{'warm q':>10}{'storm s':>10}{'storm q':>10}{'auth/s':>12}")
+    for mode, row in report.items():
+        print(
+            f"{mode:<10}{row['warm_seconds']:>10.3f}{row['warm_queries']:>10.0f}"
+            f"{row['storm_seconds']:>10.3f}{row['storm_queries']:>10.0f}"
+            f"{row['auth_per_second']:>12.0f}"
+        )
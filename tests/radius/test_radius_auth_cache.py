@@ -0,0 +1,189 @@
+"""
+Tests for the RADIUS authorization cache fast path.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from dotmac.platform.radius.auth_cache import (
+    AuthorizationCache,
+    AuthorizationSnapshot,
+    reset_authorization_cache,
+)
+from dotmac.platform.radius.schemas import (
+    RADIUSAuthorizationRequest,
+    RADIUSSubscriberCreate,
+    RADIUSSubscriberUpdate,
+)
+from dotmac.platform.radius.service import RADIUSService
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture(autouse=True)
+def fresh_authorization_cache():
+    reset_authorization_cache()
+    yield
+    reset_authorization_cache()
+
+
+def _fail_on_query(*args, **kwargs):
+    raise AssertionError("authorization should be served from the cache")
+
+
+def test_snapshot_build_keeps_last_reply_value():
+    radcheck = SimpleNamespace(username="alice", subscriber_id=None, value="cleartext:pw")
+    replies = [
+        SimpleNamespace(attribute="Session-Timeout", value="3600"),
+        SimpleNamespace(attribute="Session-Timeout", value="7200"),
+    ]
+
+    snapshot = AuthorizationSnapshot.build(radcheck, replies)
+
+    assert dict(snapshot.reply_attributes) == {"Session-Timeout": "7200"}
+    assert snapshot.network_profile is None
+
+
+def test_cache_skips_set_after_racing_invalidation():
+    cache = AuthorizationCache()
+    generation = cache.generation
+
+    cache.local_cache.delete("t1:alice")  # invalidation lands while the reader awaits Postgres
+    cache.set("t1", "alice", None, generation=generation)
+
+    assert cache.get("t1", "alice") is AuthorizationCache.MISSING
+
+
+@pytest.mark.asyncio
+async def test_authorize_served_from_cache(async_db_session, test_tenant, monkeypatch):
+    service = RADIUSService(async_db_session, test_tenant.id)
+    await service.create_subscriber(
+        RADIUSSubscriberCreate(username="storm@isp", password="secret123", session_timeout=3600)
+    )
+    request = RADIUSAuthorizationRequest(username="storm@isp", password="secret123")
+
+    first = await service.authorize_subscriber(request)
+    monkeypatch.setattr(service.repository, "get_radcheck_by_username", _fail_on_query)
+    monkeypatch.setattr(service.repository, "get_radreplies_by_username", _fail_on_query)
+    second = await service.authorize_subscriber(request)
+
+    assert first.accept is True
+    assert second.accept is True
+    assert second.reply_attributes == first.reply_attributes
+    assert second.reply_attributes["Session-Timeout"] == "3600"
+
+    rejected = await service.authorize_subscriber(
+        RADIUSAuthorizationRequest(username="storm@isp", password="wrong")
+    )
+    assert rejected.accept is False
+    assert rejected.reason == "Invalid password"
+
+
+@pytest.mark.asyncio
+async def test_subscriber_changes_invalidate_cache(async_db_session, test_tenant, test_subscriber):
+    service = RADIUSService(async_db_session, test_tenant.id)
+    await service.create_subscriber(
+        RADIUSSubscriberCreate(
+            subscriber_id=test_subscriber.id, username="change@isp", password="secret123"
+        )
+    )
+    request = RADIUSAuthorizationRequest(username="change@isp")
+    assert "Auth-Type" not in (await service.authorize_subscriber(request)).reply_attributes
+
+    await service.suspend_subscriber(test_subscriber.id)
+    suspended = await service.authorize_subscriber(request)
+    assert suspended.reply_attributes["Auth-Type"] == "Reject"
+
+    await service.resume_subscriber(test_subscriber.id)
+    await service.update_subscriber("change@isp", RADIUSSubscriberUpdate(idle_timeout=600))
+    updated = await service.authorize_subscriber(request)
+    assert "Auth-Type" not in updated.reply_attributes
+    assert updated.reply_attributes["Idle-Timeout"] == "600"
+
+
+@pytest.mark.asyncio
+async def test_profile_changes_invalidate_only_after_commit(
+    async_db_session, test_tenant, test_subscriber, monkeypatch
+):
+    from dotmac.platform.network.profile_service import SubscriberNetworkProfileService
+    from dotmac.platform.network.schemas import NetworkProfileUpdate
+    from dotmac.platform.radius.auth_cache import get_authorization_cache
+
+    await RADIUSService(async_db_session, test_tenant.id).create_subscriber(
+        RADIUSSubscriberCreate(
+            subscriber_id=test_subscriber.id, username="profile@isp", password="secret123"
+        )
+    )
+    invalidated: list[tuple[str, ...]] = []
+
+    async def record_invalidate(tenant_id: str, *usernames: str) -> None:
+        invalidated.append((tenant_id, *usernames))
+
+    monkeypatch.setattr(get_authorization_cache(), "invalidate", record_invalidate)
+    profiles = SubscriberNetworkProfileService(async_db_session, test_tenant.id)
+
+    await profiles.upsert_profile(test_subscriber.id, NetworkProfileUpdate(circuit_id="OLT1:1"))
+    assert invalidated == []
+
+    await profiles.upsert_profile(
+        test_subscriber.id, NetworkProfileUpdate(circuit_id="OLT1:2"), commit=True
+    )
+    assert invalidated == [(test_tenant.id, "profile@isp")]
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_cached_until_created(async_db_session, test_tenant):
+    service = RADIUSService(async_db_session, test_tenant.id)
+    request = RADIUSAuthorizationRequest(username="late@isp", password="secret123")
+
+    assert (await service.authorize_subscriber(request)).accept is False
+
+    await service.create_subscriber(
+        RADIUSSubscriberCreate(username="late@isp", password="secret123")
+    )
+    assert (await service.authorize_subscriber(request)).accept is True
+
+
+@pytest.mark.asyncio
+async def test_workflow_created_user_not_served_from_negative_cache(async_db_session, test_tenant):
+    from dotmac.platform.radius.schemas import BandwidthProfileCreate
+    from dotmac.platform.radius.workflow_service import RADIUSService as WorkflowRADIUSService
+
+    service = RADIUSService(async_db_session, test_tenant.id)
+    await service.create_bandwidth_profile(
+        BandwidthProfileCreate(name="100mbps", download_rate_kbps=100_000, upload_rate_kbps=20_000)
+    )
+    request = RADIUSAuthorizationRequest(username="workflow@isp", password="unused")
+    assert (await service.authorize_subscriber(request)).accept is False
+
+    account = await WorkflowRADIUSService(async_db_session).create_subscriber(
+        customer_id="cust-1",
+        username="workflow@isp",
+        bandwidth_profile="100mbps",
+        tenant_id=test_tenant.id,
+    )
+
+    result = await service.authorize_subscriber(
+        RADIUSAuthorizationRequest(username="workflow@isp", password=account["password"])
+    )
+    assert result.accept is True
+
+
+@pytest.mark.asyncio
+async def test_warm_authorization_cache(async_db_session, test_tenant, monkeypatch):
+    service = RADIUSService(async_db_session, test_tenant.id)
+    for i in range(5):
+        await service.create_subscriber(
+            RADIUSSubscriberCreate(username=f"warm{i}@isp", password="secret123")
+        )
+
+    loaded = await service.warm_authorization_cache(batch_size=2)
+    monkeypatch.setattr(service.repository, "get_radcheck_by_username", _fail_on_query)
+
+    assert loaded == 5
+    for i in range(5):
+        result = await service.authorize_subscriber(
+            RADIUSAuthorizationRequest(username=f"warm{i}@isp", password="secret123")
+        )
+        assert result.accept is True
@@ -0,0 +1,235 @@
+"""
+Tests for the RADIUS -> TimescaleDB session sync task.
+"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from dotmac.platform.radius import tasks
+
+pytestmark = pytest.mark.unit
+
+BASE_TIME = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _session_row(radacctid: int, minutes: int = 0):
+    stop = BASE_TIME + timedelta(minutes=minutes)
+    return SimpleNamespace(
+        radacctid=radacctid,
+        tenant_id="tenant-1",
+        subscriber_id=f"sub-{radacctid}",
+        username=f"user{radacctid}",
+        acctsessionid=f"session-{radacctid}",
+        nasipaddress="192.0.2.1",
+        acctinputoctets=100,
+        acctoutputoctets=None,
+        acctsessiontime=60,
+        framedipaddress=None,
+        framedipv6address=None,
+        acctterminatecause="User-Request",
+        acctstarttime=stop - timedelta(minutes=1),
+        acctstoptime=stop,
+    )
+
+
+def _context(value):
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=value)
+    context.__aexit__ = AsyncMock(return_value=False)
+    return context
+
+
+@pytest.fixture
+def sync_env(monkeypatch):
+    pg_session = AsyncMock()
+    ts_session = AsyncMock()
+    monkeypatch.setattr(tasks, "AsyncSessionLocal", lambda: _context(pg_session))
+    monkeypatch.setattr(tasks, "TimeSeriesSessionLocal", lambda: _context(ts_session))
+
+    env = SimpleNamespace(
+        ts_session=ts_session,
+        watermark=None,
+        batches=[],
+        positions=[],
+        inserted=[],
+        saved=[],
+    )
+
+    async def load_watermark(session):
+        return env.watermark
+
+    async def fetch(session, after, batch_size):
+        env.positions.append(after)
+        return env.batches.pop(0) if env.batches else []
+
+    async def insert(session, rows):
+        env.inserted.append(rows)
+        # Pretend the first row of every batch already existed
+        return len(rows) - 1
+
+    async def save(session, stop_time, radacctid):
+        env.saved.append((stop_time, radacctid))
+
+    monkeypatch.setattr(tasks, "_ensure_sync_schema", AsyncMock())
+    monkeypatch.setattr(tasks, "_load_watermark", load_watermark)
+    monkeypatch.setattr(tasks, "_fetch_completed_sessions", fetch)
+    monkeypatch.setattr(tasks, "_insert_timeseries_rows", insert)
+    monkeypatch.setattr(tasks, "_save_watermark", save)
+    return env
+
+
+def test_fetch_statement_uses_keyset_pagination():
+    captured = {}
+
+    async def execute(stmt):
+        captured["sql"] = str(stmt.compile(dialect=postgresql.dialect()))
+        result = MagicMock()
+        result.all.return_value = []
+        return result
+
+    session = SimpleNamespace(execute=execute)
+    asyncio.run(tasks._fetch_completed_sessions(session, (BASE_TIME, 10), 500))
+
+    sql = captured["sql"]
+    assert "OFFSET" not in sql
+    assert "(radacct.acctstoptime, radacct.radacctid) >" in sql
+    assert "ORDER BY radacct.acctstoptime ASC, radacct.radacctid ASC" in sql
+
+
+@pytest.mark.asyncio
+async def test_sync_pages_by_keyset_and_advances_watermark(sync_env):
+    sync_env.batches = [
+        [_session_row(1, 0), _session_row(2, 1)],
+        [_session_row(5, 2)],
+    ]
+
+    result = await tasks._sync_sessions_async(batch_size=2, max_age_hours=24)
+
+    # First page starts at the cutoff, the next one after the last row seen
+    assert sync_env.positions[0][1] == 0
+    assert sync_env.positions[1] == (BASE_TIME + timedelta(minutes=1), 2)
+    assert sync_env.saved == [
+        (BASE_TIME + timedelta(minutes=1), 2),
+        (BASE_TIME + timedelta(minutes=2), 5),
+    ]
+    assert sync_env.ts_session.commit.await_count == 2
+    assert result["synced"] == 1
+    assert result["skipped"] == 2
+    assert result["batches"] == 2
+
+    row = sync_env.inserted[0][0]
+    assert row["time"] == BASE_TIME
+    assert row["total_bytes"] == 100
+    assert row["session_id"] == "session-1"
+
+
+@pytest.mark.asyncio
+async def test_sync_resumes_from_watermark_with_lookback(sync_env):
+    sync_env.watermark = (BASE_TIME, 42)
+
+    result = await tasks._sync_sessions_async(batch_size=10, max_age_hours=24, lookback_seconds=60)
+
+    assert sync_env.positions == [(BASE_TIME - timedelta(seconds=60), 0)]
+    assert result["synced"] == 0
+    assert result["watermark"] == BASE_TIME.isoformat()
+
+
+@pytest.mark.asyncio
+async def test_sync_stops_at_max_rows(sync_env):
+    sync_env.batches = [[_session_row(i, i)] for i in range(1, 10)]
+
+    result = await tasks._sync_sessions_async(batch_size=1, max_age_hours=24, max_rows=3)
+
+    assert result["batches"] == 3
+    assert len(sync_env.batches) == 6
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_retries_rows_and_advances(sync_env, monkeypatch):
+    sync_env.batches = [
+        [_session_row(1, 0), _session_row(2, 1), _session_row(3, 2)],
+        [_session_row(4, 3)],
+    ]
+
+    async def insert(session, rows):
+        if len(rows) > 1 or rows[0]["session_id"] == "session-2":
+            raise RuntimeError("bad row")
+        return 1
+
+    monkeypatch.setattr(tasks, "_insert_timeseries_rows", insert)
+
+    result = await tasks._sync_sessions_async(batch_size=3, max_age_hours=24)
+
+    # The bad row is skipped and the sync carries on past it
+    assert sync_env.saved == [
+        (BASE_TIME + timedelta(minutes=2), 3),
+        (BASE_TIME + timedelta(minutes=3), 4),
+    ]
+    assert sync_env.positions[1] == (BASE_TIME + timedelta(minutes=2), 3)
+    assert result["synced"] == 3
+    assert result["errors"] == 1
+    assert result["batches"] == 2
+    assert result["watermark"] == (BASE_TIME + timedelta(minutes=3)).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_unreachable_timescale_keeps_watermark(sync_env, monkeypatch):
+    sync_env.batches = [[_session_row(1)], [_session_row(2, 1)]]
+    monkeypatch.setattr(
+        tasks, "_insert_timeseries_rows", AsyncMock(side_effect=RuntimeError("down"))
+    )
+    monkeypatch.setattr(tasks, "_save_watermark", AsyncMock(side_effect=RuntimeError("down")))
+
+    result = await tasks._sync_sessions_async(batch_size=1, max_age_hours=24)
+
+    assert len(sync_env.batches) == 1
+    assert result["errors"] == 1
+    assert result["watermark"] is None
+
+
+def _schema_session(index_exists: bool):
+    statements = []
+
+    async def execute(stmt, params=None):
+        sql = " ".join(str(stmt).split())
+        statements.append(sql)
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = 1 if index_exists else None
+        result.rowcount = 3
+        return result
+
+    return SimpleNamespace(execute=execute, commit=AsyncMock()), statements
+
+
+@pytest.mark.asyncio
+async def test_ensure_sync_schema_deduplicates_before_creating_index(monkeypatch):
+    monkeypatch.setattr(tasks, "_sync_schema_ready", False)
+    session, statements = _schema_session(index_exists=False)
+
+    await tasks._ensure_sync_schema(session)
+    await tasks._ensure_sync_schema(session)
+
+    assert statements[0].startswith("SELECT pg_advisory_xact_lock")
+    assert "CREATE TABLE IF NOT EXISTS radacct_sync_watermark" in statements[2]
+    assert statements[3].startswith("DELETE FROM radacct_timeseries")
+    assert statements[4].startswith("CREATE UNIQUE INDEX IF NOT EXISTS uq_radacct_ts_session")
+    # Runs once per process
+    assert len(statements) == 5
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_ensure_sync_schema_skips_duplicate_scan_when_index_exists(monkeypatch):
+    monkeypatch.setattr(tasks, "_sync_schema_ready", False)
+    session, statements = _schema_session(index_exists=True)
+
+    await tasks._ensure_sync_schema(session)
+
+    assert not any(sql.startswith("DELETE") for sql in statements)
+    assert not any("CREATE UNIQUE INDEX" in sql for sql in statements)
+    assert "CREATE TABLE IF NOT EXISTS radacct_sync_watermark" in statements[2]
@@ -0,0 +1,331 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from dotmac.platform.rate_limit.engine import (
+    RULE_INVALIDATION_CHANNEL,
+    CompiledRule,
+    RateLimitEngine,
+    RateLimitRuleIndex,
+)
+from dotmac.platform.rate_limit.models import RateLimitAction, RateLimitScope, RateLimitWindow
+from dotmac.platform.rate_limit.service import generate_rate_limit_key
+
+pytestmark = pytest.mark.unit
+
+
+def _make_rule(
+    scope: RateLimitScope = RateLimitScope.PER_TENANT,
+    *,
+    name: str = "tenant-limit",
+    max_requests: int = 5,
+    endpoint_pattern: str | None = None,
+    action: RateLimitAction = RateLimitAction.BLOCK,
+    priority: int = 0,
+):
+    """Create a lightweight RateLimitRule-like object for testing."""
+    return SimpleNamespace(
+        id=uuid4(),
+        tenant_id="tenant-123",
+        name=name,
+        scope=scope,
+        max_requests=max_requests,
+        window=RateLimitWindow.MINUTE,
+        window_seconds=60,
+        action=action,
+        priority=priority,
+        exempt_user_ids=[],
+        exempt_ip_addresses=["10.0.0.1"],
+        exempt_api_keys=[],
+        endpoint_pattern=endpoint_pattern,
+    )
+
+
+def _session_factory(rules):
+    """Build a session factory whose sessions return the given rules."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rules
+
+    session = AsyncMock()
+    session.execute = AsyncMock(return_value=result)
+
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=session)
+    context.__aexit__ = AsyncMock(return_value=False)
+
+    factory = MagicMock(return_value=context)
+    return factory, session
+
+
+def _compiled(*rules):
+    return tuple(CompiledRule.from_model(rule) for rule in rules)
+
+
+@pytest.mark.asyncio
+async def test_rule_index_loads_once_and_matches_compiled_patterns():
+    api_rule = _make_rule(name="api", endpoint_pattern=r"^/api/v1/")
+    tenant_rule = _make_rule(name="tenant")
+    factory, session = _session_factory([api_rule, tenant_rule])
+    index = RateLimitRuleIndex(session_factory=factory)
+
+    first = await index.get_applicable_rules("tenant-123", "/api/v1/customers")
+    second = await index.get_applicable_rules("tenant-123", "/graphql")
+
+    assert [rule.name for rule in first] == ["api", "tenant"]
+    assert [rule.name for rule in second] == ["tenant"]
+    session.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_rule_index_invalidation_reloads_rules():
+    factory, session = _session_factory([_make_rule()])
+    index = RateLimitRuleIndex(session_factory=factory)
+
+    await index.get_tenant_rules("tenant-123")
+    index.invalidate("tenant-123")
+    await index.get_tenant_rules("tenant-123")
+
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_rule_index_skips_invalid_patterns():
+    factory, _ = _session_factory([_make_rule(endpoint_pattern="(")])
+    index = RateLimitRuleIndex(session_factory=factory)
+
+    assert await index.get_tenant_rules("tenant-123") == ()
+
+
+@pytest.mark.asyncio
+async def test_publish_invalidation_broadcasts_tenant():
+    factory, session = _session_factory([_make_rule()])
+    index = RateLimitRuleIndex(session_factory=factory)
+    redis = AsyncMock()
+
+    await index.get_tenant_rules("tenant-123")
+    await index.publish_invalidation(redis, "tenant-123")
+    await index.get_tenant_rules("tenant-123")
+
+    redis.publish.assert_awaited_once_with(RULE_INVALIDATION_CHANNEL, "tenant-123")
+    assert session.execute.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_evaluate_runs_single_script_for_all_rules():
+    tenant_rule = _make_rule(name="tenant", max_requests=100)
+    user_rule = _make_rule(RateLimitScope.PER_USER, name="user", max_requests=10)
+    index = RateLimitRuleIndex()
+    index.get_applicable_rules = AsyncMock(return_value=_compiled(tenant_rule, user_rule))
+
+    script = AsyncMock(return_value=[0, 40, 3])
+    redis = MagicMock()
+    redis.register_script.return_value = script
+    engine = RateLimitEngine(redis=redis, rule_index=index)
+
+    decision = await engine.evaluate("tenant-123", "/api/v1/resource", user_id="user-1")
+
+    script.assert_awaited_once()
+    keys = script.await_args.kwargs["keys"]
+    assert keys == [
+        generate_rate_limit_key(
+            "tenant-123", RateLimitScope.PER_TENANT, "tenant-123", str(tenant_rule.id)
+        ),
+        generate_rate_limit_key("tenant-123", RateLimitScope.PER_USER, "user-1", str(user_rule.id)),
+    ]
+    assert decision.allowed is True
+    assert decision.violated is False
+    # The tightest rule is reported for headers
+    assert decision.rule.name == "user"
+    assert decision.remaining == 6
+
+
+@pytest.mark.asyncio
+async def test_evaluate_reports_blocking_rule():
+    rule = _make_rule(max_requests=5)
+    index = RateLimitRuleIndex()
+    index.get_applicable_rules = AsyncMock(return_value=_compiled(rule))
+
+    redis = MagicMock()
+    redis.register_script.return_value = AsyncMock(return_value=[1, 5])
+    engine = RateLimitEngine(redis=redis, rule_index=index)
+
+    decision = await engine.evaluate("tenant-123", "/api/v1/resource")
+
+    assert decision.allowed is False
+    assert decision.violated is True
+    assert decision.rule.id == rule.id
+    assert decision.current_count == 5
+
+
+@pytest.mark.asyncio
+async def test_evaluate_log_only_rule_is_not_enforced():
+    rule = _make_rule(max_requests=5, action=RateLimitAction.LOG_ONLY)
+    index = RateLimitRuleIndex()
+    index.get_applicable_rules = AsyncMock(return_value=_compiled(rule))
+
+    script = AsyncMock(return_value=[0, 9])
+    redis = MagicMock()
+    redis.register_script.return_value = script
+    engine = RateLimitEngine(redis=redis, rule_index=index)
+
+    decision = await engine.evaluate("tenant-123", "/api/v1/resource")
+
+    # ARGV: now, member, then (limit, window, enforce) per rule
+    assert script.await_args.kwargs["args"][2:] == [5, 60, "0"]
+    assert decision.allowed is True
+    assert decision.violated is True
+
+
+@pytest.mark.asyncio
+async def test_evaluate_skips_redis_when_all_rules_exempt():
+    rule = _make_rule()
+    index = RateLimitRuleIndex()
+    index.get_applicable_rules = AsyncMock(return_value=_compiled(rule))
+
+    redis = MagicMock()
+    engine = RateLimitEngine(redis=redis, rule_index=index)
+
+    decision = await engine.evaluate("tenant-123", "/api/v1/resource", ip_address="10.0.0.1")
+
+    assert decision.allowed is True
+    redis.register_script.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sliding_window_script_checks_and_increments_atomically():
+    pytest.importorskip("lupa")
+    import fakeredis.aioredis
+
+    from dotmac.platform.rate_limit.engine import SLIDING_WINDOW_SCRIPT
+
+    redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+
+    results = [
+        await script(keys=["a", "b"], args=[1000 + i, f"m{i}", 3, 60, "1", 10, 60, "1"])
+        for i in range(4)
+    ]
+
+    assert results == [[0, 0, 0], [0, 1, 1], [0, 2, 2], [1, 3, 3]]
+    # Blocked request is not recorded in any window
+    assert await redis.zcard("b") == 3
+    assert 0 < await redis.ttl("a") <= 120
+
+
+@pytest.mark.asyncio
+async def test_refund_removes_request_from_every_window():
+    rule = _make_rule(max_requests=5)
+    user_rule = _make_rule(RateLimitScope.PER_USER, name="user")
+    index = RateLimitRuleIndex()
+    index.get_applicable_rules = AsyncMock(return_value=_compiled(rule, user_rule))
+
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis = MagicMock()
+    redis.register_script.return_value = AsyncMock(return_value=[0, 1, 1])
+    redis.pipeline.return_value = pipe
+    engine = RateLimitEngine(redis=redis, rule_index=index)
+
+    decision = await engine.evaluate("tenant-123", "/api/v1/resource", user_id="user-1")
+    await engine.refund(decision)
+
+    assert len(decision.keys) == 2
+    assert [c.args for c in pipe.zrem.call_args_list] == [
+        (key, decision.member) for key in decision.keys
+    ]
+    pipe.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_blocked_decision_has_nothing_to_refund():
+    index = RateLimitRuleIndex()
+    index.get_applicable_rules = AsyncMock(return_value=_compiled(_make_rule()))
+
+    redis = MagicMock()
+    redis.register_script.return_value = AsyncMock(return_value=[1, 5])
+    engine = RateLimitEngine(redis=redis, rule_index=index)
+
+    decision = await engine.evaluate("tenant-123", "/api/v1/resource")
+    await engine.refund(decision)
+
+    assert decision.keys == ()
+    redis.pipeline.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_listener_restarts_after_exiting():
+    index = RateLimitRuleIndex(listener_restart_seconds=0)
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock(side_effect=ConnectionError("redis down"))
+    pubsub.unsubscribe = AsyncMock()
+    pubsub.close = AsyncMock()
+    redis = MagicMock()
+    redis.pubsub.return_value = pubsub
+
+    index.start_listener(redis)
+    await index._listener_task
+    assert index.listener_running is False
+
+    index.start_listener(redis)
+    assert index.listener_running is True
+    await index._listener_task
+    assert redis.pubsub.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_listener_restart_is_throttled():
+    index = RateLimitRuleIndex(listener_restart_seconds=60)
+    pubsub = MagicMock()
+    pubsub.subscribe = AsyncMock(side_effect=ConnectionError("redis down"))
+    pubsub.unsubscribe = AsyncMock()
+    pubsub.close = AsyncMock()
+    redis = MagicMock()
+    redis.pubsub.return_value = pubsub
+
+    index.start_listener(redis)
+    await index._listener_task
+    index.start_listener(redis)
+
+    assert index.listener_running is False
+    assert redis.pubsub.call_count == 1
+
+
+def _middleware_app(engine, status_code):
+    from fastapi import FastAPI
+    from fastapi.responses import PlainTextResponse
+
+    from dotmac.platform.rate_limit.middleware import RateLimitMiddleware
+
+    app = FastAPI()
+
+    @app.get("/api/v1/resource")
+    async def resource():
+        return PlainTextResponse("ok", status_code=status_code)
+
+    app.add_middleware(RateLimitMiddleware, engine=engine)
+    return app
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("status_code", "refunded"), [(200, False), (404, True), (500, True)])
+async def test_middleware_counts_only_successful_responses(status_code, refunded):
+    from httpx import ASGITransport, AsyncClient
+
+    from dotmac.platform.rate_limit.engine import RateLimitDecision
+
+    rule = _compiled(_make_rule())[0]
+    engine = MagicMock()
+    engine.listening = True
+    engine.evaluate = AsyncMock(
+        return_value=RateLimitDecision(allowed=True, rule=rule, keys=("k",), member="m")
+    )
+    engine.refund = AsyncMock()
+
+    transport = ASGITransport(app=_middleware_app(engine, status_code))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/v1/resource")
+
+    assert response.status_code == status_code
+    assert engine.refund.await_count == (1 if refunded else 0)
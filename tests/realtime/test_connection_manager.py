@@ -6,13 +6,17 @@ Tests cover:
 - Tenant-based connection grouping
 - Resource-based connection grouping
 - Broadcasting to specific groups
+- Slow consumer handling and cross-worker fan-out
 - Connection statistics
 """
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
 import pytest
+from fakeredis import aioredis
 from fastapi import WebSocket
 
 from dotmac.platform.auth.core import UserInfo
@@ -24,6 +28,22 @@ from dotmac.platform.realtime.connection_manager import (
 pytestmark = pytest.mark.unit
 
 
+def _user(user_id: str = "user1", tenant_id: str = "tenant123") -> UserInfo:
+    return UserInfo(
+        user_id=user_id,
+        username=user_id,
+        email=f"{user_id}@example.com",
+        tenant_id=tenant_id,
+        roles=["user"],
+        permissions=[],
+    )
+
+
+def _encoded(message: dict) -> str:
+    """Text a broadcast puts on the wire (same encoding as WebSocket.send_json)."""
+    return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
 class TestConnectionInfo:
     """Test ConnectionInfo class."""
 
@@ -219,10 +239,11 @@ class TestWebSocketConnectionManager:
         # Broadcast message
         message = {"type": "test", "data": "value"}
         sent_count = await manager.broadcast_to_tenant("tenant123", message)
+        await manager.flush()
 
         assert sent_count == 2
-        mock_ws1.send_json.assert_called_once_with(message)
-        mock_ws2.send_json.assert_called_once_with(message)
+        mock_ws1.send_text.assert_called_once_with(_encoded(message))
+        mock_ws2.send_text.assert_called_once_with(_encoded(message))
 
     @pytest.mark.asyncio
     async def test_broadcast_to_tenant_with_exclusion(self):
@@ -254,10 +275,11 @@ class TestWebSocketConnectionManager:
         # Broadcast excluding conn1
         message = {"type": "test", "data": "value"}
         sent_count = await manager.broadcast_to_tenant("tenant123", message, exclude={conn1})
+        await manager.flush()
 
         assert sent_count == 1
-        mock_ws1.send_json.assert_not_called()
-        mock_ws2.send_json.assert_called_once_with(message)
+        mock_ws1.send_text.assert_not_called()
+        mock_ws2.send_text.assert_called_once_with(_encoded(message))
 
     @pytest.mark.asyncio
     async def test_broadcast_to_resource(self):
@@ -289,10 +311,11 @@ class TestWebSocketConnectionManager:
         # Broadcast to job123 only
         message = {"type": "job_update", "status": "completed"}
         sent_count = await manager.broadcast_to_resource("job", "job123", message)
+        await manager.flush()
 
         assert sent_count == 1
-        mock_ws1.send_json.assert_called_once_with(message)
-        mock_ws2.send_json.assert_not_called()
+        mock_ws1.send_text.assert_called_once_with(_encoded(message))
+        mock_ws2.send_text.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_broadcast_to_user(self):
@@ -318,10 +341,11 @@ class TestWebSocketConnectionManager:
         # Broadcast to user
         message = {"type": "notification", "text": "Hello"}
         sent_count = await manager.broadcast_to_user("user123", message)
+        await manager.flush()
 
         assert sent_count == 2
-        mock_ws1.send_json.assert_called_once_with(message)
-        mock_ws2.send_json.assert_called_once_with(message)
+        mock_ws1.send_text.assert_called_once_with(_encoded(message))
+        mock_ws2.send_text.assert_called_once_with(_encoded(message))
 
     def test_get_tenant_connections(self):
         """Test retrieving all connections for a tenant."""
@@ -423,3 +447,82 @@ class TestWebSocketConnectionManager:
         assert tenant_stats["unique_users"] == 1
         assert tenant_stats["monitored_resources"] == 1
         assert len(tenant_stats["connections"]) == 2
+
+
+class TestBroadcastFanout:
+    """Test bounded send queues and the cross-worker relay."""
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_dropped_without_blocking_others(self):
+        manager = WebSocketConnectionManager(send_queue_size=2, send_timeout=5.0)
+        stalled = asyncio.Event()
+
+        async def never_returns(text: str) -> None:
+            stalled.set()
+            await asyncio.Event().wait()
+
+        slow_ws = AsyncMock(spec=WebSocket)
+        slow_ws.send_text.side_effect = never_returns
+        fast_ws = AsyncMock(spec=WebSocket)
+        slow = manager.register(slow_ws, _user("slow"))
+        manager.register(fast_ws, _user("fast"))
+
+        await manager.broadcast_to_tenant("tenant123", {"n": 0})
+        await stalled.wait()  # first message is stuck in the slow socket's send
+        for n in range(1, 4):
+            await manager.broadcast_to_tenant("tenant123", {"n": n})
+            await asyncio.sleep(0)  # let the fast socket's sender drain
+        await manager.flush()
+
+        assert fast_ws.send_text.call_count == 4
+        assert slow not in manager._connections
+        assert manager.get_stats()["dropped_connections"] == 1
+        slow_ws.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_send_timeout_drops_connection(self):
+        manager = WebSocketConnectionManager(send_timeout=0.01)
+        ws = AsyncMock(spec=WebSocket)
+
+        async def stalls(text: str) -> None:
+            await asyncio.sleep(1)
+
+        ws.send_text.side_effect = stalls
+        conn = manager.register(ws, _user())
+
+        assert await manager.broadcast_to_user("user1", {"type": "ping"}) == 1
+        await manager.flush()
+
+        assert conn not in manager._connections
+        ws.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_sockets_on_other_workers(self, monkeypatch):
+        redis = aioredis.FakeRedis(decode_responses=True)
+        monkeypatch.setattr(WebSocketConnectionManager, "_get_redis", staticmethod(lambda: redis))
+        sender = WebSocketConnectionManager()
+        receiver = WebSocketConnectionManager()
+        local_ws = AsyncMock(spec=WebSocket)
+        remote_ws = AsyncMock(spec=WebSocket)
+        sender.register(local_ws, _user("local"))
+        receiver.register(remote_ws, _user("remote"), resource_type="job", resource_id="42")
+
+        for _ in range(50):  # wait for both relays to subscribe
+            if await redis.pubsub_numsub("realtime:ws:broadcast") == [("realtime:ws:broadcast", 2)]:
+                break
+            await asyncio.sleep(0.01)
+
+        message = {"type": "job.progress", "progress": 50}
+        assert await sender.broadcast_to_resource("job", "42", message) == 0
+        assert await sender.broadcast_to_tenant("tenant123", message) == 1
+
+        for _ in range(50):
+            if remote_ws.send_text.call_count == 2:
+                break
+            await asyncio.sleep(0.01)
+        await sender.flush()
+
+        assert remote_ws.send_text.call_args_list[0].args == (_encoded(message),)
+        local_ws.send_text.assert_called_once_with(_encoded(message))
+        await sender.close()
+        await receiver.close()
@@ -0,0 +1,129 @@
+"""Tests for the shared SSE channel multiplexer."""
+
+import asyncio
+import json
+
+import pytest
+from fakeredis import aioredis
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from dotmac.platform.realtime.multiplexer import ChannelMultiplexer, get_channel_multiplexer
+from dotmac.platform.realtime.sse import AlertStream, CombinedEventStream
+
+
+async def _next(iterator, timeout: float = 2.0):
+    return await asyncio.wait_for(anext(iterator), timeout)
+
+
+async def _wait_for_subscribers(redis, channel: str, expected: int) -> None:
+    for _ in range(100):
+        if await redis.pubsub_numsub(channel) == [(channel, expected)]:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"{channel} never reached {expected} Redis subscribers")
+
+
+@pytest.fixture
+def redis():
+    return aioredis.FakeRedis(decode_responses=True)
+
+
+@pytest.mark.asyncio
+async def test_streams_share_one_redis_subscription(redis) -> None:
+    alerts = AlertStream(redis, "tenant1").stream()
+    combined = CombinedEventStream(redis, "tenant1").stream()
+    assert (await _next(alerts))["event"] == "connected"
+    assert (await _next(combined))["event"] == "connected"
+
+    multiplexer = get_channel_multiplexer(redis)
+    assert multiplexer.get_stats()["subscribers_by_channel"]["alerts:tenant1"] == 2
+    await _wait_for_subscribers(redis, "alerts:tenant1", 1)
+
+    await redis.publish("alerts:tenant1", json.dumps({"event_type": "alert.raised"}))
+
+    event = await _next(alerts)
+    assert event == {"event": "alert.raised", "data": json.dumps({"event_type": "alert.raised"})}
+    event = await _next(combined)
+    assert json.loads(event["data"])["source"] == "alerts:tenant1"
+
+    await combined.aclose()
+    await _wait_for_subscribers(redis, "onu_status:tenant1", 0)
+    assert await redis.pubsub_numsub("alerts:tenant1") == [("alerts:tenant1", 1)]
+
+    await alerts.aclose()
+    await _wait_for_subscribers(redis, "alerts:tenant1", 0)
+    assert multiplexer.get_stats()["subscribers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_onu_and_interim_updates_are_coalesced(redis) -> None:
+    multiplexer = ChannelMultiplexer(redis, queue_size=10)
+    subscription = await multiplexer.subscribe(["onu_status:t1", "radius_sessions:t1"])
+
+    for signal in (-20.0, -24.5, -27.1):
+        multiplexer._dispatch(
+            "onu_status:t1",
+            json.dumps({"event_type": "onu.signal_degraded", "onu_serial": "A1", "signal": signal}),
+        )
+    multiplexer._dispatch(
+        "onu_status:t1", json.dumps({"event_type": "onu.online", "onu_serial": "B2"})
+    )
+    for event_type in ("session.started", "session.updated", "session.updated", "session.stopped"):
+        multiplexer._dispatch(
+            "radius_sessions:t1", json.dumps({"event_type": event_type, "session_id": "s1"})
+        )
+
+    assert multiplexer.get_stats()["coalesced_messages"] == 3
+    subscription.close()
+    received = [
+        (message.event_type, message.payload.get("signal")) async for message in subscription
+    ]
+    assert received == [
+        ("onu.signal_degraded", -27.1),
+        ("onu.online", None),
+        ("session.started", None),
+        ("session.updated", None),
+        ("session.stopped", None),
+    ]
+    await subscription.aclose()
+    await multiplexer.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_stream_is_closed_without_affecting_others(redis) -> None:
+    multiplexer = ChannelMultiplexer(redis, queue_size=2)
+    slow = await multiplexer.subscribe(["alerts:t1"])
+    fast = await multiplexer.subscribe(["alerts:t1"])
+
+    for n in range(3):
+        multiplexer._dispatch("alerts:t1", json.dumps({"event_type": "alert.raised", "n": n}))
+        assert (await anext(fast)).payload["n"] == n
+
+    assert slow.overflowed and slow.closed
+    assert [message async for message in slow] == []
+    assert not fast.closed
+    assert multiplexer.get_stats()["dropped_subscribers"] == 1
+    await multiplexer.close()
+
+
+@pytest.mark.asyncio
+async def test_reader_failure_resubscribes_on_a_new_connection(redis, monkeypatch) -> None:
+    multiplexer = ChannelMultiplexer(redis)
+    broken = await multiplexer.subscribe(["alerts:t1"])
+    await _wait_for_subscribers(redis, "alerts:t1", 1)
+    failed_pubsub = multiplexer._pubsub
+
+    async def lost_connection(**kwargs):
+        raise RedisConnectionError("connection lost")
+
+    monkeypatch.setattr(failed_pubsub, "get_message", lost_connection)
+    assert [message async for message in broken] == []
+    assert broken.error == "Redis error: connection lost"
+    assert multiplexer.get_stats()["channels"] == 0
+
+    subscription = await multiplexer.subscribe(["alerts:t1"])
+    assert multiplexer._pubsub is not failed_pubsub
+    await redis.publish("alerts:t1", json.dumps({"event_type": "alert.raised"}))
+
+    assert (await _next(subscription)).event_type == "alert.raised"
+    await multiplexer.close()
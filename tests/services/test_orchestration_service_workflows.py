@@ -662,6 +662,7 @@ class TestSuspendAndReactivate:
         mock_db: AsyncMock,
         tenant_id: str,
         user_id: UUID,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Test successful subscriber suspension."""
         subscriber_id = f"{tenant_id}_testuser"
@@ -681,6 +682,7 @@ class TestSuspendAndReactivate:
         radcheck = RadCheck(
             tenant_id=tenant_id,
             subscriber_id=subscriber_id,
+            username="testuser",
             attribute="Cleartext-Password",
             value="password",
         )
@@ -694,6 +696,12 @@ class TestSuspendAndReactivate:
         mock_radius_service.disconnect_session = AsyncMock()
         mock_radius_factory = Mock(return_value=mock_radius_service)
 
+        authorization_cache = Mock(invalidate=AsyncMock())
+        monkeypatch.setattr(
+            "dotmac.platform.services.orchestration.get_authorization_cache",
+            lambda: authorization_cache,
+        )
+
         service = OrchestrationService(
             db=mock_db,
             radius_service=mock_radius_factory,
@@ -710,6 +718,7 @@ class TestSuspendAndReactivate:
         assert result["subscriber"].suspension_date is not None
         assert radcheck.attribute == "Auth-Type"
         assert radcheck.value == "Reject"
+        authorization_cache.invalidate.assert_awaited_once_with(tenant_id, "testuser")
 
     @pytest.mark.asyncio
     async def test_reactivate_subscriber_success(
@@ -717,6 +726,7 @@ class TestSuspendAndReactivate:
         mock_db: AsyncMock,
         tenant_id: str,
         user_id: UUID,
+        monkeypatch: pytest.MonkeyPatch,
     ):
         """Test successful subscriber reactivation."""
         subscriber_id = f"{tenant_id}_testuser"
@@ -738,6 +748,7 @@ class TestSuspendAndReactivate:
         radcheck = RadCheck(
             tenant_id=tenant_id,
             subscriber_id=subscriber_id,
+            username="testuser",
             attribute="Auth-Type",
             value="Reject",
         )
@@ -747,6 +758,12 @@ class TestSuspendAndReactivate:
 
         mock_db.execute.side_effect = [mock_subscriber_result, mock_radcheck_result]
 
+        authorization_cache = Mock(invalidate=AsyncMock())
+        monkeypatch.setattr(
+            "dotmac.platform.services.orchestration.get_authorization_cache",
+            lambda: authorization_cache,
+        )
+
         service = OrchestrationService(db=mock_db)
 
         result = await service.reactivate_subscriber(
@@ -760,6 +777,7 @@ class TestSuspendAndReactivate:
         assert radcheck.attribute == "Cleartext-Password"
         assert radcheck.value == "password123"
         assert "suspension_reason" not in result["subscriber"].metadata_
+        authorization_cache.invalidate.assert_awaited_once_with(tenant_id, "testuser")
 
     @pytest.mark.asyncio
     async def test_reactivate_non_suspended_subscriber(
@@ -52,6 +52,7 @@ class TestCeleryApp:
     def test_celery_app_includes(self):
         """Test that task modules are included."""
         assert "dotmac.platform.tasks" in celery_app.conf.include
+        assert "dotmac.platform.fiber.tasks" in celery_app.conf.include
 
 
 @pytest.mark.integration
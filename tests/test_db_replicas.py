@@ -0,0 +1,96 @@
+"""Tests for read-replica routing."""
+
+import asyncio
+import contextvars
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import Column, MetaData, String, Table, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from dotmac.platform.db.replicas import (
+    ReplicaRouter,
+    begin_request_routing,
+    get_read_session,
+    reset_replica_router,
+    set_replica_router,
+)
+
+metadata = MetaData()
+items = Table("replica_items", metadata, Column("name", String(50)))
+
+
+async def _engine_with_row(path, name: str):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+        await connection.execute(insert(items).values(name=name))
+    return engine
+
+
+async def _read_name(router: ReplicaRouter) -> str:
+    async with router.session_factory() as session:
+        return (await session.execute(select(items.c.name))).scalars().first()
+
+
+@pytest.fixture
+async def router(tmp_path):
+    primary = await _engine_with_row(tmp_path / "primary.sqlite", "primary")
+    replica = await _engine_with_row(tmp_path / "replica.sqlite", "replica")
+    replica_router = ReplicaRouter([("sqlite+aiosqlite:///replica", replica)], primary)
+    set_replica_router(replica_router)
+    await replica_router.refresh()
+    yield replica_router
+    await reset_replica_router()
+    await primary.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_healthy_replica(router):
+    assert await _read_name(router) == "replica"
+    assert router.get_stats()["replicas"][0]["usable"] is True
+
+
+@pytest.mark.asyncio
+async def test_lagging_or_failing_replica_falls_back_to_primary(router):
+    with patch.object(router, "_measure_lag", return_value=30.0):
+        await router.refresh(force=True)
+    assert await _read_name(router) == "primary"
+
+    with patch.object(router, "_measure_lag", side_effect=ConnectionError("down")):
+        await router.refresh(force=True)
+    assert router.replicas[0].lag_seconds is None
+    assert await _read_name(router) == "primary"
+
+    await router.refresh(force=True)
+    assert await _read_name(router) == "replica"
+
+
+@pytest.mark.asyncio
+async def test_reads_after_a_write_stick_to_primary_for_that_request(router):
+    async def request(write: bool) -> str:
+        begin_request_routing()
+        if write:
+            async with AsyncSession(router.primary) as primary_session:
+                await primary_session.execute(insert(items).values(name="written"))
+                await primary_session.commit()
+        return await _read_name(router)
+
+    # Each request runs in its own context, like separate ASGI requests
+    assert await asyncio.create_task(request(write=True), context=contextvars.Context()) == (
+        "primary"
+    )
+    assert await asyncio.create_task(request(write=False), context=contextvars.Context()) == (
+        "replica"
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_session_dependency_uses_primary_without_replicas():
+    set_replica_router(None)
+    primary_session = object()
+    try:
+        sessions = [session async for session in get_read_session(primary=primary_session)]
+    finally:
+        await reset_replica_router()
+    assert sessions == [primary_session]
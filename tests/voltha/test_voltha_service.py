@@ -4,7 +4,9 @@ Unit tests for VOLTHA Service layer
 
 from __future__ import annotations
 
+import asyncio
 import base64
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -615,3 +617,128 @@ class TestVOLTHAServiceAlarmOperations:
 
         assert exc_info.value.status_code == 500
         assert "Failed to clear alarm" in exc_info.value.detail
+
+
+def make_topology_client(olt_count: int = 1) -> MagicMock:
+    """Mocked client with ``olt_count`` OLTs, each with two ONUs on PON port 1."""
+    client = MagicMock(spec=VOLTHAClient)
+    client.get_devices = AsyncMock(
+        return_value=[
+            {
+                "id": f"onu-{olt}-{n}",
+                "parent_id": f"olt-root-{olt}",
+                "parent_port_no": 1,
+                "serial_number": f"ALCL0000{olt}{n}",
+                "admin_state": "DISABLED",
+                "oper_status": "DISCOVERED",
+            }
+            for olt in range(olt_count)
+            for n in range(2)
+        ]
+    )
+    client.get_logical_devices = AsyncMock(
+        return_value=[
+            {"id": f"olt-{olt}", "root_device_id": f"olt-root-{olt}"} for olt in range(olt_count)
+        ]
+    )
+    client.get_logical_device_ports = AsyncMock(return_value=[{"device_port_no": 1}])
+    client.get_device_ports = AsyncMock(
+        return_value=[{"port_no": 1, "type": "PON_ONU"}, {"port_no": 16, "type": "ETHERNET_UNI"}]
+    )
+    client.add_flow = AsyncMock(return_value={})
+    return client
+
+
+@pytest.mark.integration
+class TestVOLTHAServiceTopology:
+    """Tests for the cached PON topology."""
+
+    @pytest.mark.asyncio
+    async def test_provisioning_lookups_use_cached_topology(self):
+        client = make_topology_client()
+        service = VOLTHAService(client=client)
+
+        assert (await service.discover_onus()).total == 2
+        await service._configure_vlan_flow("onu-0-0", "olt-root-0", vlan=100)
+        await service._configure_qinq_flows("onu-0-0", "olt-root-0", 200, 100)
+        await service._configure_vlan_flow("onu-0-1", "olt-root-0", vlan=101)
+
+        client.get_devices.assert_awaited_once()
+        client.get_logical_devices.assert_awaited_once()
+        client.get_logical_device_ports.assert_awaited_once_with("olt-0")
+        # UNI ports are fetched once per ONU
+        assert [call.args for call in client.get_device_ports.await_args_list] == [
+            ("onu-0-0",),
+            ("onu-0-1",),
+        ]
+        assert {call.args[0] for call in client.add_flow.await_args_list} == {"olt-0"}
+        assert client.add_flow.await_args_list[0].args[1]["match"]["in_port"] == 16
+
+    @pytest.mark.asyncio
+    async def test_olt_ports_are_fetched_in_parallel(self):
+        client = make_topology_client(olt_count=4)
+        in_flight = 0
+        peak = 0
+
+        async def get_ports(logical_device_id: str) -> list[dict]:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [{"device_port_no": 1}]
+
+        client.get_logical_device_ports = AsyncMock(side_effect=get_ports)
+        response = await VOLTHAService(client=client).discover_onus()
+
+        assert response.total == 8
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_discovery_reads_current_onu_states(self):
+        client = make_topology_client()
+        service = VOLTHAService(client=client)
+        assert (await service.discover_onus()).total == 2
+
+        # Activation is not a topology event; every scan re-reads the device list
+        client.get_devices.return_value[0].update(admin_state="ENABLED", oper_status="ACTIVE")
+        assert (await service.discover_onus()).total == 1
+        assert client.get_devices.await_count == 2
+        client.get_logical_devices.assert_awaited_once()
+        client.get_logical_device_ports.assert_awaited_once_with("olt-0")
+
+    @pytest.mark.asyncio
+    async def test_topology_follows_local_changes_and_events(self):
+        client = make_topology_client()
+        service = VOLTHAService(client=client)
+        await service.discover_onus()
+
+        # Local operations patch the cached topology
+        client.enable_device = AsyncMock()
+        client.delete_device = AsyncMock(return_value=True)
+        await service.enable_device("onu-0-0")
+        assert await service.delete_device("onu-0-1")
+        topology = service.topology_cache.topology
+        assert topology.devices["onu-0-0"]["admin_state"] == "ENABLED"
+        assert "onu-0-1" not in topology.devices
+
+        # Old events are already reflected; a newer ONU event forces a rebuild
+        client.get_events = AsyncMock(
+            return_value=[
+                {
+                    "id": "event-1",
+                    "event_type": "onu_discovered",
+                    "category": "ONU",
+                    "resource_id": "onu-0-2",
+                    "timestamp": "2020-01-01T00:00:00+00:00",
+                }
+            ]
+        )
+        await service.get_events()
+        await service.discover_onus()
+        client.get_logical_devices.assert_awaited_once()
+
+        client.get_events.return_value[0]["timestamp"] = datetime.now(UTC).isoformat()
+        await service.get_events()
+        assert (await service.discover_onus()).total == 2
+        assert client.get_logical_devices.await_count == 2
@@ -0,0 +1,222 @@
+"""
+Tests for the background webhook delivery worker.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from dotmac.platform.webhooks.delivery import WebhookDeliveryService
+from dotmac.platform.webhooks.models import (
+    DeliveryStatus,
+    WebhookDelivery,
+    WebhookSubscription,
+    WebhookSubscriptionCreate,
+)
+from dotmac.platform.webhooks.service import WebhookSubscriptionService
+from dotmac.platform.webhooks.worker import WebhookDeliveryWorker, endpoint_key
+
+pytestmark = pytest.mark.integration
+
+TENANT_ID = "worker-tenant"
+
+
+def _make_worker(session: AsyncSession, handler, **options) -> WebhookDeliveryWorker:
+    """Worker that reuses the test session and routes HTTP through ``handler``."""
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    worker = WebhookDeliveryWorker(session_factory=session_factory, http2=False, **options)
+    transport = httpx.MockTransport(handler)
+    worker._client = lambda endpoint: worker._clients.setdefault(  # type: ignore[method-assign]
+        endpoint, httpx.AsyncClient(transport=transport)
+    )
+    return worker
+
+
+async def _subscribe(session: AsyncSession, url: str, **options) -> WebhookSubscription:
+    service = WebhookSubscriptionService(session)
+    subscription = await service.create_subscription(
+        TENANT_ID, WebhookSubscriptionCreate(url=url, events=["invoice.created"], **options)
+    )
+    await session.commit()
+    return subscription
+
+
+async def _queue(session: AsyncSession, subscriptions, count: int = 1) -> list[WebhookDelivery]:
+    service = WebhookDeliveryService(session)
+    deliveries = []
+    for i in range(count):
+        deliveries += await service.enqueue(
+            subscriptions, "invoice.created", {"n": i}, f"evt-{i}", TENANT_ID
+        )
+    return deliveries
+
+
+async def _reload(session: AsyncSession, model, ids) -> list:
+    stmt = select(model).where(model.id.in_(ids)).execution_options(populate_existing=True)
+    rows = (await session.execute(stmt)).scalars().all()
+    return sorted(rows, key=lambda row: ids.index(row.id))
+
+
+def test_endpoint_key_groups_by_origin():
+    assert endpoint_key("https://hooks.example.com/a") == "https://hooks.example.com:443"
+    assert endpoint_key("https://hooks.example.com:443/b?x=1") == "https://hooks.example.com:443"
+    assert endpoint_key("http://hooks.example.com/a") == "http://hooks.example.com:80"
+
+
+@pytest.mark.asyncio
+async def test_delivers_queued_batch_and_updates_statistics(async_db_session):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, text="ok")
+
+    subscription = await _subscribe(async_db_session, "https://a.example.com/hook")
+    deliveries = await _queue(async_db_session, [subscription], count=3)
+    worker = _make_worker(async_db_session, handler)
+
+    assert await worker.run_once() == 3
+    assert await worker.run_once() == 0
+    await worker.close()
+
+    ids = [delivery.id for delivery in deliveries]
+    rows = await _reload(async_db_session, WebhookDelivery, ids)
+    assert [row.status for row in rows] == [DeliveryStatus.SUCCESS] * 3
+    assert all(row.response_code == 200 and row.attempt_number == 1 for row in rows)
+    assert all("X-Webhook-Signature" in request.headers for request in requests)
+
+    (stored,) = await _reload(async_db_session, WebhookSubscription, [subscription.id])
+    assert stored.success_count == 3
+    assert stored.failure_count == 0
+    assert stored.last_success_at is not None
+
+
+@pytest.mark.asyncio
+async def test_failure_schedules_retry_then_next_attempt(async_db_session):
+    statuses = iter([500, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(next(statuses))
+
+    subscription = await _subscribe(async_db_session, "https://b.example.com/hook")
+    (delivery,) = await _queue(async_db_session, [subscription])
+    worker = _make_worker(async_db_session, handler)
+
+    await worker.run_once()
+    (row,) = await _reload(async_db_session, WebhookDelivery, [delivery.id])
+    assert row.status == DeliveryStatus.RETRYING
+    assert row.attempt_number == 1
+    assert row.error_message.startswith("HTTP 500")
+    assert row.next_retry_at is not None
+
+    # Not due yet
+    assert await worker.run_once() == 0
+
+    row.next_retry_at = datetime.now(UTC) - timedelta(seconds=1)
+    await async_db_session.commit()
+    assert await worker.run_once() == 1
+    await worker.close()
+
+    (row,) = await _reload(async_db_session, WebhookDelivery, [delivery.id])
+    assert row.status == DeliveryStatus.SUCCESS
+    assert row.attempt_number == 2
+    assert row.next_retry_at is None
+
+    (stored,) = await _reload(async_db_session, WebhookSubscription, [subscription.id])
+    assert (stored.success_count, stored.failure_count) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_gone_disables_subscription(async_db_session):
+    subscription = await _subscribe(async_db_session, "https://c.example.com/hook")
+    (delivery,) = await _queue(async_db_session, [subscription])
+    worker = _make_worker(async_db_session, lambda request: httpx.Response(410))
+
+    await worker.run_once()
+    await worker.close()
+
+    (row,) = await _reload(async_db_session, WebhookDelivery, [delivery.id])
+    assert row.status == DeliveryStatus.DISABLED
+    (stored,) = await _reload(async_db_session, WebhookSubscription, [subscription.id])
+    assert stored.is_active is False
+    assert stored.custom_metadata["disabled_reason"] == "Endpoint returned 410 Gone"
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_defers_without_spending_attempt(async_db_session):
+    subscription = await _subscribe(async_db_session, "https://d.example.com/hook")
+    deliveries = await _queue(async_db_session, [subscription], count=3)
+    worker = _make_worker(
+        async_db_session,
+        lambda request: httpx.Response(503),
+        max_per_endpoint=1,
+        circuit_failure_threshold=2,
+    )
+
+    await worker.run_once()
+    await worker.close()
+
+    rows = await _reload(async_db_session, WebhookDelivery, [d.id for d in deliveries])
+    assert [row.status for row in rows] == [
+        DeliveryStatus.RETRYING,
+        DeliveryStatus.RETRYING,
+        DeliveryStatus.QUEUED,
+    ]
+    deferred = rows[2]
+    assert deferred.attempt_number == 1
+    assert deferred.error_message.startswith("Circuit open")
+    assert deferred.next_retry_at is not None
+
+    (stored,) = await _reload(async_db_session, WebhookSubscription, [subscription.id])
+    assert stored.failure_count == 2
+
+
+@pytest.mark.asyncio
+async def test_per_endpoint_concurrency_limit(async_db_session):
+    in_flight: dict[str, int] = {}
+    peak: dict[str, int] = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        in_flight[host] = in_flight.get(host, 0) + 1
+        peak[host] = max(peak.get(host, 0), in_flight[host])
+        await asyncio.sleep(0.01)
+        in_flight[host] -= 1
+        return httpx.Response(204)
+
+    slow = await _subscribe(async_db_session, "https://slow.example.com/hook")
+    fast = await _subscribe(async_db_session, "https://fast.example.com/hook")
+    await _queue(async_db_session, [slow, fast], count=6)
+    worker = _make_worker(async_db_session, handler, max_per_endpoint=2)
+
+    assert await worker.run_once() == 12
+    await worker.close()
+
+    assert peak == {"slow.example.com": 2, "fast.example.com": 2}
+
+
+@pytest.mark.asyncio
+async def test_inactive_subscription_fails_queued_delivery(async_db_session):
+    subscription = await _subscribe(async_db_session, "https://e.example.com/hook")
+    (delivery,) = await _queue(async_db_session, [subscription])
+    subscription.is_active = False
+    await async_db_session.commit()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("inactive subscriptions must not be called")
+
+    worker = _make_worker(async_db_session, handler)
+    assert await worker.run_once() == 0
+
+    (row,) = await _reload(async_db_session, WebhookDelivery, [delivery.id])
+    assert row.status == DeliveryStatus.FAILED
+    assert row.error_message == "Subscription no longer active"
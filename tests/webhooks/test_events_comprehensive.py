@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from dotmac.platform.settings import settings
 from dotmac.platform.webhooks.events import (
     EventBus,
     EventSchema,
@@ -279,6 +280,45 @@ class TestEventBusPublish:
         assert count == 1
         assert mock_del_svc.deliver.call_count == 2
 
+    @patch("dotmac.platform.webhooks.events.notify_delivery_worker")
+    @patch("dotmac.platform.webhooks.events.WebhookDeliveryService")
+    @patch("dotmac.platform.webhooks.events.WebhookSubscriptionService")
+    @pytest.mark.asyncio
+    async def test_publish_queues_for_delivery_worker(
+        self, mock_sub_service, mock_del_service, mock_notify, monkeypatch
+    ):
+        """Test that publish queues deliveries and wakes the worker."""
+        monkeypatch.setattr(settings.webhooks, "delivery_worker_enabled", True)
+        event_bus = EventBus()
+        mock_db = AsyncMock()
+
+        subscriptions = [MagicMock(id=uuid.uuid4()), MagicMock(id=uuid.uuid4())]
+        mock_sub_svc = AsyncMock()
+        mock_sub_svc.get_subscriptions_for_event = AsyncMock(return_value=subscriptions)
+        mock_sub_service.return_value = mock_sub_svc
+
+        mock_del_svc = AsyncMock()
+        mock_del_service.return_value = mock_del_svc
+
+        count = await event_bus.publish(
+            event_type="invoice.created",
+            event_data={"invoice_id": "inv_123"},
+            tenant_id="tenant_123",
+            db=mock_db,
+            event_id="evt_123",
+        )
+
+        assert count == 2
+        mock_del_svc.enqueue.assert_awaited_once_with(
+            subscriptions=subscriptions,
+            event_type="invoice.created",
+            event_data={"invoice_id": "inv_123"},
+            event_id="evt_123",
+            tenant_id="tenant_123",
+        )
+        mock_del_svc.deliver.assert_not_called()
+        mock_notify.assert_called_once()
+
 
 @pytest.mark.unit
 class TestEventBusPublishBatch: